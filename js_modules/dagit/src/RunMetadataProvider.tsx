@@ -303,8 +303,8 @@ export function extractMetadataFromLogs(
         }
       } else if (log.__typename === "ObjectStoreOperationEvent") {
         // this indicates the step was skipped and its previous intermediates were copied
-        // so we will drop the step because we didn't execute it
-        if (log.operationResult.op === "CP_OBJECT") {
+        // or referenced, so we will drop the step because we didn't execute it
+        if (log.operationResult.op === "CP_OBJECT" || log.operationResult.op === "REF_OBJECT") {
           return;
         }
       }
@@ -32,6 +32,7 @@ export enum LogLevel {
 export enum ObjectStoreOperationType {
   CP_OBJECT = "CP_OBJECT",
   GET_OBJECT = "GET_OBJECT",
+  REF_OBJECT = "REF_OBJECT",
   RM_OBJECT = "RM_OBJECT",
   SET_OBJECT = "SET_OBJECT",
 }
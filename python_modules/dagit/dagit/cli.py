@@ -1,6 +1,7 @@
 import os
 import sys
 import threading
+import warnings
 from contextlib import contextmanager
 
 import click
@@ -13,6 +14,7 @@ from dagster.cli.workspace import Workspace, get_workspace_from_kwargs, workspac
 from dagster.core.instance import DagsterInstance
 from dagster.core.telemetry import START_DAGIT_WEBSERVER, log_action, log_repo_stats, upload_logs
 from dagster.utils import DEFAULT_WORKSPACE_YAML_FILENAME
+from dagster.utils.timing import format_duration
 
 from .app import create_app_from_workspace
 from .version import __version__
@@ -106,6 +108,19 @@ def host_dagit_ui_with_workspace(instance, workspace, host, port, path_prefix, p
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(workspace, "workspace", Workspace)
 
+    for location_name, load_seconds in workspace.location_load_timings.items():
+        print(  # pylint: disable=print-call
+            "Loaded repository location {location_name} in {duration}".format(
+                location_name=location_name, duration=format_duration(load_seconds * 1000)
+            )
+        )
+
+    for location_name, error_info in workspace.location_load_errors.items():
+        warnings.warn(
+            "Error loading repository location {location_name}, which will be unavailable in "
+            "Dagit:\n{error}".format(location_name=location_name, error=error_info.to_string())
+        )
+
     if len(workspace.repository_location_handles) == 1:
         repository_location_handle = workspace.repository_location_handles[0]
 
@@ -1,12 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from dagster_graphql.implementation.utils import UserFacingGraphQLError
 from dagster_graphql.schema.errors import DauphinInvalidSubsetError
 from dagster_graphql.schema.pipelines import DauphinPipeline
 
 from dagster import check
+from dagster.cli.workspace.load import MAX_CONCURRENT_LOCATION_LOADS
 from dagster.core.host_representation import PipelineSelector, RepositoryLocation
 from dagster.core.host_representation.external import ExternalPipeline
+from dagster.core.host_representation.selector import normalize_solid_selection
 from dagster.core.instance import DagsterInstance
 from dagster.grpc.types import ScheduleExecutionDataMode
+from dagster.utils.cache import LRUCache
+
+# Maximum number of pipeline subset results to keep in memory per repository location
+SUBSET_EXTERNAL_PIPELINE_CACHE_SIZE = 32
 
 
 class DagsterGraphQLContext:
@@ -14,16 +22,30 @@ class DagsterGraphQLContext:
         self._instance = check.inst_param(instance, "instance", DagsterInstance)
         self._workspace = workspace
         self._repository_locations = {}
-        for handle in self._workspace.repository_location_handles:
+        self._subset_external_pipeline_results = {}
+
+        handles = self._workspace.repository_location_handles
+        for handle in handles:
             check.invariant(
-                self._repository_locations.get(handle.location_name) is None,
+                handle.location_name not in self._repository_locations,
                 'Can not have multiple locations with the same name, got multiple "{name}"'.format(
                     name=handle.location_name,
                 ),
             )
-            self._repository_locations[handle.location_name] = RepositoryLocation.from_handle(
-                handle
-            )
+            self._repository_locations[handle.location_name] = None
+
+        # Fetching the repositories for each location is dominated by waiting on the processes
+        # that host user code, so fetch them concurrently
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(handles), MAX_CONCURRENT_LOCATION_LOADS))
+        ) as executor:
+            for handle, location in zip(
+                handles, executor.map(RepositoryLocation.from_handle, handles)
+            ):
+                self._repository_locations[handle.location_name] = location
+                self._subset_external_pipeline_results[handle.location_name] = LRUCache(
+                    SUBSET_EXTERNAL_PIPELINE_CACHE_SIZE
+                )
         self.version = version
 
     @property
@@ -45,6 +67,8 @@ class DagsterGraphQLContext:
         new_location = RepositoryLocation.from_handle(new_handle)
         check.invariant(new_location.name == name)
         self._repository_locations[name] = new_location
+        # Subset results computed against the old location may no longer be valid
+        self._subset_external_pipeline_results[name] = LRUCache(SUBSET_EXTERNAL_PIPELINE_CACHE_SIZE)
         return new_location
 
     def get_subset_external_pipeline(self, selector):
@@ -55,7 +79,18 @@ class DagsterGraphQLContext:
         repository_location = self._repository_locations[selector.location_name]
         external_repository = repository_location.get_repository(selector.repository_name)
 
-        subset_result = repository_location.get_subset_external_pipeline_result(selector)
+        subset_result = self._subset_external_pipeline_results[
+            selector.location_name
+        ].get_or_compute(
+            (
+                selector.repository_name,
+                selector.pipeline_name,
+                normalize_solid_selection(selector.solid_selection),
+            ),
+            lambda: repository_location.get_subset_external_pipeline_result(selector),
+            # failed subsets are recomputed, since the failure may not be permanent
+            should_cache=lambda subset_result: subset_result.success,
+        )
         if not subset_result.success:
             error_info = subset_result.error
             raise UserFacingGraphQLError(
@@ -228,9 +228,7 @@ def _do_execute_plan(graphene_info, execution_params, external_pipeline, retries
     return graphene_info.schema.type_named("ExecutePlanSuccess")(
         pipeline=DauphinPipeline(external_pipeline),
         has_failures=any(
-            er
-            for er in event_logs
-            if er.is_dagster_event and er.dagster_event.event_type == DagsterEventType.STEP_FAILURE
+            er for er in event_logs if er.dagster_event_type == DagsterEventType.STEP_FAILURE
         ),
         step_events=list(map(to_graphql_event, event_logs)),
         raw_event_records=list(map(serialize_dagster_namedtuple, event_logs)),
@@ -59,10 +59,13 @@ def get_asset_run_ids(graphene_info, asset_key):
 def get_assets_for_run_id(graphene_info, run_id):
     check.str_param(run_id, "run_id")
 
-    records = graphene_info.context.instance.all_logs(run_id)
+    # only materializations have asset keys, and reading lazy records of the run lets the event
+    # type be checked without deserializing the rest of the events
+    records = graphene_info.context.instance.all_lazy_logs(run_id)
     asset_keys = [
         record.dagster_event.asset_key
         for record in records
-        if record.is_dagster_event and record.dagster_event.asset_key
+        if record.dagster_event_type == DagsterEventType.STEP_MATERIALIZATION
+        and record.dagster_event.asset_key
     ]
     return [graphene_info.schema.type_named("Asset")(key=asset_key) for asset_key in asset_keys]
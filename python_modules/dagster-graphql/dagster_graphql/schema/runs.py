@@ -541,6 +541,7 @@ class DauphinObjectStoreOperationType(dauphin.Enum):
     GET_OBJECT = "GET_OBJECT"
     RM_OBJECT = "RM_OBJECT"
     CP_OBJECT = "CP_OBJECT"
+    REF_OBJECT = "REF_OBJECT"
 
 
 class DauphinObjectStoreOperationResult(dauphin.ObjectType):
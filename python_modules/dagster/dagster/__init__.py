@@ -1,3 +1,6 @@
+import importlib
+import sys
+
 from dagster.builtins import Any, Bool, Float, Int, Nothing, String
 from dagster.config import Enum, EnumValue, Field, Permissive, Selector, Shape
 from dagster.config.config_schema import ConfigSchema
@@ -68,6 +71,7 @@ from dagster.core.errors import (
     DagsterConfigMappingFunctionError,
     DagsterError,
     DagsterEventLogInvalidForRun,
+    DagsterEventLogWriteError,
     DagsterExecutionStepExecutionError,
     DagsterExecutionStepNotFoundError,
     DagsterInvalidConfigDefinitionError,
@@ -85,42 +89,6 @@ from dagster.core.errors import (
     DagsterUserCodeExecutionError,
 )
 from dagster.core.events import DagsterEvent, DagsterEventType
-from dagster.core.execution.api import (
-    execute_pipeline,
-    execute_pipeline_iterator,
-    reexecute_pipeline,
-    reexecute_pipeline_iterator,
-)
-from dagster.core.execution.context.compute import SolidExecutionContext
-from dagster.core.execution.context.init import InitResourceContext
-from dagster.core.execution.context.logger import InitLoggerContext
-from dagster.core.execution.context.system import (
-    HookContext,
-    SystemComputeExecutionContext,
-    TypeCheckContext,
-)
-from dagster.core.execution.results import (
-    CompositeSolidExecutionResult,
-    PipelineExecutionResult,
-    SolidExecutionResult,
-)
-from dagster.core.executor.base import Executor
-from dagster.core.executor.init import InitExecutorContext
-from dagster.core.instance import DagsterInstance
-from dagster.core.launcher import DefaultRunLauncher
-from dagster.core.log_manager import DagsterLogManager
-from dagster.core.storage.file_manager import FileHandle, LocalFileHandle, local_file_manager
-from dagster.core.storage.init import InitIntermediateStorageContext, InitSystemStorageContext
-from dagster.core.storage.pipeline_run import PipelineRun
-from dagster.core.storage.system_storage import (
-    build_intermediate_storage_from_object_store,
-    default_intermediate_storage_defs,
-    default_system_storage_defs,
-    fs_intermediate_storage,
-    fs_system_storage,
-    mem_intermediate_storage,
-    mem_system_storage,
-)
 from dagster.core.types.config_schema import (
     dagster_type_loader,
     dagster_type_materializer,
@@ -137,16 +105,94 @@ from dagster.core.types.python_dict import Dict
 from dagster.core.types.python_set import Set
 from dagster.core.types.python_tuple import Tuple
 from dagster.utils import file_relative_path
-from dagster.utils.test import (
-    check_dagster_type,
-    execute_solid,
-    execute_solid_within_pipeline,
-    execute_solids_within_pipeline,
-)
+from dagster.config.source import StringSource, IntSource  # isort:skip
 
 from .version import __version__
 
-from dagster.config.source import StringSource, IntSource  # isort:skip
+# The parts of the public API that are only needed to execute pipelines, as the modules that
+# define them and the names imported from each. These modules pull in the execution, instance and
+# storage machinery, so they are only imported when one of their names is first accessed (see
+# __getattr__ below), which keeps "import dagster" cheap for code that only defines pipelines.
+_LAZY_PUBLIC_API = [
+    (
+        "dagster.core.execution.api",
+        [
+            "execute_pipeline",
+            "execute_pipeline_iterator",
+            "reexecute_pipeline",
+            "reexecute_pipeline_iterator",
+        ],
+    ),
+    ("dagster.core.execution.context.compute", ["SolidExecutionContext"]),
+    ("dagster.core.execution.context.init", ["InitResourceContext"]),
+    ("dagster.core.execution.context.logger", ["InitLoggerContext"]),
+    (
+        "dagster.core.execution.context.system",
+        ["HookContext", "SystemComputeExecutionContext", "TypeCheckContext"],
+    ),
+    (
+        "dagster.core.execution.results",
+        ["CompositeSolidExecutionResult", "PipelineExecutionResult", "SolidExecutionResult"],
+    ),
+    ("dagster.core.executor.base", ["Executor"]),
+    ("dagster.core.executor.init", ["InitExecutorContext"]),
+    ("dagster.core.instance", ["DagsterInstance"]),
+    ("dagster.core.launcher", ["DefaultRunLauncher"]),
+    ("dagster.core.log_manager", ["DagsterLogManager"]),
+    ("dagster.core.storage.file_manager", ["FileHandle", "LocalFileHandle", "local_file_manager"]),
+    ("dagster.core.storage.init", ["InitIntermediateStorageContext", "InitSystemStorageContext"]),
+    ("dagster.core.storage.pipeline_run", ["PipelineRun"]),
+    (
+        "dagster.core.storage.system_storage",
+        [
+            "build_intermediate_storage_from_object_store",
+            "default_intermediate_storage_defs",
+            "default_system_storage_defs",
+            "fs_intermediate_storage",
+            "fs_system_storage",
+            "mem_intermediate_storage",
+            "mem_system_storage",
+        ],
+    ),
+    (
+        "dagster.utils.test",
+        [
+            "check_dagster_type",
+            "execute_solid",
+            "execute_solid_within_pipeline",
+            "execute_solids_within_pipeline",
+        ],
+    ),
+]
+
+_LAZY_PUBLIC_API_MODULES = {
+    name: module_name for module_name, names in _LAZY_PUBLIC_API for name in names
+}
+
+
+def _load_lazy_public_api_name(name):
+    value = getattr(importlib.import_module(_LAZY_PUBLIC_API_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name in _LAZY_PUBLIC_API_MODULES:
+            return _load_lazy_public_api_name(name)
+
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_LAZY_PUBLIC_API_MODULES))
+
+
+else:
+    # Module-level __getattr__ (PEP 562) is not available, so the whole API is imported eagerly
+    for _module_name, _names in _LAZY_PUBLIC_API:
+        for _name in _names:
+            _load_lazy_public_api_name(_name)
 
 
 __all__ = [
@@ -236,6 +282,7 @@ __all__ = [
     "DagsterConfigMappingFunctionError",
     "DagsterError",
     "DagsterEventLogInvalidForRun",
+    "DagsterEventLogWriteError",
     "DagsterExecutionStepExecutionError",
     "DagsterExecutionStepNotFoundError",
     "DagsterInvalidConfigDefinitionError",
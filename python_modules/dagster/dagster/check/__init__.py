@@ -1,4 +1,5 @@
 import inspect
+import os
 import sys
 
 from future.utils import raise_with_traceback
@@ -55,6 +56,20 @@ def _param_type_mismatch_exception(obj, ttype, param_name, additional_message=No
         )
 
 
+# frozenlist and frozendict subclass list and dict, so they are only imported to report errors,
+# rather than on every check
+def _list_param_type_mismatch_exception(obj, param_name):
+    from dagster.utils import frozenlist
+
+    return _param_type_mismatch_exception(obj, (frozenlist, list), param_name)
+
+
+def _dict_param_type_mismatch_exception(obj, param_name):
+    from dagster.utils import frozendict
+
+    return _param_type_mismatch_exception(obj, (frozendict, dict), param_name)
+
+
 def _not_type_param_subclass_mismatch_exception(obj, param_name):
     return ParameterCheckError(
         'Param "{name}" was supposed to be a type. Got {obj} of type {obj_type}'.format(
@@ -305,12 +320,8 @@ def is_tuple(obj_tuple, of_type=None, desc=None):
 
 
 def list_param(obj_list, param_name, of_type=None):
-    from dagster.utils import frozenlist
-
-    if not isinstance(obj_list, (frozenlist, list)):
-        raise_with_traceback(
-            _param_type_mismatch_exception(obj_list, (frozenlist, list), param_name)
-        )
+    if not isinstance(obj_list, list):
+        raise_with_traceback(_list_param_type_mismatch_exception(obj_list, param_name))
 
     if not of_type:
         return obj_list
@@ -485,12 +496,8 @@ def opt_list_param(obj_list, param_name, of_type=None):
     If the of_type argument is provided, also ensures that list items conform to the type specified
     by of_type.
     """
-    from dagster.utils import frozenlist
-
-    if obj_list is not None and not isinstance(obj_list, (frozenlist, list)):
-        raise_with_traceback(
-            _param_type_mismatch_exception(obj_list, (frozenlist, list), param_name)
-        )
+    if obj_list is not None and not isinstance(obj_list, list):
+        raise_with_traceback(_list_param_type_mismatch_exception(obj_list, param_name))
     if not obj_list:
         return []
     if not of_type:
@@ -522,12 +529,8 @@ def opt_nullable_list_param(obj_list, param_name, of_type=None):
     If the of_type argument is provided, also ensures that list items conform to the type specified
     by of_type.
     """
-    from dagster.utils import frozenlist
-
-    if obj_list is not None and not isinstance(obj_list, (frozenlist, list)):
-        raise_with_traceback(
-            _param_type_mismatch_exception(obj_list, (frozenlist, list), param_name)
-        )
+    if obj_list is not None and not isinstance(obj_list, list):
+        raise_with_traceback(_list_param_type_mismatch_exception(obj_list, param_name))
     if not obj_list:
         return None if obj_list is None else []
     if not of_type:
@@ -574,10 +577,8 @@ def dict_param(obj, param_name, key_type=None, value_type=None):
     """Ensures argument obj is a native Python dictionary, raises an exception if not, and otherwise
     returns obj.
     """
-    from dagster.utils import frozendict
-
-    if not isinstance(obj, (frozendict, dict)):
-        raise_with_traceback(_param_type_mismatch_exception(obj, (frozendict, dict), param_name))
+    if not isinstance(obj, dict):
+        raise_with_traceback(_dict_param_type_mismatch_exception(obj, param_name))
 
     if not (key_type or value_type):
         return obj
@@ -589,10 +590,8 @@ def opt_dict_param(obj, param_name, key_type=None, value_type=None, value_class=
     """Ensures argument obj is either a dictionary or None; if the latter, instantiates an empty
     dictionary.
     """
-    from dagster.utils import frozendict
-
-    if obj is not None and not isinstance(obj, (frozendict, dict)):
-        raise_with_traceback(_param_type_mismatch_exception(obj, (frozendict, dict), param_name))
+    if obj is not None and not isinstance(obj, dict):
+        raise_with_traceback(_dict_param_type_mismatch_exception(obj, param_name))
 
     if not obj:
         return {}
@@ -605,10 +604,8 @@ def opt_dict_param(obj, param_name, key_type=None, value_type=None, value_class=
 def opt_nullable_dict_param(obj, param_name, key_type=None, value_type=None, value_class=None):
     """Ensures argument obj is either a dictionary or None;
     """
-    from dagster.utils import frozendict
-
-    if obj is not None and not isinstance(obj, (frozendict, dict)):
-        raise_with_traceback(_param_type_mismatch_exception(obj, (frozendict, dict), param_name))
+    if obj is not None and not isinstance(obj, dict):
+        raise_with_traceback(_dict_param_type_mismatch_exception(obj, param_name))
 
     if not obj:
         return None if obj is None else {}
@@ -820,3 +817,166 @@ def class_param(obj, param_name):
             )
         )
     return obj
+
+
+# Setting the DAGSTER_SKIP_PARAM_CHECKS environment variable to "1" or "true" before dagster is
+# imported replaces the *_param functions above with variants that skip their type checks, but
+# still apply the defaults of optional params. This removes the cost of the checks from the per
+# step and per event code paths of deployments where it is measurable. Invariants, the other
+# checks, and the element checks of collection params given an element type are still enforced.
+SKIP_PARAM_CHECKS_ENV_VAR = "DAGSTER_SKIP_PARAM_CHECKS"
+
+# pylint: disable=unused-argument
+
+
+def _unchecked_inst_param(obj, param_name, ttype, additional_message=None):
+    return obj
+
+
+def _unchecked_opt_inst_param(obj, param_name, ttype, default=None):
+    return default if obj is None else obj
+
+
+def _unchecked_param(obj, param_name):
+    return obj
+
+
+def _unchecked_opt_param(obj, param_name, default=None):
+    return default if obj is None else obj
+
+
+def _unchecked_opt_scalar_param(obj, param_name):
+    return obj
+
+
+def _unchecked_opt_nonempty_str_param(obj, param_name, default=None):
+    return default if obj is None or obj == "" else obj
+
+
+# The element checks of the collection params are kept: callers rely on them to validate user
+# input, such as solid type hints and workspace files, so these fall back to the checked function
+# whenever an element type is given
+
+
+def _unchecked_list_param(obj_list, param_name, of_type=None):
+    if of_type:
+        return _CHECKED_PARAM_FNS["list_param"](obj_list, param_name, of_type)
+    return obj_list
+
+
+def _unchecked_set_param(obj_set, param_name, of_type=None):
+    if of_type:
+        return _CHECKED_PARAM_FNS["set_param"](obj_set, param_name, of_type)
+    return obj_set
+
+
+def _unchecked_tuple_param(obj, param_name, of_type=None):
+    if of_type:
+        return _CHECKED_PARAM_FNS["tuple_param"](obj, param_name, of_type)
+    return obj
+
+
+def _unchecked_opt_tuple_param(obj, param_name, default=None, of_type=None):
+    if of_type:
+        return _CHECKED_PARAM_FNS["opt_tuple_param"](obj, param_name, default, of_type)
+    return default if obj is None else obj
+
+
+def _unchecked_opt_list_param(obj_list, param_name, of_type=None):
+    if of_type:
+        return _CHECKED_PARAM_FNS["opt_list_param"](obj_list, param_name, of_type)
+    return obj_list if obj_list else []
+
+
+def _unchecked_opt_set_param(obj_set, param_name, of_type=None):
+    if of_type:
+        return _CHECKED_PARAM_FNS["opt_set_param"](obj_set, param_name, of_type)
+    return obj_set if obj_set else set()
+
+
+def _unchecked_opt_nullable_list_param(obj_list, param_name, of_type=None):
+    if of_type:
+        return _CHECKED_PARAM_FNS["opt_nullable_list_param"](obj_list, param_name, of_type)
+    if not obj_list:
+        return None if obj_list is None else []
+    return obj_list
+
+
+def _unchecked_dict_param(obj, param_name, key_type=None, value_type=None):
+    if key_type or value_type:
+        return _CHECKED_PARAM_FNS["dict_param"](obj, param_name, key_type, value_type)
+    return obj
+
+
+def _unchecked_opt_dict_param(obj, param_name, key_type=None, value_type=None, value_class=None):
+    if key_type or value_type or value_class:
+        return _CHECKED_PARAM_FNS["opt_dict_param"](
+            obj, param_name, key_type, value_type, value_class
+        )
+    return obj if obj else {}
+
+
+def _unchecked_opt_nullable_dict_param(
+    obj, param_name, key_type=None, value_type=None, value_class=None
+):
+    if key_type or value_type or value_class:
+        return _CHECKED_PARAM_FNS["opt_nullable_dict_param"](
+            obj, param_name, key_type, value_type, value_class
+        )
+    if not obj:
+        return None if obj is None else {}
+    return obj
+
+
+def _unchecked_subclass_param(obj, param_name, superclass):
+    return obj
+
+
+# pylint: enable=unused-argument
+
+_UNCHECKED_PARAM_FNS = {
+    "inst_param": _unchecked_inst_param,
+    "opt_inst_param": _unchecked_opt_inst_param,
+    "callable_param": _unchecked_param,
+    "opt_callable_param": _unchecked_opt_param,
+    "int_param": _unchecked_param,
+    "opt_int_param": _unchecked_opt_param,
+    "float_param": _unchecked_param,
+    "opt_float_param": _unchecked_opt_scalar_param,
+    "numeric_param": _unchecked_param,
+    "opt_numeric_param": _unchecked_opt_scalar_param,
+    "str_param": _unchecked_param,
+    "opt_str_param": _unchecked_opt_param,
+    "opt_nonempty_str_param": _unchecked_opt_nonempty_str_param,
+    "bool_param": _unchecked_param,
+    "opt_bool_param": _unchecked_opt_param,
+    "list_param": _unchecked_list_param,
+    "opt_list_param": _unchecked_opt_list_param,
+    "opt_nullable_list_param": _unchecked_opt_nullable_list_param,
+    "set_param": _unchecked_set_param,
+    "opt_set_param": _unchecked_opt_set_param,
+    "tuple_param": _unchecked_tuple_param,
+    "opt_tuple_param": _unchecked_opt_tuple_param,
+    "dict_param": _unchecked_dict_param,
+    "opt_dict_param": _unchecked_opt_dict_param,
+    "opt_nullable_dict_param": _unchecked_opt_nullable_dict_param,
+    # the keys of two dimensional dicts are always checked
+    "two_dim_dict_param": two_dim_dict_param,
+    "opt_two_dim_dict_param": opt_two_dim_dict_param,
+    "type_param": _unchecked_param,
+    "opt_type_param": _unchecked_opt_param,
+    "subclass_param": _unchecked_subclass_param,
+    "opt_subclass_param": _unchecked_subclass_param,
+    "generator_param": _unchecked_param,
+    "opt_generator_param": _unchecked_param,
+}
+
+_CHECKED_PARAM_FNS = {name: globals()[name] for name in _UNCHECKED_PARAM_FNS}
+
+
+def _should_skip_param_checks():
+    return os.getenv(SKIP_PARAM_CHECKS_ENV_VAR, "").lower() in ("1", "true")
+
+
+if _should_skip_param_checks():
+    globals().update(_UNCHECKED_PARAM_FNS)
@@ -1,29 +1,43 @@
-import os
-import sys
+from importlib import import_module
 
 import click
 
-from ..core.instance import DagsterInstance
 from ..version import __version__
-from .api import api_cli
-from .asset import asset_cli
-from .instance import instance_cli
-from .pipeline import pipeline_cli
-from .run import run_cli
-from .schedule import schedule_cli
+
+# The module and attribute defining each subcommand. Each of these modules imports much of dagster,
+# so a module is only imported when its subcommand is invoked (or listed, as in --help).
+_LAZY_COMMANDS = {
+    "api": ("dagster.cli.api", "api_cli"),
+    "pipeline": ("dagster.cli.pipeline", "pipeline_cli"),
+    "run": ("dagster.cli.run", "run_cli"),
+    "instance": ("dagster.cli.instance", "instance_cli"),
+    "schedule": ("dagster.cli.schedule", "schedule_cli"),
+    "asset": ("dagster.cli.asset", "asset_cli"),
+}
+
+
+class LazyCommandGroup(click.Group):
+    """A click group whose subcommands are imported on first use."""
+
+    def __init__(self, lazy_commands=None, **kwargs):
+        super(LazyCommandGroup, self).__init__(**kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted(
+            set(super(LazyCommandGroup, self).list_commands(ctx)) | set(self.lazy_commands)
+        )
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attr_name = self.lazy_commands[cmd_name]
+            self.add_command(getattr(import_module(module_name), attr_name), cmd_name)
+
+        return super(LazyCommandGroup, self).get_command(ctx, cmd_name)
 
 
 def create_dagster_cli():
-    commands = {
-        "api": api_cli,
-        "pipeline": pipeline_cli,
-        "run": run_cli,
-        "instance": instance_cli,
-        "schedule": schedule_cli,
-        "asset": asset_cli,
-    }
-
-    @click.group(commands=commands)
+    @click.group(cls=LazyCommandGroup, lazy_commands=_LAZY_COMMANDS)
     @click.version_option(version=__version__)
     def group():
         "CLI tools for working with dagster."
@@ -21,6 +21,7 @@ from dagster.core.errors import DagsterLaunchFailedError, DagsterSubprocessError
 from dagster.core.events import EngineEventData
 from dagster.core.execution.api import (
     create_execution_plan,
+    create_execution_plan_for_steps,
     execute_plan_iterator,
     execute_run_iterator,
 )
@@ -410,15 +411,26 @@ def execute_step_with_structured_logs_command(input_json):
         pipeline_run = instance.get_run_by_id(args.pipeline_run_id)
         recon_pipeline = recon_pipeline_from_origin(args.pipeline_origin)
 
-        execution_plan = create_execution_plan(
-            recon_pipeline.subset_for_execution_from_existing_pipeline(
-                pipeline_run.solids_to_execute
-            ),
-            run_config=args.run_config,
-            step_keys_to_execute=args.step_keys_to_execute,
-            mode=args.mode,
+        pipeline = recon_pipeline.subset_for_execution_from_existing_pipeline(
+            pipeline_run.solids_to_execute
         )
 
+        if args.step_keys_to_execute and args.mode in (None, pipeline_run.mode):
+            execution_plan = create_execution_plan_for_steps(
+                pipeline,
+                pipeline_run,
+                instance,
+                args.step_keys_to_execute,
+                run_config=args.run_config,
+            )
+        else:
+            execution_plan = create_execution_plan(
+                pipeline,
+                run_config=args.run_config,
+                step_keys_to_execute=args.step_keys_to_execute,
+                mode=args.mode,
+            )
+
         retries = Retries.from_config(args.retries_dict)
 
         buff = []
@@ -504,6 +516,17 @@ def _schedule_tick_state(instance, stream, tick_data):
     default=30,
     help="Timout after which to shutdown if --heartbeat is set and a heartbeat is not received",
 )
+@click.option(
+    "--num-worker-processes",
+    type=click.INT,
+    required=False,
+    default=None,
+    help=(
+        "If set, serve requests that load snapshots or evaluate user code (e.g. schedules and "
+        "partitions) from a pool of this many worker processes, rather than from the server "
+        "process itself. Set --max_workers to at least this value to keep every worker busy."
+    ),
+)
 @python_origin_target_argument
 def grpc_command(
     port=None,
@@ -512,6 +535,7 @@ def grpc_command(
     max_workers=1,
     heartbeat=False,
     heartbeat_timeout=30,
+    num_worker_processes=None,
     **kwargs
 ):
     if seven.IS_WINDOWS and port is None:
@@ -539,6 +563,7 @@ def grpc_command(
         max_workers=max_workers,
         heartbeat=heartbeat,
         heartbeat_timeout=heartbeat_timeout,
+        num_worker_processes=num_worker_processes,
     )
 
     server.serve()
@@ -10,6 +10,7 @@ from click import UsageError
 from dagster import check
 from dagster.core.code_pointer import CodePointer
 from dagster.core.definitions.reconstructable import repository_def_from_target_def
+from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.host_representation import ExternalRepository, RepositoryLocation, UserProcessApi
 from dagster.core.host_representation.handle import RepositoryLocationHandle
 from dagster.core.instance import DagsterInstance
@@ -470,26 +471,36 @@ def get_repository_location_from_kwargs(kwargs, instance):
     check.inst_param(instance, "instance", DagsterInstance)
     with get_workspace_from_kwargs(kwargs, instance) as workspace:
         provided_location_name = kwargs.get("location")
+        # Locations that failed to load are still options, so that choosing one reports its error
+        location_names = workspace.repository_location_names + list(workspace.location_load_errors)
+
+        if not workspace.repository_location_handles and workspace.location_load_errors:
+            raise DagsterInvariantViolationError(
+                "\n".join(
+                    workspace.location_load_error_message(location_name)
+                    for location_name in sorted(workspace.location_load_errors)
+                )
+            )
 
-        if provided_location_name is None and len(workspace.repository_location_handles) == 1:
-            yield RepositoryLocation.from_handle(next(iter(workspace.repository_location_handles)))
+        if provided_location_name is None and len(location_names) == 1:
+            provided_location_name = location_names[0]
 
-        elif provided_location_name is None:
+        if provided_location_name is None:
             raise click.UsageError(
                 (
                     "Must provide --location as there are more than one locations "
                     "available. Options are: {}"
-                ).format(_sorted_quoted(workspace.repository_location_names))
+                ).format(_sorted_quoted(location_names))
             )
 
-        elif not workspace.has_repository_location_handle(provided_location_name):
+        elif provided_location_name not in location_names:
             raise click.UsageError(
                 (
                     'Location "{provided_location_name}" not found in workspace. '
                     "Found {found_names} instead."
                 ).format(
                     provided_location_name=provided_location_name,
-                    found_names=_sorted_quoted(workspace.repository_location_names),
+                    found_names=_sorted_quoted(location_names),
                 )
             )
 
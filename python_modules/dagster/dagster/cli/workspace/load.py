@@ -1,6 +1,7 @@
 import os
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 
@@ -9,6 +10,8 @@ from dagster.core.code_pointer import CodePointer, rebase_file
 from dagster.core.host_representation import RepositoryLocationHandle, UserProcessApi
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster.utils import load_yaml_from_path
+from dagster.utils.error import serializable_error_info_from_exc_info
+from dagster.utils.timing import time_execution_scope
 
 from .config_schema import ensure_workspace_config
 from .workspace import Workspace
@@ -25,14 +28,22 @@ def load_workspace_from_yaml_paths(yaml_paths, python_user_process_api):
     ]
 
     repository_location_handles_dict = {}
+    location_load_errors = {}
+    location_load_timings = {}
     for workspace in workspaces:
         for repository_location_name in workspace.repository_location_names:
             repository_location_handles_dict[
                 repository_location_name
             ] = workspace.get_repository_location_handle(repository_location_name)
+        location_load_errors.update(workspace.location_load_errors)
+        location_load_timings.update(workspace.location_load_timings)
 
     repository_location_handles = list(repository_location_handles_dict.values())
-    merged_workspace = Workspace(repository_location_handles)
+    merged_workspace = Workspace(
+        repository_location_handles,
+        location_load_errors=location_load_errors,
+        location_load_timings=location_load_timings,
+    )
     return merged_workspace
 
 
@@ -54,15 +65,98 @@ def load_workspace_from_config(workspace_config, yaml_path, python_user_process_
             ]
         )
 
-    location_handles = []
-    for location_config in workspace_config["load_from"]:
-        location_handles.append(
-            _location_handle_from_location_config(
+    location_configs = workspace_config["load_from"]
+    load_results = _load_concurrently(
+        [
+            # bind location_config at definition time
+            lambda location_config=location_config: _location_handle_from_location_config(
                 location_config, yaml_path, python_user_process_api
             )
-        )
+            for location_config in location_configs
+        ]
+    )
+
+    # An invalid workspace config is a user error that should fail loudly, rather than being
+    # surfaced as a single location that failed to load
+    for _location_handle, exc_info, _load_seconds in load_results:
+        if exc_info and isinstance(exc_info[1], check.CheckError):
+            for location_handle, _exc_info, _load_seconds in load_results:
+                if location_handle:
+                    location_handle.cleanup()
+            six.reraise(*exc_info)
+
+    location_handles = []
+    location_load_errors = {}
+    location_load_timings = {}
+    for location_config, (location_handle, exc_info, load_seconds) in zip(
+        location_configs, load_results
+    ):
+        if exc_info:
+            location_load_errors[
+                _describe_location_config(location_config)
+            ] = serializable_error_info_from_exc_info(exc_info)
+        else:
+            location_handles.append(location_handle)
+            location_load_timings[location_handle.location_name] = load_seconds
+
+    return Workspace(
+        location_handles,
+        location_load_errors=location_load_errors,
+        location_load_timings=location_load_timings,
+    )
+
+
+# Maximum number of repository locations to load at once. Loading a location may spawn a
+# subprocess that imports user code, so this bounds the load placed on the machine.
+MAX_CONCURRENT_LOCATION_LOADS = 8
+
+
+def _timed_load(load_fn):
+    with time_execution_scope() as timer_result:
+        try:
+            result = load_fn()
+            exc_info = None
+        except Exception:  # pylint: disable=broad-except
+            result = None
+            exc_info = sys.exc_info()
+
+    return result, exc_info, timer_result.seconds
+
+
+def _load_concurrently(load_fns):
+    """Call each of load_fns on a bounded thread pool, returning a list of
+    (result, exc_info, load_seconds) tuples in the same order. An error raised by one function
+    does not prevent the others from loading."""
+    check.list_param(load_fns, "load_fns")
+
+    if len(load_fns) <= 1:
+        return [_timed_load(load_fn) for load_fn in load_fns]
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(load_fns), MAX_CONCURRENT_LOCATION_LOADS)
+    ) as executor:
+        return list(executor.map(_timed_load, load_fns))
+
+
+def _describe_location_config(location_config):
+    """A key for a location that failed to load, and so has no handle to name it: the configured
+    location_name if there is one, or the location config itself otherwise."""
+    return _find_location_name(location_config) or str(location_config)
+
+
+def _find_location_name(config):
+    if not isinstance(config, dict):
+        return None
+
+    if config.get("location_name"):
+        return config["location_name"]
+
+    for value in config.values():
+        location_name = _find_location_name(value)
+        if location_name:
+            return location_name
 
-    return Workspace(location_handles)
+    return None
 
 
 def _location_handle_from_module_config(
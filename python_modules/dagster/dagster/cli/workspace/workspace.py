@@ -1,15 +1,27 @@
 from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.host_representation import RepositoryLocationHandle
 
 
 class Workspace:
-    def __init__(self, repository_location_handles):
+    def __init__(
+        self, repository_location_handles, location_load_errors=None, location_load_timings=None
+    ):
         check.list_param(
             repository_location_handles,
             "repository_location_handles",
             of_type=RepositoryLocationHandle,
         )
         self._location_handle_dict = {rlh.location_name: rlh for rlh in repository_location_handles}
+        # Dict[str, SerializableErrorInfo]: errors for locations that failed to load, keyed by
+        # their configured location name (or their config, if no name was configured)
+        self._location_load_errors = check.opt_dict_param(
+            location_load_errors, "location_load_errors", key_type=str
+        )
+        # Dict[str, float]: seconds spent loading each location, keyed by location name
+        self._location_load_timings = check.opt_dict_param(
+            location_load_timings, "location_load_timings", key_type=str
+        )
 
     @property
     def repository_location_handles(self):
@@ -19,14 +31,31 @@ class Workspace:
     def repository_location_names(self):
         return list(self._location_handle_dict.keys())
 
+    @property
+    def location_load_errors(self):
+        return self._location_load_errors
+
+    @property
+    def location_load_timings(self):
+        return self._location_load_timings
+
     def has_repository_location_handle(self, location_name):
         check.str_param(location_name, "location_name")
         return location_name in self._location_handle_dict
 
     def get_repository_location_handle(self, location_name):
         check.str_param(location_name, "location_name")
+        if location_name in self._location_load_errors:
+            raise DagsterInvariantViolationError(self.location_load_error_message(location_name))
         return self._location_handle_dict[location_name]
 
+    def location_load_error_message(self, location_name):
+        check.str_param(location_name, "location_name")
+        return 'Repository location "{location_name}" failed to load: {error}'.format(
+            location_name=location_name,
+            error=self._location_load_errors[location_name].to_string(),
+        )
+
     def reload_repository_location(self, location_name):
         existing_handle = self.get_repository_location_handle(location_name)
         reloaded_handle = existing_handle.create_reloaded_handle()
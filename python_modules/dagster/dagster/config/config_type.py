@@ -63,6 +63,10 @@ class ConfigType(object):
             if type_params
             else None
         )
+        # Compiled by dagster.config.validate and dagster.config.post_process on first use, and
+        # reset when a memoized type is re-declared
+        self._compiled_validator = None
+        self._compiled_processors = {}
 
     @property
     def description(self):
@@ -28,3 +28,46 @@ def config_schema_snapshot_from_config_type(config_type):
     return ConfigSchemaSnapshot(
         {ct.key: snap_from_config_type(ct) for ct in iterate_config_types(config_type)}
     )
+
+
+def record_config_type_fields(config_type):
+    """Record the fields of the Shape, Permissive and Selector types reachable from a config type.
+
+    These types are memoized by key, and re-declaring one re-initializes the shared instance with
+    the newly declared fields. Anything compiled from a config type tree is checked against this
+    record with ``config_type_fields_unchanged`` before being reused.
+    """
+    check.inst_param(config_type, "config_type", ConfigType)
+    recorded = {}
+    for inner_type in iterate_config_types(config_type):
+        if ConfigTypeKind.has_fields(inner_type.kind):
+            recorded[id(inner_type)] = (inner_type, inner_type.fields)
+    return list(recorded.values())
+
+
+def config_type_fields_unchanged(recorded_fields):
+    for config_type, fields in recorded_fields:
+        if config_type.fields is not fields and not _are_fields_equivalent(
+            fields, config_type.fields
+        ):
+            return False
+    return True
+
+
+def _are_fields_equivalent(fields, other_fields):
+    # a re-declaration of the same fields produces new Field instances
+    return set(fields.keys()) == set(other_fields.keys()) and all(
+        _is_field_equivalent(field, other_fields[name]) for name, field in fields.items()
+    )
+
+
+def _is_field_equivalent(field, other_field):
+    return (
+        field.config_type is other_field.config_type
+        and field.is_required == other_field.is_required
+        and field.default_provided == other_field.default_provided
+        and (
+            not field.default_provided
+            or field.default_value_as_json_str == other_field.default_value_as_json_str
+        )
+    )
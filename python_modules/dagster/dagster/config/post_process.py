@@ -7,182 +7,234 @@ from dagster.utils.error import serializable_error_info_from_exc_info
 from .config_type import ConfigType, ConfigTypeKind
 from .errors import PostProcessingError, create_failed_post_processing_error
 from .evaluate_value_result import EvaluateValueResult
-from .stack import EvaluationStack
-from .traversal_context import TraversalContext, TraversalType
+from .iterate_types import config_type_fields_unchanged, record_config_type_fields
+from .stack import EvaluationStackPathEntry, evaluation_stack_from_path
+from .traversal_context import ContextData
 
 
 def post_process_config(config_type, config_value):
-    ctx = TraversalContext.from_config_type(
-        config_type=check.inst_param(config_type, "config_type", ConfigType),
-        stack=EvaluationStack(entries=[]),
-        traversal_type=TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS,
-    )
-    return _recursively_process_config(ctx, config_value)
+    return _get_processor(
+        check.inst_param(config_type, "config_type", ConfigType), do_post_process=True
+    )(config_value)
 
 
 def resolve_defaults(config_type, config_value):
-    ctx = TraversalContext.from_config_type(
-        config_type=check.inst_param(config_type, "config_type", ConfigType),
-        stack=EvaluationStack(entries=[]),
-        traversal_type=TraversalType.RESOLVE_DEFAULTS,
-    )
-
-    return _recursively_process_config(ctx, config_value)
-
-
-def _recursively_process_config(context, config_value):
-    evr = _recursively_resolve_defaults(context, config_value)
-
-    if evr.success:
-        if not context.do_post_process:
-            return evr
-        return _post_process(context, evr.value)
-    else:
-        return evr
-
-
-def _recursively_resolve_defaults(context, config_value):
-    kind = context.config_type.kind
-
-    if kind == ConfigTypeKind.SCALAR:
-        return EvaluateValueResult.for_value(config_value)
-    elif kind == ConfigTypeKind.ENUM:
-        return EvaluateValueResult.for_value(config_value)
-    elif kind == ConfigTypeKind.SELECTOR:
-        return _recurse_in_to_selector(context, config_value)
-    elif ConfigTypeKind.is_shape(kind):
-        return _recurse_in_to_shape(context, config_value)
-    elif kind == ConfigTypeKind.ARRAY:
-        return _recurse_in_to_array(context, config_value)
-    elif kind == ConfigTypeKind.NONEABLE:
-        if config_value is None:
-            return EvaluateValueResult.for_value(None)
+    return _get_processor(
+        check.inst_param(config_type, "config_type", ConfigType), do_post_process=False
+    )(config_value)
+
+
+def _get_processor(config_type, do_post_process):
+    processors = config_type._compiled_processors  # pylint: disable=protected-access
+
+    compiled = processors.get(do_post_process)
+    if compiled is None or not config_type_fields_unchanged(compiled[0]):
+        process = _ConfigProcessorCompiler(do_post_process).compile(config_type)
+
+        def _process(config_value):
+            value, errors = process(config_value, ())
+            if errors:
+                return EvaluateValueResult.for_errors(errors)
+            return EvaluateValueResult.for_value(value)
+
+        compiled = (record_config_type_fields(config_type), _process)
+        processors[do_post_process] = compiled
+
+    return compiled[1]
+
+
+class _ConfigProcessorCompiler(object):
+    """Compiles a config type into a closure that resolves defaults in, and optionally post
+    processes, a config value that has already been validated against it.
+
+    Compiled processors take the value and the path to it (a tuple of EvaluationStackPathEntry and
+    list indices), and return a tuple of the processed value and a list of errors, which is empty
+    or None on success.
+    """
+
+    def __init__(self, do_post_process):
+        self._do_post_process = check.bool_param(do_post_process, "do_post_process")
+        self._compiled = {}
+
+    def compile(self, config_type):
+        # memoized by instance rather than key, since types with the same key (e.g. enums with the
+        # same name) may post process differently
+        if id(config_type) not in self._compiled:
+            self._compiled[id(config_type)] = (config_type, self._compile_config_type(config_type))
+        return self._compiled[id(config_type)][1]
+
+    def _compile_config_type(self, config_type):
+        resolve = self._compile_resolve_defaults(config_type)
+
+        if not self._do_post_process:
+            return resolve
+
+        def _process(config_value, path):
+            value, errors = resolve(config_value, path)
+            if errors:
+                return None, errors
+
+            try:
+                return config_type.post_process(value), None
+            except PostProcessingError:
+                error_data = serializable_error_info_from_exc_info(sys.exc_info())
+                return (
+                    None,
+                    [
+                        create_failed_post_processing_error(
+                            ContextData(
+                                config_schema_snapshot=None,
+                                config_type_snap=None,
+                                stack=evaluation_stack_from_path(path),
+                            ),
+                            value,
+                            error_data,
+                        )
+                    ],
+                )
+
+        return _process
+
+    def _compile_resolve_defaults(self, config_type):
+        kind = config_type.kind
+
+        if kind in (ConfigTypeKind.SCALAR, ConfigTypeKind.ENUM, ConfigTypeKind.ANY):
+            return lambda config_value, _path: (config_value, None)
+        elif kind == ConfigTypeKind.SELECTOR:
+            return self._compile_selector(config_type)
+        elif ConfigTypeKind.is_shape(kind):
+            return self._compile_shape(config_type)
+        elif kind == ConfigTypeKind.ARRAY:
+            return self._compile_array(config_type)
+        elif kind == ConfigTypeKind.NONEABLE:
+            return self._compile_noneable(config_type)
+        elif kind == ConfigTypeKind.SCALAR_UNION:
+            return self._compile_scalar_union(config_type)
         else:
-            return _recursively_process_config(context.for_nullable_inner_type(), config_value)
-    elif kind == ConfigTypeKind.ANY:
-        return EvaluateValueResult.for_value(config_value)
-    elif context.config_type.kind == ConfigTypeKind.SCALAR_UNION:
-        return _recurse_in_to_scalar_union(context, config_value)
-    else:
-        check.failed("Unsupported type {name}".format(name=context.config_type.name))
-
-
-def _post_process(context, config_value):
-    try:
-        new_value = context.config_type.post_process(config_value)
-        return EvaluateValueResult.for_value(new_value)
-    except PostProcessingError:
-        error_data = serializable_error_info_from_exc_info(sys.exc_info())
-        return EvaluateValueResult.for_error(
-            create_failed_post_processing_error(context, config_value, error_data)
-        )
-
-
-def _recurse_in_to_scalar_union(context, config_value):
-    if isinstance(config_value, dict) or isinstance(config_value, list):
-        return _recursively_process_config(
-            context.for_new_config_type(context.config_type.non_scalar_type), config_value
-        )
-    else:
-        return _recursively_process_config(
-            context.for_new_config_type(context.config_type.scalar_type), config_value
-        )
-
-
-def _recurse_in_to_selector(context, config_value):
-    check.invariant(
-        context.config_type.kind == ConfigTypeKind.SELECTOR,
-        "Non-selector not caught in validation",
-    )
-
-    if config_value:
-        check.invariant(config_value and len(config_value) == 1)
-        field_name, incoming_field_value = ensure_single_item(config_value)
-    else:
-        field_name, field_def = ensure_single_item(context.config_type.fields)
-        incoming_field_value = field_def.default_value if field_def.default_provided else None
-
-    field_def = context.config_type.fields[field_name]
-
-    field_evr = _recursively_process_config(
-        context.for_field(field_def, field_name),
-        {}
-        if incoming_field_value is None and ConfigTypeKind.has_fields(field_def.config_type.kind)
-        else incoming_field_value,
-    )
-    if field_evr.success:
-        return EvaluateValueResult.for_value(frozendict({field_name: field_evr.value}))
-
-    return field_evr
-
-
-def _recurse_in_to_shape(context, config_value):
-    check.invariant(ConfigTypeKind.is_shape(context.config_type.kind), "Unexpected non shape type")
-    config_value = check.opt_dict_param(config_value, "config_value", key_type=str)
-
-    fields = context.config_type.fields
-    incoming_fields = set(config_value.keys())
-
-    processed_fields = {}
-
-    for expected_field, field_def in fields.items():
-        if expected_field in incoming_fields:
-            processed_fields[expected_field] = _recursively_process_config(
-                context.for_field(field_def, expected_field), config_value[expected_field]
-            )
+            check.failed("Unsupported type {name}".format(name=config_type.name))
+
+    def _compile_noneable(self, config_type):
+        process_inner = self.compile(config_type.inner_type)
+
+        def _resolve_noneable(config_value, path):
+            if config_value is None:
+                return None, None
+            return process_inner(config_value, path)
+
+        return _resolve_noneable
+
+    def _compile_scalar_union(self, config_type):
+        process_non_scalar = self.compile(config_type.non_scalar_type)
+        process_scalar = self.compile(config_type.scalar_type)
+
+        def _resolve_scalar_union(config_value, path):
+            if isinstance(config_value, (dict, list)):
+                return process_non_scalar(config_value, path)
+            return process_scalar(config_value, path)
 
-        elif field_def.default_provided:
-            processed_fields[expected_field] = _recursively_process_config(
-                context.for_field(field_def, expected_field), field_def.default_value
+        return _resolve_scalar_union
+
+    def _compile_fields(self, config_type):
+        return {
+            field_name: (
+                field_def,
+                EvaluationStackPathEntry(field_name),
+                self.compile(field_def.config_type),
+            )
+            for field_name, field_def in config_type.fields.items()
+        }
+
+    def _compile_selector(self, config_type):
+        compiled_fields = self._compile_fields(config_type)
+
+        def _resolve_selector(config_value, path):
+            if config_value:
+                check.invariant(config_value and len(config_value) == 1)
+                field_name, incoming_field_value = ensure_single_item(config_value)
+            else:
+                field_name, field_def = ensure_single_item(config_type.fields)
+                incoming_field_value = (
+                    field_def.default_value if field_def.default_provided else None
+                )
+
+            field_def, entry, process_field = compiled_fields[field_name]
+
+            value, errors = process_field(
+                {}
+                if incoming_field_value is None
+                and ConfigTypeKind.has_fields(field_def.config_type.kind)
+                else incoming_field_value,
+                path + (entry,),
             )
+            if errors:
+                return None, errors
+
+            return frozendict({field_name: value}), None
+
+        return _resolve_selector
+
+    def _compile_shape(self, config_type):
+        compiled_fields = list(self._compile_fields(config_type).items())
+        is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+
+        def _resolve_shape(config_value, path):
+            config_value = check.opt_dict_param(config_value, "config_value", key_type=str)
 
-        elif field_def.is_required:
-            check.failed("Missing required composite member not caught in validation")
+            processed_fields = {}
+            errors = []
 
-    # For permissive composite fields, we skip applying defaults because these fields are unknown
-    # to us
+            for field_name, (field_def, entry, process_field) in compiled_fields:
+                if field_name in config_value:
+                    value, field_errors = process_field(config_value[field_name], path + (entry,))
+                elif field_def.default_provided:
+                    value, field_errors = process_field(field_def.default_value, path + (entry,))
+                elif field_def.is_required:
+                    check.failed("Missing required composite member not caught in validation")
+                else:
+                    continue
 
-    if context.config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE:
-        defined_fields = set(fields.keys())
-        extra_fields = incoming_fields - defined_fields
-        for extra_field in extra_fields:
-            processed_fields[extra_field] = EvaluateValueResult.for_value(config_value[extra_field])
+                if field_errors:
+                    errors += field_errors
+                else:
+                    processed_fields[field_name] = value
 
-    errors = []
-    for result in processed_fields.values():
-        if not result.success:
-            for error in result.errors:
-                errors.append(error)
+            # For permissive composite fields, we skip applying defaults because these fields are
+            # unknown to us
+            if is_permissive:
+                for extra_field in set(config_value.keys()) - set(config_type.fields.keys()):
+                    processed_fields[extra_field] = config_value[extra_field]
 
-    if errors:
-        return EvaluateValueResult.for_errors(errors)
+            if errors:
+                return None, errors
 
-    return EvaluateValueResult.for_value(
-        frozendict({key: result.value for key, result in processed_fields.items()})
-    )
+            return frozendict(processed_fields), None
 
+        return _resolve_shape
 
-def _recurse_in_to_array(context, config_value):
-    check.invariant(context.config_type.kind == ConfigTypeKind.ARRAY, "Unexpected non array type")
+    def _compile_array(self, config_type):
+        process_item = self.compile(config_type.inner_type)
+        allows_none = config_type.inner_type.kind == ConfigTypeKind.NONEABLE
 
-    if not config_value:
-        return EvaluateValueResult.for_value([])
+        def _resolve_array(config_value, path):
+            if not config_value:
+                return [], None
 
-    if context.config_type.inner_type.kind != ConfigTypeKind.NONEABLE:
-        if any((cv is None for cv in config_value)):
-            check.failed("Null array member not caught in validation")
+            if not allows_none:
+                if any((cv is None for cv in config_value)):
+                    check.failed("Null array member not caught in validation")
 
-    results = [
-        _recursively_process_config(context.for_array(idx), item)
-        for idx, item in enumerate(config_value)
-    ]
+            values = []
+            errors = []
+            for index, item in enumerate(config_value):
+                value, item_errors = process_item(item, path + (index,))
+                if item_errors:
+                    errors += item_errors
+                else:
+                    values.append(value)
 
-    errors = []
-    for result in results:
-        if not result.success:
-            errors += result.errors
+            if errors:
+                return None, errors
 
-    if errors:
-        return EvaluateValueResult.for_errors(errors)
+            return frozenlist(values), None
 
-    return EvaluateValueResult.for_value(frozenlist([result.value for result in results]))
+        return _resolve_array
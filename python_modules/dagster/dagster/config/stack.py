@@ -46,6 +46,17 @@ class EvaluationStackListItemEntry(
         return super(EvaluationStackListItemEntry, cls).__new__(cls, list_index)
 
 
+def evaluation_stack_from_path(path):
+    """Build an EvaluationStack from a tuple of EvaluationStackPathEntry and list indices, the
+    lightweight path representation threaded through compiled config validators."""
+    return EvaluationStack(
+        entries=[
+            EvaluationStackListItemEntry(entry) if isinstance(entry, int) else entry
+            for entry in path
+        ]
+    )
+
+
 def get_friendly_path_msg(stack):
     return get_friendly_path_info(stack)[0]
 
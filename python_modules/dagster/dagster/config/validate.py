@@ -2,6 +2,7 @@ import six
 
 from dagster import check
 from dagster.utils import ensure_single_item, frozendict
+from dagster.utils.cache import LRUCache
 
 from .config_type import ConfigScalarKind, ConfigTypeKind
 from .errors import (
@@ -22,310 +23,403 @@ from .errors import (
 )
 from .evaluate_value_result import EvaluateValueResult
 from .field import resolve_to_config_type
-from .iterate_types import config_schema_snapshot_from_config_type
+from .iterate_types import (
+    config_schema_snapshot_from_config_type,
+    config_type_fields_unchanged,
+    record_config_type_fields,
+)
 from .post_process import post_process_config
 from .snap import ConfigSchemaSnapshot, ConfigTypeSnap
-from .stack import EvaluationStack
+from .stack import EvaluationStackPathEntry, evaluation_stack_from_path
 from .traversal_context import ValidationContext
 
 VALID_FLOAT_TYPES = tuple(list(six.integer_types) + [float])
 
 
+def _is_config_int(config_value):
+    return not isinstance(config_value, bool) and isinstance(config_value, six.integer_types)
+
+
+_SCALAR_VALIDITY_CHECKS = {
+    ConfigScalarKind.INT: _is_config_int,
+    ConfigScalarKind.STRING: lambda config_value: isinstance(config_value, six.string_types),
+    ConfigScalarKind.BOOL: lambda config_value: isinstance(config_value, bool),
+    ConfigScalarKind.FLOAT: lambda config_value: isinstance(config_value, VALID_FLOAT_TYPES),
+    # historical snapshot without scalar kind. do no validation
+    None: lambda _config_value: True,
+}
+
+
 def is_config_scalar_valid(config_type_snap, config_value):
     check.inst_param(config_type_snap, "config_type_snap", ConfigTypeSnap)
     check.param_invariant(config_type_snap.kind == ConfigTypeKind.SCALAR, "config_type_snap")
-    if config_type_snap.scalar_kind == ConfigScalarKind.INT:
-        return not isinstance(config_value, bool) and isinstance(config_value, six.integer_types)
-    elif config_type_snap.scalar_kind == ConfigScalarKind.STRING:
-        return isinstance(config_value, six.string_types)
-    elif config_type_snap.scalar_kind == ConfigScalarKind.BOOL:
-        return isinstance(config_value, bool)
-    elif config_type_snap.scalar_kind == ConfigScalarKind.FLOAT:
-        return isinstance(config_value, VALID_FLOAT_TYPES)
-    elif config_type_snap.scalar_kind is None:
-        # historical snapshot without scalar kind. do no validation
-        return True
-    else:
+    if config_type_snap.scalar_kind not in _SCALAR_VALIDITY_CHECKS:
         check.failed("Not a supported scalar {}".format(config_type_snap))
+    return _SCALAR_VALIDITY_CHECKS[config_type_snap.scalar_kind](config_value)
 
 
-def validate_config(config_schema, config_value):
-
-    config_type = resolve_to_config_type(config_schema)
+# Validators compiled from snapshots that are not built from a config type (e.g. in dagit) are
+# cached by snapshot instance, which is held by the entry so that its id is not reused
+_VALIDATORS_BY_SNAPSHOT = LRUCache(max_size=64)
 
-    config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
 
-    return validate_config_from_snap(
-        config_schema_snapshot=config_schema_snapshot,
-        config_type_key=config_type.key,
-        config_value=config_value,
-    )
+def validate_config(config_schema, config_value):
+    config_type = resolve_to_config_type(config_schema)
+    return _get_config_type_validator(config_type)(config_value)
 
 
 def validate_config_from_snap(config_schema_snapshot, config_type_key, config_value):
     check.inst_param(config_schema_snapshot, "config_schema_snapshot", ConfigSchemaSnapshot)
     check.str_param(config_type_key, "config_type_key")
-    return _validate_config(
-        ValidationContext(
-            config_schema_snapshot=config_schema_snapshot,
-            config_type_snap=config_schema_snapshot.get_config_snap(config_type_key),
-            stack=EvaluationStack(entries=[]),
-        ),
-        config_value,
+    return _get_snapshot_validators(config_schema_snapshot).get_validator(config_type_key)(
+        config_value
     )
 
 
-def _validate_config(context, config_value):
-    check.inst_param(context, "context", ValidationContext)
-
-    kind = context.config_type_snap.kind
-
-    if kind == ConfigTypeKind.NONEABLE:
-        return (
-            EvaluateValueResult.for_value(None)
-            if config_value is None
-            else _validate_config(context.for_nullable_inner_type(), config_value)
+def _get_config_type_validator(config_type):
+    # pylint: disable=protected-access
+    compiled = config_type._compiled_validator
+    if compiled is None or not config_type_fields_unchanged(compiled[0]):
+        compiled = (
+            record_config_type_fields(config_type),
+            CompiledConfigSchemaValidators(
+                config_schema_snapshot_from_config_type(config_type)
+            ).get_validator(config_type.key),
         )
+        config_type._compiled_validator = compiled
+    return compiled[1]
 
-    if kind == ConfigTypeKind.ANY:
-        return EvaluateValueResult.for_value(config_value)  # yolo
-
-    if config_value is None:
-        return EvaluateValueResult.for_error(create_none_not_allowed_error(context))
-
-    if kind == ConfigTypeKind.SCALAR:
-        if not is_config_scalar_valid(context.config_type_snap, config_value):
-            return EvaluateValueResult.for_error(create_scalar_error(context, config_value))
-        return EvaluateValueResult.for_value(config_value)
-    elif kind == ConfigTypeKind.SELECTOR:
-        return validate_selector_config(context, config_value)
-    elif kind == ConfigTypeKind.STRICT_SHAPE:
-        return validate_shape_config(context, config_value)
-    elif kind == ConfigTypeKind.PERMISSIVE_SHAPE:
-        return validate_permissive_shape_config(context, config_value)
-    elif kind == ConfigTypeKind.ARRAY:
-        return validate_array_config(context, config_value)
-    elif kind == ConfigTypeKind.ENUM:
-        return validate_enum_config(context, config_value)
-    elif kind == ConfigTypeKind.SCALAR_UNION:
-        return _validate_scalar_union_config(context, config_value)
-    else:
-        check.failed("Unsupported ConfigTypeKind {}".format(kind))
-
-
-def _validate_scalar_union_config(context, config_value):
-    check.inst_param(context, "context", ValidationContext)
-    check.param_invariant(context.config_type_snap.kind == ConfigTypeKind.SCALAR_UNION, "context")
-    check.not_none_param(config_value, "config_value")
-
-    if isinstance(config_value, dict) or isinstance(config_value, list):
-        return _validate_config(
-            context.for_new_config_type_key(context.config_type_snap.non_scalar_type_key),
-            config_value,
-        )
-    else:
-        return _validate_config(
-            context.for_new_config_type_key(context.config_type_snap.scalar_type_key), config_value,
-        )
-
-
-def _validate_empty_selector_config(context):
-    if len(context.config_type_snap.fields) > 1:
-        return EvaluateValueResult.for_error(
-            create_selector_multiple_fields_no_field_selected_error(context)
-        )
 
-    defined_field_snap = context.config_type_snap.fields[0]
+def _get_snapshot_validators(config_schema_snapshot):
+    _snapshot, validators = _VALIDATORS_BY_SNAPSHOT.get_or_compute(
+        id(config_schema_snapshot),
+        lambda: (config_schema_snapshot, CompiledConfigSchemaValidators(config_schema_snapshot)),
+    )
+    return validators
 
-    if defined_field_snap.is_required:
-        return EvaluateValueResult.for_error(create_selector_unspecified_value_error(context))
 
-    return EvaluateValueResult.for_value({})
+class CompiledConfigSchemaValidators(object):
+    """Validators for the config types of a ConfigSchemaSnapshot.
 
+    Each config type is compiled once into a closure that validates a config value against it,
+    instead of re-walking the type snaps on every validation. Compiled validators take the value
+    and the path to it (a tuple of EvaluationStackPathEntry and list indices), and return a tuple
+    of the validated value and a list of errors, which is empty or None on success. Contexts and
+    evaluation stacks are only built when an error is reported, and the errors are identical to
+    those of the type snap traversal they replace.
+    """
 
-def validate_selector_config(context, config_value):
-    check.inst_param(context, "context", ValidationContext)
-    check.param_invariant(context.config_type_snap.kind == ConfigTypeKind.SELECTOR, "selector_type")
-    check.not_none_param(config_value, "config_value")
+    def __init__(self, config_schema_snapshot):
+        self._config_schema_snapshot = check.inst_param(
+            config_schema_snapshot, "config_schema_snapshot", ConfigSchemaSnapshot
+        )
+        self._compiled = {}
+
+    def get_validator(self, config_type_key):
+        """Return a function validating a config value against the config type with the given key
+        and returning an EvaluateValueResult."""
+        check.str_param(config_type_key, "config_type_key")
+        validate = self._compile(config_type_key)
+
+        def _validate(config_value):
+            value, errors = validate(config_value, ())
+            return EvaluateValueResult(not errors, value, errors)
+
+        return _validate
+
+    def _compile(self, config_type_key):
+        if config_type_key not in self._compiled:
+            config_type_snap = self._config_schema_snapshot.get_config_snap(config_type_key)
+            self._compiled[config_type_key] = self._compile_type_snap(config_type_snap)
+        return self._compiled[config_type_key]
+
+    def _context(self, config_type_snap, path):
+        return ValidationContext(
+            config_schema_snapshot=self._config_schema_snapshot,
+            config_type_snap=config_type_snap,
+            stack=evaluation_stack_from_path(path),
+        )
 
-    # Special case the empty dictionary, meaning no values provided for the
-    # value of the selector. # E.g. {'logging': {}}
-    # If there is a single field defined on the selector and if it is optional
-    # it passes validation. (e.g. a single logger "console")
-    if config_value == {}:
-        return _validate_empty_selector_config(context)
+    def _compile_type_snap(self, config_type_snap):
+        kind = config_type_snap.kind
+
+        if kind == ConfigTypeKind.NONEABLE:
+            return self._compile_noneable(config_type_snap)
+
+        if kind == ConfigTypeKind.ANY:
+            return lambda config_value, _path: (config_value, None)  # yolo
+
+        if kind == ConfigTypeKind.SCALAR:
+            validate = self._compile_scalar(config_type_snap)
+        elif kind == ConfigTypeKind.SELECTOR:
+            validate = self._compile_selector(config_type_snap)
+        elif kind == ConfigTypeKind.STRICT_SHAPE:
+            validate = self._compile_shape(config_type_snap, check_for_extra_incoming_fields=True)
+        elif kind == ConfigTypeKind.PERMISSIVE_SHAPE:
+            validate = self._compile_shape(config_type_snap, check_for_extra_incoming_fields=False)
+        elif kind == ConfigTypeKind.ARRAY:
+            validate = self._compile_array(config_type_snap)
+        elif kind == ConfigTypeKind.ENUM:
+            validate = self._compile_enum(config_type_snap)
+        elif kind == ConfigTypeKind.SCALAR_UNION:
+            validate = self._compile_scalar_union(config_type_snap)
+        else:
+            check.failed("Unsupported ConfigTypeKind {}".format(kind))
 
-    # Now we ensure that the used-provided config has only a a single entry
-    # and then continue the validation pass
+        def _validate_not_none(config_value, path):
+            if config_value is None:
+                return (
+                    None,
+                    [create_none_not_allowed_error(self._context(config_type_snap, path))],
+                )
+            return validate(config_value, path)
 
-    if not isinstance(config_value, dict):
-        return EvaluateValueResult.for_error(create_selector_type_error(context, config_value))
+        return _validate_not_none
 
-    if len(config_value) > 1:
-        return EvaluateValueResult.for_error(
-            create_selector_multiple_fields_error(context, config_value)
-        )
+    def _compile_noneable(self, config_type_snap):
+        validate_inner = self._compile(config_type_snap.inner_type_key)
 
-    field_name, field_value = ensure_single_item(config_value)
+        def _validate_noneable(config_value, path):
+            if config_value is None:
+                return None, None
+            return validate_inner(config_value, path)
 
-    if not context.config_type_snap.has_field(field_name):
-        return EvaluateValueResult.for_error(create_field_not_defined_error(context, field_name))
+        return _validate_noneable
 
-    field_snap = context.config_type_snap.get_field(field_name)
+    def _compile_scalar(self, config_type_snap):
+        is_valid = _SCALAR_VALIDITY_CHECKS.get(
+            config_type_snap.scalar_kind,
+            lambda config_value: is_config_scalar_valid(config_type_snap, config_value),
+        )
 
-    child_evaluate_value_result = _validate_config(
-        context.for_field_snap(field_snap),
-        # This is a very particular special case where we want someone
-        # to be able to select a selector key *without* a value
+        def _validate_scalar(config_value, path):
+            if not is_valid(config_value):
+                return (
+                    None,
+                    [create_scalar_error(self._context(config_type_snap, path), config_value)],
+                )
+            return config_value, None
+
+        return _validate_scalar
+
+    def _compile_scalar_union(self, config_type_snap):
+        validate_non_scalar = self._compile(config_type_snap.non_scalar_type_key)
+        validate_scalar = self._compile(config_type_snap.scalar_type_key)
+
+        def _validate_scalar_union(config_value, path):
+            if isinstance(config_value, (dict, list)):
+                return validate_non_scalar(config_value, path)
+            return validate_scalar(config_value, path)
+
+        return _validate_scalar_union
+
+    def _compile_field(self, field_snap):
+        return EvaluationStackPathEntry(field_snap.name), self._compile(field_snap.type_key)
+
+    def _compile_selector(self, config_type_snap):
+        compiled_fields = {
+            field_snap.name: self._compile_field(field_snap)
+            for field_snap in config_type_snap.fields
+        }
+        # This is a very particular special case where we want someone to be able to select a
+        # selector key *without* a value
         #
         # e.g.
         # storage:
         #   filesystem:
         #
-        # And we want the default values of the child elements of filesystem:
-        # to "fill in"
-        {}
-        if field_value is None
-        and ConfigTypeKind.has_fields(
-            context.config_schema_snapshot.get_config_snap(field_snap.type_key).kind
-        )
-        else field_value,
-    )
-
-    if child_evaluate_value_result.success:
-        return EvaluateValueResult.for_value(
-            frozendict({field_name: child_evaluate_value_result.value})
-        )
-    else:
-        return child_evaluate_value_result
-
-
-def _validate_shape_config(context, config_value, check_for_extra_incoming_fields):
-    check.inst_param(context, "context", ValidationContext)
-    check.not_none_param(config_value, "config_value")
-    check.bool_param(check_for_extra_incoming_fields, "check_for_extra_incoming_fields")
+        # And we want the default values of the child elements of filesystem: to "fill in"
+        fills_in_none = {
+            field_snap.name: ConfigTypeKind.has_fields(
+                self._config_schema_snapshot.get_config_snap(field_snap.type_key).kind
+            )
+            for field_snap in config_type_snap.fields
+        }
+
+        def _validate_selector(config_value, path):
+            # Special case the empty dictionary, meaning no values provided for the
+            # value of the selector. # E.g. {'logging': {}}
+            # If there is a single field defined on the selector and if it is optional
+            # it passes validation. (e.g. a single logger "console")
+            if config_value == {}:
+                return _validate_empty_selector_config(self._context(config_type_snap, path))
+
+            if not isinstance(config_value, dict):
+                return (
+                    None,
+                    [
+                        create_selector_type_error(
+                            self._context(config_type_snap, path), config_value
+                        )
+                    ],
+                )
+
+            if len(config_value) > 1:
+                return (
+                    None,
+                    [
+                        create_selector_multiple_fields_error(
+                            self._context(config_type_snap, path), config_value
+                        )
+                    ],
+                )
+
+            field_name, field_value = ensure_single_item(config_value)
+
+            if field_name not in compiled_fields:
+                return (
+                    None,
+                    [
+                        create_field_not_defined_error(
+                            self._context(config_type_snap, path), field_name
+                        )
+                    ],
+                )
+
+            entry, validate_field = compiled_fields[field_name]
+            value, errors = validate_field(
+                {} if field_value is None and fills_in_none[field_name] else field_value,
+                path + (entry,),
+            )
+            if errors:
+                return value, errors
+
+            return frozendict({field_name: value}), None
+
+        return _validate_selector
+
+    def _compile_shape(self, config_type_snap, check_for_extra_incoming_fields):
+        compiled_fields = [
+            (field_snap.name, self._compile_field(field_snap))
+            for field_snap in config_type_snap.fields
+        ]
+        defined_field_names = {field_snap.name for field_snap in config_type_snap.fields}
+        required_field_names = [
+            field_snap.name for field_snap in config_type_snap.fields if field_snap.is_required
+        ]
+
+        def _validate_shape(config_value, path):
+            if config_value and not isinstance(config_value, dict):
+                return (
+                    None,
+                    [
+                        create_dict_type_mismatch_error(
+                            self._context(config_type_snap, path), config_value
+                        )
+                    ],
+                )
+
+            incoming_field_names = set(config_value.keys())
+
+            errors = []
+
+            if check_for_extra_incoming_fields:
+                extra_fields = list(incoming_field_names - defined_field_names)
+                if len(extra_fields) == 1:
+                    errors.append(
+                        create_field_not_defined_error(
+                            self._context(config_type_snap, path), extra_fields[0]
+                        )
+                    )
+                elif extra_fields:
+                    errors.append(
+                        create_fields_not_defined_error(
+                            self._context(config_type_snap, path), extra_fields
+                        )
+                    )
+
+            missing_fields = [
+                name for name in required_field_names if name not in incoming_field_names
+            ]
+            if len(missing_fields) == 1:
+                errors.append(
+                    create_missing_required_field_error(
+                        self._context(config_type_snap, path), missing_fields[0]
+                    )
+                )
+            elif missing_fields:
+                errors.append(
+                    create_missing_required_fields_error(
+                        self._context(config_type_snap, path), missing_fields
+                    )
+                )
+
+            # dict is well-formed. now recursively validate all incoming fields
+            for name, (entry, validate_field) in compiled_fields:
+                if name in config_value:
+                    _, field_errors = validate_field(config_value[name], path + (entry,))
+                    if field_errors:
+                        errors += field_errors
+
+            if errors:
+                return None, errors
+
+            return frozendict(config_value), None
+
+        return _validate_shape
+
+    def _compile_array(self, config_type_snap):
+        validate_item = self._compile(config_type_snap.inner_type_key)
+
+        def _validate_array(config_value, path):
+            if not isinstance(config_value, list):
+                return (
+                    None,
+                    [create_array_error(self._context(config_type_snap, path), config_value)],
+                )
+
+            values = []
+            errors = []
+            for index, config_item in enumerate(config_value):
+                value, item_errors = validate_item(config_item, path + (index,))
+                if item_errors:
+                    errors += item_errors
+                else:
+                    values.append(value)
+
+            return values, errors
+
+        return _validate_array
+
+    def _compile_enum(self, config_type_snap):
+        enum_values = {enum_value.value for enum_value in config_type_snap.enum_values}
+
+        def _validate_enum(config_value, path):
+            if not isinstance(config_value, six.string_types):
+                return (
+                    None,
+                    [
+                        create_enum_type_mismatch_error(
+                            self._context(config_type_snap, path), config_value
+                        )
+                    ],
+                )
+
+            if config_value not in enum_values:
+                return (
+                    None,
+                    [
+                        create_enum_value_missing_error(
+                            self._context(config_type_snap, path), config_value
+                        )
+                    ],
+                )
+
+            return config_value, None
+
+        return _validate_enum
 
-    if config_value and not isinstance(config_value, dict):
-        return EvaluateValueResult.for_error(create_dict_type_mismatch_error(context, config_value))
 
-    field_snaps = context.config_type_snap.fields
-    defined_field_names = {fs.name for fs in field_snaps}
-
-    incoming_field_names = set(config_value.keys())
-
-    errors = []
-
-    if check_for_extra_incoming_fields:
-        _append_if_error(
-            errors,
-            _check_for_extra_incoming_fields(context, defined_field_names, incoming_field_names),
-        )
-
-    _append_if_error(
-        errors, _compute_missing_fields_error(context, field_snaps, incoming_field_names)
-    )
-
-    # dict is well-formed. now recursively validate all incoming fields
-
-    field_errors = []
-    for field_snap in context.config_type_snap.fields:
-        name = field_snap.name
-        if name in config_value:
-            field_evr = _validate_config(context.for_field_snap(field_snap), config_value[name])
-
-            if field_evr.errors:
-                field_errors += field_evr.errors
-
-    if field_errors:
-        errors += field_errors
-
-    if errors:
-        return EvaluateValueResult.for_errors(errors)
-    else:
-        return EvaluateValueResult.for_value(frozendict(config_value))
-
-
-def validate_permissive_shape_config(context, config_value):
-    check.inst_param(context, "context", ValidationContext)
-    check.invariant(context.config_type_snap.kind == ConfigTypeKind.PERMISSIVE_SHAPE)
-    check.not_none_param(config_value, "config_value")
-
-    return _validate_shape_config(context, config_value, check_for_extra_incoming_fields=False)
-
-
-def validate_shape_config(context, config_value):
-    check.inst_param(context, "context", ValidationContext)
-    check.invariant(context.config_type_snap.kind == ConfigTypeKind.STRICT_SHAPE)
-    check.not_none_param(config_value, "config_value")
-
-    return _validate_shape_config(context, config_value, check_for_extra_incoming_fields=True)
-
-
-def _append_if_error(errors, maybe_error):
-    if maybe_error:
-        errors.append(maybe_error)
-
-
-def _check_for_extra_incoming_fields(context, defined_field_names, incoming_field_names):
-    extra_fields = list(incoming_field_names - defined_field_names)
-
-    if extra_fields:
-        if len(extra_fields) == 1:
-            return create_field_not_defined_error(context, extra_fields[0])
-        else:
-            return create_fields_not_defined_error(context, extra_fields)
-
-
-def _compute_missing_fields_error(context, field_snaps, incoming_fields):
-    missing_fields = []
-
-    for field_snap in field_snaps:
-        if field_snap.is_required and field_snap.name not in incoming_fields:
-            missing_fields.append(field_snap.name)
-
-    if missing_fields:
-        if len(missing_fields) == 1:
-            return create_missing_required_field_error(context, missing_fields[0])
-        else:
-            return create_missing_required_fields_error(context, missing_fields)
-
-
-def validate_array_config(context, config_value):
-    check.inst_param(context, "context", ValidationContext)
-    check.invariant(context.config_type_snap.kind == ConfigTypeKind.ARRAY)
-    check.not_none_param(config_value, "config_value")
-
-    if not isinstance(config_value, list):
-        return EvaluateValueResult.for_error(create_array_error(context, config_value))
-
-    evaluation_results = [
-        _validate_config(context.for_array(index), config_item)
-        for index, config_item in enumerate(config_value)
-    ]
-
-    values = []
-    errors = []
-    for result in evaluation_results:
-        if result.success:
-            values.append(result.value)
-        else:
-            errors += result.errors
-
-    return EvaluateValueResult(not bool(errors), values, errors)
-
-
-def validate_enum_config(context, config_value):
-    check.inst_param(context, "context", ValidationContext)
-    check.invariant(context.config_type_snap.kind == ConfigTypeKind.ENUM)
-    check.not_none_param(config_value, "config_value")
+def _validate_empty_selector_config(context):
+    if len(context.config_type_snap.fields) > 1:
+        return None, [create_selector_multiple_fields_no_field_selected_error(context)]
 
-    if not isinstance(config_value, six.string_types):
-        return EvaluateValueResult.for_error(create_enum_type_mismatch_error(context, config_value))
+    defined_field_snap = context.config_type_snap.fields[0]
 
-    if not context.config_type_snap.has_enum_value(config_value):
-        return EvaluateValueResult.for_error(create_enum_value_missing_error(context, config_value))
+    if defined_field_snap.is_required:
+        return None, [create_selector_unspecified_value_error(context)]
 
-    return EvaluateValueResult.for_value(config_value)
+    return {}, None
 
 
 def process_config(config_type, config_dict):
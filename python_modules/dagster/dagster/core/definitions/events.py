@@ -592,6 +592,7 @@ class ObjectStoreOperationType(Enum):
     GET_OBJECT = "GET_OBJECT"
     RM_OBJECT = "RM_OBJECT"
     CP_OBJECT = "CP_OBJECT"
+    REF_OBJECT = "REF_OBJECT"
 
 
 class ObjectStoreOperation(
@@ -608,7 +609,8 @@ class ObjectStoreOperation(
     Args:
         op (ObjectStoreOperationType): The type of the operation on the object store.
         key (str): The key of the object on which the operation was performed.
-        dest_key (Optional[str]): The destination key, if any, to which the object was copied.
+        dest_key (Optional[str]): The destination key, if any, to which the object was copied, or in
+            place of which it is referenced.
         obj (Any): The object, if any, retrieved by the operation.
         serialization_strategy_name (Optional[str]): The name of the serialization strategy, if any,
             employed by the operation
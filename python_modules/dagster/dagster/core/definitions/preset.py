@@ -1,6 +1,5 @@
 from collections import namedtuple
 
-import pkg_resources
 import six
 import yaml
 
@@ -169,6 +168,8 @@ class PresetDefinition(
             DagsterInvariantViolationError: When one of the YAML documents is invalid and has a
                 parse error.
         """
+        import pkg_resources
+
         pkg_resource_defs = check.opt_list_param(
             pkg_resource_defs, "pkg_resource_defs", of_type=tuple
         )
@@ -2,7 +2,6 @@ from collections import namedtuple
 
 from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError
-from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.storage.tags import check_tags
 from dagster.utils import merge_dicts
@@ -24,6 +23,7 @@ class ScheduleExecutionContext(namedtuple("ScheduleExecutionContext", "instance"
     def __new__(
         cls, instance,
     ):
+        from dagster.core.instance import DagsterInstance
 
         return super(ScheduleExecutionContext, cls).__new__(
             cls, check.inst_param(instance, "instance", DagsterInstance),
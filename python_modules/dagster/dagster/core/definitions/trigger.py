@@ -1,7 +1,6 @@
 from collections import namedtuple
 
 from dagster import check
-from dagster.core.instance import DagsterInstance
 from dagster.utils.backcompat import experimental_class_warning
 
 from .mode import DEFAULT_MODE_NAME
@@ -20,6 +19,8 @@ class TriggeredExecutionContext(namedtuple("TriggeredExecutionContext", "instanc
     def __new__(
         cls, instance,
     ):
+        from dagster.core.instance import DagsterInstance
+
         experimental_class_warning("TriggeredExecutionContext")
         return super(TriggeredExecutionContext, cls).__new__(
             cls, check.inst_param(instance, "instance", DagsterInstance),
@@ -3,7 +3,6 @@ import os
 import re
 from glob import glob
 
-import pkg_resources
 import six
 import yaml
 
@@ -195,6 +194,8 @@ def config_from_pkg_resources(pkg_resource_defs):
         DagsterInvariantViolationError: When one of the YAML documents is invalid and has a
             parse error.
     """
+    import pkg_resources
+
     pkg_resource_defs = check.opt_list_param(pkg_resource_defs, "pkg_resource_defs", of_type=tuple)
 
     try:
@@ -440,6 +440,19 @@ class DagsterEventLogInvalidForRun(DagsterError):
         )
 
 
+class DagsterEventLogWriteError(DagsterError):
+    """Raised when events handed to the background event writer of an instance could not be
+    written to its storage."""
+
+    def __init__(self, *args, **kwargs):
+        from dagster.utils.error import SerializableErrorInfo
+
+        self.write_error_infos = check.list_param(
+            kwargs.pop("write_error_infos"), "write_error_infos", SerializableErrorInfo
+        )
+        super(DagsterEventLogWriteError, self).__init__(*args, **kwargs)
+
+
 class ScheduleExecutionError(DagsterUserCodeExecutionError):
     """Errors raised in a user process during the execution of schedule."""
 
@@ -748,6 +748,18 @@ class DagsterEvent(
                 key=object_store_operation_result.key,
                 dest_key=object_store_operation_result.dest_key,
             )
+        elif (
+            ObjectStoreOperationType(object_store_operation_result.op)
+            == ObjectStoreOperationType.REF_OBJECT
+        ):
+            message = (
+                "Referenced intermediate object for input {value_name} at {key} in place of "
+                "{dest_key}"
+            ).format(
+                value_name=value_name,
+                key=object_store_operation_result.key,
+                dest_key=object_store_operation_result.dest_key,
+            )
         else:
             message = ""
 
@@ -1,7 +1,7 @@
 from collections import namedtuple
 
 from dagster import check
-from dagster.core.events import DagsterEvent
+from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.log_manager import coerce_valid_log_level
 from dagster.serdes import (
     deserialize_json_to_dagster_namedtuple,
@@ -75,22 +75,108 @@ class LogMessageRecord(EventRecord):
     pass
 
 
+class LazyEventRecord(object):
+    """A read-only view of an EventRecord stored in an event log, which defers deserializing the
+    record until it is needed.
+
+    The run_id, step_key and dagster_event_type of the record are read from the columns that the
+    event log storage indexes them in, so filtering a run's events by type or step does not
+    deserialize the events that are filtered out. Reading any other attribute deserializes the
+    whole record, once.
+
+    Args:
+        json_str (str): The serialized EventRecord.
+        run_id (str): The run_id column of the stored record.
+        step_key (Optional[str]): The step_key column of the stored record.
+        dagster_event_type_value (Optional[str]): The dagster_event_type column of the stored
+            record.
+    """
+
+    def __init__(self, json_str, run_id, step_key=None, dagster_event_type_value=None):
+        self._json_str = check.str_param(json_str, "json_str")
+        self._run_id = check.str_param(run_id, "run_id")
+        self._step_key = check.opt_str_param(step_key, "step_key")
+        self._dagster_event_type_value = check.opt_str_param(
+            dagster_event_type_value, "dagster_event_type_value"
+        )
+        self._event_record = None
+
+    @property
+    def event_record(self):
+        """EventRecord: The deserialized record."""
+        if self._event_record is None:
+            self._event_record = check.inst(
+                deserialize_json_to_dagster_namedtuple(self._json_str), EventRecord
+            )
+        return self._event_record
+
+    @property
+    def is_deserialized(self):
+        return self._event_record is not None
+
+    @property
+    def run_id(self):
+        return self._run_id
+
+    @property
+    def step_key(self):
+        # the step_key column is not populated for records stored before it was added
+        if self._step_key is not None:
+            return self._step_key
+        return self.event_record.step_key
+
+    @property
+    def dagster_event_type(self):
+        if self._dagster_event_type_value is not None:
+            try:
+                return DagsterEventType(self._dagster_event_type_value)
+            except ValueError:
+                # legacy event types are translated when the event is deserialized
+                pass
+        return self.event_record.dagster_event_type
+
+    @property
+    def is_dagster_event(self):
+        if self._dagster_event_type_value is not None:
+            return True
+        return self.event_record.is_dagster_event
+
+    def __getattr__(self, name):
+        # only reached for attributes not defined above
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.event_record, name)
+
+
 def construct_event_record(logger_message):
     check.inst_param(logger_message, "logger_message", StructuredLoggerMessage)
 
+    return construct_event_record_from_meta(
+        logger_message.message,
+        logger_message.level,
+        logger_message.meta,
+        logger_message.record.created,
+    )
+
+
+def construct_event_record_from_meta(message, level, meta, timestamp):
+    """Build the event record of a message logged through a DagsterLogManager, from the dagster
+    meta of the message, without requiring a logging.LogRecord."""
+    check.dict_param(meta, "meta")
+
     log_record_cls = LogMessageRecord
-    if logger_message.meta.get("dagster_event"):
+    if meta.get("dagster_event"):
         log_record_cls = DagsterEventRecord
 
     return log_record_cls(
-        message=logger_message.message,
-        level=logger_message.level,
-        user_message=logger_message.meta["orig_message"],
-        run_id=logger_message.meta["run_id"],
-        timestamp=logger_message.record.created,
-        step_key=logger_message.meta.get("step_key"),
-        pipeline_name=logger_message.meta.get("pipeline_name"),
-        dagster_event=logger_message.meta.get("dagster_event"),
+        message=message,
+        level=level,
+        user_message=meta["orig_message"],
+        run_id=meta["run_id"],
+        timestamp=timestamp,
+        step_key=meta.get("step_key"),
+        pipeline_name=meta.get("pipeline_name"),
+        dagster_event=meta.get("dagster_event"),
         error_info=None,
     )
 
@@ -574,6 +574,45 @@ def create_execution_plan(pipeline, run_config=None, mode=None, step_keys_to_exe
     )
 
 
+def create_execution_plan_for_steps(pipeline, pipeline_run, instance, step_keys, run_config=None):
+    """Create the plan for executing some of the steps of an existing run, e.g. in a subprocess or
+    a remote step worker.
+
+    The run config of a run with a snapshotted execution plan was validated when the run was
+    created, so it is not validated again, and only the steps to execute and the steps whose outputs
+    they consume are built, using the snapshot. Otherwise, the full plan for the run is built and
+    subset.
+    """
+    pipeline = _check_pipeline(pipeline)
+    check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+    check.inst_param(instance, "instance", DagsterInstance)
+    check.list_param(step_keys, "step_keys", of_type=str)
+    run_config = check.opt_dict_param(run_config, "run_config", key_type=str)
+
+    if (
+        pipeline_run.execution_plan_snapshot_id is None
+        or run_config != pipeline_run.run_config
+        or not instance.has_execution_plan_snapshot(pipeline_run.execution_plan_snapshot_id)
+    ):
+        return create_execution_plan(
+            pipeline,
+            run_config,
+            mode=pipeline_run.mode,
+            step_keys_to_execute=pipeline_run.step_keys_to_execute,
+        ).build_subset_plan(step_keys)
+
+    environment_config = EnvironmentConfig.build_from_validated(
+        pipeline.get_definition(), run_config, mode=pipeline_run.mode
+    )
+    return ExecutionPlan.build_subset_from_snapshot(
+        pipeline,
+        environment_config,
+        instance.get_execution_plan_snapshot(pipeline_run.execution_plan_snapshot_id),
+        step_keys,
+        mode=pipeline_run.mode,
+    )
+
+
 class BoolRef:
     def __init__(self, value):
         self.value = value
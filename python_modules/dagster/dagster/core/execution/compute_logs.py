@@ -4,9 +4,11 @@ import io
 import os
 import subprocess
 import sys
+import threading
 import time
 import warnings
 from contextlib import contextmanager
+from enum import Enum
 
 from dagster.core.execution import poll_compute_logs, watch_orphans
 from dagster.seven import IS_WINDOWS
@@ -14,6 +16,28 @@ from dagster.utils import delay_interrupts, ensure_file
 
 WIN_PY36_COMPUTE_LOG_DISABLED_MSG = """\u001b[33mWARNING: Compute log capture is disabled for the current environment. Set the environment variable `PYTHONLEGACYWINDOWSSTDIO` to enable.\n\u001b[0m"""
 
+# The most that the thread teeing a stream reads from its pipe at once. Writes to the stream block
+# while the pipe is full, so at most the pipe's capacity plus this is buffered in memory.
+TEE_READ_SIZE = 65536
+
+# How long to wait, when leaving tee_stream_to_file, for the thread to finish writing what was
+# written to the stream. The wait is only this long if a subprocess spawned from within still holds
+# the stream open, in which case the thread keeps teeing its output in the background.
+TEE_SHUTDOWN_TIMEOUT = 2.0
+
+
+class ComputeLogCaptureMode(Enum):
+    """How the output written to stdout and stderr is mirrored to compute log files.
+
+    TAIL redirects each stream to its file, and mirrors the file back to the original stream with a
+    tail subprocess, alongside a process that terminates the tail if the current process dies.
+    THREAD redirects each stream to a pipe, drained by a thread in the current process that writes
+    to both the file and the original stream.
+    """
+
+    TAIL = "TAIL"
+    THREAD = "THREAD"
+
 
 @contextmanager
 def redirect_to_file(stream, filepath):
@@ -30,6 +54,80 @@ def mirror_stream_to_file(stream, filepath):
             yield pids
 
 
+@contextmanager
+def tee_stream_to_file(stream, filepath):
+    """Mirrors everything written to the file descriptor of a stream, including by subprocesses, to
+    the end of a file, without spawning any processes.
+
+    The file descriptor is redirected to a pipe, which a thread drains into both the file and the
+    original file descriptor until the original is restored on exit.
+    """
+    ensure_file(filepath)
+    from_fd = _fileno(stream)
+
+    if not from_fd or should_disable_io_stream_redirect():
+        yield
+        return
+
+    stream.flush()
+    log_fd = os.open(filepath, os.O_WRONLY | os.O_APPEND)
+    copied_fd = os.dup(from_fd)
+    mirror_fd = os.dup(from_fd)
+    read_fd, write_fd = os.pipe()
+
+    # The thread owns the read end of the pipe, the log file and its own copy of the original file
+    # descriptor, and closes them once every write end of the pipe is closed. The copy kept here is
+    # only closed once the original has been restored from it.
+    tee_thread = threading.Thread(
+        target=_tee_pipe, args=(read_fd, log_fd, mirror_fd), name="tee-{}".format(filepath)
+    )
+    tee_thread.daemon = True
+    tee_thread.start()
+
+    try:
+        os.dup2(write_fd, from_fd)
+    finally:
+        os.close(write_fd)
+
+    try:
+        yield
+    finally:
+        stream.flush()
+        try:
+            os.dup2(copied_fd, from_fd)
+        finally:
+            os.close(copied_fd)
+        tee_thread.join(TEE_SHUTDOWN_TIMEOUT)
+
+
+def _tee_pipe(read_fd, log_fd, mirror_fd):
+    try:
+        while True:
+            data = os.read(read_fd, TEE_READ_SIZE)
+            if not data:
+                return
+
+            _write_all(log_fd, data)
+            if mirror_fd is not None:
+                try:
+                    _write_all(mirror_fd, data)
+                except OSError:
+                    # The original stream was closed, but the output is still written to the file
+                    os.close(mirror_fd)
+                    mirror_fd = None
+    finally:
+        os.close(read_fd)
+        os.close(log_fd)
+        if mirror_fd is not None:
+            os.close(mirror_fd)
+
+
+def _write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
 def should_disable_io_stream_redirect():
     # See https://stackoverflow.com/a/52377087
     # https://www.python.org/dev/peps/pep-0528/
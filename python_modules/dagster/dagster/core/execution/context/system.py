@@ -190,8 +190,13 @@ class SystemExecutionContext(object):
             self._execution_context_data, self._log_manager.with_tags(**step.logging_tags), step,
         )
 
-    def for_type(self, dagster_type):
-        return TypeCheckContext(self._execution_context_data, self.log, dagster_type)
+    def for_type(self, dagster_type, input_already_checked=False):
+        return TypeCheckContext(
+            self._execution_context_data,
+            self.log,
+            dagster_type,
+            input_already_checked=input_already_checked,
+        )
 
 
 class SystemPipelineExecutionContext(SystemExecutionContext):
@@ -294,19 +299,30 @@ class TypeCheckContext(SystemExecutionContext):
         log (DagsterLogManager): Centralized log dispatch from user code.
         resources (Any): An object whose attributes contain the resources available to this solid.
         run_id (str): The id of this pipeline run.
+        input_already_checked (bool): True when checking a step input whose value is the output of
+            an upstream step of this run, which already passed the type check of the same type.
     """
 
-    def __init__(self, execution_context_data, log_manager, dagster_type):
+    def __init__(
+        self, execution_context_data, log_manager, dagster_type, input_already_checked=False
+    ):
         super(TypeCheckContext, self).__init__(execution_context_data, log_manager)
         self._resources = self._execution_context_data.scoped_resources_builder.build(
             dagster_type.required_resource_keys
         )
         self._log_manager = log_manager
+        self._input_already_checked = check.bool_param(
+            input_already_checked, "input_already_checked"
+        )
 
     @property
     def resources(self):
         return self._resources
 
+    @property
+    def input_already_checked(self):
+        return self._input_already_checked
+
 
 class HookContext(SystemExecutionContext):
     """The ``context`` object available to a hook function on an DagsterEvent.
@@ -118,7 +118,19 @@ def create_context_creation_data(
     execution_plan, run_config, pipeline_run, instance,
 ):
     pipeline_def = execution_plan.pipeline.get_definition()
-    environment_config = EnvironmentConfig.build(pipeline_def, run_config, mode=pipeline_run.mode)
+
+    # reuse the environment config the plan was built with, rather than validating the run config
+    # again
+    if (
+        execution_plan.environment_config is not None
+        and execution_plan.mode == pipeline_run.mode
+        and execution_plan.environment_config.original_config_dict == run_config
+    ):
+        environment_config = execution_plan.environment_config
+    else:
+        environment_config = EnvironmentConfig.build(
+            pipeline_def, run_config, mode=pipeline_run.mode
+        )
 
     mode_def = pipeline_def.get_mode_definition(pipeline_run.mode)
     system_storage_def = system_storage_def_from_config(mode_def, environment_config)
@@ -61,20 +61,40 @@ def copy_required_intermediates_for_execution(pipeline_context, execution_plan):
     for handle in output_handles_to_copy:
         output_handles_to_copy_by_step[handle.step_key].append(handle)
 
+    # Copy the intermediates of all the steps at once, so that the intermediate storage can run the
+    # copies concurrently
+    steps = execution_plan.topological_steps()
+    step_output_handles = [
+        handle for step in steps for handle in output_handles_to_copy_by_step.get(step.key, [])
+    ]
     intermediate_storage = pipeline_context.intermediate_storage
-    for step in execution_plan.topological_steps():
-        step_context = pipeline_context.for_step(step)
-        for handle in output_handles_to_copy_by_step.get(step.key, []):
-            if intermediate_storage.has_intermediate(pipeline_context, handle):
-                continue
-
-            operation = intermediate_storage.copy_intermediate_from_run(
-                pipeline_context, parent_run_id, handle
+    parent_run_manifest = intermediate_manifest_from_event_logs(parent_run_logs)
+    if pipeline_context.pipeline_run.is_zero_copy_reexecution:
+        # Every process executing part of the run references the intermediates that it reads, but
+        # only records the references that no other process has recorded yet
+        recorded_handles = set(
+            intermediate_manifest_from_event_logs(
+                pipeline_context.instance.all_logs(pipeline_context.run_id)
             )
-            yield DagsterEvent.object_store_operation(
-                step_context,
-                ObjectStoreOperation.serializable(operation, value_name=handle.output_name),
+        )
+        copies = [
+            (handle, operation)
+            for handle, operation in intermediate_storage.reference_intermediates_from_run(
+                pipeline_context, parent_run_id, step_output_handles, parent_run_manifest
             )
+            if handle not in recorded_handles
+        ]
+    else:
+        copies = intermediate_storage.copy_intermediates_from_run(
+            pipeline_context, parent_run_id, step_output_handles, parent_run_manifest
+        )
+
+    steps_by_key = {step.key: step for step in steps}
+    for handle, operation in copies:
+        yield DagsterEvent.object_store_operation(
+            pipeline_context.for_step(steps_by_key[handle.step_key]),
+            ObjectStoreOperation.serializable(operation, value_name=handle.output_name),
+        )
 
 
 def is_intermediate_storage_write_event(record):
@@ -85,6 +105,7 @@ def is_intermediate_storage_write_event(record):
     write_ops = (
         ObjectStoreOperationType.SET_OBJECT.value,
         ObjectStoreOperationType.CP_OBJECT.value,
+        ObjectStoreOperationType.REF_OBJECT.value,
     )
     return (
         record.dagster_event.event_type_value == DagsterEventType.OBJECT_STORE_OPERATION.value
@@ -92,6 +113,89 @@ def is_intermediate_storage_write_event(record):
     )
 
 
+def _is_intermediate_reference_event(record):
+    return (
+        record.is_dagster_event
+        and record.dagster_event.event_type_value == DagsterEventType.OBJECT_STORE_OPERATION.value
+        and record.dagster_event.event_specific_data.op == ObjectStoreOperationType.REF_OBJECT.value
+    )
+
+
+def intermediate_manifest_from_event_logs(event_logs):
+    """The manifest of a run, read from its event logs: the keys of the intermediates that the run
+    references in place in the storage of other runs, by StepOutputHandle.
+    """
+    manifest = {}
+    for record in event_logs:
+        if not _is_intermediate_reference_event(record):
+            continue
+
+        event_specific_data = record.dagster_event.event_specific_data
+        key_entry = next(
+            entry for entry in event_specific_data.metadata_entries if entry.label == "key"
+        )
+        manifest[
+            StepOutputHandle(record.dagster_event.step_key, event_specific_data.value_name)
+        ] = key_entry.entry_data.path
+
+    return manifest
+
+
+def rm_run_intermediates(instance, intermediate_storage, run_id):
+    """Removes the intermediates stored by a run, except for those that other runs in its run group
+    reference in place.
+
+    Args:
+        instance (DagsterInstance): The instance holding the run and its run group.
+        intermediate_storage (ObjectStoreIntermediateStorage): The intermediate storage used by the
+            runs of the group.
+        run_id (str): The run whose intermediates are removed.
+
+    Returns:
+        List[ObjectStoreOperation]: The operations removing the intermediates.
+    """
+    from dagster.core.instance import DagsterInstance
+    from dagster.core.storage.intermediate_storage import ObjectStoreIntermediateStorage
+
+    check.inst_param(instance, "instance", DagsterInstance)
+    check.inst_param(intermediate_storage, "intermediate_storage", ObjectStoreIntermediateStorage)
+    check.str_param(run_id, "run_id")
+
+    run_group = instance.get_run_group(run_id)
+    if run_group is None:
+        raise DagsterRunNotFoundError(
+            "Run id {} was not found in instance".format(run_id), invalid_run_id=run_id
+        )
+
+    _, runs = run_group
+    referenced_keys = set()
+    for run in runs:
+        if run.run_id != run_id:
+            referenced_keys.update(
+                intermediate_manifest_from_event_logs(instance.all_logs(run.run_id)).values()
+            )
+
+    # Every output that the run wrote, including those of steps that went on to fail
+    written_handles = set()
+    for record in instance.all_logs(run_id):
+        if is_intermediate_storage_write_event(record) and not _is_intermediate_reference_event(
+            record
+        ):
+            written_handles.add(
+                StepOutputHandle(
+                    record.dagster_event.step_key,
+                    record.dagster_event.event_specific_data.value_name,
+                )
+            )
+
+    keys = [intermediate_storage.key_for_run(run_id, handle) for handle in written_handles]
+    return [
+        intermediate_storage.object_store.rm_object(key)
+        for key in sorted(keys)
+        if key not in referenced_keys
+    ]
+
+
 def output_handles_from_event_logs(event_logs):
     output_handles_from_previous_run = set()
     failed_step_keys = set(
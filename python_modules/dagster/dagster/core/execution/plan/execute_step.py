@@ -6,6 +6,7 @@ from dagster.core.definitions import (
     Materialization,
     Output,
     RetryRequested,
+    SolidHandle,
     TypeCheck,
 )
 from dagster.core.errors import (
@@ -128,6 +129,26 @@ def _create_step_input_event(step_context, input_name, type_check, success):
     )
 
 
+def _is_input_already_checked(step_context, step_input):
+    """Whether the value of a step input is an output of an upstream step of this run of the same
+    dagster type, in which case it passed the same type check before it was stored. An input from
+    an output of a parent run, on re-execution, is not."""
+    if not step_input.is_from_single_output:
+        return False
+
+    step_output_handle = step_input.source_handles[0]
+    step_keys_to_execute = step_context.pipeline_run.step_keys_to_execute
+    if step_keys_to_execute is not None and step_output_handle.step_key not in step_keys_to_execute:
+        return False
+
+    # outputs are always resolved to the compute step of the solid that yields them
+    solid_handle_str, _, _suffix = step_output_handle.step_key.rpartition(".")
+    output_def = step_context.pipeline_def.get_solid(
+        SolidHandle.from_string(solid_handle_str)
+    ).output_def_named(step_output_handle.output_name)
+    return output_def.dagster_type.key == step_input.dagster_type.key
+
+
 def _type_checked_event_sequence_for_input(step_context, input_name, input_value):
     check.inst_param(step_context, "step_context", SystemStepExecutionContext)
     check.str_param(input_name, "input_name")
@@ -150,7 +171,12 @@ def _type_checked_event_sequence_for_input(step_context, input_name, input_value
         ),
     ):
         type_check = _do_type_check(
-            step_context.for_type(step_input.dagster_type), step_input.dagster_type, input_value,
+            step_context.for_type(
+                step_input.dagster_type,
+                input_already_checked=_is_input_already_checked(step_context, step_input),
+            ),
+            step_input.dagster_type,
+            input_value,
         )
 
         yield _create_step_input_event(
@@ -32,9 +32,16 @@ class _PlanBuilder(object):
     (solid_name, output_name) to particular step outputs. This covers the case where a solid maps to
     multiple steps and one wants to be able to attach to the logical output of a solid during
     execution.
+
+    execution_plan_snapshot Optional[ExecutionPlanSnapshot]: a snapshot of a plan previously built
+    for the same pipeline and environment config. If provided, steps are only created for the steps
+    to execute and the steps whose outputs they consume, and the keys of all other steps are read
+    from the snapshot.
     """
 
-    def __init__(self, pipeline, environment_config, mode, step_keys_to_execute):
+    def __init__(
+        self, pipeline, environment_config, mode, step_keys_to_execute, execution_plan_snapshot=None
+    ):
         self.pipeline = check.inst_param(pipeline, "pipeline", ExecutablePipeline)
         self.environment_config = check.inst_param(
             environment_config, "environment_config", EnvironmentConfig
@@ -51,6 +58,29 @@ class _PlanBuilder(object):
         self.step_output_map = dict()
         self._seen_keys = set()
 
+        self._snapshot_step_keys_by_handle = None
+        self._solid_handles_to_build = None
+        if execution_plan_snapshot is not None:
+            check.invariant(
+                step_keys_to_execute is not None,
+                "Must provide step_keys_to_execute when building from an execution plan snapshot",
+            )
+            step_snaps = {step_snap.key: step_snap for step_snap in execution_plan_snapshot.steps}
+            self._snapshot_step_keys_by_handle = {
+                step_snap.solid_handle_id: step_snap.key for step_snap in step_snaps.values()
+            }
+            self._solid_handles_to_build = set()
+            for step_key in step_keys_to_execute:
+                # missing steps are reported when the plan is constructed
+                if step_key not in step_snaps:
+                    continue
+                self._solid_handles_to_build.add(step_snaps[step_key].solid_handle_id)
+                for input_snap in step_snaps[step_key].inputs:
+                    for upstream_step_key in input_snap.upstream_step_keys:
+                        self._solid_handles_to_build.add(
+                            step_snaps[upstream_step_key].solid_handle_id
+                        )
+
     @property
     def pipeline_name(self):
         return self.pipeline.get_definition().name
@@ -75,6 +105,18 @@ class _PlanBuilder(object):
         check.inst_param(handle, "handle", SolidHandle)
         return self._steps[handle.to_string()]
 
+    def get_step_key_by_handle(self, handle):
+        check.inst_param(handle, "handle", SolidHandle)
+        if handle.to_string() in self._steps:
+            return self._steps[handle.to_string()].key
+        return self._snapshot_step_keys_by_handle[handle.to_string()]
+
+    def should_build_step(self, handle):
+        check.inst_param(handle, "handle", SolidHandle)
+        return self._solid_handles_to_build is None or (
+            handle.to_string() in self._solid_handles_to_build
+        )
+
     def get_output_handle(self, key):
         check.inst_param(key, "key", SolidOutputHandle)
         return self.step_output_map[key]
@@ -98,7 +140,8 @@ class _PlanBuilder(object):
 
         for step in self._steps.values():
             for step_input in step.step_inputs:
-                deps[step.key].update(step_input.dependency_keys)
+                # steps that were not built from a snapshot are not part of the plan
+                deps[step.key].update(step_input.dependency_keys.intersection(deps))
 
         step_dict = {step.key: step for step in self._steps.values()}
 
@@ -107,7 +150,13 @@ class _PlanBuilder(object):
         ]
 
         return ExecutionPlan(
-            self.pipeline, step_dict, deps, self.storage_is_persistent(), step_keys_to_execute,
+            self.pipeline,
+            step_dict,
+            deps,
+            self.storage_is_persistent(),
+            step_keys_to_execute,
+            environment_config=self.environment_config,
+            mode=self.mode_definition.name,
         )
 
     def storage_is_persistent(self):
@@ -129,6 +178,12 @@ class _PlanBuilder(object):
         for solid in solids:
             handle = SolidHandle(solid.name, parent_handle)
 
+            # Skip creating steps that are not needed when building from a snapshot, keeping track
+            # of their outputs for the steps downstream of them
+            if isinstance(solid.definition, SolidDefinition) and not self.should_build_step(handle):
+                self._set_solid_output_handles(solid, handle)
+                continue
+
             ### 1. INPUTS
             # Create and add execution plan steps for solid inputs
             step_inputs = []
@@ -179,19 +234,23 @@ class _PlanBuilder(object):
 
             ### 3. OUTPUTS
             # Create output handles for solid outputs
-            for name, output_def in solid.definition.output_dict.items():
-                output_handle = solid.output_handle(name)
+            self._set_solid_output_handles(solid, handle)
 
-                # Punch through layers of composition scope to map to the output of the
-                # actual compute step
-                resolved_output_def, resolved_handle = solid.definition.resolve_output_to_origin(
-                    output_def.name, handle
-                )
-                compute_step = self.get_step_by_handle(resolved_handle)
-                self.set_output_handle(
-                    output_handle,
-                    StepOutputHandle.from_step(compute_step, resolved_output_def.name),
-                )
+    def _set_solid_output_handles(self, solid, handle):
+        for name, output_def in solid.definition.output_dict.items():
+            output_handle = solid.output_handle(name)
+
+            # Punch through layers of composition scope to map to the output of the
+            # actual compute step
+            resolved_output_def, resolved_handle = solid.definition.resolve_output_to_origin(
+                output_def.name, handle
+            )
+            self.set_output_handle(
+                output_handle,
+                StepOutputHandle(
+                    self.get_step_key_by_handle(resolved_handle), resolved_output_def.name
+                ),
+            )
 
 
 def get_step_input(
@@ -278,11 +337,20 @@ def get_step_input(
 
 class ExecutionPlan(
     namedtuple(
-        "_ExecutionPlan", "pipeline step_dict deps steps artifacts_persisted step_keys_to_execute",
+        "_ExecutionPlan",
+        "pipeline step_dict deps steps artifacts_persisted step_keys_to_execute environment_config "
+        "mode",
     )
 ):
     def __new__(
-        cls, pipeline, step_dict, deps, artifacts_persisted, step_keys_to_execute,
+        cls,
+        pipeline,
+        step_dict,
+        deps,
+        artifacts_persisted,
+        step_keys_to_execute,
+        environment_config=None,
+        mode=None,
     ):
         missing_steps = [step_key for step_key in step_keys_to_execute if step_key not in step_dict]
         if missing_steps:
@@ -304,6 +372,10 @@ class ExecutionPlan(
             step_keys_to_execute=check.list_param(
                 step_keys_to_execute, "step_keys_to_execute", of_type=str
             ),
+            environment_config=check.opt_inst_param(
+                environment_config, "environment_config", EnvironmentConfig
+            ),
+            mode=check.opt_str_param(mode, "mode"),
         )
 
     @property
@@ -371,6 +443,8 @@ class ExecutionPlan(
             self.deps,
             self.artifacts_persisted,
             step_keys_to_execute,
+            environment_config=self.environment_config,
+            mode=self.mode,
         )
 
     def start(
@@ -409,3 +483,31 @@ class ExecutionPlan(
 
         # Finally, we build and return the execution plan
         return plan_builder.build()
+
+    @staticmethod
+    def build_subset_from_snapshot(
+        pipeline, environment_config, execution_plan_snapshot, step_keys_to_execute, mode=None
+    ):
+        """Build an ExecutionPlan to execute a subset of the steps of a plan that was already built
+        for the same pipeline and environment config, and snapshotted, e.g. when the run was
+        created.
+
+        Unlike build_subset_plan on a fully built plan, only the steps to execute and the steps
+        whose outputs they consume are created, so the cost of building the plan does not grow
+        with the size of the pipeline.
+        """
+        from dagster.core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+
+        check.inst_param(pipeline, "pipeline", ExecutablePipeline)
+        check.inst_param(environment_config, "environment_config", EnvironmentConfig)
+        check.inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
+        check.list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        check.opt_str_param(mode, "mode")
+
+        return _PlanBuilder(
+            pipeline,
+            environment_config,
+            mode=mode,
+            step_keys_to_execute=step_keys_to_execute,
+            execution_plan_snapshot=execution_plan_snapshot,
+        ).build()
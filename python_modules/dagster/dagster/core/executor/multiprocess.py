@@ -5,7 +5,7 @@ from dagster import EventMetadataEntry, check
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
 from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEvent, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import create_execution_plan_for_steps, execute_plan_iterator
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
@@ -45,12 +45,9 @@ class InProcessExecutorChildProcessCommand(ChildProcessCommand):
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
 
-            execution_plan = create_execution_plan(
-                pipeline=pipeline,
-                run_config=self.run_config,
-                mode=self.pipeline_run.mode,
-                step_keys_to_execute=self.pipeline_run.step_keys_to_execute,
-            ).build_subset_plan([self.step_key])
+            execution_plan = create_execution_plan_for_steps(
+                pipeline, self.pipeline_run, instance, [self.step_key], run_config=self.run_config,
+            )
 
             yield instance.report_engine_event(
                 "Executing step {} in subprocess".format(self.step_key),
@@ -3,30 +3,6 @@ from abc import ABCMeta, abstractmethod, abstractproperty
 import six
 
 from dagster import check
-from dagster.api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
-from dagster.api.snapshot_partition import (
-    sync_get_external_partition_config,
-    sync_get_external_partition_config_grpc,
-    sync_get_external_partition_names,
-    sync_get_external_partition_names_grpc,
-    sync_get_external_partition_set_execution_param_data,
-    sync_get_external_partition_set_execution_param_data_grpc,
-    sync_get_external_partition_tags,
-    sync_get_external_partition_tags_grpc,
-)
-from dagster.api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
-from dagster.api.snapshot_repository import (
-    sync_get_external_repositories,
-    sync_get_external_repositories_grpc,
-)
-from dagster.api.snapshot_schedule import (
-    sync_get_external_schedule_execution_data,
-    sync_get_external_schedule_execution_data_grpc,
-)
-from dagster.api.snapshot_trigger import (
-    sync_get_external_trigger_execution_params,
-    sync_get_external_trigger_execution_params_grpc,
-)
 from dagster.core.definitions.reconstructable import ReconstructableRepository
 from dagster.core.execution.api import create_execution_plan, execute_plan, execute_run
 from dagster.core.host_representation import (
@@ -63,13 +39,12 @@ from dagster.grpc.types import (
     PartitionSetExecutionParamArgs,
     ScheduleExecutionDataMode,
 )
-from dagster.utils.hosted_user_process import (
-    external_repo_from_def,
-    is_repository_location_in_same_python_env,
-    recon_repository_from_origin,
-)
+from dagster.utils.cache import LRUCache
+
+from .selector import PipelineSelector, normalize_solid_selection
 
-from .selector import PipelineSelector
+# Maximum number of pipeline subset results to keep in memory per repository location
+SUBSET_EXTERNAL_PIPELINE_CACHE_SIZE = 32
 
 
 class RepositoryLocation(six.with_metaclass(ABCMeta)):
@@ -200,6 +175,8 @@ class RepositoryLocation(six.with_metaclass(ABCMeta)):
 
 class InProcessRepositoryLocation(RepositoryLocation):
     def __init__(self, recon_repo):
+        from dagster.utils.hosted_user_process import external_repo_from_def
+
         self._recon_repo = check.inst_param(recon_repo, "recon_repo", ReconstructableRepository)
         self._handle = RepositoryLocationHandle.create_in_process_location(recon_repo.pointer)
 
@@ -210,6 +187,7 @@ class InProcessRepositoryLocation(RepositoryLocation):
             RepositoryHandle(repository_name=def_name, repository_location_handle=self._handle),
         )
         self._repositories = {self._external_repo.name: self._external_repo}
+        self._subset_external_pipeline_results = LRUCache(SUBSET_EXTERNAL_PIPELINE_CACHE_SIZE)
 
     @property
     def is_reload_supported(self):
@@ -249,8 +227,17 @@ class InProcessRepositoryLocation(RepositoryLocation):
 
         from dagster.cli.api import get_external_pipeline_subset_result
 
-        return get_external_pipeline_subset_result(
-            self.get_reconstructable_pipeline(selector.pipeline_name), selector.solid_selection
+        return self._subset_external_pipeline_results.get_or_compute(
+            (
+                selector.repository_name,
+                selector.pipeline_name,
+                normalize_solid_selection(selector.solid_selection),
+            ),
+            lambda: get_external_pipeline_subset_result(
+                self.get_reconstructable_pipeline(selector.pipeline_name), selector.solid_selection
+            ),
+            # failed subsets are recomputed, since the failure may not be permanent
+            should_cache=lambda subset_result: subset_result.success,
         )
 
     def get_external_execution_plan(
@@ -361,6 +348,8 @@ class InProcessRepositoryLocation(RepositoryLocation):
     def get_external_schedule_execution_data(
         self, instance, repository_handle, schedule_name, schedule_execution_data_mode
     ):
+        from dagster.utils.hosted_user_process import recon_repository_from_origin
+
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(schedule_name, "schedule_name")
@@ -379,6 +368,8 @@ class InProcessRepositoryLocation(RepositoryLocation):
         return get_external_schedule_execution(recon_repo, args)
 
     def get_external_triggered_execution_params(self, instance, repository_handle, trigger_name):
+        from dagster.utils.hosted_user_process import recon_repository_from_origin
+
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(trigger_name, "trigger_name")
@@ -409,6 +400,8 @@ class InProcessRepositoryLocation(RepositoryLocation):
 
 class GrpcServerRepositoryLocation(RepositoryLocation):
     def __init__(self, repository_location_handle):
+        from dagster.api.snapshot_repository import sync_get_external_repositories_grpc
+
         check.param_invariant(
             isinstance(repository_location_handle, GrpcServerRepositoryLocationHandle)
             or isinstance(repository_location_handle, ManagedGrpcPythonEnvRepositoryLocationHandle),
@@ -448,6 +441,8 @@ class GrpcServerRepositoryLocation(RepositoryLocation):
     def get_external_execution_plan(
         self, external_pipeline, run_config, mode, step_keys_to_execute
     ):
+        from dagster.api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
+
         check.inst_param(external_pipeline, "external_pipeline", ExternalPipeline)
         check.dict_param(run_config, "run_config")
         check.str_param(mode, "mode")
@@ -496,6 +491,8 @@ class GrpcServerRepositoryLocation(RepositoryLocation):
         return ExternalPipelineExecutionResult(event_list=event_list)
 
     def get_subset_external_pipeline_result(self, selector):
+        from dagster.api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
+
         check.inst_param(selector, "selector", PipelineSelector)
         check.invariant(
             selector.location_name == self.name,
@@ -511,6 +508,8 @@ class GrpcServerRepositoryLocation(RepositoryLocation):
         )
 
     def get_external_partition_config(self, repository_handle, partition_set_name, partition_name):
+        from dagster.api.snapshot_partition import sync_get_external_partition_config_grpc
+
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(partition_set_name, "partition_set_name")
         check.str_param(partition_name, "partition_name")
@@ -520,6 +519,8 @@ class GrpcServerRepositoryLocation(RepositoryLocation):
         )
 
     def get_external_partition_tags(self, repository_handle, partition_set_name, partition_name):
+        from dagster.api.snapshot_partition import sync_get_external_partition_tags_grpc
+
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(partition_set_name, "partition_set_name")
         check.str_param(partition_name, "partition_name")
@@ -529,6 +530,8 @@ class GrpcServerRepositoryLocation(RepositoryLocation):
         )
 
     def get_external_partition_names(self, repository_handle, partition_set_name):
+        from dagster.api.snapshot_partition import sync_get_external_partition_names_grpc
+
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(partition_set_name, "partition_set_name")
 
@@ -539,6 +542,8 @@ class GrpcServerRepositoryLocation(RepositoryLocation):
     def get_external_schedule_execution_data(
         self, instance, repository_handle, schedule_name, schedule_execution_data_mode
     ):
+        from dagster.api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
+
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(schedule_name, "schedule_name")
@@ -555,6 +560,8 @@ class GrpcServerRepositoryLocation(RepositoryLocation):
         )
 
     def get_external_triggered_execution_params(self, instance, repository_handle, trigger_name):
+        from dagster.api.snapshot_trigger import sync_get_external_trigger_execution_params_grpc
+
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(trigger_name, "trigger_name")
@@ -565,6 +572,10 @@ class GrpcServerRepositoryLocation(RepositoryLocation):
     def get_external_partition_set_execution_param_data(
         self, repository_handle, partition_set_name, partition_names
     ):
+        from dagster.api.snapshot_partition import (
+            sync_get_external_partition_set_execution_param_data_grpc,
+        )
+
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(partition_set_name, "partition_set_name")
         check.list_param(partition_names, "partition_names", of_type=str)
@@ -576,6 +587,8 @@ class GrpcServerRepositoryLocation(RepositoryLocation):
 
 class PythonEnvRepositoryLocation(RepositoryLocation):
     def __init__(self, repository_location_handle):
+        from dagster.api.snapshot_repository import sync_get_external_repositories
+
         self._handle = check.inst_param(
             repository_location_handle,
             "repository_location_handle",
@@ -643,6 +656,8 @@ class PythonEnvRepositoryLocation(RepositoryLocation):
         step_keys_to_execute,
         retries=None,
     ):
+        from dagster.utils.hosted_user_process import is_repository_location_in_same_python_env
+
         if (
             is_repository_location_in_same_python_env(self.location_handle)
             and len(self.location_handle.repository_code_pointer_dict) == 1
@@ -714,6 +729,8 @@ class PythonEnvRepositoryLocation(RepositoryLocation):
         )
 
     def get_external_partition_config(self, repository_handle, partition_set_name, partition_name):
+        from dagster.api.snapshot_partition import sync_get_external_partition_config
+
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(partition_set_name, "partition_set_name")
         check.str_param(partition_name, "partition_name")
@@ -723,6 +740,8 @@ class PythonEnvRepositoryLocation(RepositoryLocation):
         )
 
     def get_external_partition_tags(self, repository_handle, partition_set_name, partition_name):
+        from dagster.api.snapshot_partition import sync_get_external_partition_tags
+
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(partition_set_name, "partition_set_name")
         check.str_param(partition_name, "partition_name")
@@ -732,6 +751,8 @@ class PythonEnvRepositoryLocation(RepositoryLocation):
         )
 
     def get_external_partition_names(self, repository_handle, partition_set_name):
+        from dagster.api.snapshot_partition import sync_get_external_partition_names
+
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(partition_set_name, "partition_set_name")
 
@@ -740,6 +761,8 @@ class PythonEnvRepositoryLocation(RepositoryLocation):
     def get_external_schedule_execution_data(
         self, instance, repository_handle, schedule_name, schedule_execution_data_mode
     ):
+        from dagster.api.snapshot_schedule import sync_get_external_schedule_execution_data
+
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(schedule_name, "schedule_name")
@@ -752,6 +775,8 @@ class PythonEnvRepositoryLocation(RepositoryLocation):
         )
 
     def get_external_triggered_execution_params(self, instance, repository_handle, trigger_name):
+        from dagster.api.snapshot_trigger import sync_get_external_trigger_execution_params
+
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(trigger_name, "trigger_name")
@@ -760,6 +785,10 @@ class PythonEnvRepositoryLocation(RepositoryLocation):
     def get_external_partition_set_execution_param_data(
         self, repository_handle, partition_set_name, partition_names
     ):
+        from dagster.api.snapshot_partition import (
+            sync_get_external_partition_set_execution_param_data,
+        )
+
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(partition_set_name, "partition_set_name")
         check.list_param(partition_names, "partition_names", of_type=str)
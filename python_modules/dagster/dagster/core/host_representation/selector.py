@@ -3,6 +3,13 @@ from collections import namedtuple
 from dagster import check
 
 
+def normalize_solid_selection(solid_selection):
+    """Normalize a solid selection for use as a cache key. An empty selection selects the full
+    pipeline, just like None. Order is preserved, since it is recorded in the subset snapshot."""
+    check.opt_nullable_list_param(solid_selection, "solid_selection", of_type=str)
+    return tuple(solid_selection) if solid_selection else None
+
+
 class PipelineSelector(
     namedtuple("_PipelineSelector", "location_name repository_name pipeline_name solid_selection")
 ):
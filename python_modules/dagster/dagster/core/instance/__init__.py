@@ -8,7 +8,6 @@ from enum import Enum
 
 import six
 import yaml
-from rx import Observable
 
 from dagster import check, seven
 from dagster.config import Field, Permissive
@@ -20,7 +19,7 @@ from dagster.core.errors import (
     DagsterRunAlreadyExists,
     DagsterRunConflict,
 )
-from dagster.core.storage.migration.utils import upgrading_instance
+from dagster.core.log_manager import StructuredMessageLogger
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from dagster.core.utils import str_format_list
 from dagster.serdes import ConfigurableClass, whitelist_for_serdes
@@ -29,6 +28,7 @@ from dagster.utils.merger import merge_dicts
 from dagster.utils.yaml_utils import load_yaml_from_globs
 
 from .config import DAGSTER_CONFIG_YAML_FILENAME
+from .event_writer import AsyncEventWriter
 from .ref import InstanceRef, compute_logs_directory
 
 # 'airflow_execution_date' and 'is_airflow_ingest_pipeline' are hardcoded tags used in the
@@ -125,6 +125,48 @@ class _EventListenerLogHandler(logging.Handler):
             raise
 
 
+class _EventListenerLogger(StructuredMessageLogger):
+    """Stores the messages of a DagsterLogManager as event records on the instance.
+
+    The log manager hands messages to this logger directly, so no logging.LogRecord is built for
+    them. Messages logged through the standard logging API still reach the instance through the
+    _EventListenerLogHandler.
+    """
+
+    def __init__(self, instance):
+        super(_EventListenerLogger, self).__init__("__event_listener", level=logging.DEBUG)
+        self._instance = instance
+        self.addHandler(_EventListenerLogHandler(instance))
+
+    def handle_structured_message(self, level, message, meta):
+        from dagster.core.events.log import construct_event_record_from_meta
+
+        try:
+            event = construct_event_record_from_meta(message, level, meta, time.time())
+
+            self._instance.handle_new_event(event)
+
+        except Exception as e:  # pylint: disable=W0703
+            logging.critical("Error during instance event listen")
+            logging.exception(str(e))
+            raise
+
+
+def _is_event_writer_boundary(event):
+    if not event.is_dagster_event:
+        return False
+
+    dagster_event = event.dagster_event
+    return (
+        dagster_event.is_pipeline_event
+        or dagster_event.is_engine_event
+        or dagster_event.is_step_success
+        or dagster_event.is_step_failure
+        or dagster_event.is_step_skipped
+        or dagster_event.is_step_up_for_retry
+    )
+
+
 class InstanceType(Enum):
     PERSISTENT = "PERSISTENT"
     EPHEMERAL = "EPHEMERAL"
@@ -222,6 +264,15 @@ class DagsterInstance:
 
         self._subscribers = defaultdict(list)
 
+        async_event_log_settings = self.get_settings("async_event_log") or {}
+        self._async_event_writer = (
+            AsyncEventWriter(
+                self._write_event, async_event_log_settings.get("max_queue_size", 1000),
+            )
+            if async_event_log_settings.get("enabled")
+            else None
+        )
+
     # ctors
 
     @staticmethod
@@ -410,6 +461,8 @@ class DagsterInstance:
             return dagster_telemetry_enabled_default
 
     def upgrade(self, print_fn=lambda _: None):
+        from dagster.core.storage.migration.utils import upgrading_instance
+
         with upgrading_instance(self):
 
             print_fn("Updating run storage...")
@@ -422,8 +475,12 @@ class DagsterInstance:
             self._schedule_storage.upgrade()
 
     def dispose(self):
-        self._run_storage.dispose()
-        self._event_storage.dispose()
+        try:
+            if self._async_event_writer:
+                self._async_event_writer.shutdown()
+        finally:
+            self._run_storage.dispose()
+            self._event_storage.dispose()
 
     # run storage
 
@@ -455,6 +512,9 @@ class DagsterInstance:
     def get_execution_plan_snapshot(self, snapshot_id):
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
+    def has_execution_plan_snapshot(self, snapshot_id):
+        return self._run_storage.has_execution_plan_snapshot(snapshot_id)
+
     def get_run_stats(self, run_id):
         return self._event_storage.get_stats_for_run(run_id)
 
@@ -819,6 +879,9 @@ class DagsterInstance:
     def all_logs(self, run_id):
         return self._event_storage.get_logs_for_run(run_id)
 
+    def all_lazy_logs(self, run_id):
+        return self._event_storage.get_lazy_logs_for_run(run_id)
+
     def watch_event_logs(self, run_id, cursor, cb):
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -861,12 +924,26 @@ class DagsterInstance:
     # event subscriptions
 
     def get_logger(self):
-        logger = logging.Logger("__event_listener")
-        logger.addHandler(_EventListenerLogHandler(self))
-        logger.setLevel(10)
-        return logger
+        return _EventListenerLogger(self)
 
     def handle_new_event(self, event):
+        """Store an event and notify the subscribers to its run.
+
+        When the ``async_event_log`` setting is enabled, events are written on a background
+        thread, in order. Pipeline, engine and step completion events wait for every preceding
+        event to be written, and a failure to write any of them is raised as a
+        :py:class:`~dagster.core.errors.DagsterEventLogWriteError` by a later call to this
+        method.
+        """
+        if not self._async_event_writer:
+            self._write_event(event)
+            return
+
+        self._async_event_writer.put(event)
+        if _is_event_writer_boundary(event):
+            self._async_event_writer.flush()
+
+    def _write_event(self, event):
         run_id = event.run_id
 
         self._event_storage.store_event(event)
@@ -1,6 +1,6 @@
 import os
 
-from dagster import Bool, check
+from dagster import Bool, Int, check
 from dagster.config import Field, Permissive
 from dagster.config.validate import validate_config
 from dagster.core.errors import DagsterInvalidConfigError
@@ -42,4 +42,10 @@ def dagster_instance_config_schema():
         "run_launcher": config_field_for_configurable_class(),
         "telemetry": Field({"enabled": Field(Bool, default_value=True, is_required=False)}),
         "opt_in": Field({"local_servers": Field(Bool, default_value=False, is_required=False)}),
+        "async_event_log": Field(
+            {
+                "enabled": Field(Bool, default_value=False, is_required=False),
+                "max_queue_size": Field(Int, default_value=1000, is_required=False),
+            }
+        ),
     }
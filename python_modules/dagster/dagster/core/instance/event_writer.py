@@ -0,0 +1,111 @@
+"""Background writing of the events handled by a DagsterInstance."""
+
+import os
+import queue
+import sys
+import threading
+
+from dagster import check
+from dagster.core.errors import DagsterEventLogWriteError
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+_STOP = object()
+
+
+class AsyncEventWriter(object):
+    """Writes events on a background thread, in the order in which they were handed to it.
+
+    At most ``max_queue_size`` events wait to be written at any time: once the queue is full,
+    ``put`` blocks until the writer thread has caught up.
+
+    A failure to write an event does not stop the writer thread, which goes on to write the events
+    that follow it. Instead, the failure is raised as a
+    :py:class:`~dagster.core.errors.DagsterEventLogWriteError` by the next call to ``put``,
+    ``flush`` or ``shutdown`` made by a producer.
+
+    Args:
+        write_fn (Callable[[EventRecord], None]): Writes a single event. Called on the writer
+            thread.
+        max_queue_size (int): The maximum number of events waiting to be written.
+    """
+
+    def __init__(self, write_fn, max_queue_size):
+        self._write_fn = check.callable_param(write_fn, "write_fn")
+        self._max_queue_size = check.int_param(max_queue_size, "max_queue_size")
+        check.invariant(max_queue_size > 0, "max_queue_size must be positive")
+
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._write_error_infos = []
+
+    def put(self, event):
+        self._raise_write_errors()
+        self._get_queue().put(event)
+
+    def flush(self):
+        """Block until every event put so far has been written."""
+        event_queue = self._queue
+        if event_queue is not None and self._pid == os.getpid():
+            event_queue.join()
+        self._raise_write_errors()
+
+    def shutdown(self):
+        """Write any remaining events and stop the writer thread."""
+        with self._lock:
+            event_queue, thread, pid = self._queue, self._thread, self._pid
+            self._queue, self._thread, self._pid = None, None, None
+
+        if thread is not None and pid == os.getpid():
+            event_queue.put(_STOP)
+            thread.join()
+
+        self._raise_write_errors()
+
+    def _get_queue(self):
+        with self._lock:
+            # The writer thread of a parent process does not survive a fork, so a forked process
+            # starts its own
+            if self._thread is None or self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._max_queue_size)
+                self._thread = threading.Thread(
+                    target=self._write_events, args=(self._queue,), name="dagster-event-writer"
+                )
+                self._thread.daemon = True
+                self._pid = os.getpid()
+                self._thread.start()
+
+            return self._queue
+
+    def _write_events(self, event_queue):
+        while True:
+            event = event_queue.get()
+            try:
+                if event is _STOP:
+                    return
+
+                self._write_fn(event)
+            except Exception:  # pylint: disable=broad-except
+                with self._lock:
+                    self._write_error_infos.append(
+                        serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+            finally:
+                event_queue.task_done()
+
+    def _raise_write_errors(self):
+        if not self._write_error_infos:
+            return
+
+        with self._lock:
+            write_error_infos = self._write_error_infos
+            self._write_error_infos = []
+
+        raise DagsterEventLogWriteError(
+            "Failed to write {count} event(s) to the event log:\n\n{errors}".format(
+                count=len(write_error_infos),
+                errors="\n".join(error_info.to_string() for error_info in write_error_infos),
+            ),
+            write_error_infos=write_error_infos,
+        )
@@ -149,7 +149,7 @@ class InstanceRef(
             ConfigurableClassData("dagster", "DefaultRunLauncher", yaml.dump({}),),
         )
 
-        settings_keys = {"telemetry", "opt_in"}
+        settings_keys = {"telemetry", "opt_in", "async_event_log"}
         settings = {key: config_value.get(key) for key in settings_keys}
 
         return InstanceRef(
@@ -1,8 +1,10 @@
 import datetime
-import itertools
 import logging
+from abc import ABCMeta, abstractmethod
 from collections import OrderedDict, namedtuple
 
+import six
+
 from dagster import check, seven
 from dagster.core.utils import make_new_run_id
 from dagster.utils import frozendict, merge_dicts
@@ -26,6 +28,11 @@ PYTHON_LOGGING_LEVELS_NAMES = frozenset(
 )
 
 
+_RESERVED_MESSAGE_PROPS = frozenset(
+    ["extra", "exc_info", "orig_message", "message", "log_message_id", "log_timestamp"]
+)
+
+
 def _dump_value(value):
     # dump namedtuples as objects instead of arrays
     if isinstance(value, tuple) and hasattr(value, "_asdict"):
@@ -34,13 +41,9 @@ def _dump_value(value):
     return seven.json.dumps(value)
 
 
-def construct_log_string(synth_props, logging_tags, message_props):
-    from dagster.core.execution.plan.objects import StepFailureData
-
-    format_str = "{key:>20} = {value}"
-
-    # reduce noise and key duplication
-    skip_keys = [
+# reduce noise and key duplication
+_SKIP_LOG_STRING_KEYS = frozenset(
+    [
         "dagster_event",  #         separately included
         "event_type_value",  #      separately included
         "logging_tags",  #          separately included
@@ -51,21 +54,63 @@ def construct_log_string(synth_props, logging_tags, message_props):
         "solid_handle",  #          we have solid and solid_definition keys
         "step_kind_value",  #       can be inferred from step_key
     ]
+)
 
-    # Handle this explicitly
-    dagster_event = (
-        message_props["dagster_event"]._asdict() if "dagster_event" in message_props else {}
-    )
 
-    log_props = dict(
-        itertools.chain(logging_tags.items(), message_props.items(), dagster_event.items())
+def _format_log_prop(key, value):
+    return "{key:>20} = {value}".format(key=key, value=_dump_value(value))
+
+
+def _format_log_props(props):
+    """Format the lines of the log string contributed by a dict of props, keyed by prop name."""
+    return {
+        key: _format_log_prop(key, value)
+        for key, value in props.items()
+        if key not in _SKIP_LOG_STRING_KEYS and value != None
+    }
+
+
+def construct_log_string(synth_props, logging_tags, message_props):
+    return _construct_log_string(
+        synth_props, logging_tags, _format_log_props(logging_tags), message_props
     )
 
-    event_specific_data = log_props.get("event_specific_data")
+
+def _construct_log_string(synth_props, logging_tags, formatted_logging_tags, message_props):
+    """Build the human-readable log string.
+
+    ``formatted_logging_tags`` are the lines contributed by ``logging_tags``, as returned by
+    ``_format_log_props``. Since the logging tags of a log manager do not change between calls,
+    only the props of the individual message are formatted here.
+    """
+    from dagster.core.execution.plan.objects import StepFailureData
+
+    # Handle this explicitly
+    event_props = dict(message_props)
+    if "dagster_event" in message_props:
+        event_props.update(message_props["dagster_event"]._asdict())
+
+    def _get_prop(key, default=None):
+        return event_props[key] if key in event_props else logging_tags.get(key, default)
+
+    lines = dict(formatted_logging_tags)
+
+    def _set_line(key, value):
+        # props of the message override the logging tags, including when they are None
+        if value != None:
+            lines[key] = _format_log_prop(key, value)
+        else:
+            lines.pop(key, None)
+
+    for key, value in event_props.items():
+        if key not in _SKIP_LOG_STRING_KEYS:
+            _set_line(key, value)
+
+    event_specific_data = _get_prop("event_specific_data")
     stack = ""
     if isinstance(event_specific_data, StepFailureData):
-        log_props["error_message"] = event_specific_data.error.message
-        log_props["cls_name"] = event_specific_data.error.cls_name
+        _set_line("error_message", event_specific_data.error.message)
+        _set_line("cls_name", event_specific_data.error.cls_name)
         stack = (
             "\n"
             + "\n"
@@ -73,20 +118,15 @@ def construct_log_string(synth_props, logging_tags, message_props):
             + "\n"
             + "".join(event_specific_data.error.stack)
         )
-        log_props["user_failure_data"] = event_specific_data.user_failure_data
-        del log_props["event_specific_data"]
+        _set_line("user_failure_data", event_specific_data.user_failure_data)
+        lines.pop("event_specific_data", None)
 
-    log_props_list = [
-        format_str.format(key=key, value=_dump_value(value))
-        for key, value in sorted(log_props.items())
-        if key not in skip_keys and value != None
-    ]
-    log_props_str = "\n" + "\n".join(log_props_list) if log_props_list else ""
+    log_props_str = "\n" + "\n".join(lines[key] for key in sorted(lines)) if lines else ""
 
     log_source_prefix = (
-        "resource:%s" % log_props["resource_name"]
-        if "resource_name" in log_props
-        else log_props.get("pipeline_name", "system")
+        "resource:%s" % _get_prop("resource_name")
+        if "resource_name" in event_props or "resource_name" in logging_tags
+        else _get_prop("pipeline_name", "system")
     )
 
     prefix = " - ".join(
@@ -95,7 +135,7 @@ def construct_log_string(synth_props, logging_tags, message_props):
             (
                 log_source_prefix,
                 synth_props.get("run_id"),
-                log_props.get("event_type_value"),
+                _get_prop("event_type_value"),
                 synth_props.get("orig_message"),
             ),
         )
@@ -121,6 +161,24 @@ def coerce_valid_log_level(log_level):
     return PYTHON_LOGGING_LEVELS_MAPPING[log_level]
 
 
+class StructuredMessageLogger(six.with_metaclass(ABCMeta, logging.Logger)):
+    """A logger that is handed the structured messages of a :py:class:`DagsterLogManager`
+    directly, without going through the ``logging.LogRecord`` and handler machinery.
+
+    The log manager still only calls loggers that are enabled for the level of a message.
+    """
+
+    @abstractmethod
+    def handle_structured_message(self, level, message, meta):
+        """Handle a message logged through a :py:class:`DagsterLogManager`.
+
+        Args:
+            level (int): The Python logging level of the message.
+            message (str): The human-readable log string.
+            meta (dict): All the props of the message, including its ``dagster_event``, if any.
+        """
+
+
 class DagsterLogManager(namedtuple("_DagsterLogManager", "run_id logging_tags loggers")):
     """Centralized dispatch for logging from user code.
 
@@ -144,12 +202,20 @@ class DagsterLogManager(namedtuple("_DagsterLogManager", "run_id logging_tags lo
     """
 
     def __new__(cls, run_id, logging_tags, loggers):
-        return super(DagsterLogManager, cls).__new__(
+        log_manager = super(DagsterLogManager, cls).__new__(
             cls,
             run_id=check.str_param(run_id, "run_id"),
             logging_tags=check.dict_param(logging_tags, "logging_tags"),
             loggers=check.list_param(loggers, "loggers", of_type=logging.Logger),
         )
+        # The logging tags are fixed for the lifetime of a log manager (with_tags returns a new
+        # one), so their lines of the log string are only formatted once.
+        log_manager._formatted_logging_tags = _format_log_props(log_manager.logging_tags)
+        return log_manager
+
+    def _replace(self, **kwargs):
+        # namedtuple's _replace bypasses __new__, which formats the logging tags
+        return DagsterLogManager(**merge_dicts(self._asdict(), kwargs))
 
     def with_tags(self, **new_tags):
         """Add new tags in "new_tags" to the set of tags attached to this log manager instance, and
@@ -168,19 +234,20 @@ class DagsterLogManager(namedtuple("_DagsterLogManager", "run_id logging_tags lo
         check.str_param(orig_message, "orig_message")
         check.dict_param(message_props, "message_props")
 
-        # These are todos to further align with the Python logging API
-        check.invariant(
-            "extra" not in message_props, "do not allow until explicit support is handled"
-        )
-        check.invariant(
-            "exc_info" not in message_props, "do not allow until explicit support is handled"
-        )
-
-        # Reserved keys in the message_props -- these are system generated.
-        check.invariant("orig_message" not in message_props, "orig_message reserved value")
-        check.invariant("message" not in message_props, "message reserved value")
-        check.invariant("log_message_id" not in message_props, "log_message_id reserved value")
-        check.invariant("log_timestamp" not in message_props, "log_timestamp reserved value")
+        if not _RESERVED_MESSAGE_PROPS.isdisjoint(message_props):
+            # These are todos to further align with the Python logging API
+            check.invariant(
+                "extra" not in message_props, "do not allow until explicit support is handled"
+            )
+            check.invariant(
+                "exc_info" not in message_props, "do not allow until explicit support is handled"
+            )
+
+            # Reserved keys in the message_props -- these are system generated.
+            check.invariant("orig_message" not in message_props, "orig_message reserved value")
+            check.invariant("message" not in message_props, "message reserved value")
+            check.invariant("log_message_id" not in message_props, "log_message_id reserved value")
+            check.invariant("log_timestamp" not in message_props, "log_timestamp reserved value")
 
         log_message_id = make_new_run_id()
 
@@ -195,9 +262,9 @@ class DagsterLogManager(namedtuple("_DagsterLogManager", "run_id logging_tags lo
 
         # We first generate all props for the purpose of producing the semi-structured
         # log message via _kv_messsage
-        all_props = dict(
-            itertools.chain(synth_props.items(), self.logging_tags.items(), message_props.items())
-        )
+        all_props = dict(synth_props)
+        all_props.update(self.logging_tags)
+        all_props.update(message_props)
 
         # So here we use the arbitrary key DAGSTER_META_KEY to store a dictionary of
         # all the meta information that dagster injects into log message.
@@ -208,7 +275,9 @@ class DagsterLogManager(namedtuple("_DagsterLogManager", "run_id logging_tags lo
         # See __init__.py:363 (makeLogRecord) in the python 3.6 logging module source
         # for the gory details.
         return (
-            construct_log_string(synth_props, self.logging_tags, message_props),
+            _construct_log_string(
+                synth_props, self.logging_tags, self._formatted_logging_tags, message_props
+            ),
             {DAGSTER_META_KEY: all_props},
         )
 
@@ -226,10 +295,18 @@ class DagsterLogManager(namedtuple("_DagsterLogManager", "run_id logging_tags lo
 
         level = coerce_valid_log_level(level)
 
+        # Only build the structured message if some logger will handle it
+        loggers = [logger_ for logger_ in self.loggers if logger_.isEnabledFor(level)]
+        if not loggers:
+            return
+
         message, extra = self._prepare_message(orig_message, message_props)
 
-        for logger_ in self.loggers:
-            logger_.log(level, message, extra=extra)
+        for logger_ in loggers:
+            if isinstance(logger_, StructuredMessageLogger):
+                logger_.handle_structured_message(level, message, extra[DAGSTER_META_KEY])
+            else:
+                logger_.log(level, message, extra=extra)
 
     def log(self, level, msg, **kwargs):
         """Invoke the underlying loggers for a given integer log level.
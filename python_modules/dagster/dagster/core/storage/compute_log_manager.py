@@ -33,6 +33,30 @@ class ComputeLogFileData(namedtuple("ComputeLogFileData", "path data cursor size
         )
 
 
+def trim_partial_utf8_character(data):
+    """Trims a multibyte UTF-8 character cut short at the end of the given bytes, such as a read of
+    a log limited to max_bytes may end with, so that the bytes can be decoded. The trimmed bytes are
+    left to the next read.
+
+    Args:
+        data (bytes): The bytes read.
+
+    Returns:
+        bytes
+    """
+    # Continuation bytes of a multibyte character are 0b10xxxxxx, and the lead byte of an n byte
+    # character starts with n ones
+    for index in range(len(data) - 1, max(len(data) - 4, -1), -1):
+        byte = six.indexbytes(data, index)
+        if byte & 0xC0 == 0x80:
+            continue
+        if byte & 0x80 == 0:
+            return data
+        num_bytes = 4 if byte >= 0xF0 else 3 if byte >= 0xE0 else 2
+        return data if index + num_bytes <= len(data) else data[:index]
+    return data
+
+
 class ComputeLogManager(six.with_metaclass(ABCMeta)):
     """Abstract base class for storing unstructured compute logs (stdout/stderr) from the compute
     steps of pipeline solids."""
@@ -223,7 +247,9 @@ class ComputeLogSubscription(object):
             if not self.cursor or update.cursor != self.cursor:
                 self.observer.on_next(update)
                 self.cursor = update.cursor
-            should_fetch = update.data and len(update.data.encode("utf-8")) >= MAX_BYTES_CHUNK_READ
+            # Each update carries at most MAX_BYTES_CHUNK_READ bytes, so a large backlog is sent
+            # as several updates
+            should_fetch = bool(update.data) and update.cursor < update.size
 
     def complete(self):
         if not self.observer:
@@ -36,6 +36,18 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
         """
 
+    def get_lazy_logs_for_run(self, run_id, cursor=-1):
+        """Get all of the logs corresponding to a run, for callers that only read some of them in
+        full. Storages that can defer deserializing their records return LazyEventRecords, which
+        have the same attributes as EventRecords; by default the records are read eagerly.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
+                i.e., if cursor is -1, all logs will be returned. (default: -1)
+        """
+        return self.get_logs_for_run(run_id, cursor=cursor)
+
     def get_stats_for_run(self, run_id):
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -9,9 +9,13 @@ from dagster import check, seven
 from dagster.core.definitions.events import AssetKey, Materialization
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import DagsterEventType
-from dagster.core.events.log import EventRecord
+from dagster.core.events.log import EventRecord, LazyEventRecord
 from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
-from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.serdes import (
+    SerializationFormat,
+    deserialize_json_to_dagster_namedtuple,
+    serialize_dagster_namedtuple_with_format,
+)
 from dagster.utils import datetime_as_float, utc_datetime_from_timestamp
 
 from ..pipeline_run import PipelineRunStatsSnapshot
@@ -38,6 +42,12 @@ class SqlEventLogStorage(EventLogStorage):
         out-of-date instance of the storage up to date.
         """
 
+    @property
+    def serialization_format(self):
+        """SerializationFormat: The format in which event records are written. Records in any
+        format can be read, so this may be changed on an existing storage."""
+        return SerializationFormat.JSON
+
     def prepare_insert_statement(self, event):
         """ Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
@@ -60,7 +70,7 @@ class SqlEventLogStorage(EventLogStorage):
         # https://stackoverflow.com/a/54386260/324449
         return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
             run_id=event.run_id,
-            event=serialize_dagster_namedtuple(event),
+            event=serialize_dagster_namedtuple_with_format(event, self.serialization_format),
             dagster_event_type=dagster_event_type,
             timestamp=utc_datetime_from_timestamp(event.timestamp),
             step_key=step_key,
@@ -104,8 +114,9 @@ class SqlEventLogStorage(EventLogStorage):
         events = {}
         try:
             for (record_id, json_str,) in results:
-                events[record_id] = check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventRecord
+                # check.inst rather than inst_param, since parameter checks may be skipped
+                events[record_id] = check.inst(
+                    deserialize_json_to_dagster_namedtuple(json_str), EventRecord
                 )
         except (seven.JSONDecodeError, check.CheckError) as err:
             six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
@@ -130,6 +141,45 @@ class SqlEventLogStorage(EventLogStorage):
         events_by_id = self.get_logs_for_run_by_log_id(run_id, cursor)
         return [event for id, event in sorted(events_by_id.items(), key=lambda x: x[0])]
 
+    def get_lazy_logs_for_run(self, run_id, cursor=-1):
+        """Get all of the logs corresponding to a run, as LazyEventRecords that are only
+        deserialized when an attribute other than run_id, step_key or dagster_event_type is read.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
+                i.e., if cursor is -1, all logs will be returned. (default: -1)
+        """
+        check.str_param(run_id, "run_id")
+        check.int_param(cursor, "cursor")
+        check.invariant(
+            cursor >= -1,
+            "Don't know what to do with negative cursor {cursor}".format(cursor=cursor),
+        )
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.event,
+                    SqlEventLogStorageTable.c.step_key,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                ]
+            )
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.id > cursor + 1)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.connect(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        return [
+            LazyEventRecord(
+                json_str, run_id, step_key=step_key, dagster_event_type_value=dagster_event_type
+            )
+            for (json_str, step_key, dagster_event_type) in results
+        ]
+
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
 
@@ -249,9 +299,7 @@ class SqlEventLogStorage(EventLogStorage):
 
         try:
             for (json_str,) in results:
-                event = check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventRecord
-                )
+                event = check.inst(deserialize_json_to_dagster_namedtuple(json_str), EventRecord)
                 if event.dagster_event.event_type == DagsterEventType.STEP_MATERIALIZATION:
                     materializations[event.step_key].append(
                         event.dagster_event.event_specific_data.materialization
@@ -315,7 +363,9 @@ class SqlEventLogStorage(EventLogStorage):
                 SqlEventLogStorageTable.update()  # pylint: disable=no-value-for-parameter
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_dagster_namedtuple(event),
+                    event=serialize_dagster_namedtuple_with_format(
+                        event, self.serialization_format
+                    ),
                     dagster_event_type=dagster_event_type,
                     timestamp=utc_datetime_from_timestamp(event.timestamp),
                     step_key=event.step_key,
@@ -18,10 +18,11 @@ from dagster.core.storage.sql import (
     get_alembic_config,
     handle_schema_errors,
     run_alembic_upgrade,
+    serialization_format_config_field,
     stamp_alembic_rev,
 )
 from dagster.core.storage.sqlite import create_db_conn_string
-from dagster.serdes import ConfigurableClass, ConfigurableClassData
+from dagster.serdes import ConfigurableClass, ConfigurableClassData, SerializationFormat
 from dagster.utils import mkdir_p
 
 from ..schema import SqlEventLogStorageMetadata
@@ -51,13 +52,22 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
     run.
+
+    The optional ``serialization_format`` param (``JSON``, ``COMPACT`` or ``COMPACT_ZLIB``) selects
+    the format in which new records are written. Records written in any format can be read.
     """
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(self, base_dir, inst_data=None, serialization_format=None):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database."""
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
+        self._serialization_format = check.opt_inst_param(
+            serialization_format,
+            "serialization_format",
+            SerializationFormat,
+            default=SerializationFormat.JSON,
+        )
 
         self._watchers = defaultdict(dict)
         self._obs = Observer()
@@ -80,9 +90,13 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     def inst_data(self):
         return self._inst_data
 
+    @property
+    def serialization_format(self):
+        return self._serialization_format
+
     @classmethod
     def config_type(cls):
-        return {"base_dir": str}
+        return {"base_dir": str, "serialization_format": serialization_format_config_field()}
 
     @staticmethod
     def from_config_value(inst_data, config_value):
@@ -3,6 +3,7 @@ from abc import ABCMeta, abstractmethod, abstractproperty
 import six
 
 from dagster import check
+from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
 from dagster.core.execution.context.system import SystemExecutionContext
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.types.dagster_type import DagsterType, resolve_dagster_type
@@ -28,6 +29,42 @@ class IntermediateStorage(six.with_metaclass(ABCMeta)):  # pylint: disable=no-in
     def copy_intermediate_from_run(self, context, run_id, step_output_handle):
         pass
 
+    def copy_intermediates_from_run(self, context, run_id, step_output_handles, run_manifest=None):
+        """Copies the intermediates for the given step output handles from another run, skipping
+        those already present in this run.
+
+        Args:
+            run_manifest (Optional[Dict[StepOutputHandle, str]]): The intermediates that the other
+                run references in place in the storage of other runs, by key. Intermediate storages
+                that support references copy these from where they are stored.
+
+        Yields a (StepOutputHandle, ObjectStoreOperation) tuple for each copy made, in the order of
+        the handles. If a copy fails, the copies that succeeded are yielded before its error is
+        raised."""
+        check.list_param(step_output_handles, "step_output_handles", of_type=StepOutputHandle)
+        check.opt_dict_param(run_manifest, "run_manifest", key_type=StepOutputHandle)
+        for handle in step_output_handles:
+            if not self.has_intermediate(context, handle):
+                yield handle, self.copy_intermediate_from_run(context, run_id, handle)
+
+    def reference_intermediates_from_run(
+        self, context, run_id, step_output_handles, run_manifest=None
+    ):
+        """References the intermediates for the given step output handles in the storage of
+        another run in place, rather than copying them, skipping those already present in this run.
+
+        Intermediate storages that cannot read intermediates across runs copy them instead.
+
+        Args:
+            run_manifest (Optional[Dict[StepOutputHandle, str]]): The intermediates that the other
+                run itself references in place, by key. These are referenced where they are stored.
+
+        Returns an iterable of (StepOutputHandle, ObjectStoreOperation) tuples, in the order of the
+        handles."""
+        return self.copy_intermediates_from_run(
+            context, run_id, step_output_handles, run_manifest=run_manifest
+        )
+
     @abstractproperty
     def is_persistent(self):
         pass
@@ -109,19 +146,33 @@ class ObjectStoreIntermediateStorage(IntermediateStorage):
         self.type_storage_plugin_registry = check.inst_param(
             type_storage_plugin_registry, "type_storage_plugin_registry", TypeStoragePluginRegistry
         )
+        # The keys of the intermediates that this run references in place in the storage of other
+        # runs, rather than storing under its own root
+        self.manifest = {}
 
     def _get_paths(self, step_output_handle):
         return ["intermediates", step_output_handle.step_key, step_output_handle.output_name]
 
+    def key_for_run(self, run_id, step_output_handle):
+        """The key at which a run stores the intermediate for a step output handle."""
+        check.str_param(run_id, "run_id")
+        check.inst_param(step_output_handle, "step_output_handle", StepOutputHandle)
+        return self.object_store.key_for_paths(
+            [self.root_for_run_id(run_id)] + self._get_paths(step_output_handle)
+        )
+
+    def _key(self, step_output_handle):
+        if step_output_handle in self.manifest:
+            return self.manifest[step_output_handle]
+        return self.key_for_run(self.run_id, step_output_handle)
+
     def get_intermediate_object(self, dagster_type, step_output_handle):
         check.inst_param(dagster_type, "dagster_type", DagsterType)
         check.inst_param(step_output_handle, "step_output_handle", StepOutputHandle)
-        paths = self._get_paths(step_output_handle)
-        check.param_invariant(len(paths) > 0, "paths")
 
-        key = self.object_store.key_for_paths([self.root] + paths)
         return self.object_store.get_object(
-            key, serialization_strategy=dagster_type.serialization_strategy
+            self._key(step_output_handle),
+            serialization_strategy=dagster_type.serialization_strategy,
         )
 
     def get_intermediate(
@@ -134,6 +185,13 @@ class ObjectStoreIntermediateStorage(IntermediateStorage):
         check.invariant(self.has_intermediate(context, step_output_handle))
 
         if self.type_storage_plugin_registry.is_registered(dagster_type):
+            # Type storage plugins read from this run's own root, so a referenced intermediate is
+            # copied there first
+            if step_output_handle in self.manifest:
+                self.object_store.cp_object(
+                    self.manifest.pop(step_output_handle),
+                    self.key_for_run(self.run_id, step_output_handle),
+                )
             return self.type_storage_plugin_registry.get(dagster_type.name).get_intermediate_object(
                 self, context, dagster_type, step_output_handle
             )
@@ -147,12 +205,13 @@ class ObjectStoreIntermediateStorage(IntermediateStorage):
     def set_intermediate_object(self, dagster_type, step_output_handle, value):
         check.inst_param(dagster_type, "dagster_type", DagsterType)
         check.inst_param(step_output_handle, "step_output_handle", StepOutputHandle)
-        paths = self._get_paths(step_output_handle)
-        check.param_invariant(len(paths) > 0, "paths")
 
-        key = self.object_store.key_for_paths([self.root] + paths)
+        # A new value is always written under this run's own root, replacing any reference
+        self.manifest.pop(step_output_handle, None)
         return self.object_store.set_object(
-            key, value, serialization_strategy=dagster_type.serialization_strategy
+            self.key_for_run(self.run_id, step_output_handle),
+            value,
+            serialization_strategy=dagster_type.serialization_strategy,
         )
 
     def set_intermediate(
@@ -170,6 +229,7 @@ class ObjectStoreIntermediateStorage(IntermediateStorage):
             )
 
         if self.type_storage_plugin_registry.is_registered(dagster_type):
+            self.manifest.pop(step_output_handle, None)
             return self.type_storage_plugin_registry.get(dagster_type.name).set_intermediate_object(
                 self, context, dagster_type, step_output_handle, value
             )
@@ -183,31 +243,95 @@ class ObjectStoreIntermediateStorage(IntermediateStorage):
     def has_intermediate(self, context, step_output_handle):
         check.opt_inst_param(context, "context", SystemExecutionContext)
         check.inst_param(step_output_handle, "step_output_handle", StepOutputHandle)
-        paths = self._get_paths(step_output_handle)
-        check.list_param(paths, "paths", of_type=str)
-        check.param_invariant(len(paths) > 0, "paths")
 
-        key = self.object_store.key_for_paths([self.root] + paths)
-        return self.object_store.has_object(key)
+        return self.object_store.has_object(self._key(step_output_handle))
 
     def rm_intermediate(self, context, step_output_handle):
         check.opt_inst_param(context, "context", SystemExecutionContext)
         check.inst_param(step_output_handle, "step_output_handle", StepOutputHandle)
-        paths = self._get_paths(step_output_handle)
-        check.param_invariant(len(paths) > 0, "paths")
-        key = self.object_store.key_for_paths([self.root] + paths)
-        return self.object_store.rm_object(key)
+
+        # Removing a referenced intermediate only drops the reference, since the object belongs to
+        # another run
+        if step_output_handle in self.manifest:
+            return ObjectStoreOperation(
+                op=ObjectStoreOperationType.RM_OBJECT,
+                key=self.manifest.pop(step_output_handle),
+                object_store_name=self.object_store.name,
+            )
+        return self.object_store.rm_object(self.key_for_run(self.run_id, step_output_handle))
 
     def copy_intermediate_from_run(self, context, run_id, step_output_handle):
         check.opt_inst_param(context, "context", SystemExecutionContext)
         check.str_param(run_id, "run_id")
         check.inst_param(step_output_handle, "step_output_handle", StepOutputHandle)
-        paths = self._get_paths(step_output_handle)
 
-        src = self.object_store.key_for_paths([self.root_for_run_id(run_id)] + paths)
-        dst = self.object_store.key_for_paths([self.root] + paths)
+        return self.object_store.cp_object(
+            self.key_for_run(run_id, step_output_handle),
+            self.key_for_run(self.run_id, step_output_handle),
+        )
+
+    def copy_intermediates_from_run(self, context, run_id, step_output_handles, run_manifest=None):
+        check.opt_inst_param(context, "context", SystemExecutionContext)
+        check.str_param(run_id, "run_id")
+        check.list_param(step_output_handles, "step_output_handles", of_type=StepOutputHandle)
+        run_manifest = check.opt_dict_param(
+            run_manifest, "run_manifest", key_type=StepOutputHandle, value_type=str
+        )
+
+        # Both the existence checks and the copies run concurrently in the object store, which
+        # matters for remote stores where each of them is a request
+        handles = self._handles_missing_from_run(step_output_handles)
+        handles_by_dst = {self.key_for_run(self.run_id, handle): handle for handle in handles}
+        src_dst_pairs = [
+            (
+                run_manifest.get(handle, self.key_for_run(run_id, handle)),
+                self.key_for_run(self.run_id, handle),
+            )
+            for handle in handles
+        ]
+        # The copies that succeeded are yielded even if another one fails, so that they are
+        # reported
+        for (_src, dst), operation in self.object_store.cp_objects(src_dst_pairs):
+            yield handles_by_dst[dst], operation
+
+    def reference_intermediates_from_run(
+        self, context, run_id, step_output_handles, run_manifest=None
+    ):
+        check.opt_inst_param(context, "context", SystemExecutionContext)
+        check.str_param(run_id, "run_id")
+        check.list_param(step_output_handles, "step_output_handles", of_type=StepOutputHandle)
+        run_manifest = check.opt_dict_param(
+            run_manifest, "run_manifest", key_type=StepOutputHandle, value_type=str
+        )
+
+        references = []
+        for handle in self._handles_missing_from_run(step_output_handles):
+            # Intermediates that the other run references are themselves referenced at their
+            # source, so that reading them never goes through more than one manifest
+            key = run_manifest.get(handle, self.key_for_run(run_id, handle))
+            self.manifest[handle] = key
+            references.append(
+                (
+                    handle,
+                    ObjectStoreOperation(
+                        op=ObjectStoreOperationType.REF_OBJECT,
+                        key=key,
+                        dest_key=self.key_for_run(self.run_id, handle),
+                        object_store_name=self.object_store.name,
+                    ),
+                )
+            )
+        return references
 
-        return self.object_store.cp_object(src, dst)
+    def _handles_missing_from_run(self, step_output_handles):
+        exists = self.object_store.has_objects(
+            [self.key_for_run(self.run_id, handle) for handle in step_output_handles]
+        )
+        return [
+            handle
+            for handle, handle_exists in zip(step_output_handles, exists)
+            if not handle_exists
+        ]
 
     def uri_for_paths(self, paths, protocol=None):
         check.list_param(paths, "paths", of_type=str)
@@ -1,14 +1,19 @@
 import hashlib
 import os
 import sys
+import threading
 from collections import defaultdict
 from contextlib import contextmanager
 
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers.polling import PollingObserver
 
-from dagster import check
-from dagster.core.execution.compute_logs import mirror_stream_to_file
+from dagster import Enum, Field, check
+from dagster.core.execution.compute_logs import (
+    ComputeLogCaptureMode,
+    mirror_stream_to_file,
+    tee_stream_to_file,
+)
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import ensure_dir, touch_file
@@ -19,23 +24,37 @@ from .compute_log_manager import (
     ComputeLogFileData,
     ComputeLogManager,
     ComputeLogSubscription,
+    trim_partial_utf8_character,
 )
 
 WATCHDOG_POLLING_TIMEOUT = 2.5
 
+# How long to wait after a watched log file is modified before notifying its subscriptions, so
+# that all the modifications made in the meantime (to either stream) are read at once
+SUBSCRIPTION_NOTIFY_DELAY = 0.1
+
 IO_TYPE_EXTENSION = {ComputeIOType.STDOUT: "out", ComputeIOType.STDERR: "err"}
 
 MAX_FILENAME_LENGTH = 255
 
+ComputeLogCaptureModeConfig = Enum.from_python_enum(ComputeLogCaptureMode)
+
 
 class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
     """Stores copies of stdout & stderr for each compute step locally on disk.
+
+    The optional ``capture_mode`` param selects how the output is copied to disk. ``TAIL``, the
+    default, mirrors the files back to the original streams with ``tail`` subprocesses; ``THREAD``
+    tees the streams from a thread in the executing process, without spawning any processes.
     """
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(self, base_dir, inst_data=None, capture_mode=None):
         self._base_dir = base_dir
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._capture_mode = check.opt_inst_param(
+            capture_mode, "capture_mode", ComputeLogCaptureMode, ComputeLogCaptureMode.TAIL
+        )
 
     @contextmanager
     def _watch_logs(self, pipeline_run, step_key=None):
@@ -45,17 +64,35 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
         key = self.get_key(pipeline_run, step_key)
         outpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDOUT)
         errpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDERR)
-        with mirror_stream_to_file(sys.stdout, outpath):
-            with mirror_stream_to_file(sys.stderr, errpath):
+        capture_stream_to_file = (
+            tee_stream_to_file
+            if self._capture_mode == ComputeLogCaptureMode.THREAD
+            else mirror_stream_to_file
+        )
+        with capture_stream_to_file(sys.stdout, outpath):
+            with capture_stream_to_file(sys.stderr, errpath):
                 yield
 
     @property
     def inst_data(self):
         return self._inst_data
 
+    @property
+    def capture_mode(self):
+        return self._capture_mode
+
     @classmethod
     def config_type(cls):
-        return {"base_dir": str}
+        return {
+            "base_dir": str,
+            "capture_mode": Field(
+                ComputeLogCaptureModeConfig,
+                is_required=False,
+                description="How stdout and stderr are copied to the compute log files. TAIL, the "
+                "default, spawns tail subprocesses for every step; THREAD tees the streams from a "
+                "thread in the process executing the step.",
+            ),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
@@ -80,22 +117,28 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
         path = self.get_local_path(run_id, key, io_type)
 
-        if not os.path.exists(path) or not os.path.isfile(path):
-            return ComputeLogFileData(path=path, data=None, cursor=0, size=0, download_url=None)
+        # Subscriptions read the files of the keys they watch through a file kept open between
+        # reads, rather than reopening the file for each of them
+        with self._subscription_manager.open_logs_file(run_id, key, path) as f:
+            if f is None:
+                return ComputeLogFileData(path=path, data=None, cursor=0, size=0, download_url=None)
 
-        # See: https://docs.python.org/2/library/stdtypes.html#file.tell for Windows behavior
-        with open(path, "rb") as f:
+            # See: https://docs.python.org/2/library/stdtypes.html#file.tell for Windows behavior
             f.seek(cursor, os.SEEK_SET)
             data = f.read(max_bytes)
-            cursor = f.tell()
             stats = os.fstat(f.fileno())
 
+        # A read cut short by max_bytes may end within a multibyte character, which is left to the
+        # next read
+        if len(data) == max_bytes and stats.st_size > cursor + max_bytes:
+            data = trim_partial_utf8_character(data)
+
         # local download path
         download_url = self.download_url(run_id, key, io_type)
         return ComputeLogFileData(
             path=path,
             data=data.decode("utf-8"),
-            cursor=cursor,
+            cursor=cursor + len(data),
             size=stats.st_size,
             download_url=download_url,
         )
@@ -133,24 +176,29 @@ class LocalComputeLogSubscriptionManager(object):
         self._watchers = {}
         self._observer = PollingObserver(WATCHDOG_POLLING_TIMEOUT)
         self._observer.start()
+        # Guards the notifications and open files below, which are used from the observer's thread,
+        # the notification timers and the threads fetching the first update of each subscription
+        self._lock = threading.RLock()
+        self._pending_notifications = {}
+        self._open_files = defaultdict(dict)
 
     def _key(self, run_id, key):
         return "{}:{}".format(run_id, key)
 
     def add_subscription(self, subscription):
         check.inst_param(subscription, "subscription", ComputeLogSubscription)
+        # A completed watch has nothing left to notify, and the subscription completes itself
+        if self._manager.is_watch_completed(subscription.run_id, subscription.key):
+            return
+
         key = self._key(subscription.run_id, subscription.key)
-        self._subscriptions[key].append(subscription)
+        with self._lock:
+            self._subscriptions[key].append(subscription)
         self.watch(subscription.run_id, subscription.key)
 
-    def remove_all_subscriptions(self, run_id, key):
-        key = self._key(run_id, key)
-        for subscription in self._subscriptions.pop(key, []):
-            subscription.complete()
-
     def watch(self, run_id, key):
-        key = self._key(run_id, key)
-        if key in self._watchers:
+        watch_key = self._key(run_id, key)
+        if watch_key in self._watchers:
             return
 
         update_paths = [
@@ -161,21 +209,91 @@ class LocalComputeLogSubscriptionManager(object):
         directory = os.path.dirname(self._manager.get_local_path(run_id, key, ComputeIOType.STDERR))
 
         ensure_dir(directory)
-        self._watchers[key] = self._observer.schedule(
+        # The observer is not scheduled under the lock, which its thread takes while it holds the
+        # observer's own lock
+        watch = self._observer.schedule(
             LocalComputeLogFilesystemEventHandler(self, run_id, key, update_paths, complete_paths),
             str(directory),
         )
+        with self._lock:
+            self._watchers[watch_key] = watch
 
     def notify_subscriptions(self, run_id, key):
         key = self._key(run_id, key)
-        for subscription in self._subscriptions[key]:
-            subscription.fetch()
+        with self._lock:
+            if key in self._pending_notifications:
+                return
+
+            notification = threading.Timer(
+                SUBSCRIPTION_NOTIFY_DELAY, self._notify_subscriptions, args=(key,)
+            )
+            notification.daemon = True
+            self._pending_notifications[key] = notification
+        notification.start()
+
+    def _notify_subscriptions(self, key):
+        with self._lock:
+            if self._pending_notifications.pop(key, None) is None:
+                return
+            for subscription in self._subscriptions.get(key, []):
+                subscription.fetch()
+
+    @contextmanager
+    def open_logs_file(self, run_id, key, path):
+        """Yields a file open for reading at the given log path, or None if there is no such file.
+
+        The files of watched keys are kept open until the watch completes. The lock of the manager
+        is only held to look up or open such a file; reads of the same file are serialized by a
+        lock of its own, since they seek it.
+        """
+        key = self._key(run_id, key)
+        with self._lock:
+            shared_file = None
+            if key in self._watchers:
+                shared_file = self._open_files[key].get(path)
+                if shared_file is None and os.path.isfile(path):
+                    shared_file = (open(path, "rb"), threading.Lock())
+                    self._open_files[key][path] = shared_file
+
+        if shared_file is not None:
+            f, file_lock = shared_file
+            with file_lock:
+                if not f.closed:
+                    yield f
+                    return
+
+        # The key is not watched, or its watch completed since the file was looked up
+        if not os.path.isfile(path):
+            yield None
+        else:
+            with open(path, "rb") as f:
+                yield f
 
     def unwatch(self, run_id, key, handler):
+        """Stops watching a key whose watch completed, and completes its subscriptions.
+
+        The subscriptions, open files and watcher of the key are removed together, so that a
+        concurrent read cannot reopen a file of the key once it is closed.
+        """
         key = self._key(run_id, key)
-        if key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[key])
-        del self._watchers[key]
+        with self._lock:
+            pending_notification = self._pending_notifications.pop(key, None)
+            if pending_notification:
+                pending_notification.cancel()
+            # The subscriptions fetch what was written since their last notification before they
+            # are completed
+            subscriptions = self._subscriptions.pop(key, [])
+            for subscription in subscriptions:
+                subscription.fetch()
+            for f, file_lock in self._open_files.pop(key, {}).values():
+                with file_lock:
+                    f.close()
+            watch = self._watchers.pop(key, None)
+
+        if watch is not None:
+            self._observer.remove_handler_for_watch(handler, watch)
+        for subscription in subscriptions:
+            subscription.complete()
 
 
 class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
@@ -190,7 +308,6 @@ class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
 
     def on_created(self, event):
         if event.src_path in self.complete_paths:
-            self.manager.remove_all_subscriptions(self.run_id, self.key)
             self.manager.unwatch(self.run_id, self.key, self)
 
     def on_modified(self, event):
@@ -1,7 +1,9 @@
 import logging
 import os
 import shutil
+import sys
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 
@@ -12,6 +14,11 @@ from dagster.utils import mkdir_p
 
 
 class ObjectStore(six.with_metaclass(ABCMeta)):
+    # The maximum number of operations run at the same time by has_objects and cp_objects. Stores
+    # backed by remote storage, where each operation is a request, benefit from running many, but
+    # only stores whose clients are safe to share between threads should raise it.
+    batch_concurrency = 1
+
     def __init__(self, name, sep="/"):
         """Create an ObjectStore.
         
@@ -63,6 +70,25 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         
         Should return a URI as a string."""
 
+    def has_objects(self, keys):
+        """Checks whether each of a list of keys exists in the object store, running up to
+        ``batch_concurrency`` checks at the same time.
+
+        Returns a list of booleans, in the order of the keys."""
+        check.list_param(keys, "keys", of_type=str)
+        return _map_concurrently(self.has_object, keys, self.batch_concurrency)
+
+    def cp_objects(self, src_dst_pairs):
+        """Copies each of a list of (src, dst) keys, running up to ``batch_concurrency`` copies at
+        the same time.
+
+        Yields each (src, dst) pair with the ObjectStoreOperation of its copy, in the order of the
+        pairs. If a copy fails, the copies that succeeded are yielded before its error is raised."""
+        check.list_param(src_dst_pairs, "src_dst_pairs", of_type=tuple)
+        return _imap_concurrently(
+            lambda src_dst: self.cp_object(*src_dst), src_dst_pairs, self.batch_concurrency
+        )
+
     def key_for_paths(self, path_fragments):
         """Joins path fragments into a key using the object-store specific path separator."""
         return self.sep.join(path_fragments)
@@ -182,10 +208,15 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
         # Ensure output path exists
         mkdir_p(os.path.dirname(dst))
 
+        # Hard links make copies without duplicating data. This is safe since set_object replaces
+        # the file at a key rather than writing to it in place.
         if os.path.isfile(src):
-            shutil.copy(src, dst)
+            _link_or_copy(src, dst)
         elif os.path.isdir(src):
-            shutil.copytree(src, dst)
+            if sys.version_info >= (3, 0):
+                shutil.copytree(src, dst, copy_function=_link_or_copy)
+            else:
+                shutil.copytree(src, dst)
         else:
             check.failed("should not get here")
 
@@ -206,3 +237,42 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
     def key_for_paths(self, path_fragments):
         """Joins path fragments into a key using the object-store specific path separator."""
         return os.path.join(*path_fragments)
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except (AttributeError, OSError):
+        # Hard links are not available on every platform and filesystem, nor across filesystems
+        shutil.copy(src, dst)
+    return dst
+
+
+def _map_concurrently(fn, items, max_workers):
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+def _imap_concurrently(fn, items, max_workers):
+    if max_workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield item, fn(item)
+        return
+
+    # Leaving the executor waits for every call to finish
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+
+    failed_future = None
+    for item, future in zip(items, futures):
+        if future.exception() is not None:
+            failed_future = failed_future or future
+            continue
+        yield item, future.result()
+
+    if failed_future is not None:
+        # raises the error of the first failed call
+        failed_future.result()
@@ -13,6 +13,7 @@ from .tags import (
     PARTITION_SET_TAG,
     RESUME_RETRY_TAG,
     SCHEDULE_NAME_TAG,
+    ZERO_COPY_REEXECUTION_TAG,
 )
 
 
@@ -269,6 +270,10 @@ class PipelineRun(
     def is_resume_retry(self):
         return self.tags.get(RESUME_RETRY_TAG) == "true"
 
+    @property
+    def is_zero_copy_reexecution(self):
+        return self.tags.get(ZERO_COPY_REEXECUTION_TAG) == "true"
+
     @property
     def previous_run_id(self):
         # Compat
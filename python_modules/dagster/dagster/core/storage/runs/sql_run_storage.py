@@ -18,7 +18,11 @@ from dagster.core.snap import (
     create_pipeline_snapshot_id,
 )
 from dagster.core.storage.tags import ROOT_RUN_ID_TAG
-from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.serdes import (
+    SerializationFormat,
+    deserialize_json_to_dagster_namedtuple,
+    serialize_dagster_namedtuple_with_format,
+)
 from dagster.seven import JSONDecodeError
 from dagster.utils import merge_dicts
 
@@ -46,6 +50,15 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         out-of-date instance of the storage up to date.
         """
 
+    @property
+    def serialization_format(self):
+        """SerializationFormat: The format in which runs and snapshots are written. Rows in any
+        format can be read, so this may be changed on an existing storage."""
+        return SerializationFormat.JSON
+
+    def _serialize(self, value):
+        return serialize_dagster_namedtuple_with_format(value, self.serialization_format)
+
     def fetchall(self, query):
         with self.connect() as conn:
             result_proxy = conn.execute(query)
@@ -80,7 +93,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
                     run_id=pipeline_run.run_id,
                     pipeline_name=pipeline_run.pipeline_name,
                     status=pipeline_run.status.value,
-                    run_body=serialize_dagster_namedtuple(pipeline_run),
+                    run_body=self._serialize(pipeline_run),
                     snapshot_id=pipeline_run.pipeline_snapshot_id,
                 )
                 conn.execute(runs_insert)
@@ -124,7 +137,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
                 .where(RunsTable.c.run_id == run_id)
                 .values(
                     status=new_pipeline_status.value,
-                    run_body=serialize_dagster_namedtuple(run.with_status(new_pipeline_status)),
+                    run_body=self._serialize(run.with_status(new_pipeline_status)),
                     update_timestamp=datetime.now(),
                 )
             )
@@ -255,9 +268,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
                 RunsTable.update()  # pylint: disable=no-value-for-parameter
                 .where(RunsTable.c.run_id == run_id)
                 .values(
-                    run_body=serialize_dagster_namedtuple(
-                        run.with_tags(merge_dicts(current_tags, new_tags))
-                    ),
+                    run_body=self._serialize(run.with_tags(merge_dicts(current_tags, new_tags))),
                     update_timestamp=datetime.now(),
                 )
             )
@@ -492,10 +503,21 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         check.not_none_param(snapshot_obj, "snapshot_obj")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
+        # snapshot bodies are always zlib compressed, so avoid compressing them twice
+        serialization_format = (
+            SerializationFormat.COMPACT
+            if self.serialization_format == SerializationFormat.COMPACT_ZLIB
+            else self.serialization_format
+        )
+
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(  # pylint: disable=no-value-for-parameter
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_dagster_namedtuple(snapshot_obj).encode()),
+                snapshot_body=zlib.compress(
+                    serialize_dagster_namedtuple_with_format(
+                        snapshot_obj, serialization_format
+                    ).encode()
+                ),
                 snapshot_type=snapshot_type.value,
             )
             conn.execute(snapshot_insert)
@@ -12,10 +12,11 @@ from dagster.core.storage.sql import (
     handle_schema_errors,
     run_alembic_downgrade,
     run_alembic_upgrade,
+    serialization_format_config_field,
     stamp_alembic_rev,
 )
 from dagster.core.storage.sqlite import create_db_conn_string
-from dagster.serdes import ConfigurableClass, ConfigurableClassData
+from dagster.serdes import ConfigurableClass, ConfigurableClassData, SerializationFormat
 from dagster.seven import urljoin, urlparse
 from dagster.utils import mkdir_p
 
@@ -44,27 +45,40 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
             base_dir: /path/to/dir
 
     The ``base_dir`` param tells the run storage where on disk to store the database.
+
+    The optional ``serialization_format`` param (``JSON``, ``COMPACT`` or ``COMPACT_ZLIB``) selects
+    the format in which new records are written. Records written in any format can be read.
     """
 
-    def __init__(self, conn_string, inst_data=None):
+    def __init__(self, conn_string, inst_data=None, serialization_format=None):
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._serialization_format = check.opt_inst_param(
+            serialization_format,
+            "serialization_format",
+            SerializationFormat,
+            default=SerializationFormat.JSON,
+        )
 
     @property
     def inst_data(self):
         return self._inst_data
 
+    @property
+    def serialization_format(self):
+        return self._serialization_format
+
     @classmethod
     def config_type(cls):
-        return {"base_dir": str}
+        return {"base_dir": str, "serialization_format": serialization_format_config_field()}
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return SqliteRunStorage.from_local(inst_data=inst_data, **config_value)
 
     @staticmethod
-    def from_local(base_dir, inst_data=None):
+    def from_local(base_dir, inst_data=None, serialization_format=None):
         check.str_param(base_dir, "base_dir")
         mkdir_p(base_dir)
         conn_string = create_db_conn_string(base_dir, "runs")
@@ -77,7 +91,7 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
         if not (db_revision and head_revision):
             stamp_alembic_rev(alembic_config, engine)
 
-        return SqliteRunStorage(conn_string, inst_data)
+        return SqliteRunStorage(conn_string, inst_data, serialization_format=serialization_format)
 
     @contextmanager
     def connect(self):
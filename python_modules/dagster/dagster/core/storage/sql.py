@@ -8,12 +8,25 @@ from alembic.config import Config
 from alembic.migration import MigrationContext  # pylint: disable=import-error
 from alembic.script import ScriptDirectory
 
+from dagster.config import Enum, Field
 from dagster.core.errors import DagsterInstanceMigrationRequired
+from dagster.serdes import SerializationFormat
 from dagster.utils import file_relative_path
 from dagster.utils.log import quieten
 
 create_engine = db.create_engine  # exported
 
+SerializationFormatConfig = Enum.from_python_enum(SerializationFormat)
+
+
+def serialization_format_config_field():
+    return Field(
+        SerializationFormatConfig,
+        is_required=False,
+        description="The format in which records are written to storage. JSON, the default, can "
+        "be read by all versions of dagster; the compact formats are smaller and faster to parse.",
+    )
+
 
 def get_alembic_config(dunder_file, config_path="alembic/alembic.ini", script_path="alembic/"):
     alembic_config = Config(file_relative_path(dunder_file, config_path))
@@ -19,6 +19,8 @@ ROOT_RUN_ID_TAG = "{prefix}root_run_id".format(prefix=SYSTEM_TAG_PREFIX)
 
 RESUME_RETRY_TAG = "{prefix}is_resume_retry".format(prefix=SYSTEM_TAG_PREFIX)
 
+ZERO_COPY_REEXECUTION_TAG = "{prefix}zero_copy_reexecution".format(prefix=SYSTEM_TAG_PREFIX)
+
 STEP_SELECTION_TAG = "{prefix}step_selection".format(prefix=SYSTEM_TAG_PREFIX)
 
 SOLID_SELECTION_TAG = "{prefix}solid_selection".format(prefix=SYSTEM_TAG_PREFIX)
@@ -81,10 +81,6 @@ class EnvironmentConfig(
         In case the run_config is invalid, this method raises a DagsterInvalidConfigError
         """
         from dagster.config.validate import process_config
-        from dagster.core.definitions.executor import ExecutorDefinition
-        from dagster.core.definitions.intermediate_storage import IntermediateStorageDefinition
-        from dagster.core.definitions.system_storage import SystemStorageDefinition
-        from .composite_descent import composite_descent
 
         check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
         run_config = check.opt_dict_param(run_config, "run_config")
@@ -101,7 +97,44 @@ class EnvironmentConfig(
                 run_config,
             )
 
-        config_value = config_evr.value
+        return EnvironmentConfig._from_config_value(
+            pipeline_def, run_config, mode, config_evr.value
+        )
+
+    @staticmethod
+    def build_from_validated(pipeline_def, run_config=None, mode=None):
+        """Instantiates an EnvironmentConfig from run config that has already been validated
+        against the config schema of the same pipeline and mode, e.g. the config of a run that is
+        being executed one step at a time. Validation is skipped, and defaults are resolved and
+        values post processed as in build.
+        """
+        from dagster.config.post_process import post_process_config
+
+        check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
+        run_config = check.opt_dict_param(run_config, "run_config")
+        check.opt_str_param(mode, "mode")
+
+        mode = mode or pipeline_def.get_default_mode_name()
+        environment_type = create_environment_type(pipeline_def, mode)
+
+        config_evr = post_process_config(environment_type, run_config)
+        if not config_evr.success:
+            raise DagsterInvalidConfigError(
+                "Error in config for pipeline {}".format(pipeline_def.name),
+                config_evr.errors,
+                run_config,
+            )
+
+        return EnvironmentConfig._from_config_value(
+            pipeline_def, run_config, mode, config_evr.value
+        )
+
+    @staticmethod
+    def _from_config_value(pipeline_def, run_config, mode, config_value):
+        from dagster.core.definitions.executor import ExecutorDefinition
+        from dagster.core.definitions.intermediate_storage import IntermediateStorageDefinition
+        from dagster.core.definitions.system_storage import SystemStorageDefinition
+        from .composite_descent import composite_descent
 
         mode_def = pipeline_def.get_mode_definition(mode)
         config_mapped_intermediate_storage_configs = config_map_objects(
@@ -23,7 +23,6 @@ from functools import wraps
 from logging.handlers import RotatingFileHandler
 
 import click
-import requests
 import six
 import yaml
 
@@ -489,6 +488,8 @@ def upload_logs(stop_event):
 
 def _upload_logs(dagster_log_dir, log_size, dagster_log_queue_dir):
     """Send POST request to telemetry server with the contents of $DAGSTER_HOME/logs/ directory """
+    import requests
+
     try:
         if log_size > 0:
             # Delete contents of dagster_log_queue_dir so that new logs can be copied over
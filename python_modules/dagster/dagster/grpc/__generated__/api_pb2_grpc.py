@@ -72,11 +72,21 @@ class DagsterApiStub(object):
             request_serializer=api__pb2.ExternalPipelineSubsetSnapshotRequest.SerializeToString,
             response_deserializer=api__pb2.ExternalPipelineSubsetSnapshotReply.FromString,
         )
+        self.StreamingExternalPipelineSubsetSnapshot = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalPipelineSubsetSnapshot",
+            request_serializer=api__pb2.ExternalPipelineSubsetSnapshotRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingChunkEvent.FromString,
+        )
         self.ExternalRepository = channel.unary_unary(
             "/api.DagsterApi/ExternalRepository",
             request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
             response_deserializer=api__pb2.ExternalRepositoryReply.FromString,
         )
+        self.StreamingExternalRepository = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalRepository",
+            request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingChunkEvent.FromString,
+        )
         self.ExternalScheduleExecution = channel.unary_unary(
             "/api.DagsterApi/ExternalScheduleExecution",
             request_serializer=api__pb2.ExternalScheduleExecutionRequest.SerializeToString,
@@ -182,12 +192,24 @@ class DagsterApiServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamingExternalPipelineSubsetSnapshot(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalRepository(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamingExternalRepository(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalScheduleExecution(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -289,11 +311,21 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalPipelineSubsetSnapshotRequest.FromString,
             response_serializer=api__pb2.ExternalPipelineSubsetSnapshotReply.SerializeToString,
         ),
+        "StreamingExternalPipelineSubsetSnapshot": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalPipelineSubsetSnapshot,
+            request_deserializer=api__pb2.ExternalPipelineSubsetSnapshotRequest.FromString,
+            response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
+        ),
         "ExternalRepository": grpc.unary_unary_rpc_method_handler(
             servicer.ExternalRepository,
             request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
             response_serializer=api__pb2.ExternalRepositoryReply.SerializeToString,
         ),
+        "StreamingExternalRepository": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalRepository,
+            request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
+            response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
+        ),
         "ExternalScheduleExecution": grpc.unary_unary_rpc_method_handler(
             servicer.ExternalScheduleExecution,
             request_deserializer=api__pb2.ExternalScheduleExecutionRequest.FromString,
@@ -613,6 +645,33 @@ class DagsterApi(object):
             metadata,
         )
 
+    @staticmethod
+    def StreamingExternalPipelineSubsetSnapshot(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalPipelineSubsetSnapshot",
+            api__pb2.ExternalPipelineSubsetSnapshotRequest.SerializeToString,
+            api__pb2.StreamingChunkEvent.FromString,
+            options,
+            channel_credentials,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalRepository(
         request,
@@ -640,6 +699,33 @@ class DagsterApi(object):
             metadata,
         )
 
+    @staticmethod
+    def StreamingExternalRepository(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalRepository",
+            api__pb2.ExternalRepositoryRequest.SerializeToString,
+            api__pb2.StreamingChunkEvent.FromString,
+            options,
+            channel_credentials,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalScheduleExecution(
         request,
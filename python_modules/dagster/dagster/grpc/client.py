@@ -1,6 +1,7 @@
 import os
 import subprocess
 import sys
+import threading
 import warnings
 from contextlib import contextmanager
 
@@ -31,6 +32,23 @@ from .types import (
 
 CLIENT_HEARTBEAT_INTERVAL = 1
 
+# Send keepalive pings on long-lived channels while calls are in flight, so that a connection to a
+# server that has gone away is detected even when a streaming call is waiting on a quiet server.
+# DagsterGrpcServer is configured to accept pings at this rate.
+CLIENT_KEEPALIVE_TIME_MS = 60000
+CLIENT_KEEPALIVE_TIMEOUT_MS = 20000
+
+SHARED_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", CLIENT_KEEPALIVE_TIME_MS),
+    ("grpc.keepalive_timeout_ms", CLIENT_KEEPALIVE_TIMEOUT_MS),
+]
+
+_shared_channels_lock = threading.Lock()
+# Dict[str, grpc.Channel], keyed by server address
+_shared_channels = {}
+# The pid that created _shared_channels -- gRPC channels can't be used across a fork
+_shared_channels_pid = None
+
 
 def client_heartbeat_thread(client, shutdown_event):
     while True:
@@ -44,11 +62,53 @@ def client_heartbeat_thread(client, shutdown_event):
             continue
 
 
+def get_shared_channel(server_address):
+    """Return the long-lived channel to server_address shared by every client in this process,
+    creating it if necessary. gRPC channels are thread-safe and multiplex concurrent calls over a
+    single connection, reconnecting on their own after transient failures."""
+    global _shared_channels_pid  # pylint: disable=global-statement
+
+    check.str_param(server_address, "server_address")
+
+    with _shared_channels_lock:
+        if _shared_channels_pid != os.getpid():
+            # Channels inherited from a parent process are unusable, but must not be closed here
+            # since they are still in use by the parent
+            _shared_channels.clear()
+            _shared_channels_pid = os.getpid()
+
+        channel = _shared_channels.get(server_address)
+        if channel is None:
+            channel = grpc.insecure_channel(server_address, options=SHARED_CHANNEL_OPTIONS)
+            _shared_channels[server_address] = channel
+
+        return channel
+
+
+def discard_shared_channel(server_address):
+    """Stop sharing the channel to server_address, so that the next call opens a new connection.
+
+    The channel is not closed, since other threads may still have calls in flight on it -- it is
+    closed once it is garbage collected."""
+    check.str_param(server_address, "server_address")
+
+    with _shared_channels_lock:
+        if _shared_channels_pid == os.getpid():
+            _shared_channels.pop(server_address, None)
+
+
+def _is_unimplemented_error(rpc_error):
+    # Servers from versions of dagster that predate a method reject calls to it as unimplemented,
+    # so that clients can fall back to an older method
+    return rpc_error.code() == grpc.StatusCode.UNIMPLEMENTED  # pylint: disable=no-member
+
+
 class DagsterGrpcClient(object):
-    def __init__(self, port=None, socket=None, host="localhost"):
+    def __init__(self, port=None, socket=None, host="localhost", use_shared_channel=True):
         self.port = check.opt_int_param(port, "port")
         self.socket = check.opt_str_param(socket, "socket")
         self.host = check.opt_str_param(host, "host")
+        self._use_shared_channel = check.bool_param(use_shared_channel, "use_shared_channel")
         check.invariant(
             port is not None if seven.IS_WINDOWS else True,
             "You must pass a valid `port` on Windows: `socket` not supported.",
@@ -66,20 +126,53 @@ class DagsterGrpcClient(object):
         else:
             self._server_address = "unix:" + os.path.abspath(socket)
 
+    @contextmanager
+    def _channel(self):
+        if not self._use_shared_channel:
+            with grpc.insecure_channel(self._server_address) as channel:
+                yield channel
+            return
+
+        try:
+            yield get_shared_channel(self._server_address)
+        except grpc.RpcError as rpc_error:
+            # The server may have been restarted or replaced, so reconnect on the next call rather
+            # than waiting out the channel's reconnect backoff
+            if rpc_error.code() == grpc.StatusCode.UNAVAILABLE:  # pylint: disable=no-member
+                discard_shared_channel(self._server_address)
+            raise
+
     def _query(self, method, request_type, **kwargs):
-        with grpc.insecure_channel(self._server_address) as channel:
+        with self._channel() as channel:
             stub = DagsterApiStub(channel)
             response = getattr(stub, method)(request_type(**kwargs))
         # TODO need error handling here
         return response
 
     def _streaming_query(self, method, request_type, **kwargs):
-        with grpc.insecure_channel(self._server_address) as channel:
+        with self._channel() as channel:
             stub = DagsterApiStub(channel)
             response_stream = getattr(stub, method)(request_type(**kwargs))
             for response in response_stream:
                 yield response
 
+    def _chunked_streaming_query(self, method, request_type, **kwargs):
+        chunks = []
+        for sequence_number, response in enumerate(
+            self._streaming_query(method, request_type, **kwargs)
+        ):
+            check.invariant(
+                response.sequence_number == sequence_number,
+                "Received chunk {received} out of order from {method}, expected {expected}".format(
+                    received=response.sequence_number, method=method, expected=sequence_number
+                ),
+            )
+            chunks.append(response.serialized_chunk)
+
+        check.invariant(chunks, "Received no chunks from {method}".format(method=method))
+
+        return "".join(chunks)
+
     def ping(self, echo):
         check.str_param(echo, "echo")
         res = self._query("Ping", api_pb2.PingRequest, echo=echo)
@@ -191,17 +284,25 @@ class DagsterGrpcClient(object):
             PipelineSubsetSnapshotArgs,
         )
 
-        res = self._query(
-            "ExternalPipelineSubsetSnapshot",
-            api_pb2.ExternalPipelineSubsetSnapshotRequest,
-            serialized_pipeline_subset_snapshot_args=serialize_dagster_namedtuple(
-                pipeline_subset_snapshot_args
-            ),
+        serialized_pipeline_subset_snapshot_args = serialize_dagster_namedtuple(
+            pipeline_subset_snapshot_args
         )
+        try:
+            serialized_external_pipeline_subset_result = self._chunked_streaming_query(
+                "StreamingExternalPipelineSubsetSnapshot",
+                api_pb2.ExternalPipelineSubsetSnapshotRequest,
+                serialized_pipeline_subset_snapshot_args=serialized_pipeline_subset_snapshot_args,
+            )
+        except grpc.RpcError as rpc_error:
+            if not _is_unimplemented_error(rpc_error):
+                raise
+            serialized_external_pipeline_subset_result = self._query(
+                "ExternalPipelineSubsetSnapshot",
+                api_pb2.ExternalPipelineSubsetSnapshotRequest,
+                serialized_pipeline_subset_snapshot_args=serialized_pipeline_subset_snapshot_args,
+            ).serialized_external_pipeline_subset_result
 
-        return deserialize_json_to_dagster_namedtuple(
-            res.serialized_external_pipeline_subset_result
-        )
+        return deserialize_json_to_dagster_namedtuple(serialized_external_pipeline_subset_result)
 
     def external_repository(self, repository_grpc_server_origin):
         check.inst_param(
@@ -210,15 +311,25 @@ class DagsterGrpcClient(object):
             RepositoryGrpcServerOrigin,
         )
 
-        res = self._query(
-            "ExternalRepository",
-            api_pb2.ExternalRepositoryRequest,
-            serialized_repository_python_origin=serialize_dagster_namedtuple(
-                repository_grpc_server_origin
-            ),
+        serialized_repository_python_origin = serialize_dagster_namedtuple(
+            repository_grpc_server_origin
         )
+        try:
+            serialized_external_repository_data = self._chunked_streaming_query(
+                "StreamingExternalRepository",
+                api_pb2.ExternalRepositoryRequest,
+                serialized_repository_python_origin=serialized_repository_python_origin,
+            )
+        except grpc.RpcError as rpc_error:
+            if not _is_unimplemented_error(rpc_error):
+                raise
+            serialized_external_repository_data = self._query(
+                "ExternalRepository",
+                api_pb2.ExternalRepositoryRequest,
+                serialized_repository_python_origin=serialized_repository_python_origin,
+            ).serialized_external_repository_data
 
-        return deserialize_json_to_dagster_namedtuple(res.serialized_external_repository_data)
+        return deserialize_json_to_dagster_namedtuple(serialized_external_repository_data)
 
     def external_schedule_execution(self, external_schedule_execution_args):
         check.inst_param(
@@ -406,6 +517,8 @@ class EphemeralDagsterGrpcClient(DagsterGrpcClient):
                 except grpc._channel._InactiveRpcError:  # pylint: disable=protected-access
                     pass
             self._server_process = None
+            # Ephemeral servers are never restarted at the same address
+            discard_shared_channel(self._server_address)
 
     def __enter__(self):
         return self
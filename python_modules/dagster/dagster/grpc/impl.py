@@ -51,7 +51,6 @@ from dagster.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.serdes.ipc import IPCErrorMessage
 from dagster.utils import start_termination_thread
 from dagster.utils.error import serializable_error_info_from_exc_info
-from dagster.utils.hosted_user_process import recon_repository_from_origin
 
 from .types import ExecuteRunArgs, ExternalScheduleExecutionArgs, PartitionSetExecutionParamArgs
 
@@ -307,6 +306,8 @@ def get_external_triggered_execution_params(recon_repo, external_triggered_execu
 
 
 def get_partition_config(args):
+    from dagster.utils.hosted_user_process import recon_repository_from_origin
+
     check.inst_param(args, "args", PartitionArgs)
     recon_repo = recon_repository_from_origin(args.repository_origin)
     definition = recon_repo.get_definition()
@@ -329,6 +330,8 @@ def get_partition_config(args):
 
 
 def get_partition_names(args):
+    from dagster.utils.hosted_user_process import recon_repository_from_origin
+
     check.inst_param(args, "args", PartitionNamesArgs)
     recon_repo = recon_repository_from_origin(args.repository_origin)
     definition = recon_repo.get_definition()
@@ -349,6 +352,8 @@ def get_partition_names(args):
 
 
 def get_partition_tags(args):
+    from dagster.utils.hosted_user_process import recon_repository_from_origin
+
     check.inst_param(args, "args", PartitionArgs)
     recon_repo = recon_repository_from_origin(args.repository_origin)
     definition = recon_repo.get_definition()
@@ -395,6 +400,8 @@ def get_external_execution_plan_snapshot(recon_pipeline, args):
 
 
 def get_partition_set_execution_param_data(args):
+    from dagster.utils.hosted_user_process import recon_repository_from_origin
+
     check.inst_param(args, "args", PartitionSetExecutionParamArgs)
     recon_repo = recon_repository_from_origin(args.repository_origin)
     repo_definition = recon_repo.get_definition()
@@ -25,6 +25,7 @@ from dagster.core.host_representation.external_data import (
     ExternalPartitionTagsData,
     external_repository_data_from_def,
 )
+from dagster.core.host_representation.selector import normalize_solid_selection
 from dagster.core.instance import DagsterInstance
 from dagster.core.origin import PipelineOrigin, RepositoryGrpcServerOrigin, RepositoryOrigin
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
@@ -32,8 +33,8 @@ from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dag
 from dagster.serdes.ipc import IPCErrorMessage, open_ipc_subprocess
 from dagster.seven import multiprocessing
 from dagster.utils import find_free_port, safe_tempfile_path_unmanaged
+from dagster.utils.cache import LRUCache
 from dagster.utils.error import serializable_error_info_from_exc_info
-from dagster.utils.hosted_user_process import recon_repository_from_origin
 
 from .__generated__ import api_pb2
 from .__generated__.api_pb2_grpc import DagsterApiServicer, add_DagsterApiServicer_to_server
@@ -77,10 +78,51 @@ CLEANUP_TICK = 0.5
 GRACE_PERIOD_AFTER_PROCESS_TERMINATION = 15
 
 
+# Serialized payloads are split into chunks of at most this many characters when streamed back to
+# the client. Since a character encodes to at most 4 bytes of UTF-8, this keeps every chunk under
+# gRPC's default 4MB maximum message size.
+MAX_CHUNK_SIZE = 1000000
+
+# Responses carrying serialized payloads larger than this many characters are gzip-compressed on
+# the wire. Smaller payloads aren't worth the CPU cost of compression.
+COMPRESSION_THRESHOLD = 100000
+
+# Accept the keepalive pings sent by DagsterGrpcClient on its long-lived channels (by default, gRPC
+# servers only tolerate a ping every five minutes and drop connections that ping more often)
+SERVER_OPTIONS = [
+    ("grpc.http2.min_ping_interval_without_data_ms", 30000),
+]
+
+# Maximum number of pipeline subset snapshots to keep in memory, since dagit requests a new subset
+# snapshot on every edit to the solid selection in the playground
+SUBSET_SNAPSHOT_CACHE_SIZE = 32
+
+
 class CouldNotBindGrpcServerToAddress(Exception):
     pass
 
 
+def _maybe_compress_response(serialized_payload, context):
+    if len(serialized_payload) > COMPRESSION_THRESHOLD:
+        context.set_compression(grpc.Compression.Gzip)
+
+
+def _stream_serialized_chunks(serialized_payload, context):
+    check.str_param(serialized_payload, "serialized_payload")
+
+    _maybe_compress_response(serialized_payload, context)
+
+    # Always yield at least one chunk so that the client can distinguish an empty payload from
+    # an interrupted stream
+    for sequence_number, start in enumerate(
+        range(0, max(len(serialized_payload), 1), MAX_CHUNK_SIZE)
+    ):
+        yield api_pb2.StreamingChunkEvent(
+            sequence_number=sequence_number,
+            serialized_chunk=serialized_payload[start : start + MAX_CHUNK_SIZE],
+        )
+
+
 class LazyRepositorySymbolsAndCodePointers:
     """Enables lazily loading user code at RPC-time so that it doesn't interrupt startup and
     we can gracefully handle user code errors."""
@@ -190,6 +232,11 @@ class DagsterApiServer(DagsterApiServicer):
             loadable_target_origin
         )
 
+        # Successful ExternalPipelineSubsetResults, along with their serializations, keyed by pipeline
+        # origin and solid selection. The loaded repository never changes over the lifetime of the
+        # server, so entries never go stale.
+        self._subset_snapshot_cache = LRUCache(SUBSET_SNAPSHOT_CACHE_SIZE)
+
         self.__last_heartbeat_time = time.time()
         if heartbeat:
             self.__heartbeat_thread = threading.Thread(
@@ -289,6 +336,9 @@ class DagsterApiServer(DagsterApiServicer):
                     repository_origin.repository_name
                 ]
             )
+
+        from dagster.utils.hosted_user_process import recon_repository_from_origin
+
         return recon_repository_from_origin(repository_origin)
 
     def _recon_pipeline_from_origin(self, pipeline_origin):
@@ -514,7 +564,7 @@ class DagsterApiServer(DagsterApiServicer):
                 )
             )
 
-    def ExternalPipelineSubsetSnapshot(self, request, _context):
+    def _get_serialized_external_pipeline_subset_result(self, request):
         pipeline_subset_snapshot_args = deserialize_json_to_dagster_namedtuple(
             request.serialized_pipeline_subset_snapshot_args
         )
@@ -525,16 +575,43 @@ class DagsterApiServer(DagsterApiServicer):
             PipelineSubsetSnapshotArgs,
         )
 
+        _subset_result, serialized_subset_result = self._subset_snapshot_cache.get_or_compute(
+            (
+                pipeline_subset_snapshot_args.pipeline_origin,
+                normalize_solid_selection(pipeline_subset_snapshot_args.solid_selection),
+            ),
+            lambda: self._compute_serialized_external_pipeline_subset_result(request),
+            # failed subsets are recomputed, since the failure may not be permanent
+            should_cache=lambda computed: computed[0].success,
+        )
+        return serialized_subset_result
+
+    def _compute_serialized_external_pipeline_subset_result(self, request):
+        pipeline_subset_snapshot_args = deserialize_json_to_dagster_namedtuple(
+            request.serialized_pipeline_subset_snapshot_args
+        )
+
+        subset_result = get_external_pipeline_subset_result(
+            self._recon_pipeline_from_origin(pipeline_subset_snapshot_args.pipeline_origin),
+            pipeline_subset_snapshot_args.solid_selection,
+        )
+        return subset_result, serialize_dagster_namedtuple(subset_result)
+
+    def ExternalPipelineSubsetSnapshot(self, request, context):
+        serialized_external_pipeline_subset_result = self._get_serialized_external_pipeline_subset_result(
+            request
+        )
+        _maybe_compress_response(serialized_external_pipeline_subset_result, context)
         return api_pb2.ExternalPipelineSubsetSnapshotReply(
-            serialized_external_pipeline_subset_result=serialize_dagster_namedtuple(
-                get_external_pipeline_subset_result(
-                    self._recon_pipeline_from_origin(pipeline_subset_snapshot_args.pipeline_origin),
-                    pipeline_subset_snapshot_args.solid_selection,
-                )
-            )
+            serialized_external_pipeline_subset_result=serialized_external_pipeline_subset_result
         )
 
-    def ExternalRepository(self, request, _context):
+    def StreamingExternalPipelineSubsetSnapshot(self, request, context):
+        return _stream_serialized_chunks(
+            self._get_serialized_external_pipeline_subset_result(request), context
+        )
+
+    def _get_serialized_external_repository_data(self, request):
         repository_origin = deserialize_json_to_dagster_namedtuple(
             request.serialized_repository_python_origin
         )
@@ -542,10 +619,20 @@ class DagsterApiServer(DagsterApiServicer):
         check.inst_param(repository_origin, "repository_origin", RepositoryOrigin)
 
         recon_repo = self._recon_repository_from_origin(repository_origin)
+        return serialize_dagster_namedtuple(
+            external_repository_data_from_def(recon_repo.get_definition())
+        )
+
+    def ExternalRepository(self, request, context):
+        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        _maybe_compress_response(serialized_external_repository_data, context)
         return api_pb2.ExternalRepositoryReply(
-            serialized_external_repository_data=serialize_dagster_namedtuple(
-                external_repository_data_from_def(recon_repo.get_definition())
-            )
+            serialized_external_repository_data=serialized_external_repository_data
+        )
+
+    def StreamingExternalRepository(self, request, context):
+        return _stream_serialized_chunks(
+            self._get_serialized_external_repository_data(request), context
         )
 
     def ExternalScheduleExecution(self, request, _context):
@@ -854,6 +941,144 @@ class DagsterApiServer(DagsterApiServicer):
         )
 
 
+# Set in each worker process of a ProcessPoolDagsterApiServer by _initialize_worker_process
+_WORKER_API_SERVER = None
+
+
+def _initialize_worker_process(loadable_target_origin):
+    global _WORKER_API_SERVER  # pylint: disable=global-statement
+
+    _WORKER_API_SERVER = DagsterApiServer(
+        shutdown_server_event=threading.Event(), loadable_target_origin=loadable_target_origin
+    )
+
+    # Load user code as soon as the worker starts rather than on its first request. Errors are
+    # swallowed here and surfaced at RPC-time, just as they are in a single-process server --
+    # raising from a pool initializer would cause the pool to respawn the worker indefinitely.
+    try:
+        _WORKER_API_SERVER._repository_symbols_and_code_pointers.loadable_repository_symbols  # pylint: disable=protected-access,pointless-statement
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+def _serve_rpc_in_worker_process(rpc_name, request_type_name, serialized_request):
+    request = getattr(api_pb2, request_type_name).FromString(serialized_request)
+    return getattr(_WORKER_API_SERVER, rpc_name)(request, None).SerializeToString()
+
+
+def _serialize_in_worker_process(method_name, request_type_name, serialized_request):
+    request = getattr(api_pb2, request_type_name).FromString(serialized_request)
+    return getattr(_WORKER_API_SERVER, method_name)(request)
+
+
+class ProcessPoolDagsterApiServer(DagsterApiServer):
+    """A DagsterApiServer that farms out RPCs that evaluate user code or build snapshots to a pool
+    of worker processes, each of which loads the repository once at startup.
+
+    This keeps CPU-heavy calls (subset snapshots, schedule evaluation, partition config generation)
+    from serializing on the GIL of a single process, so one slow schedule function can't stall
+    every other client of the server. Heartbeats, cancellation, and run execution are still served
+    from the main process: ExecuteRun and StartRun launch their own subprocess as before.
+
+    Requests and replies cross the process boundary as serialized protobuf messages.
+    """
+
+    def __init__(
+        self,
+        num_worker_processes,
+        shutdown_server_event,
+        loadable_target_origin=None,
+        heartbeat=False,
+        heartbeat_timeout=30,
+    ):
+        super(ProcessPoolDagsterApiServer, self).__init__(
+            shutdown_server_event=shutdown_server_event,
+            loadable_target_origin=loadable_target_origin,
+            heartbeat=heartbeat,
+            heartbeat_timeout=heartbeat_timeout,
+        )
+
+        check.int_param(num_worker_processes, "num_worker_processes")
+        check.invariant(num_worker_processes > 0, "num_worker_processes must be greater than 0")
+
+        self._pool = multiprocessing.Pool(
+            processes=num_worker_processes,
+            initializer=_initialize_worker_process,
+            initargs=(loadable_target_origin,),
+        )
+
+    def cleanup(self):
+        self._pool.terminate()
+        self._pool.join()
+        super(ProcessPoolDagsterApiServer, self).cleanup()
+
+    def _serve_rpc_in_worker_process(self, rpc_name, request, reply_type):
+        return reply_type.FromString(
+            self._pool.apply(
+                _serve_rpc_in_worker_process,
+                (rpc_name, type(request).__name__, request.SerializeToString()),
+            )
+        )
+
+    def _serialize_in_worker_process(self, method_name, request):
+        return self._pool.apply(
+            _serialize_in_worker_process,
+            (method_name, type(request).__name__, request.SerializeToString()),
+        )
+
+    def ExecutionPlanSnapshot(self, request, _context):
+        return self._serve_rpc_in_worker_process(
+            "ExecutionPlanSnapshot", request, api_pb2.ExecutionPlanSnapshotReply
+        )
+
+    def ListRepositories(self, request, _context):
+        return self._serve_rpc_in_worker_process(
+            "ListRepositories", request, api_pb2.ListRepositoriesReply
+        )
+
+    def ExternalPartitionNames(self, request, _context):
+        return self._serve_rpc_in_worker_process(
+            "ExternalPartitionNames", request, api_pb2.ExternalPartitionNamesReply
+        )
+
+    def ExternalPartitionSetExecutionParams(self, request, _context):
+        return self._serve_rpc_in_worker_process(
+            "ExternalPartitionSetExecutionParams",
+            request,
+            api_pb2.ExternalPartitionSetExecutionParamsReply,
+        )
+
+    def ExternalPartitionConfig(self, request, _context):
+        return self._serve_rpc_in_worker_process(
+            "ExternalPartitionConfig", request, api_pb2.ExternalPartitionConfigReply
+        )
+
+    def ExternalPartitionTags(self, request, _context):
+        return self._serve_rpc_in_worker_process(
+            "ExternalPartitionTags", request, api_pb2.ExternalPartitionTagsReply
+        )
+
+    def _compute_serialized_external_pipeline_subset_result(self, request):
+        return self._serialize_in_worker_process(
+            "_compute_serialized_external_pipeline_subset_result", request
+        )
+
+    def _get_serialized_external_repository_data(self, request):
+        return self._serialize_in_worker_process(
+            "_get_serialized_external_repository_data", request
+        )
+
+    def ExternalScheduleExecution(self, request, _context):
+        return self._serve_rpc_in_worker_process(
+            "ExternalScheduleExecution", request, api_pb2.ExternalScheduleExecutionReply
+        )
+
+    def ExternalTriggerExecutionParams(self, request, _context):
+        return self._serve_rpc_in_worker_process(
+            "ExternalTriggerExecutionParams", request, api_pb2.ExternalTriggerExecutionParamsReply
+        )
+
+
 # This is not a splendid scheme. We could possibly use a sentinel file for this, or send a custom
 # signal back to the client process (Unix only, i think, and questionable); or maybe the client
 # could poll the ping rpc instead/in addition to this
@@ -883,6 +1108,7 @@ class DagsterGrpcServer(object):
         loadable_target_origin=None,
         heartbeat=False,
         heartbeat_timeout=30,
+        num_worker_processes=None,
     ):
         check.opt_str_param(host, "host")
         check.opt_int_param(port, "port")
@@ -907,16 +1133,28 @@ class DagsterGrpcServer(object):
             max_workers > 1 if heartbeat else True,
             "max_workers must be greater than 1 if heartbeat is True",
         )
+        check.opt_int_param(num_worker_processes, "num_worker_processes")
 
-        self.server = grpc.server(ThreadPoolExecutor(max_workers=max_workers))
+        self.server = grpc.server(
+            ThreadPoolExecutor(max_workers=max_workers), options=SERVER_OPTIONS
+        )
         self._shutdown_server_event = threading.Event()
 
-        self._servicer = DagsterApiServer(
-            shutdown_server_event=self._shutdown_server_event,
-            loadable_target_origin=loadable_target_origin,
-            heartbeat=heartbeat,
-            heartbeat_timeout=heartbeat_timeout,
-        )
+        if num_worker_processes:
+            self._servicer = ProcessPoolDagsterApiServer(
+                num_worker_processes=num_worker_processes,
+                shutdown_server_event=self._shutdown_server_event,
+                loadable_target_origin=loadable_target_origin,
+                heartbeat=heartbeat,
+                heartbeat_timeout=heartbeat_timeout,
+            )
+        else:
+            self._servicer = DagsterApiServer(
+                shutdown_server_event=self._shutdown_server_event,
+                loadable_target_origin=loadable_target_origin,
+                heartbeat=heartbeat,
+                heartbeat_timeout=heartbeat_timeout,
+            )
 
         add_DagsterApiServicer_to_server(self._servicer, self.server)
 
@@ -13,9 +13,11 @@ Why not pickle?
 * This isn't meant to replace pickle in the conditions that pickle is reasonable to use
   (in memory, not human readable, etc) just handle the json case effectively.
 """
+import base64
 import hashlib
 import importlib
 import sys
+import zlib
 from abc import ABCMeta, abstractmethod, abstractproperty
 from collections import namedtuple
 from enum import Enum
@@ -48,6 +50,42 @@ def register_serdes_tuple_fallbacks(fallback_map):
         _WHITELIST_MAP["types"]["tuple"][class_name] = klass
 
 
+class _TupleCodec(namedtuple("_TupleCodec", "fields constructor_args")):
+    """Per-class information needed to pack and unpack a whitelisted namedtuple, computed once
+    rather than on every (de)serialization.
+
+    Args:
+        fields (Tuple[str, ...]): The fields of the namedtuple, in declaration order.
+        constructor_args (FrozenSet[str]): The names of the arguments accepted by the class
+            constructor. Serialized keys outside of this set are dropped on deserialization.
+    """
+
+
+# Codecs keyed by class rather than by name, so that each whitelist map (and each redefinition of
+# a class with the same name) gets its own entry
+_TUPLE_CODECS = {}
+
+
+def _compile_tuple_codec(klass, constructor_args=None):
+    codec = _TupleCodec(
+        fields=tuple(klass._fields),
+        constructor_args=frozenset(
+            constructor_args if constructor_args is not None else seven.get_args(klass)
+        ),
+    )
+    _TUPLE_CODECS[klass] = codec
+    return codec
+
+
+def _get_tuple_codec(klass):
+    codec = _TUPLE_CODECS.get(klass)
+    if codec is None:
+        # classes registered as fallbacks, rather than through whitelist_for_serdes, are compiled
+        # on first use
+        codec = _compile_tuple_codec(klass)
+    return codec
+
+
 def _get_dunder_new_params_dict(klass):
     check.invariant(sys.version_info.major >= 3, "This function can only be run in python 3")
 
@@ -74,14 +112,12 @@ class Persistable(six.with_metaclass(ABCMeta)):
         return default_from_storage_dict(cls, storage_dict)
 
 
-def _check_serdes_tuple_class_invariants(klass):
+def _check_serdes_tuple_class_invariants(klass, dunder_new_params):
     check.invariant(sys.version_info.major >= 3, "This function can only be run in python 3")
 
     # pull this in dynamically because this method is only called in python 3 contexts
     from inspect import Parameter
 
-    dunder_new_params = _get_dunder_new_params(klass)
-
     cls_param = dunder_new_params[0]
 
     def _with_header(msg):
@@ -152,7 +188,21 @@ def _whitelist_for_serdes(whitelist_map):
             # no need to do backwards compat since this is
             # only for development time
             if sys.version_info.major >= 3:
-                _check_serdes_tuple_class_invariants(klass)
+                from inspect import Parameter
+
+                dunder_new_params = _get_dunder_new_params(klass)
+                _check_serdes_tuple_class_invariants(klass, dunder_new_params)
+                # reuse the signature we just inspected rather than inspecting the class again
+                _compile_tuple_codec(
+                    klass,
+                    constructor_args=[
+                        param.name
+                        for param in dunder_new_params[1:]
+                        if param.kind == Parameter.POSITIONAL_OR_KEYWORD
+                    ],
+                )
+            else:
+                _compile_tuple_codec(klass)
             whitelist_map["types"]["tuple"][klass.__name__] = klass
         else:
             check.failed("Can not whitelist class {klass} for serdes".format(klass=klass))
@@ -179,7 +229,16 @@ def pack_value(val):
     return _pack_value(val, whitelist_map=_WHITELIST_MAP)
 
 
+# Exact types that are passed through serdes untouched. Checked with type() rather than isinstance
+# so that, e.g., Enums that subclass str still get packed as Enums.
+_PASSTHROUGH_TYPES = frozenset(
+    (six.text_type, six.binary_type, float, bool, type(None)) + six.integer_types
+)
+
+
 def _pack_value(val, whitelist_map):
+    if type(val) in _PASSTHROUGH_TYPES:  # pylint: disable=unidiomatic-typecheck
+        return val
     if isinstance(val, list):
         return [_pack_value(i, whitelist_map) for i in val]
     if isinstance(val, tuple):
@@ -190,9 +249,7 @@ def _pack_value(val, whitelist_map):
         )
         if klass_name in whitelist_map["persistence"]:
             return val.to_storage_value()
-        base_dict = {key: _pack_value(value, whitelist_map) for key, value in val._asdict().items()}
-        base_dict["__class__"] = klass_name
-        return base_dict
+        return _pack_tuple(val, klass_name, whitelist_map)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
         check.invariant(
@@ -210,6 +267,13 @@ def _pack_value(val, whitelist_map):
     return val
 
 
+def _pack_tuple(val, klass_name, whitelist_map):
+    codec = _get_tuple_codec(val.__class__)
+    base_dict = {key: _pack_value(value, whitelist_map) for key, value in zip(codec.fields, val)}
+    base_dict["__class__"] = klass_name
+    return base_dict
+
+
 def _serialize_dagster_namedtuple(nt, whitelist_map, **json_kwargs):
     return seven.json.dumps(_pack_value(nt, whitelist_map), **json_kwargs)
 
@@ -235,48 +299,77 @@ def unpack_value(val):
 
 
 def _unpack_value(val, whitelist_map):
+    if type(val) in _PASSTHROUGH_TYPES:  # pylint: disable=unidiomatic-typecheck
+        return val
     if isinstance(val, list):
         return [_unpack_value(i, whitelist_map) for i in val]
-    if isinstance(val, dict) and val.get("__class__"):
-        klass_name = val.pop("__class__")
-        if klass_name not in whitelist_map["types"]["tuple"]:
-            check.failed(
-                'Attempted to deserialize class "{}" which is not in the serdes whitelist.'.format(
-                    klass_name
-                )
+    if isinstance(val, dict):
+        if val.get("__class__"):
+            return _unpack_tuple(val, whitelist_map)
+        if val.get("__enum__"):
+            name, member = val["__enum__"].split(".")
+            return getattr(_get_whitelisted_type(whitelist_map, "enum", name), member)
+        if val.get("__set__") is not None:
+            return set([_unpack_value(item, whitelist_map) for item in val["__set__"]])
+        if val.get("__frozenset__") is not None:
+            return frozenset([_unpack_value(item, whitelist_map) for item in val["__frozenset__"]])
+        return {key: _unpack_value(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def _get_whitelisted_type(whitelist_map, type_kind, type_name):
+    types = whitelist_map["types"][type_kind]
+    if type_name not in types and whitelist_map is _WHITELIST_MAP:
+        # The execution, instance and storage parts of the public API are only imported when first
+        # used (see dagster/__init__.py), so the type may be defined in a module that this process
+        # has not imported yet.
+        import dagster
+
+        for name in dagster.__all__:
+            getattr(dagster, name)
+
+    if type_name not in types:
+        check.failed(
+            'Attempted to deserialize {type_description} "{type_name}" which is not in the serdes '
+            "whitelist.".format(
+                type_description="class" if type_kind == "tuple" else type_kind,
+                type_name=type_name,
             )
+        )
 
-        klass = whitelist_map["types"]["tuple"][klass_name]
-        if klass is None:
-            return None
+    return types[type_name]
 
-        unpacked_val = {key: _unpack_value(value, whitelist_map) for key, value in val.items()}
 
-        if klass_name in whitelist_map["persistence"]:
-            return klass.from_storage_dict(unpacked_val)
-
-        # Naively implements backwards compatibility by filtering arguments that aren't present in
-        # the constructor. If a property is present in the serialized object, but doesn't exist in
-        # the version of the class loaded into memory, that property will be completely ignored.
-        # The call to seven.get_args turns out to be pretty expensive -- we should probably turn
-        # to, e.g., manually managing the deprecated keys on the serdes constructor.
-        args_for_class = seven.get_args(klass)
-        filtered_val = {k: v for k, v in unpacked_val.items() if k in args_for_class}
-        return klass(**filtered_val)
-    if isinstance(val, dict) and val.get("__enum__"):
-        name, member = val["__enum__"].split(".")
-        return getattr(whitelist_map["types"]["enum"][name], member)
-    if isinstance(val, dict) and val.get("__set__") is not None:
-        return set([_unpack_value(item, whitelist_map) for item in val["__set__"]])
-    if isinstance(val, dict) and val.get("__frozenset__") is not None:
-        return frozenset([_unpack_value(item, whitelist_map) for item in val["__frozenset__"]])
-    if isinstance(val, dict):
-        return {key: _unpack_value(value, whitelist_map) for key, value in val.items()}
+def _unpack_tuple(val, whitelist_map):
+    klass_name = val.pop("__class__")
+    klass = _get_whitelisted_type(whitelist_map, "tuple", klass_name)
+    if klass is None:
+        return None
 
-    return val
+    if klass_name in whitelist_map["persistence"]:
+        return klass.from_storage_dict(
+            {key: _unpack_value(value, whitelist_map) for key, value in val.items()}
+        )
+
+    # Naively implements backwards compatibility by filtering arguments that aren't present in
+    # the constructor. If a property is present in the serialized object, but doesn't exist in
+    # the version of the class loaded into memory, that property will be completely ignored (and
+    # is never unpacked).
+    constructor_args = _get_tuple_codec(klass).constructor_args
+    return klass(
+        **{
+            key: _unpack_value(value, whitelist_map)
+            for key, value in val.items()
+            if key in constructor_args
+        }
+    )
 
 
 def deserialize_json_to_dagster_namedtuple(json_str):
+    """Deserialize a namedtuple serialized with either serialize_dagster_namedtuple or
+    serialize_dagster_namedtuple_with_format, so that rows written in different formats can be read
+    side by side."""
     dagster_namedtuple = _deserialize_json_to_dagster_namedtuple(
         check.str_param(json_str, "json_str"), whitelist_map=_WHITELIST_MAP
     )
@@ -290,13 +383,206 @@ def deserialize_json_to_dagster_namedtuple(json_str):
 
 
 def _deserialize_json_to_dagster_namedtuple(json_str, whitelist_map):
+    if json_str.startswith(_COMPACT_MARKER_PREFIX):
+        return _deserialize_compact(json_str, whitelist_map)
     return _unpack_value(seven.json.loads(json_str), whitelist_map=whitelist_map)
 
 
+class SerializationFormat(Enum):
+    """The encoding used when writing serialized namedtuples to storage.
+
+    JSON is the legacy format, readable by every version of dagster. COMPACT stores each class name
+    and field list once per value rather than on every nested namedtuple, and COMPACT_ZLIB
+    additionally compresses (and base64 encodes) the result, for use in text columns.
+    """
+
+    JSON = "JSON"
+    COMPACT = "COMPACT"
+    COMPACT_ZLIB = "COMPACT_ZLIB"
+
+
+# Compact values are prefixed with a format marker that legacy JSON, which always starts with "{",
+# can never collide with. The trailing digit versions the encoding.
+_COMPACT_MARKER_PREFIX = "~"
+_COMPACT_MARKERS = {
+    SerializationFormat.COMPACT: "~c1:",
+    SerializationFormat.COMPACT_ZLIB: "~z1:",
+}
+
+# Tags for the non-primitive values in the compact encoding, each of which is packed as a JSON
+# array whose first element is its tag. Dicts are packed as JSON objects.
+_COMPACT_LIST = 0
+_COMPACT_TUPLE = 1
+_COMPACT_ENUM = 2
+_COMPACT_SET = 3
+_COMPACT_FROZENSET = 4
+_COMPACT_PERSISTABLE = 5
+
+
+def serialize_dagster_namedtuple_with_format(nt, serialization_format):
+    check.tuple_param(nt, "nt")
+    check.inst_param(serialization_format, "serialization_format", SerializationFormat)
+
+    if serialization_format == SerializationFormat.JSON:
+        return _serialize_dagster_namedtuple(nt, whitelist_map=_WHITELIST_MAP)
+
+    return _serialize_compact(nt, serialization_format, whitelist_map=_WHITELIST_MAP)
+
+
+def _serialize_compact(val, serialization_format, whitelist_map):
+    packer = _CompactPacker(whitelist_map)
+    packed_value = packer.pack(val)
+    payload = seven.json.dumps(
+        {"c": packer.classes, "e": packer.enums, "v": packed_value}, separators=(",", ":")
+    )
+    if serialization_format == SerializationFormat.COMPACT_ZLIB:
+        payload = base64.b64encode(zlib.compress(payload.encode("utf-8"))).decode("ascii")
+
+    return _COMPACT_MARKERS[serialization_format] + payload
+
+
+def _deserialize_compact(serialized_str, whitelist_map):
+    if serialized_str.startswith(_COMPACT_MARKERS[SerializationFormat.COMPACT_ZLIB]):
+        encoded = serialized_str[len(_COMPACT_MARKERS[SerializationFormat.COMPACT_ZLIB]) :]
+        try:
+            payload = zlib.decompress(base64.b64decode(encoded)).decode("utf-8")
+        except (TypeError, ValueError, zlib.error):
+            check.failed("Could not decompress compact serialized value.")
+    elif serialized_str.startswith(_COMPACT_MARKERS[SerializationFormat.COMPACT]):
+        payload = serialized_str[len(_COMPACT_MARKERS[SerializationFormat.COMPACT]) :]
+    else:
+        check.failed(
+            'Unknown serialization format marker in "{prefix}". This value may have been written '
+            "by a newer version of dagster.".format(prefix=serialized_str[:8])
+        )
+
+    unpacked = seven.json.loads(payload)
+    return _CompactUnpacker(unpacked["c"], unpacked["e"], whitelist_map).unpack(unpacked["v"])
+
+
+class _CompactPacker(object):
+    """Packs a value into the compact encoding, interning the name and fields of each class and
+    the name of each enum member into tables that are serialized alongside the value."""
+
+    def __init__(self, whitelist_map):
+        self._whitelist_map = whitelist_map
+        self.classes = []
+        self._class_indices = {}
+        self.enums = []
+        self._enum_indices = {}
+
+    def _intern_class(self, klass):
+        index = self._class_indices.get(klass)
+        if index is None:
+            index = len(self.classes)
+            self.classes.append([klass.__name__, list(_get_tuple_codec(klass).fields)])
+            self._class_indices[klass] = index
+        return index
+
+    def _intern_enum(self, val):
+        enum_str = str(val)
+        index = self._enum_indices.get(enum_str)
+        if index is None:
+            index = len(self.enums)
+            self.enums.append(enum_str)
+            self._enum_indices[enum_str] = index
+        return index
+
+    def pack(self, val):
+        if type(val) in _PASSTHROUGH_TYPES:  # pylint: disable=unidiomatic-typecheck
+            return val
+        if isinstance(val, list):
+            return [_COMPACT_LIST] + [self.pack(item) for item in val]
+        if isinstance(val, tuple):
+            klass_name = val.__class__.__name__
+            check.invariant(
+                klass_name in self._whitelist_map["types"]["tuple"],
+                "Can only serialize whitelisted namedtuples, received tuple {}".format(val),
+            )
+            if klass_name in self._whitelist_map["persistence"]:
+                # Persistable classes control their own (JSON) storage representation
+                return [_COMPACT_PERSISTABLE, val.to_storage_value()]
+            return [_COMPACT_TUPLE, self._intern_class(val.__class__)] + [
+                self.pack(item) for item in val
+            ]
+        if isinstance(val, Enum):
+            check.invariant(
+                val.__class__.__name__ in self._whitelist_map["types"]["enum"],
+                "Can only serialize whitelisted Enums, received {}".format(val.__class__.__name__),
+            )
+            return [_COMPACT_ENUM, self._intern_enum(val)]
+        if isinstance(val, set):
+            return [_COMPACT_SET] + [self.pack(item) for item in val]
+        if isinstance(val, frozenset):
+            return [_COMPACT_FROZENSET] + [self.pack(item) for item in val]
+        if isinstance(val, dict):
+            return {key: self.pack(value) for key, value in val.items()}
+
+        return val
+
+
+class _CompactUnpacker(object):
+    def __init__(self, classes, enums, whitelist_map):
+        self._classes = classes
+        self._enums = enums
+        self._whitelist_map = whitelist_map
+        # Each entry of the class table is resolved once per value rather than once per tuple
+        self._resolved_classes = [None] * len(classes)
+
+    def unpack(self, val):
+        if type(val) in _PASSTHROUGH_TYPES:  # pylint: disable=unidiomatic-typecheck
+            return val
+        if isinstance(val, dict):
+            return {key: self.unpack(value) for key, value in val.items()}
+
+        tag = val[0]
+        if tag == _COMPACT_TUPLE:
+            return self._unpack_tuple(val)
+        if tag == _COMPACT_LIST:
+            return [self.unpack(item) for item in val[1:]]
+        if tag == _COMPACT_ENUM:
+            name, member = self._enums[val[1]].split(".")
+            return getattr(_get_whitelisted_type(self._whitelist_map, "enum", name), member)
+        if tag == _COMPACT_SET:
+            return set([self.unpack(item) for item in val[1:]])
+        if tag == _COMPACT_FROZENSET:
+            return frozenset([self.unpack(item) for item in val[1:]])
+        if tag == _COMPACT_PERSISTABLE:
+            return _unpack_value(val[1], self._whitelist_map)
+
+        check.failed("Unknown tag {tag} in compact serialized value.".format(tag=tag))
+
+    def _resolve_class(self, class_index):
+        klass_name, fields = self._classes[class_index]
+        klass = _get_whitelisted_type(self._whitelist_map, "tuple", klass_name)
+        if klass is None:
+            return None, None
+
+        # Fields are matched up by the names recorded at serialization time, so values written by
+        # other versions of a class are handled just as they are in the JSON format. Values are
+        # offset by the tag and class index at the head of the packed tuple.
+        constructor_args = _get_tuple_codec(klass).constructor_args
+        return (
+            klass,
+            [(index + 2, field) for index, field in enumerate(fields) if field in constructor_args],
+        )
+
+    def _unpack_tuple(self, val):
+        class_index = val[1]
+        resolved = self._resolved_classes[class_index]
+        if resolved is None:
+            resolved = self._resolve_class(class_index)
+            self._resolved_classes[class_index] = resolved
+
+        klass, kept_fields = resolved
+        if klass is None:
+            return None
+
+        return klass(**{field: self.unpack(val[index]) for index, field in kept_fields})
+
+
 def default_to_storage_value(value, whitelist_map):
-    base_dict = {key: _pack_value(value, whitelist_map) for key, value in value._asdict().items()}
-    base_dict["__class__"] = value.__class__.__name__
-    return base_dict
+    return _pack_tuple(value, value.__class__.__name__, whitelist_map)
 
 
 def default_from_storage_dict(cls, storage_dict):
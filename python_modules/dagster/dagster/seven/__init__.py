@@ -151,19 +151,32 @@ elif IS_WINDOWS:
 else:
     time_fn = time.time
 
-try:
-    from unittest import mock
-except ImportError:
-    # Because this dependency is not encoded setup.py deliberately
-    # (we do not want to override or conflict with our users mocks)
-    # we never fail when importing this.
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        # unittest.mock pulls in asyncio, so it is only imported when seven.mock is first used
+        if name == "mock":
+            from unittest import mock
+
+            return mock
+
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
-    # This will only be used within *our* test environment of which
-    # we have total control
+
+else:
     try:
-        import mock
+        from unittest import mock
     except ImportError:
-        pass
+        # Because this dependency is not encoded setup.py deliberately
+        # (we do not want to override or conflict with our users mocks)
+        # we never fail when importing this.
+
+        # This will only be used within *our* test environment of which
+        # we have total control
+        try:
+            import mock
+        except ImportError:
+            pass
 
 
 def get_args(callable_):
@@ -239,6 +252,8 @@ def builtin_print():
 
 def print_single_line_str(single_line_str):
     if sys.version_info.major >= 3:
+        from unittest import mock
+
         return [
             mock.call(single_line_str),
         ]
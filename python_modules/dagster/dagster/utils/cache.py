@@ -0,0 +1,63 @@
+import threading
+from collections import OrderedDict
+
+from dagster import check
+
+
+class LRUCache(object):
+    """A thread-safe, size-bounded mapping that evicts the least recently used entry once full.
+
+    Unlike ``lru_cache``, entries live on the instance, so the cache can be discarded along with
+    the object that owns it (e.g. when a repository location is reloaded).
+    """
+
+    def __init__(self, max_size):
+        self._max_size = check.int_param(max_size, "max_size")
+        check.invariant(max_size > 0, "max_size must be greater than 0")
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute_fn, should_cache=None):
+        """Return the value cached for key, calling compute_fn() to produce and cache it if absent.
+
+        compute_fn is called outside of the cache lock, so concurrent misses on the same key may
+        each compute the value. Nothing is cached if compute_fn raises.
+
+        Args:
+            key (Hashable): The key of the value.
+            compute_fn (Callable[[], Any]): Produces the value on a miss.
+            should_cache (Optional[Callable[[Any], bool]]): Called with a computed value; the value
+                is only cached if it returns True, e.g. to not cache results that report a failure.
+                By default, every computed value is cached.
+        """
+        check.callable_param(compute_fn, "compute_fn")
+        check.opt_callable_param(should_cache, "should_cache")
+
+        with self._lock:
+            if key in self._entries:
+                value = self._entries.pop(key)
+                self._entries[key] = value
+                return value
+
+        value = compute_fn()
+        if should_cache and not should_cache(value):
+            return value
+
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
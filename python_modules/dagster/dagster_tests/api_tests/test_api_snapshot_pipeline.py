@@ -3,10 +3,13 @@ import sys
 
 import pytest
 
+from dagster import file_relative_path
 from dagster.api.snapshot_pipeline import (
     sync_get_external_pipeline_subset,
     sync_get_external_pipeline_subset_grpc,
 )
+from dagster.core.definitions.reconstructable import ReconstructableRepository
+from dagster.core.host_representation import InProcessRepositoryLocation, PipelineSelector
 from dagster.core.host_representation.external_data import ExternalPipelineSubsetResult
 from dagster.core.host_representation.handle import PipelineHandle
 
@@ -143,3 +146,52 @@ def test_pipeline_with_invalid_definition_snapshot_api_grpc():
             ),
             external_pipeline_subset_result.error.cause.message,
         )
+
+
+def test_in_process_pipeline_subset_cached():
+    location = InProcessRepositoryLocation(
+        ReconstructableRepository.from_legacy_repository_yaml(
+            file_relative_path(__file__, "repository_file.yaml")
+        )
+    )
+    selector = PipelineSelector(
+        location_name=location.name,
+        repository_name="bar_repo",
+        pipeline_name="foo",
+        solid_selection=["do_something"],
+    )
+
+    external_pipeline_subset_result = location.get_subset_external_pipeline_result(selector)
+    assert external_pipeline_subset_result.success == True
+    assert location.get_subset_external_pipeline_result(selector) is external_pipeline_subset_result
+
+    other_subset_result = location.get_subset_external_pipeline_result(
+        PipelineSelector(
+            location_name=location.name,
+            repository_name="bar_repo",
+            pipeline_name="foo",
+            solid_selection=["do_input"],
+        )
+    )
+    assert other_subset_result is not external_pipeline_subset_result
+
+
+def test_in_process_pipeline_subset_failure_not_cached():
+    location = InProcessRepositoryLocation(
+        ReconstructableRepository.from_legacy_repository_yaml(
+            file_relative_path(__file__, "repository_file.yaml")
+        )
+    )
+    selector = PipelineSelector(
+        location_name=location.name,
+        repository_name="bar_repo",
+        pipeline_name="foo",
+        solid_selection=["invalid_solid"],
+    )
+
+    external_pipeline_subset_result = location.get_subset_external_pipeline_result(selector)
+    assert external_pipeline_subset_result.success == False
+    assert (
+        location.get_subset_external_pipeline_result(selector)
+        is not external_pipeline_subset_result
+    )
@@ -0,0 +1,113 @@
+"""Measure execution plan creation and pipeline execution times with and without the parameter
+checks of dagster.check, which are skipped when the DAGSTER_SKIP_PARAM_CHECKS environment variable
+is set.
+
+Each configuration is measured in a subprocess, since the environment variable is read when
+dagster is imported.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.bench_checks [--iterations 10] [--num-solids 300] \
+        [--num-events 2000]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from dagster import DagsterInstance, execute_pipeline
+from dagster.core.execution.api import create_execution_plan
+from dagster.check import SKIP_PARAM_CHECKS_ENV_VAR
+from dagster.utils.timing import format_duration, time_execution_scope
+
+from .bench_config import define_chain_pipeline, define_run_config
+from .bench_logging import materializations_pipeline
+
+
+QUIET_LOGGERS = {"console": {"config": {"log_level": "ERROR"}}}
+
+
+def _measure(args):
+    # the chain of solids is deeper than the default recursion limit allows when sorting it
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * args.num_solids))
+
+    chain_pipeline = define_chain_pipeline(args.num_solids)
+    chain_run_config = dict(
+        define_run_config(args.num_solids), storage={"in_memory": {}}, loggers=QUIET_LOGGERS
+    )
+    materializations_run_config = {
+        "solids": {"materializations": {"config": {"num_events": args.num_events}}},
+        "loggers": QUIET_LOGGERS,
+    }
+
+    benchmarks = [
+        (
+            "create_execution_plan",
+            lambda: create_execution_plan(chain_pipeline, run_config=chain_run_config),
+        ),
+        (
+            "chain_pipeline",
+            lambda: execute_pipeline(
+                chain_pipeline, run_config=chain_run_config, instance=DagsterInstance.ephemeral()
+            ),
+        ),
+        (
+            "materializations",
+            lambda: execute_pipeline(
+                materializations_pipeline,
+                run_config=materializations_run_config,
+                instance=DagsterInstance.ephemeral(),
+            ),
+        ),
+    ]
+
+    for name, fn in benchmarks:
+        # warm up any caches
+        fn()
+
+        # report the fastest run, which is the least affected by noise
+        timings = []
+        for _ in range(args.iterations):
+            with time_execution_scope() as timer_result:
+                fn()
+            timings.append(timer_result.millis)
+
+        print(  # pylint: disable=print-call
+            "{name:>22}: {best}".format(name=name, best=format_duration(min(timings)))
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--num-solids", type=int, default=300)
+    parser.add_argument("--num-events", type=int, default=2000)
+    parser.add_argument("--measure", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        _measure(args)
+        return
+
+    for label, skip_param_checks in [("param checks", ""), ("skipped param checks", "1")]:
+        print("{label}:".format(label=label))  # pylint: disable=print-call
+        sys.stdout.flush()
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "dagster_tests.benchmarks.bench_checks",
+                "--measure",
+                "--iterations",
+                str(args.iterations),
+                "--num-solids",
+                str(args.num_solids),
+                "--num-events",
+                str(args.num_events),
+            ],
+            env=dict(os.environ, **{SKIP_PARAM_CHECKS_ENV_VAR: skip_param_checks}),
+        )
+
+
+if __name__ == "__main__":
+    main()
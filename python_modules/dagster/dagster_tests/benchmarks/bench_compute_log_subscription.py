@@ -0,0 +1,102 @@
+"""Measure the throughput of streaming the stdout of a running step to a compute log subscription,
+as dagit does, for a step writing a large amount of output.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.bench_compute_log_subscription [--size-mb 100] \
+        [--line-length 100]
+"""
+import argparse
+import os
+import sys
+import threading
+
+from dagster import pipeline, seven, solid
+from dagster.core.definitions.executable import InMemoryExecutablePipeline
+from dagster.core.execution.api import create_execution_plan, execute_run
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.utils.timing import format_duration, time_execution_scope
+
+MiB = 1024 * 1024
+
+
+@solid(config_schema={"num_lines": int, "line_length": int})
+def spew_stdout(context):
+    line = "x" * (context.solid_config["line_length"] - 1) + "\n"
+    for _ in range(context.solid_config["num_lines"]):
+        sys.stdout.write(line)
+    sys.stdout.flush()
+
+
+@pipeline
+def spew_stdout_pipeline():
+    spew_stdout()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=100)
+    parser.add_argument("--line-length", type=int, default=100)
+    args = parser.parse_args()
+
+    num_lines = args.size_mb * MiB // args.line_length
+    run_config = {
+        "solids": {
+            "spew_stdout": {"config": {"num_lines": num_lines, "line_length": args.line_length}}
+        },
+        "loggers": {"console": {"config": {"log_level": "ERROR"}}},
+    }
+
+    with seven.TemporaryDirectory() as tempdir:
+        instance = DagsterInstance.local_temp(tempdir)
+        pipeline_run = instance.create_run_for_pipeline(
+            pipeline_def=spew_stdout_pipeline,
+            execution_plan=create_execution_plan(spew_stdout_pipeline, run_config=run_config),
+            run_config=run_config,
+        )
+
+        updates = []
+        num_bytes = [0]
+        completed = threading.Event()
+
+        def on_update(update):
+            updates.append(update.cursor)
+            num_bytes[0] += len(update.data or "")
+
+        instance.compute_log_manager.observable(
+            pipeline_run.run_id, "spew_stdout.compute", ComputeIOType.STDOUT
+        ).subscribe(on_update, on_completed=completed.set)
+
+        # The step's stdout is discarded so as not to drown out the results
+        with open(os.devnull, "w") as devnull:
+            stdout_fd = os.dup(sys.stdout.fileno())
+            os.dup2(devnull.fileno(), sys.stdout.fileno())
+            try:
+                with time_execution_scope() as step_timer:
+                    result = execute_run(
+                        InMemoryExecutablePipeline(spew_stdout_pipeline), pipeline_run, instance
+                    )
+                with time_execution_scope() as drain_timer:
+                    assert completed.wait(60)
+            finally:
+                os.dup2(stdout_fd, sys.stdout.fileno())
+                os.close(stdout_fd)
+
+    assert result.success
+    total_millis = step_timer.millis + drain_timer.millis
+    print(  # pylint: disable=print-call
+        "{size} MiB of stdout: step took {step}, subscription completed {drain} later; "
+        "{num_updates} updates, {received:.1f} MiB received, {throughput:.1f} MiB/s".format(
+            size=args.size_mb,
+            step=format_duration(step_timer.millis),
+            drain=format_duration(drain_timer.millis),
+            num_updates=len(updates),
+            received=num_bytes[0] / float(MiB),
+            throughput=num_bytes[0] / float(MiB) / (total_millis / 1000.0),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Measure the per-step overhead of capturing stdout and stderr to compute log files, for each of
+the LocalComputeLogManager's capture modes.
+
+Every worker process captures its streams for the given number of steps, as a step executed by the
+multiprocess executor would, and the workers run concurrently to show contention between the
+processes spawned for capture.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.bench_compute_logs [--num-steps 50] [--num-workers 8]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+
+from dagster import seven
+from dagster.core.execution.compute_logs import (
+    ComputeLogCaptureMode,
+    mirror_stream_to_file,
+    tee_stream_to_file,
+)
+from dagster.utils.timing import format_duration, time_execution_scope
+
+CAPTURE_FUNCTIONS = {
+    ComputeLogCaptureMode.TAIL: mirror_stream_to_file,
+    ComputeLogCaptureMode.THREAD: tee_stream_to_file,
+}
+
+
+def capture_steps(capture_mode, num_steps, log_dir):
+    capture_stream_to_file = CAPTURE_FUNCTIONS[capture_mode]
+    for step in range(num_steps):
+        path = os.path.join(log_dir, "{pid}.{step}".format(pid=os.getpid(), step=step))
+        with capture_stream_to_file(sys.stdout, path + ".out"):
+            with capture_stream_to_file(sys.stderr, path + ".err"):
+                sys.stdout.write("step {step}\n".format(step=step))
+
+
+def time_capture(capture_mode, num_steps, num_workers):
+    with seven.TemporaryDirectory() as log_dir:
+        workers = [
+            multiprocessing.Process(target=capture_steps, args=(capture_mode, num_steps, log_dir))
+            for _ in range(num_workers)
+        ]
+        with time_execution_scope() as timer_result:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    return timer_result.millis
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-steps", type=int, default=50)
+    parser.add_argument("--num-workers", type=int, default=8)
+    args = parser.parse_args()
+
+    # The steps write to stdout, which is discarded so as not to drown out the results
+    with open(os.devnull, "w") as devnull:
+        stdout_fd = os.dup(sys.stdout.fileno())
+        os.dup2(devnull.fileno(), sys.stdout.fileno())
+        try:
+            results = [
+                (
+                    capture_mode,
+                    # subtract the fixed cost of starting the workers
+                    time_capture(capture_mode, args.num_steps, args.num_workers)
+                    - time_capture(capture_mode, 0, args.num_workers),
+                )
+                for capture_mode in ComputeLogCaptureMode
+            ]
+        finally:
+            os.dup2(stdout_fd, sys.stdout.fileno())
+            os.close(stdout_fd)
+
+    for capture_mode, total_millis in results:
+        print(  # pylint: disable=print-call
+            "{capture_mode:>6}: {per_step} per step, {total} for {num_steps} steps in each of "
+            "{num_workers} workers".format(
+                capture_mode=capture_mode.value,
+                per_step=format_duration(total_millis / (args.num_steps * args.num_workers)),
+                total=format_duration(total_millis),
+                num_steps=args.num_steps,
+                num_workers=args.num_workers,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
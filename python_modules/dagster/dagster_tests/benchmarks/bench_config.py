@@ -0,0 +1,119 @@
+"""Measure config validation and default resolution times against the run config schema of a
+pipeline with many configured solids.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.bench_config [--iterations 20] [--num-solids 300]
+"""
+import argparse
+
+from dagster import (
+    DependencyDefinition,
+    Field,
+    InputDefinition,
+    Int,
+    Noneable,
+    OutputDefinition,
+    PipelineDefinition,
+    String,
+    lambda_solid,
+    solid,
+)
+from dagster.config.validate import process_config, validate_config_from_snap
+from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.utils.timing import format_duration, time_execution_scope
+
+SOLID_CONFIG_SCHEMA = {
+    "increment": Int,
+    "label": Field(String, is_required=False, default_value="label"),
+    "tags": Field([String], is_required=False, default_value=[]),
+    "nested": {
+        "threshold": Field(Noneable(Int), is_required=False, default_value=None),
+        "names": Field([{"first": String, "last": String}], is_required=False),
+    },
+}
+
+
+def define_chain_pipeline(num_solids):
+    @lambda_solid(output_def=OutputDefinition(Int))
+    def start():
+        return 1
+
+    solid_defs = [start]
+    dependencies = {}
+    previous = "start"
+    for index in range(num_solids):
+        name = "add_{index}".format(index=index)
+
+        @solid(
+            name=name,
+            input_defs=[InputDefinition("num", Int)],
+            output_defs=[OutputDefinition(Int)],
+            config_schema=SOLID_CONFIG_SCHEMA,
+        )
+        def add(context, num):
+            return num + context.solid_config["increment"]
+
+        solid_defs.append(add)
+        dependencies[name] = {"num": DependencyDefinition(previous)}
+        previous = name
+
+    return PipelineDefinition(
+        name="chain_pipeline", solid_defs=solid_defs, dependencies=dependencies
+    )
+
+
+def define_run_config(num_solids):
+    return {
+        "solids": {
+            "add_{index}".format(index=index): {
+                "config": {
+                    "increment": index,
+                    "nested": {"names": [{"first": "first", "last": "last"}] * 3},
+                }
+            }
+            for index in range(num_solids)
+        },
+        "storage": {"filesystem": {}},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--num-solids", type=int, default=300)
+    args = parser.parse_args()
+
+    pipeline_def = define_chain_pipeline(args.num_solids)
+    run_config = define_run_config(args.num_solids)
+    run_config_schema = pipeline_def.get_run_config_schema(pipeline_def.get_default_mode_name())
+    environment_type = run_config_schema.environment_type
+    config_schema_snapshot = pipeline_def.get_pipeline_snapshot().config_schema_snapshot
+
+    benchmarks = [
+        (
+            "validate_config_from_snap",
+            lambda: validate_config_from_snap(
+                config_schema_snapshot, environment_type.key, run_config
+            ),
+        ),
+        ("process_config", lambda: process_config(environment_type, run_config)),
+        ("EnvironmentConfig.build", lambda: EnvironmentConfig.build(pipeline_def, run_config)),
+    ]
+
+    for name, fn in benchmarks:
+        # warm up any caches
+        fn()
+        with time_execution_scope() as timer_result:
+            for _ in range(args.iterations):
+                fn()
+
+        print(  # pylint: disable=print-call
+            "{name:>26}: {per_call} per call".format(
+                name=name, per_call=format_duration(timer_result.millis / args.iterations),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
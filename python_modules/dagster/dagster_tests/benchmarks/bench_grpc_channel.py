@@ -0,0 +1,60 @@
+"""Compare the latency of gRPC calls made over a fresh channel per call with calls made over the
+shared, long-lived channel.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.bench_grpc_channel [--iterations 1000] [--force-port]
+"""
+import argparse
+
+from dagster.grpc.client import DagsterGrpcClient
+from dagster.grpc.server import GrpcServerProcess
+from dagster.utils.timing import format_duration, time_execution_scope
+
+
+def time_pings(client, iterations):
+    with time_execution_scope() as timer_result:
+        for _ in range(iterations):
+            client.ping("foo")
+
+    return timer_result.millis
+
+
+def run_benchmark(iterations, force_port=False):
+    server_process = GrpcServerProcess(force_port=force_port, max_workers=2)
+    with server_process.create_ephemeral_client() as ephemeral_client:
+        results = {}
+        for mode, use_shared_channel in [("per-call", False), ("shared", True)]:
+            client = DagsterGrpcClient(
+                port=ephemeral_client.port,
+                socket=ephemeral_client.socket,
+                use_shared_channel=use_shared_channel,
+            )
+            # warm up the server, and the shared channel's connection
+            client.ping("foo")
+            results[mode] = time_pings(client, iterations)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument(
+        "--force-port", action="store_true", help="Serve over TCP instead of a unix socket"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmark(args.iterations, args.force_port)
+    for mode, total_millis in results.items():
+        print(  # pylint: disable=print-call
+            "{mode:>10}: {total} total, {per_call} per call".format(
+                mode=mode,
+                total=format_duration(total_millis),
+                per_call=format_duration(total_millis / args.iterations),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure the time taken to import dagster, and the modules that contribute the most to it, as
+reported by ``python -X importtime`` in a fresh interpreter.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.bench_import [--iterations 5] [--top 20] \
+        [--statement "import dagster"]
+"""
+import argparse
+import subprocess
+import sys
+
+from dagster.utils.timing import format_duration
+
+
+def import_times(statement):
+    """Import times, in microseconds, keyed by module name, as (self, cumulative) tuples."""
+    output = subprocess.check_output(
+        [sys.executable, "-X", "importtime", "-c", statement], stderr=subprocess.STDOUT
+    ).decode("utf-8")
+
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module_name = line[len("import time:") :].split("|")
+        times[module_name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--statement", default="import dagster")
+    args = parser.parse_args()
+
+    # report the fastest run, which is the least affected by noise
+    runs = [import_times(args.statement) for _ in range(args.iterations)]
+    best = min(runs, key=lambda times: sum(self_us for self_us, _ in times.values()))
+    total_millis = sum(self_us for self_us, _ in best.values()) / 1000.0
+
+    print(  # pylint: disable=print-call
+        "{statement}: {total}, {count} modules".format(
+            statement=args.statement, total=format_duration(total_millis), count=len(best)
+        )
+    )
+    for module_name, (self_us, cumulative_us) in sorted(
+        best.items(), key=lambda item: item[1][1], reverse=True
+    )[: args.top]:
+        print(  # pylint: disable=print-call
+            "{cumulative:>10} {self:>10}  {module_name}".format(
+                cumulative=format_duration(cumulative_us / 1000.0),
+                self=format_duration(self_us / 1000.0),
+                module_name=module_name,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Measure the throughput of log messages and DagsterEvents through the DagsterLogManager into the
+instance's event log.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.bench_logging [--num-events 10000] [--console-level ERROR] \
+        [--instance {ephemeral,sqlite,sqlite-async}]
+"""
+import argparse
+
+from dagster import AssetMaterialization, Output, execute_pipeline, pipeline, seven, solid
+from dagster.core.instance import DagsterInstance
+from dagster.utils.timing import format_duration, time_execution_scope
+
+
+@solid(config_schema={"num_events": int})
+def log_messages(context):
+    for index in range(context.solid_config["num_events"]):
+        context.log.info("message {index}".format(index=index))
+
+
+@solid(config_schema={"num_events": int})
+def materializations(context):
+    for index in range(context.solid_config["num_events"]):
+        yield AssetMaterialization(asset_key="asset_{index}".format(index=index))
+    yield Output(None)
+
+
+@pipeline
+def log_messages_pipeline():
+    log_messages()
+
+
+@pipeline
+def materializations_pipeline():
+    materializations()
+
+
+def create_instance(instance_type, tempdir):
+    if instance_type == "ephemeral":
+        return DagsterInstance.ephemeral()
+
+    return DagsterInstance.local_temp(
+        tempdir, overrides={"async_event_log": {"enabled": instance_type == "sqlite-async"}}
+    )
+
+
+def time_pipeline(pipeline_def, solid_name, num_events, console_level, instance_type):
+    run_config = {
+        "solids": {solid_name: {"config": {"num_events": num_events}}},
+        "loggers": {"console": {"config": {"log_level": console_level}}},
+    }
+    with seven.TemporaryDirectory() as tempdir:
+        with create_instance(instance_type, tempdir) as instance:
+            with time_execution_scope() as timer_result:
+                result = execute_pipeline(pipeline_def, run_config=run_config, instance=instance)
+    assert result.success
+    return timer_result.millis
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-events", type=int, default=10000)
+    parser.add_argument(
+        "--console-level",
+        default="ERROR",
+        help="Level of the console logger; at the default, only the instance consumes events",
+    )
+    parser.add_argument(
+        "--instance",
+        default="ephemeral",
+        choices=["ephemeral", "sqlite", "sqlite-async"],
+        help="Instance to store the events in; sqlite-async enables the async_event_log setting",
+    )
+    args = parser.parse_args()
+
+    for pipeline_def, solid_name, description in [
+        (log_messages_pipeline, "log_messages", "context.log.info"),
+        (materializations_pipeline, "materializations", "AssetMaterialization"),
+    ]:
+        # subtract the fixed cost of executing the pipeline
+        baseline_millis = time_pipeline(
+            pipeline_def, solid_name, 0, args.console_level, args.instance
+        )
+        total_millis = (
+            time_pipeline(
+                pipeline_def, solid_name, args.num_events, args.console_level, args.instance
+            )
+            - baseline_millis
+        )
+        print(  # pylint: disable=print-call
+            "{description:>22}: {per_event} per event, {rate} events/second".format(
+                description=description,
+                per_event=format_duration(total_millis / args.num_events),
+                rate=int(args.num_events / (total_millis / 1000.0)),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Measure serdes round trip times for the objects that dominate storage and snapshot traffic:
+event log records, runs, pipeline snapshots and repository snapshots.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.bench_serdes [--iterations 100] [--num-solids 50]
+        [--format JSON|COMPACT|COMPACT_ZLIB]
+"""
+import argparse
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+    repository,
+)
+from dagster.core.host_representation.external_data import external_repository_data_from_def
+from dagster.core.instance import DagsterInstance
+from dagster.serdes import (
+    SerializationFormat,
+    deserialize_json_to_dagster_namedtuple,
+    serialize_dagster_namedtuple_with_format,
+)
+from dagster.utils.timing import format_duration, time_execution_scope
+
+
+def define_chain_pipeline(num_solids):
+    @lambda_solid(output_def=OutputDefinition(Int))
+    def start():
+        return 1
+
+    solid_defs = [start]
+    dependencies = {}
+    previous = "start"
+    for index in range(num_solids):
+        name = "add_one_{index}".format(index=index)
+
+        @lambda_solid(
+            name=name, input_defs=[InputDefinition("num", Int)], output_def=OutputDefinition(Int),
+        )
+        def add_one(num):
+            return num + 1
+
+        solid_defs.append(add_one)
+        dependencies[name] = {"num": DependencyDefinition(previous)}
+        previous = name
+
+    return PipelineDefinition(
+        name="chain_pipeline", solid_defs=solid_defs, dependencies=dependencies
+    )
+
+
+def build_samples(num_solids):
+    pipeline_def = define_chain_pipeline(num_solids)
+
+    @repository
+    def bench_repository():
+        return [pipeline_def]
+
+    instance = DagsterInstance.ephemeral()
+    result = execute_pipeline(
+        pipeline_def,
+        run_config={"loggers": {"console": {"config": {"log_level": "ERROR"}}}},
+        instance=instance,
+    )
+    assert result.success
+
+    return {
+        "EventRecord": instance.all_logs(result.run_id),
+        "PipelineRun": [instance.get_run_by_id(result.run_id)],
+        "PipelineSnapshot": [pipeline_def.get_pipeline_snapshot()],
+        "ExternalRepositoryData": [external_repository_data_from_def(bench_repository)],
+    }
+
+
+def time_round_trips(values, iterations, serialization_format):
+    serialized = [
+        serialize_dagster_namedtuple_with_format(value, serialization_format) for value in values
+    ]
+
+    with time_execution_scope() as serialize_timer:
+        for _ in range(iterations):
+            for value in values:
+                serialize_dagster_namedtuple_with_format(value, serialization_format)
+
+    with time_execution_scope() as deserialize_timer:
+        for _ in range(iterations):
+            for json_str in serialized:
+                deserialize_json_to_dagster_namedtuple(json_str)
+
+    mean_size = sum(len(serialized_str) for serialized_str in serialized) / len(serialized)
+    return serialize_timer.millis, deserialize_timer.millis, mean_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--num-solids", type=int, default=50)
+    parser.add_argument(
+        "--format",
+        choices=[serialization_format.value for serialization_format in SerializationFormat],
+        default=SerializationFormat.JSON.value,
+    )
+    args = parser.parse_args()
+
+    for name, values in build_samples(args.num_solids).items():
+        serialize_millis, deserialize_millis, mean_size = time_round_trips(
+            values, args.iterations, SerializationFormat(args.format)
+        )
+        num_values = args.iterations * len(values)
+        print(  # pylint: disable=print-call
+            "{name:>22}: serialize {serialize} per object, deserialize {deserialize} per "
+            "object, {size} bytes per object".format(
+                name=name,
+                serialize=format_duration(serialize_millis / num_values),
+                deserialize=format_duration(deserialize_millis / num_values),
+                size=int(mean_size),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure the time taken to create the execution plan for a single step of an existing run, as
+done by multiprocess child processes and remote step workers, in a pipeline with many configured
+solids.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.bench_step_plan [--iterations 5] [--num-solids 2000]
+"""
+import argparse
+import sys
+
+from dagster import DagsterInstance
+from dagster.core.execution.api import create_execution_plan, create_execution_plan_for_steps
+from dagster.utils.timing import format_duration, time_execution_scope
+
+from .bench_config import define_chain_pipeline, define_run_config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--num-solids", type=int, default=2000)
+    args = parser.parse_args()
+
+    # the chain of solids is deeper than the default recursion limit allows when sorting it
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * args.num_solids))
+
+    run_config = define_run_config(args.num_solids)
+    step_key = "add_{index}.compute".format(index=args.num_solids // 2)
+
+    instance = DagsterInstance.ephemeral()
+    pipeline_def = define_chain_pipeline(args.num_solids)
+    pipeline_run = instance.create_run_for_pipeline(
+        pipeline_def=pipeline_def,
+        execution_plan=create_execution_plan(pipeline_def, run_config),
+        run_config=run_config,
+    )
+
+    benchmarks = [
+        (
+            "full plan",
+            lambda pipeline_def: create_execution_plan(pipeline_def, run_config).build_subset_plan(
+                [step_key]
+            ),
+        ),
+        (
+            "plan from snapshot",
+            lambda pipeline_def: create_execution_plan_for_steps(
+                pipeline_def, pipeline_run, instance, [step_key], run_config=run_config
+            ),
+        ),
+    ]
+
+    for name, fn in benchmarks:
+        millis = 0
+        for _ in range(args.iterations):
+            # step workers load the pipeline definition from scratch
+            pipeline_def = define_chain_pipeline(args.num_solids)
+            with time_execution_scope() as timer_result:
+                fn(pipeline_def)
+            millis += timer_result.millis
+
+        print(  # pylint: disable=print-call
+            "{name:>20}: {per_call} per step".format(
+                name=name, per_call=format_duration(millis / args.iterations)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
+import os
 import sys
 
 import pytest
 import yaml
+from click.testing import CliRunner
+
+from dagster import seven
 
 from dagster.api.snapshot_repository import sync_get_external_repositories
+from dagster.cli.pipeline import pipeline_list_command
 from dagster.cli.workspace import Workspace
 from dagster.cli.workspace.load import load_workspace_from_config, load_workspace_from_yaml_paths
+from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.host_representation.handle import (
     ManagedGrpcPythonEnvRepositoryLocationHandle,
     PythonEnvRepositoryLocationHandle,
@@ -267,3 +273,100 @@ def test_grpc_multi_location_workspace():
         assert isinstance(
             named_loaded_from_file_attribute_handle, ManagedGrpcPythonEnvRepositoryLocationHandle
         )
+
+
+def test_workspace_location_load_error():
+    workspace_yaml = """
+load_from:
+    - python_file:
+        relative_path: hello_world_repository.py
+        location_name: loaded_from_file
+
+    - python_file:
+        relative_path: does_not_exist.py
+        location_name: missing_file
+
+    - python_module:
+        module_name: dagster.utils.test.hello_world_repository
+        location_name: loaded_from_module
+    """
+
+    with load_workspace_from_config(
+        yaml.safe_load(workspace_yaml),
+        # fake out as if it were loaded by a yaml file in this directory
+        file_relative_path(__file__, "not_a_real.yaml"),
+        UserProcessApi.CLI,
+    ) as workspace:
+        # A location that fails to load does not prevent the others from loading
+        assert workspace.repository_location_names == ["loaded_from_file", "loaded_from_module"]
+        assert set(workspace.location_load_timings.keys()) == {
+            "loaded_from_file",
+            "loaded_from_module",
+        }
+        assert all(seconds >= 0 for seconds in workspace.location_load_timings.values())
+
+        assert list(workspace.location_load_errors.keys()) == ["missing_file"]
+        assert "does_not_exist.py" in workspace.location_load_errors["missing_file"].to_string()
+        assert not workspace.has_repository_location_handle("missing_file")
+
+        with pytest.raises(DagsterInvariantViolationError, match="missing_file"):
+            workspace.get_repository_location_handle("missing_file")
+
+
+def _write_workspace(tempdir, location_names):
+    for location_name in location_names:
+        with open(os.path.join(tempdir, location_name + ".py"), "w") as f:
+            f.write("import does_not_exist  # pylint: disable=import-error\n")
+    with open(os.path.join(tempdir, "workspace.yaml"), "w") as f:
+        yaml.dump(
+            {
+                "load_from": [
+                    {
+                        "python_file": {
+                            "relative_path": location_name + ".py",
+                            "location_name": location_name,
+                        }
+                    }
+                    for location_name in location_names
+                ]
+            },
+            f,
+        )
+    return os.path.join(tempdir, "workspace.yaml")
+
+
+def test_cli_reports_location_load_errors():
+    runner = CliRunner()
+    with seven.TemporaryDirectory() as tempdir:
+        result = runner.invoke(
+            pipeline_list_command, ["-w", _write_workspace(tempdir, ["only_location"])]
+        )
+        assert result.exit_code != 0
+        assert isinstance(result.exception, DagsterInvariantViolationError)
+        assert 'Repository location "only_location" failed to load' in str(result.exception)
+        assert "does_not_exist" in str(result.exception)
+
+        result = runner.invoke(
+            pipeline_list_command,
+            ["-w", _write_workspace(tempdir, ["first_location", "second_location"])],
+        )
+        assert isinstance(result.exception, DagsterInvariantViolationError)
+        assert "first_location" in str(result.exception)
+        assert "second_location" in str(result.exception)
+
+
+def test_cli_location_option_reports_location_load_error():
+    workspace_yaml = file_relative_path(__file__, "multi_location.yaml")
+    runner = CliRunner()
+    with seven.TemporaryDirectory() as tempdir:
+        failing_yaml = _write_workspace(tempdir, ["broken_location"])
+        result = runner.invoke(
+            pipeline_list_command,
+            ["-w", workspace_yaml, "-w", failing_yaml, "-l", "broken_location"],
+        )
+        assert isinstance(result.exception, DagsterInvariantViolationError)
+        assert 'Repository location "broken_location" failed to load' in str(result.exception)
+
+        result = runner.invoke(pipeline_list_command, ["-w", workspace_yaml, "-w", failing_yaml])
+        assert result.exit_code == 2
+        assert "'broken_location'" in result.output
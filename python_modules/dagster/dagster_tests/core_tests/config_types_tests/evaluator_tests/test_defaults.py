@@ -160,3 +160,18 @@ def test_post_process_config():
     ).value["args"] == {"foo": "wow", "mau": "mau",}
     assert post_process_config(noneable_permissive_config_type, {"args": {}}).value["args"] == {}
     assert post_process_config(noneable_permissive_config_type, None).value["args"] == None
+
+
+def test_post_process_config_redeclared_shape():
+    # shapes are memoized by key, so re-declaring one with a different enum of the same name
+    # re-initializes the shared instance, which must not reuse the processor compiled for it
+    config_type = resolve_to_config_type(
+        {"enum": Enum("redeclared_enum", [EnumValue("foo", python_value=1)])}
+    )
+    assert post_process_config(config_type, {"enum": "foo"}).value == {"enum": 1}
+
+    redeclared_config_type = resolve_to_config_type(
+        {"enum": Enum("redeclared_enum", [EnumValue("foo", python_value=2)])}
+    )
+    assert redeclared_config_type is config_type
+    assert post_process_config(redeclared_config_type, {"enum": "foo"}).value == {"enum": 2}
@@ -1,8 +1,10 @@
 from dagster import Field, Noneable, Permissive, ScalarUnion, Selector, Shape
 from dagster.config.errors import DagsterEvaluationErrorReason
 from dagster.config.field import resolve_to_config_type
+from dagster.config.iterate_types import config_schema_snapshot_from_config_type
 from dagster.config.stack import EvaluationStackListItemEntry, EvaluationStackPathEntry
-from dagster.config.validate import validate_config
+from dagster.config.validate import validate_config, validate_config_from_snap
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 
 
 def test_parse_scalar_success():
@@ -538,3 +540,39 @@ def test_list_of_scalar_or_dict():
     assert not validate_config(int_or_dict_list, [2, {"wrong_key": "kjdfd"}]).success
     assert not validate_config(int_or_dict_list, [2, {"a_string": 2343}]).success
     assert not validate_config(int_or_dict_list, ["kjdfkd", {"a_string": "kjdfd"}]).success
+
+
+def test_validate_config_from_snap_errors_match():
+    config_type = resolve_to_config_type(
+        {"list": [Shape({"a_string": str})], "selector": Selector({"a": int, "b": int})}
+    )
+    config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
+    config_value = {"list": [{"a_string": "a"}, {"a_string": 2}], "selector": {"c": 1}}
+
+    result = validate_config(config_type, config_value)
+    assert not result.success
+    assert [error.stack.entries for error in result.errors] == [
+        [
+            EvaluationStackPathEntry("list"),
+            EvaluationStackListItemEntry(1),
+            EvaluationStackPathEntry("a_string"),
+        ],
+        [EvaluationStackPathEntry("selector")],
+    ]
+
+    assert (
+        validate_config_from_snap(config_schema_snapshot, config_type.key, config_value) == result
+    )
+
+    # validators are cached by snapshot instance, without adding attributes to the snapshot
+    assert not vars(config_schema_snapshot)
+    assert (
+        validate_config_from_snap(
+            deserialize_json_to_dagster_namedtuple(
+                serialize_dagster_namedtuple(config_schema_snapshot)
+            ),
+            config_type.key,
+            config_value,
+        )
+        == result
+    )
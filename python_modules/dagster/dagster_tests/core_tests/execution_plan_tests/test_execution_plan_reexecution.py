@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from dagster import (
@@ -15,11 +17,17 @@ from dagster.core.errors import (
     DagsterInvariantViolationError,
     DagsterRunNotFoundError,
 )
-from dagster.core.events import get_step_output_event
+from dagster.core.definitions.events import ObjectStoreOperationType
+from dagster.core.events import DagsterEventType, get_step_output_event
 from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.memoization import (
+    intermediate_manifest_from_event_logs,
+    rm_run_intermediates,
+)
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.intermediate_storage import build_fs_intermediate_storage
+from dagster.core.storage.tags import ZERO_COPY_REEXECUTION_TAG
 from dagster.utils import merge_dicts
 
 
@@ -225,3 +233,92 @@ def test_pipeline_step_key_subset_execution():
             step_keys_to_execute=["nope.compute"],
             instance=instance,
         )
+
+
+def _object_store_operations(instance, run_id):
+    return [
+        (
+            record.dagster_event.step_key,
+            record.dagster_event.event_specific_data.op,
+            record.dagster_event.event_specific_data.value_name,
+        )
+        for record in instance.all_logs(run_id)
+        if record.is_dagster_event
+        and record.dagster_event.event_type_value == DagsterEventType.OBJECT_STORE_OPERATION.value
+        and record.dagster_event.event_specific_data.op != ObjectStoreOperationType.GET_OBJECT.value
+    ]
+
+
+def test_zero_copy_reexecution():
+    pipeline_def = define_addy_pipeline()
+    instance = DagsterInstance.ephemeral()
+    run_config = env_with_fs({"solids": {"add_one": {"inputs": {"num": {"value": 3}}}}})
+    result = execute_pipeline(pipeline_def, run_config=run_config, instance=instance)
+    assert result.success
+
+    parent_intermediate_storage = build_fs_intermediate_storage(
+        instance.intermediates_directory, result.run_id
+    )
+    add_two_handle = StepOutputHandle("add_two.compute")
+    parent_key = parent_intermediate_storage.key_for_run(result.run_id, add_two_handle)
+
+    ## re-execute add_three, referencing the output of add_two in the parent run
+
+    child_result = reexecute_pipeline(
+        pipeline_def,
+        parent_run_id=result.run_id,
+        run_config=run_config,
+        step_keys_to_execute=["add_three.compute"],
+        tags={ZERO_COPY_REEXECUTION_TAG: "true"},
+        instance=instance,
+    )
+    assert child_result.success
+    assert child_result.result_for_solid("add_three").output_value() == 9
+
+    assert _object_store_operations(instance, child_result.run_id) == [
+        ("add_two.compute", ObjectStoreOperationType.REF_OBJECT.value, "result"),
+        ("add_three.compute", ObjectStoreOperationType.SET_OBJECT.value, "result"),
+    ]
+    assert intermediate_manifest_from_event_logs(instance.all_logs(child_result.run_id)) == {
+        add_two_handle: parent_key
+    }
+    child_intermediate_storage = build_fs_intermediate_storage(
+        instance.intermediates_directory, child_result.run_id
+    )
+    assert not os.path.exists(
+        child_intermediate_storage.key_for_run(child_result.run_id, add_two_handle)
+    )
+
+    ## re-execute add_three again, which references the output of add_two in the root run
+
+    grandchild_result = reexecute_pipeline(
+        pipeline_def,
+        parent_run_id=child_result.run_id,
+        run_config=run_config,
+        step_keys_to_execute=["add_three.compute"],
+        tags={ZERO_COPY_REEXECUTION_TAG: "true"},
+        instance=instance,
+    )
+    assert grandchild_result.success
+    assert grandchild_result.result_for_solid("add_three").output_value() == 9
+    assert intermediate_manifest_from_event_logs(instance.all_logs(grandchild_result.run_id)) == {
+        add_two_handle: parent_key
+    }
+
+    ## removing the intermediates of the root run keeps those that the other runs reference
+
+    operations = rm_run_intermediates(instance, parent_intermediate_storage, result.run_id)
+    assert [operation.key for operation in operations] == sorted(
+        [
+            parent_intermediate_storage.key_for_run(
+                result.run_id, StepOutputHandle("add_one.compute")
+            ),
+            parent_intermediate_storage.key_for_run(
+                result.run_id, StepOutputHandle("add_three.compute")
+            ),
+        ]
+    )
+    assert os.path.exists(parent_key)
+    assert not parent_intermediate_storage.has_intermediate(
+        None, StepOutputHandle("add_one.compute")
+    )
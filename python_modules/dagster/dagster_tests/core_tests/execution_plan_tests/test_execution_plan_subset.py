@@ -1,15 +1,25 @@
 from dagster import (
     DependencyDefinition,
+    Field,
     InputDefinition,
     Int,
     Output,
     OutputDefinition,
     PipelineDefinition,
+    composite_solid,
     lambda_solid,
+    pipeline,
     solid,
 )
-from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.api import (
+    create_execution_plan,
+    create_execution_plan_for_steps,
+    execute_plan,
+)
 from dagster.core.instance import DagsterInstance
+from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.core.test_utils import instance_for_test
+from dagster.seven import mock
 
 
 def define_two_int_pipeline():
@@ -106,3 +116,98 @@ def test_reentrant_execute_plan():
     assert len(step_events) == 3
 
     assert step_events[1].logging_tags["foo"] == "bar"
+
+
+def define_composite_chain_pipeline():
+    @lambda_solid(output_def=OutputDefinition(Int))
+    def return_one():
+        return 1
+
+    @solid(
+        input_defs=[InputDefinition("num", Int)],
+        output_defs=[OutputDefinition(Int)],
+        config_schema={"increment": Field(Int, is_required=False, default_value=1)},
+    )
+    def add(context, num):
+        return num + context.solid_config["increment"]
+
+    @composite_solid(input_defs=[InputDefinition("num", Int)], output_defs=[OutputDefinition(Int)])
+    def add_twice(num):
+        return add.alias("second")(add.alias("first")(num))
+
+    @pipeline
+    def composite_chain_pipeline():
+        add(add_twice(add(return_one())))
+
+    return composite_chain_pipeline
+
+
+def test_create_execution_plan_for_steps():
+    pipeline_def = define_composite_chain_pipeline()
+    run_config = {"solids": {"add_2": {"config": {"increment": 10}}}, "storage": {"filesystem": {}}}
+
+    with instance_for_test() as instance:
+        execution_plan = create_execution_plan(pipeline_def, run_config=run_config)
+        pipeline_run = instance.create_run_for_pipeline(
+            pipeline_def=pipeline_def, execution_plan=execution_plan, run_config=run_config
+        )
+
+        for step_key in ["add_twice.first.compute", "add_twice.second.compute", "add_2.compute"]:
+            with mock.patch.object(
+                EnvironmentConfig, "build", wraps=EnvironmentConfig.build
+            ) as build_environment_config:
+                subset_plan = create_execution_plan_for_steps(
+                    pipeline_def, pipeline_run, instance, [step_key], run_config=run_config
+                )
+                assert build_environment_config.call_count == 0
+
+            full_step = execution_plan.get_step_by_key(step_key)
+            assert subset_plan.step_keys_to_execute == [step_key]
+            assert set(subset_plan.step_dict.keys()) == {step_key}.union(
+                *[step_input.dependency_keys for step_input in full_step.step_inputs]
+            )
+            subset_step = subset_plan.get_step_by_key(step_key)
+            assert [
+                (step_input.name, step_input.source_handles)
+                for step_input in subset_step.step_inputs
+            ] == [
+                (step_input.name, step_input.source_handles) for step_input in full_step.step_inputs
+            ]
+
+        step_events = execute_plan(
+            execution_plan, pipeline_run=pipeline_run, instance=instance, run_config=run_config
+        )
+        assert all(not event.is_failure for event in step_events)
+
+        subset_plan = create_execution_plan_for_steps(
+            pipeline_def, pipeline_run, instance, ["add_2.compute"], run_config=run_config
+        )
+        step_events = execute_plan(
+            subset_plan, pipeline_run=pipeline_run, instance=instance, run_config=run_config
+        )
+        output_events = [event for event in step_events if event.is_successful_output]
+        assert len(output_events) == 1
+        assert output_events[0].step_key == "add_2.compute"
+
+
+def test_create_execution_plan_for_steps_with_other_config():
+    pipeline_def = define_two_int_pipeline()
+
+    with instance_for_test() as instance:
+        execution_plan = create_execution_plan(pipeline_def)
+        pipeline_run = instance.create_run_for_pipeline(
+            pipeline_def=pipeline_def, execution_plan=execution_plan
+        )
+
+        # run config that differs from that of the run is validated, and the full plan is built
+        run_config = {"storage": {"filesystem": {}}}
+        with mock.patch.object(
+            EnvironmentConfig, "build", wraps=EnvironmentConfig.build
+        ) as build_environment_config:
+            subset_plan = create_execution_plan_for_steps(
+                pipeline_def, pipeline_run, instance, ["add_one.compute"], run_config=run_config
+            )
+            assert build_environment_config.call_count == 1
+
+        assert subset_plan.step_keys_to_execute == ["add_one.compute"]
+        assert len(subset_plan.steps) == 2
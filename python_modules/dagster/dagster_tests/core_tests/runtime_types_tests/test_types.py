@@ -17,13 +17,16 @@ from dagster import (
     OutputDefinition,
     TypeCheck,
     check_dagster_type,
+    dagster_type_loader,
     execute_pipeline,
     lambda_solid,
     make_python_type_usable_as_dagster_type,
     pipeline,
+    reexecute_pipeline,
     resource,
     solid,
 )
+from dagster.core.instance import DagsterInstance
 from dagster.core.types.dagster_type import (
     DagsterType,
     PythonObjectDagsterType,
@@ -624,3 +627,60 @@ def test_make_usable_as_dagster_type_called_twice():
 
     with pytest.raises(DagsterInvalidDefinitionError):
         make_python_type_usable_as_dagster_type(AType, BDagsterType)
+
+
+def test_input_already_checked():
+    checks = []
+
+    def _type_check(context, value):
+        checks.append((value, context.input_already_checked))
+        return True
+
+    @dagster_type_loader(int)
+    def _load_int(_context, value):
+        return value
+
+    checked_int = DagsterType(name="CheckedInt", type_check_fn=_type_check, loader=_load_int)
+
+    @solid(output_defs=[OutputDefinition(checked_int)])
+    def return_one(_):
+        return 1
+
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @solid(
+        input_defs=[
+            InputDefinition("checked", checked_int),
+            InputDefinition("unchecked", checked_int),
+            InputDefinition("from_config", checked_int),
+        ]
+    )
+    def add(_, checked, unchecked, from_config):
+        return checked + unchecked + from_config
+
+    @pipeline
+    def checked_pipeline():
+        add(return_one(), return_two())
+
+    run_config = {
+        "solids": {"add": {"inputs": {"from_config": 3}}},
+        "intermediate_storage": {"filesystem": {}},
+    }
+    instance = DagsterInstance.ephemeral()
+    result = execute_pipeline(checked_pipeline, run_config=run_config, instance=instance)
+    assert result.success
+    # the output of return_one, then the inputs of add
+    assert sorted(checks) == [(1, False), (1, True), (2, False), (3, False)]
+
+    # the output of return_one is from the parent run when only add is re-executed
+    del checks[:]
+    assert reexecute_pipeline(
+        checked_pipeline,
+        result.run_id,
+        run_config=run_config,
+        step_keys_to_execute=["add.compute"],
+        instance=instance,
+    ).success
+    assert sorted(checks) == [(1, False), (2, False), (3, False)]
@@ -17,7 +17,7 @@ from dagster.core.events import (
     StepExpectationResultData,
     StepMaterializationData,
 )
-from dagster.core.events.log import DagsterEventRecord
+from dagster.core.events.log import DagsterEventRecord, LazyEventRecord
 from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
 from dagster.core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
@@ -27,6 +27,7 @@ from dagster.core.storage.event_log import (
     SqliteEventLogStorage,
 )
 from dagster.core.storage.sql import create_engine
+from dagster.serdes import SerializationFormat, serialize_dagster_namedtuple
 from dagster.seven import multiprocessing
 
 
@@ -41,6 +42,14 @@ def create_sqlite_run_event_logstorage():
         yield SqliteEventLogStorage(tmpdir_path)
 
 
+@contextmanager
+def create_compact_sqlite_run_event_logstorage():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        yield SqliteEventLogStorage(
+            tmpdir_path, serialization_format=SerializationFormat.COMPACT_ZLIB
+        )
+
+
 @contextmanager
 def create_consolidated_sqlite_run_event_log_storage():
     with seven.TemporaryDirectory() as tmpdir_path:
@@ -52,6 +61,7 @@ event_storage_test = pytest.mark.parametrize(
     [
         create_in_memory_event_log_storage,
         create_sqlite_run_event_logstorage,
+        create_compact_sqlite_run_event_logstorage,
         create_consolidated_sqlite_run_event_log_storage,
     ],
 )
@@ -245,6 +255,61 @@ def test_event_log_get_stats_without_start_and_success(event_storage_factory_cm_
         assert storage.get_stats_for_run("foo")
 
 
+def test_sqlite_event_log_storage_mixed_serialization_formats():
+    run_id = "foo"
+    records = _stats_records(run_id=run_id)
+    with seven.TemporaryDirectory() as tmpdir_path:
+        # records written in the legacy format remain readable once the format is changed
+        for index, serialization_format in enumerate(SerializationFormat):
+            storage = SqliteEventLogStorage(tmpdir_path, serialization_format=serialization_format)
+            storage.store_event(records[index])
+
+        storage = SqliteEventLogStorage(tmpdir_path)
+        assert storage.get_logs_for_run(run_id) == records[: len(SerializationFormat)]
+
+
+def test_sqlite_event_log_storage_lazy_logs():
+    run_id = "foo"
+    records = _stats_records(run_id=run_id)
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        for record in records:
+            storage.store_event(record)
+
+        lazy_records = storage.get_lazy_logs_for_run(run_id)
+        assert all(isinstance(record, LazyEventRecord) for record in lazy_records)
+
+        # the indexed columns are read without deserializing the records
+        assert [record.dagster_event_type for record in lazy_records] == [
+            record.dagster_event_type for record in records
+        ]
+        assert [record.step_key for record in lazy_records] == [
+            record.step_key for record in records
+        ]
+        assert all(record.run_id == run_id for record in lazy_records)
+        assert all(record.is_dagster_event for record in lazy_records)
+        assert not any(record.is_deserialized for record in lazy_records)
+
+        materialization = lazy_records[-2]
+        assert materialization.dagster_event.asset_key.to_string() == "mat_3"
+        assert materialization.is_deserialized
+        assert materialization.timestamp == records[-2].timestamp
+
+        assert [record.event_record for record in lazy_records] == records
+        assert [
+            record.event_record for record in storage.get_lazy_logs_for_run(run_id, cursor=1)
+        ] == records[2:]
+
+
+def test_in_memory_event_log_storage_lazy_logs():
+    records = _stats_records(run_id="foo")
+    storage = InMemoryEventLogStorage()
+    for record in records:
+        storage.store_event(record)
+
+    assert storage.get_lazy_logs_for_run("foo") == records
+
+
 def test_filesystem_event_log_storage_run_corrupted():
     with seven.TemporaryDirectory() as tmpdir_path:
         storage = SqliteEventLogStorage(tmpdir_path)
@@ -4,6 +4,7 @@ import pytest
 
 from dagster import seven
 from dagster.core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster.serdes import SerializationFormat
 from dagster.utils.test.run_storage import TestRunStorage
 
 
@@ -13,6 +14,14 @@ def create_sqlite_run_storage():
         yield SqliteRunStorage.from_local(tempdir)
 
 
+@contextmanager
+def create_compact_sqlite_run_storage():
+    with seven.TemporaryDirectory() as tempdir:
+        yield SqliteRunStorage.from_local(
+            tempdir, serialization_format=SerializationFormat.COMPACT_ZLIB
+        )
+
+
 @contextmanager
 def create_in_memory_storage():
     yield InMemoryRunStorage()
@@ -24,7 +33,9 @@ TestRunStorage.__test__ = False
 class TestSqliteImplementation(TestRunStorage):
     __test__ = True
 
-    @pytest.fixture(name="storage", params=[create_sqlite_run_storage])
+    @pytest.fixture(
+        name="storage", params=[create_sqlite_run_storage, create_compact_sqlite_run_storage]
+    )
     def run_storage(self, request):
         with request.param() as s:
             yield s
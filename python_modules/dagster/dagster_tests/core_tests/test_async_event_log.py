@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+
+from dagster import DagsterEventLogWriteError, execute_pipeline, pipeline, seven, solid
+from dagster.core.events import DagsterEventType
+from dagster.core.instance import DagsterInstance
+from dagster.core.instance.event_writer import AsyncEventWriter
+
+
+@solid
+def log_messages(context):
+    for index in range(20):
+        context.log.info("message {index}".format(index=index))
+
+
+@pipeline
+def log_messages_pipeline():
+    log_messages()
+
+
+def _async_instance(tempdir, **settings):
+    return DagsterInstance.local_temp(
+        tempdir, overrides={"async_event_log": dict(enabled=True, **settings)}
+    )
+
+
+def test_async_event_log_pipeline():
+    with seven.TemporaryDirectory() as tempdir:
+        instance = _async_instance(tempdir, max_queue_size=5)
+
+        result = execute_pipeline(log_messages_pipeline, instance=instance)
+        assert result.success
+
+        events = instance.all_logs(result.run_id)
+        assert [event.user_message for event in events if not event.is_dagster_event] == [
+            "message {index}".format(index=index) for index in range(20)
+        ]
+        assert events[-1].dagster_event_type == DagsterEventType.PIPELINE_SUCCESS
+        assert instance.get_run_by_id(result.run_id).is_success
+
+        instance.dispose()
+
+
+def test_async_event_log_subscribers():
+    with seven.TemporaryDirectory() as tempdir:
+        instance = _async_instance(tempdir)
+        result = execute_pipeline(log_messages_pipeline, instance=instance)
+
+        received = []
+        instance.add_event_listener(result.run_id, received.append)
+        instance.report_engine_event("engine event", instance.get_run_by_id(result.run_id))
+
+        # engine events wait for the writer, so the subscriber has been called on return
+        assert len(received) == 1
+        assert received[0].dagster_event_type == DagsterEventType.ENGINE_EVENT
+
+        instance.dispose()
+
+
+def test_async_event_writer_order():
+    written = []
+    writer = AsyncEventWriter(written.append, max_queue_size=2)
+
+    for index in range(100):
+        writer.put(index)
+
+    writer.flush()
+    assert written == list(range(100))
+
+    writer.shutdown()
+
+
+def test_async_event_writer_backpressure():
+    written = []
+    can_write = threading.Event()
+
+    def write_fn(event):
+        can_write.wait()
+        written.append(event)
+
+    writer = AsyncEventWriter(write_fn, max_queue_size=1)
+    writer.put(0)  # taken by the writer thread, which waits
+    writer.put(1)  # fills the queue
+
+    producer = threading.Thread(target=writer.put, args=(2,))
+    producer.start()
+    producer.join(0.1)
+    assert producer.is_alive()
+
+    can_write.set()
+    producer.join()
+    writer.shutdown()
+
+    assert written == [0, 1, 2]
+
+
+def test_async_event_writer_errors():
+    written = []
+
+    def write_fn(event):
+        if event == 1:
+            raise Exception("Failed to write 1")
+        written.append(event)
+
+    writer = AsyncEventWriter(write_fn, max_queue_size=10)
+    for index in range(3):
+        writer.put(index)
+
+    with pytest.raises(DagsterEventLogWriteError) as exc_info:
+        writer.flush()
+
+    assert "Failed to write 1" in str(exc_info.value)
+    assert len(exc_info.value.write_error_infos) == 1
+
+    # the events that follow a failed write are still written, and errors are only raised once
+    assert written == [0, 2]
+    writer.put(3)
+    writer.shutdown()
+    assert written == [0, 2, 3]
+
+
+def test_async_event_log_dispose_errors(monkeypatch):
+    with seven.TemporaryDirectory() as tempdir:
+        instance = _async_instance(tempdir)
+        disposed = []
+
+        def _shutdown():
+            raise DagsterEventLogWriteError("Failed to write events", write_error_infos=[])
+
+        # pylint: disable=protected-access
+        monkeypatch.setattr(instance._async_event_writer, "shutdown", _shutdown)
+        monkeypatch.setattr(instance._run_storage, "dispose", lambda: disposed.append("runs"))
+        monkeypatch.setattr(instance._event_storage, "dispose", lambda: disposed.append("events"))
+
+        # the storages are disposed of even when writing the remaining events fails
+        with pytest.raises(DagsterEventLogWriteError):
+            instance.dispose()
+
+        assert disposed == ["runs", "events"]
@@ -1,8 +1,69 @@
+import subprocess
+import sys
+
 import pytest
 
+import dagster
+from dagster import seven
+
+# Modules that "import dagster" should not load: they are only needed to execute pipelines, talk
+# to user code servers or manage the instance's storage.
+DEFERRED_MODULES = [
+    "alembic",
+    "dagster.cli.api",
+    "dagster.core.execution.api",
+    "dagster.core.instance",
+    "dagster.core.launcher",
+    "dagster.grpc",
+    "grpc",
+    "requests",
+    "sqlalchemy",
+    "watchdog",
+]
+
+
+def _loaded_modules(statement, modules):
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import sys; {statement}; print(','.join(m for m in {modules!r} if m in sys.modules))".format(
+                statement=statement, modules=modules
+            ),
+        ]
+    )
+    return [module for module in output.decode("utf-8").strip().split(",") if module]
+
 
 def test_no_warnings_on_import():
-    with pytest.warns(None) as record:
-        import dagster  # pylint: disable=unused-import
+    # dagster is already imported by this process, so the import is checked in a fresh one
+    process = subprocess.Popen(
+        [sys.executable, "-W", "error", "-c", "import dagster"], stderr=subprocess.PIPE
+    )
+    _, stderr = process.communicate()
+    assert process.returncode == 0, stderr.decode("utf-8")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Requires module __getattr__ (PEP 562)")
+def test_import_defers_execution_modules():
+    assert _loaded_modules("import dagster", DEFERRED_MODULES) == []
+    assert _loaded_modules("from dagster import pipeline, solid", DEFERRED_MODULES) == []
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Requires module __getattr__ (PEP 562)")
+def test_cli_defers_subcommand_modules():
+    subcommand_modules = ["dagster.cli.api", "dagster.cli.pipeline", "dagster.cli.schedule"]
+    assert _loaded_modules("import dagster.cli", subcommand_modules) == []
+
+
+def test_public_api_resolves():
+    for name in dagster.__all__:
+        assert getattr(dagster, name) is not None
+        assert name in dir(dagster)
+
+    from dagster import DagsterInstance, execute_pipeline  # pylint: disable=unused-import
+
+    with pytest.raises(AttributeError):
+        dagster.not_a_public_name  # pylint: disable=pointless-statement,no-member
 
-    assert len(record) == 0
+    assert seven.mock.MagicMock
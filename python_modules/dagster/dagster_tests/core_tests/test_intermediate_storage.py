@@ -1,12 +1,17 @@
 import os
+import threading
 
 import pytest
 
 from dagster import Bool, Int, List, Optional, String, check
-from dagster.core.definitions.events import ObjectStoreOperationType
+from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.intermediate_storage import build_fs_intermediate_storage
+from dagster.core.storage.intermediate_storage import (
+    ObjectStoreIntermediateStorage,
+    build_fs_intermediate_storage,
+)
+from dagster.core.storage.object_store import InMemoryObjectStore
 from dagster.core.storage.type_storage import TypeStoragePlugin, TypeStoragePluginRegistry
 from dagster.core.types.dagster_type import String as RuntimeString
 from dagster.core.types.dagster_type import create_any_type, resolve_dagster_type
@@ -90,6 +95,210 @@ def test_file_system_intermediate_storage():
     )
 
 
+def test_file_system_intermediate_storage_copy_intermediates_from_run():
+    parent_run_id, instance, parent_intermediate_storage = define_intermediate_storage()
+    handles = [StepOutputHandle("return_one.compute"), StepOutputHandle("return_two.compute")]
+    for index, handle in enumerate(handles):
+        parent_intermediate_storage.set_intermediate(None, Int, handle, index)
+
+    intermediate_storage = build_fs_intermediate_storage(
+        instance.intermediates_directory, run_id=make_new_run_id()
+    )
+    intermediate_storage.set_intermediate(None, Int, handles[1], 42)
+
+    # intermediates already present in the run are not copied
+    copies = list(intermediate_storage.copy_intermediates_from_run(None, parent_run_id, handles))
+    assert [handle for handle, _ in copies] == [handles[0]]
+    assert copies[0][1].op == ObjectStoreOperationType.CP_OBJECT
+    assert intermediate_storage.get_intermediate(None, Int, handles[0]).obj == 0
+    assert intermediate_storage.get_intermediate(None, Int, handles[1]).obj == 42
+
+    # copies are hard links, which replacing the copied intermediate does not write through
+    parent_key = parent_intermediate_storage.key_for_paths(["intermediates", "return_one.compute"])
+    key = intermediate_storage.key_for_paths(["intermediates", "return_one.compute"])
+    assert os.path.samefile(os.path.join(parent_key, "result"), os.path.join(key, "result"))
+
+    intermediate_storage.set_intermediate_object(resolve_dagster_type(Int), handles[0], 43)
+    assert parent_intermediate_storage.get_intermediate(None, Int, handles[0]).obj == 0
+
+    assert (
+        list(intermediate_storage.copy_intermediates_from_run(None, parent_run_id, handles)) == []
+    )
+
+
+def test_file_system_intermediate_storage_reference_intermediates_from_run():
+    parent_run_id, instance, parent_intermediate_storage = define_intermediate_storage()
+    handles = [StepOutputHandle("return_one.compute"), StepOutputHandle("return_two.compute")]
+    for index, handle in enumerate(handles):
+        parent_intermediate_storage.set_intermediate(None, Int, handle, index)
+
+    intermediate_storage = build_fs_intermediate_storage(
+        instance.intermediates_directory, run_id=make_new_run_id()
+    )
+    intermediate_storage.set_intermediate(None, Int, handles[1], 42)
+
+    # intermediates are read in place in the parent run, without being copied
+    references = intermediate_storage.reference_intermediates_from_run(None, parent_run_id, handles)
+    assert [handle for handle, _ in references] == [handles[0]]
+    parent_key = parent_intermediate_storage.key_for_run(parent_run_id, handles[0])
+    key = intermediate_storage.key_for_run(intermediate_storage.run_id, handles[0])
+    assert references[0][1].op == ObjectStoreOperationType.REF_OBJECT
+    assert references[0][1].key == parent_key
+    assert references[0][1].dest_key == key
+    assert intermediate_storage.manifest == {handles[0]: parent_key}
+
+    assert intermediate_storage.has_intermediate(None, handles[0])
+    assert intermediate_storage.get_intermediate(None, Int, handles[0]).obj == 0
+    assert not os.path.exists(key)
+
+    # a grandchild run references the intermediate where the parent run stores it
+    child_run_id = intermediate_storage.run_id
+    grandchild_intermediate_storage = build_fs_intermediate_storage(
+        instance.intermediates_directory, run_id=make_new_run_id()
+    )
+    references = grandchild_intermediate_storage.reference_intermediates_from_run(
+        None, child_run_id, handles, intermediate_storage.manifest
+    )
+    assert [operation.key for _, operation in references] == [
+        parent_key,
+        intermediate_storage.key_for_run(child_run_id, handles[1]),
+    ]
+    assert grandchild_intermediate_storage.get_intermediate(None, Int, handles[0]).obj == 0
+    assert grandchild_intermediate_storage.get_intermediate(None, Int, handles[1]).obj == 42
+
+    # replacing or removing a referenced intermediate leaves the parent run's intermediate in place
+    intermediate_storage.set_intermediate_object(resolve_dagster_type(Int), handles[0], 43)
+    assert intermediate_storage.get_intermediate(None, Int, handles[0]).obj == 43
+    assert parent_intermediate_storage.get_intermediate(None, Int, handles[0]).obj == 0
+
+    operation = grandchild_intermediate_storage.rm_intermediate(None, handles[0])
+    assert operation.op == ObjectStoreOperationType.RM_OBJECT
+    assert operation.key == parent_key
+    assert not grandchild_intermediate_storage.has_intermediate(None, handles[0])
+    assert parent_intermediate_storage.has_intermediate(None, handles[0])
+
+
+def test_file_system_intermediate_storage_reference_intermediates_with_type_storage_plugin():
+    type_storage_plugin_registry = TypeStoragePluginRegistry(
+        [(RuntimeString, FancyStringFilesystemTypeStoragePlugin)]
+    )
+    parent_run_id, instance, parent_intermediate_storage = define_intermediate_storage(
+        type_storage_plugin_registry=type_storage_plugin_registry
+    )
+    handle = StepOutputHandle("obj_name")
+    parent_intermediate_storage.set_intermediate(None, RuntimeString, handle, "hello")
+
+    intermediate_storage = build_fs_intermediate_storage(
+        instance.intermediates_directory,
+        run_id=make_new_run_id(),
+        type_storage_plugin_registry=type_storage_plugin_registry,
+    )
+    intermediate_storage.reference_intermediates_from_run(None, parent_run_id, [handle])
+
+    # type storage plugins read from the run's own root, so the reference is copied there on read
+    assert intermediate_storage.get_intermediate(None, RuntimeString, handle) == "hello"
+    assert intermediate_storage.manifest == {}
+    assert os.path.exists(intermediate_storage.key_for_run(intermediate_storage.run_id, handle))
+
+
+class ConcurrentInMemoryObjectStore(InMemoryObjectStore):
+    batch_concurrency = 4
+
+    def __init__(self):
+        super(ConcurrentInMemoryObjectStore, self).__init__()
+        self.lock = threading.Lock()
+        self.num_copies_started = 0
+        self.all_copies_started = threading.Event()
+
+    def cp_object(self, src, dst):
+        # every copy waits for the others to start, which only happens if they run concurrently
+        with self.lock:
+            self.num_copies_started += 1
+            if self.num_copies_started == 4:
+                self.all_copies_started.set()
+
+        assert self.all_copies_started.wait(10)
+        return super(ConcurrentInMemoryObjectStore, self).cp_object(src, dst)
+
+
+def test_object_store_copy_intermediates_from_run_concurrently():
+    object_store = ConcurrentInMemoryObjectStore()
+    intermediate_storage = ObjectStoreIntermediateStorage(
+        object_store,
+        lambda run_id: run_id,
+        "child_run",
+        TypeStoragePluginRegistry(types_to_register=[]),
+    )
+    handles = [StepOutputHandle("step_{index}.compute".format(index=index)) for index in range(4)]
+    for index, handle in enumerate(handles):
+        object_store.set_object(
+            "/".join(["parent_run", "intermediates", handle.step_key, "result"]), index
+        )
+
+    copies = list(intermediate_storage.copy_intermediates_from_run(None, "parent_run", handles))
+    assert [handle for handle, _ in copies] == handles
+    assert [intermediate_storage.get_intermediate(None, Int, handle) for handle in handles] == [
+        0,
+        1,
+        2,
+        3,
+    ]
+
+
+class FailingCopyInMemoryObjectStore(InMemoryObjectStore):
+    batch_concurrency = 4
+
+    def __init__(self, failing_src):
+        super(FailingCopyInMemoryObjectStore, self).__init__()
+        self.failing_src = failing_src
+
+    def cp_object(self, src, dst):
+        if src == self.failing_src:
+            raise Exception("copy failed")
+        super(FailingCopyInMemoryObjectStore, self).cp_object(src, dst)
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.CP_OBJECT,
+            key=src,
+            dest_key=dst,
+            object_store_name=self.name,
+        )
+
+
+@pytest.mark.parametrize("batch_concurrency", [1, 4])
+def test_object_store_copy_intermediates_from_run_partial_failure(batch_concurrency):
+    handles = [StepOutputHandle("step_{index}.compute".format(index=index)) for index in range(4)]
+    object_store = FailingCopyInMemoryObjectStore(
+        "/".join(["parent_run", "intermediates", handles[1].step_key, "result"])
+    )
+    object_store.batch_concurrency = batch_concurrency
+    intermediate_storage = ObjectStoreIntermediateStorage(
+        object_store,
+        lambda run_id: run_id,
+        "child_run",
+        TypeStoragePluginRegistry(types_to_register=[]),
+    )
+    for index, handle in enumerate(handles):
+        object_store.set_object(
+            "/".join(["parent_run", "intermediates", handle.step_key, "result"]), index
+        )
+
+    # the copies that succeeded are reported before the failure is raised
+    copied_handles = []
+    with pytest.raises(Exception, match="copy failed"):
+        for handle, operation in intermediate_storage.copy_intermediates_from_run(
+            None, "parent_run", handles
+        ):
+            assert operation.op == ObjectStoreOperationType.CP_OBJECT
+            copied_handles.append(handle)
+
+    # copies run concurrently all finish, and are all reported
+    expected_handles = [handles[0]] if batch_concurrency == 1 else [handles[0]] + handles[2:]
+    assert copied_handles == expected_handles
+    assert [intermediate_storage.has_intermediate(None, handle) for handle in handles] == [
+        handle in expected_handles for handle in handles
+    ]
+
+
 def test_file_system_intermediate_storage_composite_types():
     _, _, intermediate_storage = define_intermediate_storage()
 
@@ -1,12 +1,16 @@
 from __future__ import print_function
 
+import os
+import subprocess
 import sys
+import time
 
 import pytest
 
 from dagster.core.execution.compute_logs import (
     mirror_stream_to_file,
     should_disable_io_stream_redirect,
+    tee_stream_to_file,
 )
 from dagster.utils.test import get_temp_file_name
 
@@ -21,3 +25,75 @@ def test_capture():
 
         with open(capture_filepath, "r") as capture_stream:
             assert "HELLO" in capture_stream.read()
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_tee_capture(capfd):
+    with get_temp_file_name() as capture_filepath:
+        with tee_stream_to_file(sys.stdout, capture_filepath):
+            print("HELLO")
+            subprocess.check_call(
+                [sys.executable, "-c", "print('HELLO SUBPROCESS')"], stdout=sys.stdout
+            )
+            os.write(sys.stdout.fileno(), b"HELLO FD\n")
+
+        print("GOODBYE")
+
+        with open(capture_filepath, "r") as capture_stream:
+            captured = capture_stream.read()
+
+    assert captured.splitlines() == ["HELLO", "HELLO SUBPROCESS", "HELLO FD"]
+    # the output is still written to the original stream
+    assert capfd.readouterr().out.splitlines() == [
+        "HELLO",
+        "HELLO SUBPROCESS",
+        "HELLO FD",
+        "GOODBYE",
+    ]
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_tee_capture_large_output():
+    # more output than fits in the pipe, which blocks the writes until the thread drains it
+    line = "x" * 1023
+    with get_temp_file_name() as capture_filepath:
+        with tee_stream_to_file(sys.stdout, capture_filepath):
+            for _ in range(1024):
+                print(line)
+
+        with open(capture_filepath, "r") as capture_stream:
+            assert capture_stream.read() == (line + "\n") * 1024
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_tee_capture_closed_stream():
+    # a stream whose reader has gone away, so that writes to it fail
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    original_stat = os.fstat(write_fd)
+    with os.fdopen(write_fd, "w") as stream:
+        with get_temp_file_name() as capture_filepath:
+            with tee_stream_to_file(stream, capture_filepath):
+                os.write(write_fd, b"HELLO\n")
+                os.write(write_fd, b"STILL CAPTURED\n")
+                # wait for the thread to fail writing to the stream
+                deadline = time.time() + 10
+                while os.path.getsize(capture_filepath) < len("HELLO\nSTILL CAPTURED\n"):
+                    assert time.time() < deadline
+                    time.sleep(0.01)
+
+            with open(capture_filepath, "r") as capture_stream:
+                assert capture_stream.read().splitlines() == ["HELLO", "STILL CAPTURED"]
+
+        # the original file descriptor is restored once mirroring to it has failed
+        restored_stat = os.fstat(write_fd)
+        assert (restored_stat.st_dev, restored_stat.st_ino) == (
+            original_stat.st_dev,
+            original_stat.st_ino,
+        )
@@ -5,13 +5,14 @@ from contextlib import contextmanager
 
 import pytest
 
-from dagster import ModeDefinition, check, execute_solid, pipeline, resource, solid
+from dagster import DagsterInstance, ModeDefinition, check, execute_solid, pipeline, resource, solid
 from dagster.core.definitions import SolidHandle
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.logger import InitLoggerContext
 from dagster.core.execution.plan.objects import StepFailureData
-from dagster.core.log_manager import DagsterLogManager
+from dagster.core.log_manager import DagsterLogManager, StructuredMessageLogger
 from dagster.loggers import colored_console_logger, json_console_logger
+from dagster.seven import mock
 from dagster.utils.error import SerializableErrorInfo
 
 REGEX_UUID = r"[a-z-0-9]{8}\-[a-z-0-9]{4}\-[a-z-0-9]{4}\-[a-z-0-9]{4}\-[a-z-0-9]{12}"
@@ -156,6 +157,92 @@ def test_multiline_logging_complex():
     assert captured_results[0].split("\n") == expected_results
 
 
+def test_logging_message_props_override_tags():
+    with _setup_logger("test") as (captured_results, logger):
+
+        dl = DagsterLogManager("123", {"solid": "start"}, [logger]).with_tags(step_key="a")
+        dl.info("test")
+        dl.info("test", solid="other", extra_prop=1)
+        dl.info("test", step_key=None)
+
+    assert captured_results == [
+        'system - 123 - test\n               solid = "start"\n            step_key = "a"',
+        'system - 123 - test\n          extra_prop = 1\n               solid = "other"\n'
+        '            step_key = "a"',
+        'system - 123 - test\n               solid = "start"',
+    ]
+
+
+def test_logging_replaced_tags():
+    with _setup_logger("test") as (captured_results, logger):
+
+        dl = DagsterLogManager("123", {"solid": "start"}, [logger])
+        dl._replace(logging_tags={"solid": "other"}).info("test")
+        dl.info("test")
+
+    assert captured_results == [
+        'system - 123 - test\n               solid = "other"',
+        'system - 123 - test\n               solid = "start"',
+    ]
+
+
+def test_logging_skipped_for_disabled_loggers():
+    logger = logging.Logger("test")
+    logger.setLevel(logging.ERROR)
+
+    dl = DagsterLogManager("123", {}, [logger])
+    with mock.patch.object(
+        DagsterLogManager, "_prepare_message", wraps=dl._prepare_message
+    ) as prepare_message:
+        dl.info("test")
+        assert prepare_message.call_count == 0
+
+        dl.error("test")
+        assert prepare_message.call_count == 1
+
+
+def test_structured_message_logger():
+    captured_results = []
+
+    class CapturingLogger(StructuredMessageLogger):
+        def handle_structured_message(self, level, message, meta):
+            captured_results.append((level, message, meta))
+
+    logger = CapturingLogger("test", level=logging.INFO)
+
+    dl = DagsterLogManager("123", {"solid": "start"}, [logger])
+    with mock.patch.object(logger, "log") as log:
+        dl.debug("skipped")
+        dl.info("test", extra_prop=1)
+        assert log.call_count == 0
+
+    assert len(captured_results) == 1
+    level, message, meta = captured_results[0]
+    assert level == logging.INFO
+    assert (
+        message == 'system - 123 - test\n          extra_prop = 1\n               solid = "start"'
+    )
+    assert meta["orig_message"] == "test"
+    assert meta["run_id"] == "123"
+    assert meta["solid"] == "start"
+    assert meta["extra_prop"] == 1
+
+
+def test_instance_logger_stores_event_records():
+    instance = DagsterInstance.ephemeral()
+
+    dl = DagsterLogManager("123", {"pipeline_name": "foo"}, [instance.get_logger()])
+    dl.info("test", step_key="bar")
+
+    records = instance.all_logs("123")
+    assert len(records) == 1
+    assert records[0].user_message == "test"
+    assert records[0].level == logging.INFO
+    assert records[0].step_key == "bar"
+    assert records[0].pipeline_name == "foo"
+    assert not records[0].is_dagster_event
+
+
 def test_default_context_logging():
     called = {}
 
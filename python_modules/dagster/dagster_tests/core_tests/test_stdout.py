@@ -4,6 +4,7 @@ import os
 import random
 import string
 import sys
+import threading
 import time
 
 import pytest
@@ -18,11 +19,16 @@ from dagster import (
     resource,
     solid,
 )
-from dagster.core.execution.compute_logs import should_disable_io_stream_redirect
+from dagster.core.execution.compute_logs import (
+    ComputeLogCaptureMode,
+    should_disable_io_stream_redirect,
+)
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.local_compute_log_manager import LocalComputeLogManager
 from dagster.core.test_utils import create_run_for_test
-from dagster.seven import multiprocessing
+from dagster.seven import TemporaryDirectory, multiprocessing
+from dagster.utils import ensure_dir, touch_file
 
 HELLO_SOLID = "HELLO SOLID"
 HELLO_RESOURCE = "HELLO RESOURCE"
@@ -110,6 +116,38 @@ def test_compute_log_to_disk_multiprocess():
             assert normalize_file_content(stdout_file.read()) == HELLO_SOLID
 
 
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+@pytest.mark.parametrize("run_config", [{}, {"execution": {"multiprocess": {}}}])
+def test_compute_log_to_disk_thread_capture_mode(run_config):
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(
+            temp_dir,
+            overrides={
+                "compute_logs": {
+                    "module": "dagster.core.storage.local_compute_log_manager",
+                    "class": "LocalComputeLogManager",
+                    "config": {"base_dir": temp_dir, "capture_mode": "THREAD"},
+                }
+            },
+        )
+        manager = instance.compute_log_manager
+        assert manager.capture_mode == ComputeLogCaptureMode.THREAD
+
+        result = execute_pipeline(
+            reconstructable(define_pipeline),
+            run_config=dict(run_config, storage={"filesystem": {}}),
+            instance=instance,
+        )
+        assert result.success
+
+        for step_key in ["spew.compute", "spew_2.compute"]:
+            assert manager.is_watch_completed(result.run_id, step_key)
+            stdout = manager.read_logs_file(result.run_id, step_key, ComputeIOType.STDOUT)
+            assert normalize_file_content(stdout.data) == HELLO_SOLID
+
+
 @pytest.mark.skipif(
     should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
 )
@@ -166,6 +204,100 @@ def test_compute_log_manager_subscriptions():
     assert stderr[0].cursor > 400
 
 
+def test_compute_log_manager_subscription_updates():
+    with TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir)
+        run_id, step_key = "run_id", "spew.compute"
+        path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(path))
+
+        updates = []
+        completed = threading.Event()
+        manager.observable(run_id, step_key, ComputeIOType.STDOUT).subscribe(
+            updates.append, on_completed=completed.set
+        )
+
+        # many small writes, including multibyte characters, are read in a few large updates
+        line = u"HELLO \u2603 {}\n"
+        expected = "".join(line.format(index) for index in range(20000))
+        with open(path, "ab") as f:
+            for index in range(20000):
+                f.write(line.format(index).encode("utf-8"))
+                f.flush()
+        touch_file(manager.complete_artifact_path(run_id, step_key))
+
+        assert completed.wait(30)
+        assert "".join(update.data for update in updates if update.data) == expected
+        assert updates[-1].cursor == len(expected.encode("utf-8"))
+        assert len(updates) <= 3
+
+
+def test_read_logs_file_concurrently_while_watched():
+    with TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir)
+        run_id, step_key = "run_id", "spew.compute"
+        path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(path))
+        data = "".join("line {}\n".format(index) for index in range(1000))
+        with open(path, "w") as f:
+            f.write(data)
+
+        completed = threading.Event()
+        manager.observable(run_id, step_key, ComputeIOType.STDOUT).subscribe(
+            lambda _: None, on_completed=completed.set
+        )
+
+        # reads through the file kept open for the watch from several threads each see their own
+        # range of the file
+        errors = []
+
+        def _read(cursor):
+            for _ in range(50):
+                update = manager.read_logs_file(
+                    run_id, step_key, ComputeIOType.STDOUT, cursor, max_bytes=100
+                )
+                if update.data != data[cursor : cursor + 100]:
+                    errors.append(update)
+
+        threads = [threading.Thread(target=_read, args=(cursor,)) for cursor in range(0, 800, 100)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+
+        touch_file(manager.complete_artifact_path(run_id, step_key))
+        assert completed.wait(30)
+
+        # the file is reopened for reads once the watch completes
+        update = manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT)
+        assert update.data == data
+
+
+def test_read_logs_file_multibyte_characters():
+    with TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir)
+        path = manager.get_local_path("run_id", "spew.compute", ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(path))
+        data = u"a\u00e9\u2603\U0001f600b"
+        with open(path, "wb") as f:
+            f.write(data.encode("utf-8"))
+
+        # reads cut short within a multibyte character stop before it
+        cursor = 0
+        chunks = []
+        while True:
+            update = manager.read_logs_file(
+                "run_id", "spew.compute", ComputeIOType.STDOUT, cursor, max_bytes=4
+            )
+            if not update.data:
+                break
+            chunks.append(update.data)
+            cursor = update.cursor
+
+        assert chunks == [u"a\u00e9", u"\u2603", u"\U0001f600", u"b"]
+
+
 def gen_solid_name(length):
     return "".join(random.choice(string.ascii_lowercase) for x in range(length))
 
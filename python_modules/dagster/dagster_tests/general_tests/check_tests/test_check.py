@@ -1,3 +1,5 @@
+import os
+import subprocess
 import sys
 from collections import defaultdict
 from contextlib import contextmanager
@@ -1071,3 +1073,114 @@ def test_opt_generator():
 def test_internals():
     with pytest.raises(CheckError):
         check._check_key_value_types(None, str, str)  # pylint: disable=protected-access
+
+
+def _gen():
+    yield
+
+
+VALID_PARAM_CALLS = [
+    ("inst_param", (1, "param_name", int)),
+    ("opt_inst_param", (None, "param_name", int, 2)),
+    ("opt_inst_param", (1, "param_name", int, 2)),
+    ("callable_param", (len, "param_name")),
+    ("opt_callable_param", (None, "param_name", len)),
+    ("int_param", (1, "param_name")),
+    ("opt_int_param", (None, "param_name", 2)),
+    ("float_param", (1.0, "param_name")),
+    ("opt_float_param", (None, "param_name")),
+    ("numeric_param", (1, "param_name")),
+    ("opt_numeric_param", (None, "param_name")),
+    ("str_param", ("a", "param_name")),
+    ("opt_str_param", (None, "param_name", "b")),
+    ("opt_nonempty_str_param", ("", "param_name", "b")),
+    ("opt_nonempty_str_param", ("a", "param_name", "b")),
+    ("bool_param", (True, "param_name")),
+    ("opt_bool_param", (None, "param_name", False)),
+    ("list_param", ([1], "param_name", int)),
+    ("opt_list_param", (None, "param_name", int)),
+    ("opt_list_param", (frozenlist(), "param_name")),
+    ("opt_list_param", ([1], "param_name")),
+    ("opt_nullable_list_param", (None, "param_name")),
+    ("opt_nullable_list_param", ([], "param_name")),
+    ("set_param", ({1}, "param_name", int)),
+    ("opt_set_param", (None, "param_name")),
+    ("opt_set_param", (frozenset([1]), "param_name")),
+    ("tuple_param", ((1,), "param_name", int)),
+    ("opt_tuple_param", (None, "param_name", (1,))),
+    ("dict_param", ({"a": 1}, "param_name", str, int)),
+    ("opt_dict_param", (None, "param_name")),
+    ("opt_dict_param", (frozendict(), "param_name")),
+    ("opt_dict_param", ({"a": 1}, "param_name", str, int)),
+    ("opt_nullable_dict_param", (None, "param_name")),
+    ("opt_nullable_dict_param", ({}, "param_name")),
+    ("two_dim_dict_param", ({"a": {"b": 1}}, "param_name")),
+    ("opt_two_dim_dict_param", (None, "param_name")),
+    ("type_param", (int, "param_name")),
+    ("opt_type_param", (None, "param_name", int)),
+    ("subclass_param", (bool, "param_name", int)),
+    ("opt_subclass_param", (None, "param_name", int)),
+    ("generator_param", (_gen(), "param_name")),
+    ("opt_generator_param", (None, "param_name")),
+]
+
+
+def test_unchecked_params_match_checked_params():
+    unchecked_fns = check._UNCHECKED_PARAM_FNS  # pylint: disable=protected-access
+    assert set(unchecked_fns) == set(name for name, _args in VALID_PARAM_CALLS)
+
+    for name, args in VALID_PARAM_CALLS:
+        checked_result = getattr(check, name)(*args)
+        unchecked_result = unchecked_fns[name](*args)
+        assert type(unchecked_result) == type(
+            checked_result
+        )  # pylint: disable=unidiomatic-typecheck
+        assert unchecked_result == checked_result
+
+
+INVALID_ELEMENT_PARAM_CALLS = [
+    ("list_param", (["a"], "param_name", int)),
+    ("opt_list_param", (["a"], "param_name", int)),
+    ("opt_nullable_list_param", (["a"], "param_name", int)),
+    ("set_param", ({"a"}, "param_name", int)),
+    ("opt_set_param", ({"a"}, "param_name", int)),
+    ("tuple_param", (("a",), "param_name", int)),
+    ("opt_tuple_param", (("a",), "param_name", None, int)),
+    ("dict_param", ({"a": "b"}, "param_name", str, int)),
+    ("opt_dict_param", ({1: 1}, "param_name", str)),
+    ("opt_dict_param", ({"a": int}, "param_name", str, None, str)),
+    ("opt_nullable_dict_param", ({"a": "b"}, "param_name", None, int)),
+    ("two_dim_dict_param", ({"a": {1: 1}}, "param_name")),
+    ("opt_two_dim_dict_param", ({"a": {"b": "c"}}, "param_name", str, int)),
+]
+
+
+@pytest.mark.parametrize("name,args", INVALID_ELEMENT_PARAM_CALLS)
+def test_unchecked_params_check_elements(name, args):
+    unchecked_fn = check._UNCHECKED_PARAM_FNS[name]  # pylint: disable=protected-access
+    with pytest.raises(CheckError):
+        getattr(check, name)(*args)
+    with pytest.raises(CheckError):
+        unchecked_fn(*args)
+
+
+def test_skip_param_checks_env_var():
+    script = "\n".join(
+        [
+            "from dagster import check",
+            "assert check.inst_param('not an int', 'param_name', int) == 'not an int'",
+            "assert check.opt_dict_param(None, 'param_name') == {}",
+            "try:",
+            "    check.list_param(['a'], 'param_name', of_type=int)",
+            "    raise Exception('element check not enforced')",
+            "except check.CheckError:",
+            "    pass",
+            "try:",
+            "    check.invariant(False)",
+            "    raise Exception('invariant not enforced')",
+            "except check.CheckError:",
+            "    pass",
+        ]
+    )
+    env = dict(os.environ, **{check.SKIP_PARAM_CHECKS_ENV_VAR: "1"})
+    subprocess.check_call([sys.executable, "-c", script], env=env)
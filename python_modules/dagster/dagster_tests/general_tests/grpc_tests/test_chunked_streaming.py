@@ -0,0 +1,142 @@
+# pylint: disable=protected-access
+import threading
+
+import grpc
+
+from dagster import file_relative_path
+from dagster.core.host_representation.external_data import (
+    ExternalPipelineSubsetResult,
+    ExternalRepositoryData,
+)
+from dagster.core.origin import RepositoryGrpcServerOrigin
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc import server as grpc_server
+from dagster.grpc.__generated__ import api_pb2
+from dagster.grpc.__generated__.api_pb2_grpc import DagsterApiServicer
+from dagster.grpc.client import DagsterGrpcClient
+from dagster.grpc.server import DagsterApiServer, DagsterGrpcServer
+from dagster.grpc.types import PipelineSubsetSnapshotArgs
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.utils import find_free_port
+
+
+class _FakeServicerContext(object):
+    def __init__(self):
+        self.compression = None
+
+    def set_compression(self, compression):
+        self.compression = compression
+
+
+def test_stream_serialized_chunks(monkeypatch):
+    monkeypatch.setattr(grpc_server, "MAX_CHUNK_SIZE", 3)
+    monkeypatch.setattr(grpc_server, "COMPRESSION_THRESHOLD", 5)
+
+    context = _FakeServicerContext()
+    chunks = list(grpc_server._stream_serialized_chunks("abcdefgh", context))
+
+    assert [chunk.sequence_number for chunk in chunks] == [0, 1, 2]
+    assert [chunk.serialized_chunk for chunk in chunks] == ["abc", "def", "gh"]
+    assert context.compression == grpc.Compression.Gzip
+
+
+def test_stream_serialized_chunks_small_payload():
+    context = _FakeServicerContext()
+    chunks = list(grpc_server._stream_serialized_chunks("", context))
+
+    assert len(chunks) == 1
+    assert chunks[0].serialized_chunk == ""
+    assert context.compression is None
+
+
+def test_chunked_external_repository(monkeypatch):
+    # Force the repository snapshot to be split across many chunks and compressed
+    monkeypatch.setattr(grpc_server, "MAX_CHUNK_SIZE", 100)
+    monkeypatch.setattr(grpc_server, "COMPRESSION_THRESHOLD", 0)
+
+    port = find_free_port()
+    server = DagsterGrpcServer(
+        port=port,
+        max_workers=2,
+        loadable_target_origin=LoadableTargetOrigin(
+            python_file=file_relative_path(__file__, "grpc_repo.py"), attribute="bar_repo"
+        ),
+    )
+    server_thread = threading.Thread(target=server.serve)
+    server_thread.daemon = True
+    server_thread.start()
+
+    client = DagsterGrpcClient(port=port)
+    try:
+        origin = RepositoryGrpcServerOrigin(
+            host="localhost", port=port, socket=None, repository_name="bar_repo"
+        )
+        streamed = client._streaming_query(
+            "StreamingExternalRepository",
+            api_pb2.ExternalRepositoryRequest,
+            serialized_repository_python_origin=serialize_dagster_namedtuple(origin),
+        )
+        assert len(list(streamed)) > 1
+
+        unary = client._query(
+            "ExternalRepository",
+            api_pb2.ExternalRepositoryRequest,
+            serialized_repository_python_origin=serialize_dagster_namedtuple(origin),
+        )
+
+        external_repository_data = client.external_repository(origin)
+        assert isinstance(external_repository_data, ExternalRepositoryData)
+        assert external_repository_data.name == "bar_repo"
+        assert external_repository_data == deserialize_json_to_dagster_namedtuple(
+            unary.serialized_external_repository_data
+        )
+    finally:
+        client.shutdown_server()
+        server_thread.join()
+
+
+def test_unary_fallback(monkeypatch):
+    # A server from before the streaming methods were added rejects them as unimplemented
+    monkeypatch.setattr(
+        DagsterApiServer,
+        "StreamingExternalRepository",
+        DagsterApiServicer.StreamingExternalRepository,
+    )
+    monkeypatch.setattr(
+        DagsterApiServer,
+        "StreamingExternalPipelineSubsetSnapshot",
+        DagsterApiServicer.StreamingExternalPipelineSubsetSnapshot,
+    )
+
+    port = find_free_port()
+    server = DagsterGrpcServer(
+        port=port,
+        max_workers=2,
+        loadable_target_origin=LoadableTargetOrigin(
+            python_file=file_relative_path(__file__, "grpc_repo.py"), attribute="bar_repo"
+        ),
+    )
+    server_thread = threading.Thread(target=server.serve)
+    server_thread.daemon = True
+    server_thread.start()
+
+    client = DagsterGrpcClient(port=port)
+    try:
+        origin = RepositoryGrpcServerOrigin(
+            host="localhost", port=port, socket=None, repository_name="bar_repo"
+        )
+        external_repository_data = client.external_repository(origin)
+        assert isinstance(external_repository_data, ExternalRepositoryData)
+        assert external_repository_data.name == "bar_repo"
+
+        external_pipeline_subset_result = client.external_pipeline_subset(
+            PipelineSubsetSnapshotArgs(
+                pipeline_origin=origin.get_pipeline_origin("foo"), solid_selection=None
+            )
+        )
+        assert isinstance(external_pipeline_subset_result, ExternalPipelineSubsetResult)
+        assert external_pipeline_subset_result.success
+        assert external_pipeline_subset_result.external_pipeline_data.name == "foo"
+    finally:
+        client.shutdown_server()
+        server_thread.join()
@@ -0,0 +1,70 @@
+import threading
+
+from dagster import file_relative_path
+from dagster.core.host_representation.external_data import (
+    ExternalPartitionExecutionErrorData,
+    ExternalPartitionNamesData,
+    ExternalRepositoryData,
+)
+from dagster.core.origin import RepositoryGrpcServerOrigin
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc.client import DagsterGrpcClient
+from dagster.grpc.server import DagsterGrpcServer, ProcessPoolDagsterApiServer
+from dagster.grpc.types import ListRepositoriesResponse, PartitionNamesArgs
+from dagster.utils import find_free_port
+
+
+def test_process_pool_server():
+    port = find_free_port()
+    server = DagsterGrpcServer(
+        port=port,
+        max_workers=4,
+        num_worker_processes=2,
+        loadable_target_origin=LoadableTargetOrigin(
+            python_file=file_relative_path(__file__, "grpc_repo.py"), attribute="bar_repo"
+        ),
+    )
+    servicer = server._servicer  # pylint: disable=protected-access
+    assert isinstance(servicer, ProcessPoolDagsterApiServer)
+
+    server_thread = threading.Thread(target=server.serve)
+    server_thread.daemon = True
+    server_thread.start()
+
+    client = DagsterGrpcClient(port=port)
+    try:
+        assert client.ping("foobar") == "foobar"
+
+        list_repositories_response = client.list_repositories()
+        assert isinstance(list_repositories_response, ListRepositoriesResponse)
+        assert [
+            symbol.repository_name for symbol in list_repositories_response.repository_symbols
+        ] == ["bar_repo"]
+
+        repository_origin = RepositoryGrpcServerOrigin(
+            host="localhost", port=port, socket=None, repository_name="bar_repo"
+        )
+
+        external_repository_data = client.external_repository(repository_origin)
+        assert isinstance(external_repository_data, ExternalRepositoryData)
+        assert external_repository_data.name == "bar_repo"
+
+        partition_names = client.external_partition_names(
+            PartitionNamesArgs(
+                repository_origin=repository_origin, partition_set_name="baz_partitions"
+            )
+        )
+        assert isinstance(partition_names, ExternalPartitionNamesData)
+        assert len(partition_names.partition_names) == 26
+
+        # User code errors raised in a worker process are reported just like in-process ones
+        partition_error = client.external_partition_names(
+            PartitionNamesArgs(
+                repository_origin=repository_origin, partition_set_name="error_partitions"
+            )
+        )
+        assert isinstance(partition_error, ExternalPartitionExecutionErrorData)
+        assert "womp womp" in partition_error.error.to_string()
+    finally:
+        client.shutdown_server()
+        server_thread.join()
@@ -0,0 +1,45 @@
+# pylint: disable=protected-access
+import grpc
+import pytest
+
+from dagster.grpc.client import DagsterGrpcClient, discard_shared_channel, get_shared_channel
+from dagster.grpc.server import open_server_process
+from dagster.serdes.ipc import interrupt_ipc_subprocess_pid
+from dagster.utils import find_free_port
+
+
+def test_shared_channel_reused_across_clients():
+    port = find_free_port()
+    address = "localhost:" + str(port)
+
+    channel = get_shared_channel(address)
+    assert get_shared_channel(address) is channel
+    assert DagsterGrpcClient(port=port)._server_address == address
+
+    discard_shared_channel(address)
+    assert get_shared_channel(address) is not channel
+    discard_shared_channel(address)
+
+
+def test_shared_channel_reconnects_after_server_restart():
+    port = find_free_port()
+    client = DagsterGrpcClient(port=port)
+
+    server_process = open_server_process(port=port, socket=None)
+    try:
+        assert client.ping("foo") == "foo"
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+        server_process.wait()
+
+    with pytest.raises(grpc.RpcError):
+        client.ping("foo")
+
+    server_process = open_server_process(port=port, socket=None)
+    try:
+        assert client.ping("bar") == "bar"
+        assert DagsterGrpcClient(port=port, use_shared_channel=False).ping("baz") == "baz"
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+        server_process.wait()
+        discard_shared_channel(client._server_address)
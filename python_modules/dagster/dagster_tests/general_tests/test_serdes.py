@@ -8,8 +8,11 @@ from dagster.check import CheckError, ParameterCheckError, inst_param, set_param
 from dagster.serdes import (
     Persistable,
     SerdesClassUsageError,
+    SerializationFormat,
+    _TUPLE_CODECS,
     _deserialize_json_to_dagster_namedtuple,
     _pack_value,
+    _serialize_compact,
     _serialize_dagster_namedtuple,
     _unpack_value,
     _whitelist_for_persistence,
@@ -17,6 +20,8 @@ from dagster.serdes import (
     default_to_storage_value,
     deserialize_json_to_dagster_namedtuple,
     deserialize_value,
+    serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_with_format,
     serialize_value,
 )
 from dagster.utils import compose
@@ -380,3 +385,114 @@ def test_to_storage_value():
     assert isinstance(alphabet, SubstituteAlphabet)
     assert not isinstance(alphabet.c, DeprecatedAlphabet)
     assert isinstance(alphabet.c, SubstituteAlphabet)
+
+
+def test_tuple_codec_compiled_at_registration():
+    _TEST_WHITELIST_MAP = _initial_whitelist_map()
+
+    @_whitelist_for_serdes(whitelist_map=_TEST_WHITELIST_MAP)
+    class Grault(namedtuple("_Grault", "foo bar")):
+        def __new__(cls, foo, bar, baz=None):  # pylint: disable=unused-argument
+            return super(Grault, cls).__new__(cls, foo, bar)
+
+    codec = _TUPLE_CODECS[Grault]
+    assert codec.fields == ("foo", "bar")
+    assert codec.constructor_args == {"foo", "bar", "baz"}
+
+
+def test_unknown_fields_are_not_unpacked():
+    _TEST_WHITELIST_MAP = _initial_whitelist_map()
+
+    @_whitelist_for_serdes(whitelist_map=_TEST_WHITELIST_MAP)
+    class Garply(namedtuple("_Garply", "foo")):
+        def __new__(cls, foo):
+            return super(Garply, cls).__new__(cls, foo)
+
+    # a field removed from the class that refers to a class that no longer exists at all
+    serialized = '{"__class__": "Garply", "foo": 1, "removed": {"__class__": "NoLongerExists"}}'
+    assert _deserialize_json_to_dagster_namedtuple(
+        serialized, whitelist_map=_TEST_WHITELIST_MAP
+    ) == Garply(1)
+
+
+COMPACT_FORMATS = [SerializationFormat.COMPACT, SerializationFormat.COMPACT_ZLIB]
+
+
+@pytest.mark.parametrize("serialization_format", COMPACT_FORMATS)
+def test_compact_round_trip(serialization_format):
+    _TEST_WHITELIST_MAP = _initial_whitelist_map()
+
+    @_whitelist_for_serdes(whitelist_map=_TEST_WHITELIST_MAP)
+    class Waldo(Enum):
+        FOO = 1
+        BAR = 2
+
+    @_whitelist_for_serdes(whitelist_map=_TEST_WHITELIST_MAP)
+    class Fred(namedtuple("_Fred", "name kind children tags")):
+        def __new__(cls, name, kind, children, tags):
+            return super(Fred, cls).__new__(cls, name, kind, children, tags)
+
+    @_whitelist_for_persistence(whitelist_map=_TEST_WHITELIST_MAP)
+    @_whitelist_for_serdes(whitelist_map=_TEST_WHITELIST_MAP)
+    class Plugh(namedtuple("_Plugh", "a b"), Persistable):
+        def __new__(cls, a, b):
+            return super(Plugh, cls).__new__(cls, a, b)
+
+    value = Fred(
+        "root",
+        Waldo.FOO,
+        [Fred("child", Waldo.BAR, [], {"x": [1, 2.5, None, True]}), Plugh("A", "B")],
+        {"set": {1, 2}, "frozenset": frozenset(["a"]), "nested": {"__class__": "NotATuple"}},
+    )
+
+    serialized = _serialize_compact(value, serialization_format, whitelist_map=_TEST_WHITELIST_MAP)
+    assert not serialized.startswith("{")
+    assert (
+        _deserialize_json_to_dagster_namedtuple(serialized, whitelist_map=_TEST_WHITELIST_MAP)
+        == value
+    )
+
+
+@pytest.mark.parametrize("serialization_format", COMPACT_FORMATS)
+def test_compact_compat(serialization_format):
+    _TEST_WHITELIST_MAP = _initial_whitelist_map()
+
+    @_whitelist_for_serdes(whitelist_map=_TEST_WHITELIST_MAP)
+    class Quux(namedtuple("_Quux", "foo bar")):
+        def __new__(cls, foo, bar):
+            return super(Quux, cls).__new__(cls, foo, bar)  # pylint: disable=bad-super-call
+
+    serialized = _serialize_compact(
+        Quux("zip", "zow"), serialization_format, whitelist_map=_TEST_WHITELIST_MAP
+    )
+
+    # pylint: disable=function-redefined
+    @_whitelist_for_serdes(whitelist_map=_TEST_WHITELIST_MAP)
+    class Quux(namedtuple("_Quux", "bar baz")):  # pylint: disable=bad-super-call
+        def __new__(cls, bar, baz=None):
+            return super(Quux, cls).__new__(cls, bar, baz=baz)
+
+    # fields are matched by name: removed fields are dropped and new fields take their defaults
+    assert _deserialize_json_to_dagster_namedtuple(
+        serialized, whitelist_map=_TEST_WHITELIST_MAP
+    ) == Quux("zow")
+
+
+def test_compact_is_smaller():
+    from dagster.core.snap import PipelineSnapshot
+    from dagster.utils.test.hello_world_repository import hello_world_repository
+
+    snapshot = PipelineSnapshot.from_pipeline_def(hello_world_repository.get_all_pipelines()[0])
+
+    json_str = serialize_dagster_namedtuple(snapshot)
+    compact_str = serialize_dagster_namedtuple_with_format(snapshot, SerializationFormat.COMPACT)
+    zlib_str = serialize_dagster_namedtuple_with_format(snapshot, SerializationFormat.COMPACT_ZLIB)
+    assert len(zlib_str) < len(compact_str) < len(json_str)
+
+    for serialized in [json_str, compact_str, zlib_str]:
+        assert deserialize_json_to_dagster_namedtuple(serialized) == snapshot
+
+
+def test_compact_unknown_version():
+    with pytest.raises(CheckError, match="Unknown serialization format"):
+        deserialize_json_to_dagster_namedtuple("~c9:{}")
@@ -0,0 +1,63 @@
+import pytest
+
+from dagster.check import CheckError
+from dagster.utils.cache import LRUCache
+
+
+def test_lru_cache_get_or_compute():
+    calls = []
+
+    def _compute(value):
+        def _fn():
+            calls.append(value)
+            return value
+
+        return _fn
+
+    cache = LRUCache(max_size=2)
+    assert cache.get_or_compute("a", _compute(1)) == 1
+    assert cache.get_or_compute("a", _compute(2)) == 1
+    assert calls == [1]
+    assert "a" in cache
+    assert len(cache) == 1
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+
+    # touch "a" so that "b" becomes the least recently used entry
+    cache.get_or_compute("a", lambda: None)
+    cache.get_or_compute("c", lambda: 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_does_not_cache_failures():
+    cache = LRUCache(max_size=2)
+
+    def _raise():
+        raise Exception("failed")
+
+    with pytest.raises(Exception, match="failed"):
+        cache.get_or_compute("a", _raise)
+    assert "a" not in cache
+
+    # values rejected by should_cache are returned, but computed again on the next lookup
+    assert cache.get_or_compute("a", lambda: None, should_cache=lambda value: value) is None
+    assert "a" not in cache
+    assert cache.get_or_compute("a", lambda: 1, should_cache=lambda value: value) == 1
+    assert "a" in cache
+    assert len(cache) == 1
+
+
+def test_lru_cache_bad_size():
+    with pytest.raises(CheckError):
+        LRUCache(max_size=0)
@@ -2,7 +2,7 @@ from .compute_log_manager import S3ComputeLogManager
 from .file_cache import S3FileCache, s3_file_cache
 from .file_manager import S3FileHandle, S3FileManager
 from .intermediate_storage import S3IntermediateStorage
-from .object_store import S3ObjectStore
+from .object_store import S3ObjectChangedError, S3ObjectStore
 from .resources import s3_file_manager, s3_resource
 from .s3_fake_resource import S3FakeSession, create_s3_fake_resource
 from .solids import S3Coordinate, file_handle_to_s3
@@ -1,7 +1,12 @@
+import gzip
+import io
 import os
+import threading
 from contextlib import contextmanager
 
 import boto3
+import six
+from botocore.exceptions import BotoCoreError, ClientError
 
 from dagster import Field, StringSource, check, seven
 from dagster.core.storage.compute_log_manager import (
@@ -9,11 +14,16 @@ from dagster.core.storage.compute_log_manager import (
     ComputeIOType,
     ComputeLogFileData,
     ComputeLogManager,
+    trim_partial_utf8_character,
 )
 from dagster.core.storage.local_compute_log_manager import IO_TYPE_EXTENSION, LocalComputeLogManager
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import ensure_dir, ensure_file
 
+# The largest chunk uploaded at once when uploading logs incrementally. Reading from a compressed
+# chunk fetches the whole chunk, so this also bounds the size of those reads.
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
     """Logs solid compute function stdout and stderr to S3.
@@ -34,6 +44,14 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             verify: true
             verify_cert_path: "/path/to/cert/bundle.pem"
             endpoint_url: "http://alternate-s3-host.io"
+            upload_interval: 30
+            gzip_chunks: true
+
+    By default, the logs of each step are uploaded as a single object once the step finishes. When
+    ``upload_interval`` is set, the bytes logged since the last upload are instead uploaded every
+    ``upload_interval`` seconds (and once more when the step finishes) as numbered chunk objects,
+    listed in a manifest object next to them. Logs are then read from the chunks, with range
+    requests, so that the logs of steps running on other nodes can be read while they run.
 
     Args:
         bucket (str): The name of the s3 bucket to which to log.
@@ -45,6 +63,10 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         verify_cert_path (Optional[str]): A filename of the CA cert bundle to use. Only used if
             `verify` set to False.
         endpoint_url (Optional[str]): Override for the S3 endpoint url.
+        upload_interval (Optional[float]): How often, in seconds, to upload new log bytes while a
+            step runs. If not set, logs are uploaded as a single object when the step finishes.
+        gzip_chunks (Optional[bool]): Whether to gzip the chunks uploaded when ``upload_interval``
+            is set. Default False.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when newed up from config.
     """
@@ -59,6 +81,8 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         verify=True,
         verify_cert_path=None,
         endpoint_url=None,
+        upload_interval=None,
+        gzip_chunks=False,
     ):
         _verify = False if not verify else verify_cert_path
         self._s3_session = boto3.resource(
@@ -67,6 +91,12 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         self._s3_bucket = check.str_param(bucket, "bucket")
         self._s3_prefix = check.str_param(prefix, "prefix")
         self._download_urls = {}
+        self._upload_interval = check.opt_numeric_param(upload_interval, "upload_interval")
+        self._gzip_chunks = check.bool_param(gzip_chunks, "gzip_chunks")
+        # The manifests of the chunked logs being uploaded by this process, and of the completed
+        # chunked logs read by it, by manifest key, and the size of each manifest last uploaded
+        self._chunk_manifests = {}
+        self._uploaded_manifest_sizes = {}
 
         # proxy calls to local compute log manager (for subscriptions, etc)
         if not local_dir:
@@ -81,7 +111,12 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         with self.local_manager._watch_logs(  # pylint: disable=protected-access
             pipeline_run, step_key
         ):
-            yield
+            if self._upload_interval is None:
+                yield
+            else:
+                key = self.local_manager.get_key(pipeline_run, step_key)
+                with self._upload_chunks_periodically(pipeline_run.run_id, key):
+                    yield
 
     @property
     def inst_data(self):
@@ -97,6 +132,8 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             "verify": Field(bool, is_required=False, default_value=True),
             "verify_cert_path": Field(StringSource, is_required=False),
             "endpoint_url": Field(StringSource, is_required=False),
+            "upload_interval": Field(float, is_required=False),
+            "gzip_chunks": Field(bool, is_required=False, default_value=False),
         }
 
     @staticmethod
@@ -112,8 +149,11 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
     def on_watch_finish(self, pipeline_run, step_key):
         self.local_manager.on_watch_finish(pipeline_run, step_key)
         key = self.local_manager.get_key(pipeline_run, step_key)
-        self._upload_from_local(pipeline_run.run_id, key, ComputeIOType.STDOUT)
-        self._upload_from_local(pipeline_run.run_id, key, ComputeIOType.STDERR)
+        for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]:
+            if self._upload_interval is None:
+                self._upload_from_local(pipeline_run.run_id, key, io_type)
+            else:
+                self._upload_chunks_from_local(pipeline_run.run_id, key, io_type, complete=True)
 
     def is_watch_completed(self, run_id, key):
         return self.local_manager.is_watch_completed(run_id, key)
@@ -121,6 +161,12 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
     def download_url(self, run_id, key, io_type):
         if not self.is_watch_completed(run_id, key):
             return self.local_manager.download_url(run_id, key, io_type)
+        if self._upload_interval is not None:
+            # Chunked logs are never uploaded as a single object, so can only be downloaded from
+            # the local copy
+            if os.path.exists(self.get_local_path(run_id, key, io_type)):
+                return self.local_manager.download_url(run_id, key, io_type)
+            return None
         key = self._bucket_key(run_id, key, io_type)
         if key in self._download_urls:
             return self._download_urls[key]
@@ -131,22 +177,39 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         return url
 
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
-        if self._should_download(run_id, key, io_type):
-            self._download_to_local(run_id, key, io_type)
+        if not os.path.exists(self.get_local_path(run_id, key, io_type)):
+            bucket_key = self._bucket_key(run_id, key, io_type)
+            manifest_key = self._manifest_key(bucket_key)
+            manifest = self._chunk_manifests.get(manifest_key)
+            if manifest is None or not manifest["complete"]:
+                # A single listing tells whether the logs were uploaded as one object or as chunks,
+                # so that the manifest is only fetched for chunked logs
+                stored_keys = self._list_stored_keys(bucket_key)
+                if bucket_key in stored_keys:
+                    self._download_to_local(run_id, key, io_type)
+                    manifest = None
+                elif manifest_key in stored_keys:
+                    manifest = self._get_chunk_manifest(run_id, key, io_type)
+                else:
+                    manifest = None
+
+            if manifest is not None:
+                return self._read_chunks(run_id, key, io_type, manifest, cursor, max_bytes)
+
         data = self.local_manager.read_logs_file(run_id, key, io_type, cursor, max_bytes)
         return self._from_local_file_data(run_id, key, io_type, data)
 
     def on_subscribe(self, subscription):
         self.local_manager.on_subscribe(subscription)
 
-    def _should_download(self, run_id, key, io_type):
-        local_path = self.get_local_path(run_id, key, io_type)
-        if os.path.exists(local_path):
-            return False
-        s3_objects = self._s3_session.list_objects(
-            Bucket=self._s3_bucket, Prefix=self._bucket_key(run_id, key, io_type)
+    def _list_stored_keys(self, bucket_key):
+        """The keys of the single object and of the chunk manifest stored for the logs at the given
+        bucket key, whichever exist. The chunks themselves are grouped under a common prefix, so
+        that they are not listed."""
+        response = self._s3_session.list_objects(
+            Bucket=self._s3_bucket, Prefix=bucket_key, Delimiter="/"
         )
-        return len(s3_objects) > 0
+        return set(s3_object["Key"] for s3_object in response.get("Contents", []))
 
     def _from_local_file_data(self, run_id, key, io_type, local_file_data):
         is_complete = self.is_watch_completed(run_id, key)
@@ -171,6 +234,129 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         with open(path, "rb") as data:
             self._s3_session.upload_fileobj(data, self._s3_bucket, key)
 
+    @contextmanager
+    def _upload_chunks_periodically(self, run_id, key):
+        stop = threading.Event()
+
+        def _upload_chunks():
+            while not stop.wait(self._upload_interval):
+                for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]:
+                    try:
+                        self._upload_chunks_from_local(run_id, key, io_type, complete=False)
+                    except (BotoCoreError, ClientError):
+                        # The new bytes are uploaded at the next interval, or when the step finishes
+                        pass
+
+        upload_thread = threading.Thread(
+            target=_upload_chunks, name="compute-log-upload-{}".format(key)
+        )
+        upload_thread.daemon = True
+        upload_thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            upload_thread.join()
+
+    def _upload_chunks_from_local(self, run_id, key, io_type, complete):
+        path = self.get_local_path(run_id, key, io_type)
+        ensure_file(path)
+        bucket_key = self._bucket_key(run_id, key, io_type)
+        manifest_key = self._manifest_key(bucket_key)
+        manifest = self._chunk_manifests.setdefault(
+            manifest_key, {"size": 0, "complete": False, "chunks": []}
+        )
+
+        with open(path, "rb") as f:
+            f.seek(manifest["size"])
+            while True:
+                data = f.read(MAX_CHUNK_SIZE)
+                if not data:
+                    break
+
+                chunk = {
+                    "key": "{bucket_key}.chunks/{index:08d}{extension}".format(
+                        bucket_key=bucket_key,
+                        index=len(manifest["chunks"]),
+                        extension=".gz" if self._gzip_chunks else "",
+                    ),
+                    "offset": manifest["size"],
+                    "size": len(data),
+                    "gzip": self._gzip_chunks,
+                }
+                self._s3_session.put_object(
+                    Bucket=self._s3_bucket,
+                    Key=chunk["key"],
+                    Body=_gzip(data) if self._gzip_chunks else data,
+                )
+                # The manifest only lists chunks once they are uploaded
+                manifest["chunks"].append(chunk)
+                manifest["size"] += len(data)
+
+        if complete or manifest["size"] != self._uploaded_manifest_sizes.get(manifest_key):
+            manifest["complete"] = complete
+            self._s3_session.put_object(
+                Bucket=self._s3_bucket,
+                Key=manifest_key,
+                Body=six.ensure_binary(seven.json.dumps(manifest)),
+            )
+            self._uploaded_manifest_sizes[manifest_key] = manifest["size"]
+
+    def _get_chunk_manifest(self, run_id, key, io_type):
+        manifest_key = self._manifest_key(self._bucket_key(run_id, key, io_type))
+        if manifest_key in self._chunk_manifests:
+            manifest = self._chunk_manifests[manifest_key]
+            if manifest["complete"]:
+                return manifest
+
+        try:
+            s3_object = self._s3_session.get_object(Bucket=self._s3_bucket, Key=manifest_key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+
+        manifest = seven.json.loads(six.ensure_str(s3_object["Body"].read()))
+        if manifest["complete"]:
+            self._chunk_manifests[manifest_key] = manifest
+        return manifest
+
+    def _read_chunks(self, run_id, key, io_type, manifest, cursor, max_bytes):
+        end = min(cursor + max_bytes, manifest["size"])
+        data = []
+        for chunk in manifest["chunks"]:
+            chunk_end = chunk["offset"] + chunk["size"]
+            if chunk_end <= cursor or chunk["offset"] >= end:
+                continue
+
+            start_in_chunk = max(cursor, chunk["offset"]) - chunk["offset"]
+            end_in_chunk = min(end, chunk_end) - chunk["offset"]
+            if chunk["gzip"]:
+                s3_object = self._s3_session.get_object(Bucket=self._s3_bucket, Key=chunk["key"])
+                data.append(_gunzip(s3_object["Body"].read())[start_in_chunk:end_in_chunk])
+            else:
+                s3_object = self._s3_session.get_object(
+                    Bucket=self._s3_bucket,
+                    Key=chunk["key"],
+                    Range="bytes={start}-{end}".format(start=start_in_chunk, end=end_in_chunk - 1),
+                )
+                data.append(s3_object["Body"].read())
+
+        data = b"".join(data)
+        # A read cut short by max_bytes may end within a multibyte character, which is left to the
+        # next read
+        if end < manifest["size"]:
+            data = trim_partial_utf8_character(data)
+
+        # The chunks can't be downloaded as a single object
+        return ComputeLogFileData(
+            path="s3://{}/{}".format(self._s3_bucket, self._bucket_key(run_id, key, io_type)),
+            data=data.decode("utf-8"),
+            cursor=cursor + len(data),
+            size=manifest["size"],
+            download_url=None,
+        )
+
     def _download_to_local(self, run_id, key, io_type):
         path = self.get_local_path(run_id, key, io_type)
         ensure_dir(os.path.dirname(path))
@@ -190,3 +376,18 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             "{}.{}".format(key, extension),
         ]
         return "/".join(paths)  # s3 path delimiter
+
+    def _manifest_key(self, bucket_key):
+        return "{bucket_key}.manifest.json".format(bucket_key=bucket_key)
+
+
+def _gzip(data):
+    compressed = io.BytesIO()
+    with gzip.GzipFile(fileobj=compressed, mode="wb") as f:
+        f.write(data)
+    return compressed.getvalue()
+
+
+def _gunzip(data):
+    with gzip.GzipFile(fileobj=io.BytesIO(data), mode="rb") as f:
+        return f.read()
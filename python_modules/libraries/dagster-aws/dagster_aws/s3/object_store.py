@@ -1,8 +1,13 @@
+import io
 import logging
+import re
 import sys
-from io import BytesIO, StringIO
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
+import six
+from botocore.exceptions import ClientError
 
 from dagster import check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
@@ -10,9 +15,51 @@ from dagster.core.storage.object_store import ObjectStore
 from dagster.core.types.marshal import SerializationStrategy
 
 
+# S3 requires every part of a multipart upload but the last to be at least 5 MiB
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 4
+
+# The size of the reads made by a deserializer from the chunks of a downloaded object
+_READ_BUFFER_SIZE = 64 * 1024
+
+
+class S3ObjectChangedError(Exception):
+    """Raised when an S3 object is replaced while it is being read."""
+
+
 class S3ObjectStore(ObjectStore):
-    def __init__(self, bucket, s3_session=None):
+    """An object store backed by an S3 bucket.
+
+    Objects are streamed to and from S3 as they are serialized and deserialized: values are
+    uploaded in parts of ``multipart_chunksize`` bytes, and downloaded in ranges of the same size,
+    with up to ``max_concurrency`` parts or ranges in flight at a time. Objects no larger than a
+    single part are written with a single ``put_object`` and read with a single ``get_object``.
+
+    Args:
+        bucket (str): The S3 bucket.
+        s3_session (Optional[Any]): The boto3 S3 client to use. Defaults to ``boto3.client("s3")``.
+        multipart_chunksize (Optional[int]): The size in bytes of the parts uploaded and the ranges
+            downloaded. S3 requires parts of at least 5 MiB. Defaults to 8 MiB.
+        max_concurrency (Optional[int]): The maximum number of parts uploaded or ranges downloaded
+            at the same time, which bounds the memory used by a transfer to about
+            ``(max_concurrency + 1) * multipart_chunksize`` bytes. Defaults to 4.
+    """
+
+    # Each existence check or copy is a request, and boto3 clients can be shared between threads
+    batch_concurrency = 8
+
+    def __init__(
+        self,
+        bucket,
+        s3_session=None,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    ):
         self.bucket = check.str_param(bucket, "bucket")
+        self.multipart_chunksize = check.int_param(multipart_chunksize, "multipart_chunksize")
+        check.param_invariant(multipart_chunksize > 0, "multipart_chunksize")
+        self.max_concurrency = check.int_param(max_concurrency, "max_concurrency")
+        check.param_invariant(max_concurrency > 0, "max_concurrency")
         self.s3 = s3_session or boto3.client("s3")
         self.s3.head_bucket(Bucket=bucket)
         super(S3ObjectStore, self).__init__("s3", sep="/")
@@ -27,21 +74,24 @@ class S3ObjectStore(ObjectStore):
             serialization_strategy, "serialization_strategy", SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
-            logging.warning("Removing existing S3 key: {key}".format(key=key))
-            self.rm_object(key)
-
-        with BytesIO() as bytes_io:
+        # An upload replaces any existing object at the key, so there is no need to delete it first
+        writer = _S3ObjectWriter(
+            self.s3, self.bucket, key, self.multipart_chunksize, self.max_concurrency
+        )
+        try:
             if serialization_strategy.write_mode == "w" and sys.version_info >= (3, 0):
-                with StringIO() as string_io:
-                    string_io = StringIO()
-                    serialization_strategy.serialize(obj, string_io)
-                    string_io.seek(0)
-                    bytes_io.write(string_io.read().encode("utf-8"))
+                # Line endings are written as they are, as they were by the StringIO previously used
+                text_writer = io.TextIOWrapper(
+                    writer, encoding=serialization_strategy.encoding, newline=""
+                )
+                serialization_strategy.serialize(obj, text_writer)
+                text_writer.flush()
             else:
-                serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
+                serialization_strategy.serialize(obj, writer)
+            writer.complete()
+        except Exception:
+            writer.abort()
+            raise
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -60,15 +110,16 @@ class S3ObjectStore(ObjectStore):
         )  # cannot be none here
 
         # FIXME we need better error handling for object store
-        obj = serialization_strategy.deserialize(
-            BytesIO(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
-            if serialization_strategy.read_mode == "rb"
-            else StringIO(
-                self.s3.get_object(Bucket=self.bucket, Key=key)["Body"]
-                .read()
-                .decode(serialization_strategy.encoding)
-            )
-        )
+        with _S3ObjectReader(
+            self.s3, self.bucket, key, self.multipart_chunksize, self.max_concurrency
+        ) as reader:
+            read_file_obj = io.BufferedReader(reader, buffer_size=_READ_BUFFER_SIZE)
+            if serialization_strategy.read_mode != "rb":
+                read_file_obj = io.TextIOWrapper(
+                    read_file_obj, encoding=serialization_strategy.encoding, newline=""
+                )
+            obj = serialization_strategy.deserialize(read_file_obj)
+
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -136,3 +187,226 @@ class S3ObjectStore(ObjectStore):
         check.str_param(key, "key")
         protocol = check.opt_str_param(protocol, "protocol", default="s3://")
         return protocol + self.bucket + "/" + "{key}".format(key=key)
+
+
+class _S3ObjectWriter(io.RawIOBase):
+    """A writable stream that uploads the bytes written to it to an S3 key.
+
+    Bytes are buffered until a full part has been written, and each full part is uploaded on a
+    background thread as part of a multipart upload, with at most ``max_concurrency`` parts in
+    flight. Writes block while that many parts are being uploaded.
+
+    ``complete`` must be called once everything has been written for the object to be created; if
+    no full part was ever written, it is uploaded with a single ``put_object``. ``abort`` discards
+    the parts uploaded so far.
+    """
+
+    def __init__(self, s3, bucket, key, chunksize, max_concurrency):
+        super(_S3ObjectWriter, self).__init__()
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._chunksize = chunksize
+        self._max_concurrency = max_concurrency
+
+        self._buffer = bytearray()
+        self._executor = None
+        self._upload_id = None
+        self._part_futures = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        # Serializers may write a large value in a single call, so full parts are sliced out of it
+        # directly rather than copied through the buffer
+        view = memoryview(b)
+        size = len(view)
+        if self._buffer:
+            fill = min(len(view), self._chunksize - len(self._buffer))
+            self._buffer.extend(view[:fill])
+            view = view[fill:]
+            if len(self._buffer) == self._chunksize:
+                self._upload_part(bytes(self._buffer))
+                self._buffer = bytearray()
+
+        while len(view) >= self._chunksize:
+            self._upload_part(view[: self._chunksize].tobytes())
+            view = view[self._chunksize :]
+
+        self._buffer.extend(view)
+        return size
+
+    def complete(self):
+        if self._upload_id is None:
+            self._s3.put_object(Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer))
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+            parts = [
+                {"ETag": future.result()["ETag"], "PartNumber": part_number}
+                for part_number, future in enumerate(self._part_futures, 1)
+            ]
+            self._s3.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        self._cleanup()
+
+    def abort(self):
+        if self._upload_id is not None:
+            for future in self._part_futures:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            self._s3.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+        self._cleanup()
+
+    def _upload_part(self, part):
+        if self._upload_id is None:
+            self._upload_id = self._s3.create_multipart_upload(Bucket=self._bucket, Key=self._key)[
+                "UploadId"
+            ]
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+
+        # Bound the parts held in memory by waiting for the oldest upload in flight, which also
+        # surfaces upload errors as early as possible
+        if len(self._part_futures) >= self._max_concurrency:
+            self._part_futures[-self._max_concurrency].result()
+
+        self._part_futures.append(
+            self._executor.submit(
+                self._s3.upload_part,
+                Bucket=self._bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                PartNumber=len(self._part_futures) + 1,
+                Body=part,
+            )
+        )
+
+    def _cleanup(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._buffer = bytearray()
+        self._part_futures = []
+        self.close()
+
+
+_CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+class _S3ObjectReader(io.RawIOBase):
+    """A readable stream over the contents of an S3 key.
+
+    The object is downloaded in ranges of ``chunksize`` bytes. The first range is requested when
+    the stream is created, which also reveals the size of the object; any further ranges are
+    downloaded on background threads ahead of the reads, with at most ``max_concurrency`` ranges
+    in flight.
+
+    Further ranges are only downloaded from the version of the object that the first range was
+    read from, so that the stream never mixes the bytes of two versions of an object replaced
+    while it is read. Reading from an object replaced since then raises S3ObjectChangedError.
+    """
+
+    def __init__(self, s3, bucket, key, chunksize, max_concurrency):
+        super(_S3ObjectReader, self).__init__()
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._chunksize = chunksize
+        self._max_concurrency = max_concurrency
+
+        self._executor = None
+        self._range_futures = deque()
+
+        self._etag = None
+        self._chunk, self._size = self._get_first_range()
+        self._chunk_offset = 0
+        self._next_range_start = len(self._chunk)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._chunk_offset >= len(self._chunk):
+            if not self._next_chunk():
+                return 0
+
+        count = min(len(b), len(self._chunk) - self._chunk_offset)
+        b[:count] = self._chunk[self._chunk_offset : self._chunk_offset + count]
+        self._chunk_offset += count
+        return count
+
+    def close(self):
+        if self._executor is not None:
+            for future in self._range_futures:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._range_futures.clear()
+        self._chunk = b""
+        super(_S3ObjectReader, self).close()
+
+    def _get_first_range(self):
+        try:
+            response = self._s3.get_object(
+                Bucket=self._bucket, Key=self._key, Range=self._range_header(0)
+            )
+        except ClientError as exc:
+            # S3 refuses any range of an empty object
+            if exc.response.get("Error", {}).get("Code") != "InvalidRange":
+                raise
+            return b"", 0
+
+        self._etag = response.get("ETag")
+        chunk = response["Body"].read()
+        match = _CONTENT_RANGE_RE.match(response.get("ContentRange") or "")
+        return chunk, int(match.group(3)) if match else len(chunk)
+
+    def _next_chunk(self):
+        self._fill_range_futures()
+        if not self._range_futures:
+            return False
+
+        self._chunk = memoryview(self._range_futures.popleft().result())
+        self._chunk_offset = 0
+        self._fill_range_futures()
+        return True
+
+    def _fill_range_futures(self):
+        while (
+            self._next_range_start < self._size and len(self._range_futures) < self._max_concurrency
+        ):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+            self._range_futures.append(
+                self._executor.submit(self._get_range, self._next_range_start)
+            )
+            self._next_range_start += self._chunksize
+
+    def _get_range(self, start):
+        kwargs = {"IfMatch": self._etag} if self._etag else {}
+        try:
+            response = self._s3.get_object(
+                Bucket=self._bucket, Key=self._key, Range=self._range_header(start), **kwargs
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") != "PreconditionFailed":
+                raise
+            six.raise_from(
+                S3ObjectChangedError(
+                    "S3 object s3://{bucket}/{key} was replaced while it was being read".format(
+                        bucket=self._bucket, key=self._key
+                    )
+                ),
+                exc,
+            )
+        return response["Body"].read()
+
+    def _range_header(self, start):
+        return "bytes={start}-{end}".format(start=start, end=start + self._chunksize - 1)
@@ -1,4 +1,6 @@
+import hashlib
 import io
+import uuid
 from collections import defaultdict
 
 from botocore.exceptions import ClientError
@@ -20,6 +22,7 @@ class S3FakeSession(object):
 
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
         self.mock_extras = mock.MagicMock()
+        self.multipart_uploads = {}
 
     def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argument
         self.mock_extras.head_bucket(*args, **kwargs)
@@ -38,14 +41,56 @@ class S3FakeSession(object):
 
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
-        self.buckets[Bucket][Key] = Body.read()
+        self.buckets[Bucket][Key] = _read_body(Body)
 
-    def get_object(self, Bucket, Key, *args, **kwargs):
+    def get_object(self, Bucket, Key, Range=None, IfMatch=None, *args, **kwargs):
         if not self.has_object(Bucket, Key):
             raise ClientError({}, None)
 
         self.mock_extras.get_object(*args, **kwargs)
-        return {"Body": self._get_byte_stream(Bucket, Key)}
+        value = self.buckets[Bucket][Key]
+        if IfMatch is not None and IfMatch != _etag(value):
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "GetObject")
+
+        if Range is None:
+            return {"Body": self._get_byte_stream(Bucket, Key), "ETag": _etag(value)}
+
+        start, end = [int(bound) for bound in Range[len("bytes=") :].split("-")]
+        if start >= len(value):
+            raise ClientError({"Error": {"Code": "InvalidRange"}}, "GetObject")
+
+        end = min(end, len(value) - 1)
+        return {
+            "Body": io.BytesIO(value[start : end + 1]),
+            "ContentLength": end + 1 - start,
+            "ContentRange": "bytes {start}-{end}/{size}".format(
+                start=start, end=end, size=len(value)
+            ),
+            "ETag": _etag(value),
+        }
+
+    def create_multipart_upload(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.create_multipart_upload(*args, **kwargs)
+        upload_id = str(uuid.uuid4())
+        self.multipart_uploads[upload_id] = (Bucket, Key, {})
+        return {"Bucket": Bucket, "Key": Key, "UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs):
+        self.mock_extras.upload_part(*args, **kwargs)
+        _, _, parts = self.multipart_uploads[UploadId]
+        parts[PartNumber] = _read_body(Body)
+        return {"ETag": str(PartNumber)}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, *args, **kwargs):
+        self.mock_extras.complete_multipart_upload(*args, **kwargs)
+        _, _, parts = self.multipart_uploads.pop(UploadId)
+        self.buckets[Bucket][Key] = b"".join(
+            parts[part["PartNumber"]] for part in MultipartUpload["Parts"]
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId, *args, **kwargs):
+        self.mock_extras.abort_multipart_upload(*args, **kwargs)
+        self.multipart_uploads.pop(UploadId, None)
 
     def upload_fileobj(self, fileobj, bucket, key, *args, **kwargs):
         self.mock_extras.upload_fileobj(*args, **kwargs)
@@ -61,3 +106,11 @@ class S3FakeSession(object):
         self.mock_extras.download_file(*args, **kwargs)
         with open(Filename, "wb") as ff:
             ff.write(self._get_byte_stream(Bucket, Key).read())
+
+
+def _etag(value):
+    return '"{digest}"'.format(digest=hashlib.md5(value).hexdigest())
+
+
+def _read_body(body):
+    return body if isinstance(body, bytes) else body.read()
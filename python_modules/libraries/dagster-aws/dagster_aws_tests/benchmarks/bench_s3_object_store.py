@@ -0,0 +1,208 @@
+"""Measure the throughput and peak memory of writing and reading a large value with the
+S3ObjectStore, against a local stand-in for S3 that keeps objects on disk and simulates the
+latency and per-connection bandwidth of requests to S3.
+
+Each operation is measured in a subprocess, so that its peak RSS is not affected by the others.
+
+Run with:
+
+    python -m dagster_aws_tests.benchmarks.bench_s3_object_store [--size-mb 256] \
+        [--latency-ms 20] [--bandwidth-mb 100] [--chunksize-mb 8] [--max-concurrency 4]
+"""
+import argparse
+import io
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+from botocore.exceptions import ClientError
+from dagster_aws.s3 import S3ObjectStore
+
+from dagster.core.storage.object_store import DEFAULT_SERIALIZATION_STRATEGY
+from dagster.utils.timing import format_duration, time_execution_scope
+
+MiB = 1024 * 1024
+
+BUCKET = "bench-bucket"
+KEY = "bench/value"
+
+
+class DiskS3Session(object):
+    """A stand-in for a boto3 S3 client, which stores objects as files in a directory.
+
+    Every request sleeps for the given latency, plus the time taken to transfer its body at the
+    given bandwidth, so that concurrent requests complete sooner than sequential ones.
+    """
+
+    def __init__(self, root, latency, bandwidth):
+        self.root = root
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self._lock = threading.Lock()
+        self._uploads = {}
+
+    def _path(self, key):
+        return os.path.join(self.root, key.replace("/", "__"))
+
+    def _transfer(self, num_bytes):
+        time.sleep(self.latency + float(num_bytes) / self.bandwidth)
+
+    def head_bucket(self, Bucket):  # pylint: disable=unused-argument
+        self._transfer(0)
+
+    def list_objects_v2(self, Bucket, Prefix):  # pylint: disable=unused-argument
+        self._transfer(0)
+        return {"KeyCount": int(os.path.exists(self._path(Prefix)))}
+
+    def put_object(self, Bucket, Key, Body):  # pylint: disable=unused-argument
+        body = Body if isinstance(Body, bytes) else Body.read()
+        self._transfer(len(body))
+        with open(self._path(Key), "wb") as f:
+            f.write(body)
+
+    def get_object(self, Bucket, Key, Range=None):  # pylint: disable=unused-argument
+        size = os.path.getsize(self._path(Key))
+        start, end = (
+            [int(bound) for bound in Range[len("bytes=") :].split("-")] if Range else (0, size - 1)
+        )
+        if start >= size:
+            raise ClientError({"Error": {"Code": "InvalidRange"}}, "GetObject")
+
+        end = min(end, size - 1)
+        with open(self._path(Key), "rb") as f:
+            f.seek(start)
+            body = f.read(end + 1 - start)
+        self._transfer(len(body))
+        return {
+            "Body": io.BytesIO(body),
+            "ContentRange": "bytes {start}-{end}/{size}".format(start=start, end=end, size=size),
+        }
+
+    def create_multipart_upload(self, Bucket, Key):  # pylint: disable=unused-argument
+        self._transfer(0)
+        upload_id = str(uuid.uuid4())
+        with self._lock:
+            self._uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self._transfer(len(Body))
+        part_path = self._path(
+            "{key}.{upload_id}.{part}".format(key=Key, upload_id=UploadId, part=PartNumber)
+        )
+        with open(part_path, "wb") as f:
+            f.write(Body)
+        with self._lock:
+            self._uploads[UploadId][PartNumber] = part_path
+        return {"ETag": str(PartNumber)}
+
+    def complete_multipart_upload(
+        self, Bucket, Key, UploadId, MultipartUpload
+    ):  # pylint: disable=unused-argument
+        self._transfer(0)
+        with self._lock:
+            part_paths = self._uploads.pop(UploadId)
+        with open(self._path(Key), "wb") as f:
+            for part in MultipartUpload["Parts"]:
+                with open(part_paths[part["PartNumber"]], "rb") as part_file:
+                    shutil.copyfileobj(part_file, f)
+                os.unlink(part_paths[part["PartNumber"]])
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):  # pylint: disable=unused-argument
+        with self._lock:
+            part_paths = self._uploads.pop(UploadId)
+        for part_path in part_paths.values():
+            os.unlink(part_path)
+
+
+def _peak_rss_mb():
+    # ru_maxrss is in kilobytes on linux, and in bytes on macos
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (float(MiB) if sys.platform == "darwin" else 1024.0)
+
+
+def _measure(args):
+    s3_session = DiskS3Session(
+        args.root, latency=args.latency_ms / 1000.0, bandwidth=args.bandwidth_mb * MiB
+    )
+    object_store = S3ObjectStore(
+        BUCKET,
+        s3_session=s3_session,
+        multipart_chunksize=args.chunksize_mb * MiB,
+        max_concurrency=args.max_concurrency,
+    )
+
+    if args.measure == "set_object":
+        value = [os.urandom(MiB) for _ in range(args.size_mb)]
+        rss_before = _peak_rss_mb()
+        with time_execution_scope() as timer_result:
+            object_store.set_object(KEY, value, DEFAULT_SERIALIZATION_STRATEGY)
+    else:
+        rss_before = _peak_rss_mb()
+        with time_execution_scope() as timer_result:
+            value = object_store.get_object(KEY, DEFAULT_SERIALIZATION_STRATEGY).obj
+        assert len(value) == args.size_mb
+
+    print(  # pylint: disable=print-call
+        "{name:>10}: {time}, {throughput:.1f} MiB/s, peak RSS +{rss:.0f} MiB "
+        "for a {size} MiB value".format(
+            name=args.measure,
+            time=format_duration(timer_result.millis),
+            throughput=args.size_mb / (timer_result.millis / 1000.0),
+            rss=_peak_rss_mb() - rss_before,
+            size=args.size_mb,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--bandwidth-mb", type=float, default=100)
+    parser.add_argument("--chunksize-mb", type=int, default=8)
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--measure", choices=["set_object", "get_object"], help=argparse.SUPPRESS)
+    parser.add_argument("--root", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        _measure(args)
+        return
+
+    root = tempfile.mkdtemp()
+    try:
+        for operation in ["set_object", "get_object"]:
+            subprocess.check_call(
+                [
+                    sys.executable,
+                    "-m",
+                    "dagster_aws_tests.benchmarks.bench_s3_object_store",
+                    "--measure",
+                    operation,
+                    "--root",
+                    root,
+                    "--size-mb",
+                    str(args.size_mb),
+                    "--latency-ms",
+                    str(args.latency_ms),
+                    "--bandwidth-mb",
+                    str(args.bandwidth_mb),
+                    "--chunksize-mb",
+                    str(args.chunksize_mb),
+                    "--max-concurrency",
+                    str(args.max_concurrency),
+                ]
+            )
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,13 @@
+import json
 import os
 import sys
+import time
 
 import boto3
+import pytest
 import six
 from dagster_aws.s3 import S3ComputeLogManager
+from dagster_aws.s3 import compute_log_manager as s3_compute_log_manager
 from moto import mock_s3
 
 from dagster import DagsterEventType, execute_pipeline, pipeline, seven, solid
@@ -13,6 +17,7 @@ from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.core.storage.event_log import SqliteEventLogStorage
 from dagster.core.storage.root import LocalArtifactStorage
 from dagster.core.storage.runs import SqliteRunStorage
+from dagster.seven import mock
 
 HELLO_WORLD = "Hello World"
 SEPARATOR = os.linesep if (os.name == "nt" and sys.version_info < (3,)) else "\n"
@@ -91,6 +96,215 @@ def test_compute_log_manager(s3_bucket):
             assert expected in stderr.data
 
 
+def _wait_for_manifest(s3, s3_bucket, manifest_key):
+    for _ in range(100):
+        objects = s3.list_objects_v2(Bucket=s3_bucket, Prefix=manifest_key)
+        if objects["KeyCount"]:
+            return json.loads(
+                six.ensure_str(s3.get_object(Bucket=s3_bucket, Key=manifest_key)["Body"].read())
+            )
+        time.sleep(0.1)
+    raise Exception("Timed out waiting for {}".format(manifest_key))
+
+
+@mock_s3
+@pytest.mark.parametrize("gzip_chunks", [False, True])
+def test_compute_log_manager_upload_chunks(s3_bucket, gzip_chunks):
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket=s3_bucket)
+
+    with seven.TemporaryDirectory() as temp_dir, seven.TemporaryDirectory() as other_temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=s3_bucket,
+            prefix="my_prefix",
+            local_dir=temp_dir,
+            upload_interval=0.1,
+            gzip_chunks=gzip_chunks,
+        )
+        # reads the logs from another node, without the local copies
+        other_manager = S3ComputeLogManager(
+            bucket=s3_bucket, prefix="my_prefix", local_dir=other_temp_dir
+        )
+
+        @pipeline
+        def simple():
+            @solid
+            def easy(context):
+                print(HELLO_WORLD)  # pylint: disable=print-call
+                sys.stdout.flush()
+
+                # the logs are readable while the step is still running
+                manifest = _wait_for_manifest(
+                    s3,
+                    s3_bucket,
+                    "my_prefix/storage/{run_id}/compute_logs/easy.compute.out.manifest.json".format(
+                        run_id=context.run_id
+                    ),
+                )
+                assert not manifest["complete"]
+                stdout = other_manager.read_logs_file(
+                    context.run_id, "easy.compute", ComputeIOType.STDOUT
+                )
+                assert stdout.data == HELLO_WORLD + SEPARATOR
+
+                print("Goodbye")  # pylint: disable=print-call
+                return "easy"
+
+            easy()
+
+        instance = DagsterInstance(
+            instance_type=InstanceType.PERSISTENT,
+            local_artifact_storage=LocalArtifactStorage(temp_dir),
+            run_storage=SqliteRunStorage.from_local(temp_dir),
+            event_storage=SqliteEventLogStorage(temp_dir),
+            compute_log_manager=manager,
+            run_launcher=CliApiRunLauncher(),
+        )
+        result = execute_pipeline(simple, instance=instance)
+        assert result.success
+
+        # the logs are uploaded in chunks, and never as a single object
+        objects = s3.list_objects_v2(
+            Bucket=s3_bucket,
+            Prefix="my_prefix/storage/{run_id}/compute_logs/easy.compute.out".format(
+                run_id=result.run_id
+            ),
+        )
+        keys = [obj["Key"] for obj in objects["Contents"]]
+        assert not any(key.endswith("easy.compute.out") for key in keys)
+        assert len([key for key in keys if ".chunks/" in key]) == 2
+        assert all(key.endswith(".gz") == gzip_chunks for key in keys if ".chunks/" in key)
+
+        expected_stdout = HELLO_WORLD + SEPARATOR + "Goodbye" + SEPARATOR
+        stdout = other_manager.read_logs_file(result.run_id, "easy.compute", ComputeIOType.STDOUT)
+        assert stdout.data == expected_stdout
+        assert stdout.cursor == stdout.size == len(expected_stdout)
+        assert stdout.path.startswith("s3://")
+        assert stdout.download_url is None
+
+        # cursors are served across chunks
+        stdout = other_manager.read_logs_file(
+            result.run_id,
+            "easy.compute",
+            ComputeIOType.STDOUT,
+            cursor=3,
+            max_bytes=len(HELLO_WORLD),
+        )
+        assert stdout.data == expected_stdout[3 : 3 + len(HELLO_WORLD)]
+        assert stdout.cursor == 3 + len(HELLO_WORLD)
+
+        stderr = other_manager.read_logs_file(result.run_id, "easy.compute", ComputeIOType.STDERR)
+        for expected in EXPECTED_LOGS:
+            assert expected in stderr.data
+
+
+@mock_s3
+def test_compute_log_manager_upload_large_chunks(s3_bucket, monkeypatch):
+    monkeypatch.setattr(s3_compute_log_manager, "MAX_CHUNK_SIZE", 4)
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket=s3_bucket)
+
+    with seven.TemporaryDirectory() as temp_dir, seven.TemporaryDirectory() as other_temp_dir:
+        manager = S3ComputeLogManager(bucket=s3_bucket, local_dir=temp_dir, upload_interval=10)
+        other_manager = S3ComputeLogManager(bucket=s3_bucket, local_dir=other_temp_dir)
+
+        path = manager.get_local_path("run_id", "easy.compute", ComputeIOType.STDOUT)
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write("0123456789")
+        manager._upload_chunks_from_local(  # pylint: disable=protected-access
+            "run_id", "easy.compute", ComputeIOType.STDOUT, complete=False
+        )
+        with open(path, "a") as f:
+            f.write("abc")
+        manager._upload_chunks_from_local(  # pylint: disable=protected-access
+            "run_id", "easy.compute", ComputeIOType.STDOUT, complete=True
+        )
+
+        manifest = _wait_for_manifest(
+            s3, s3_bucket, "dagster/storage/run_id/compute_logs/easy.compute.out.manifest.json"
+        )
+        assert manifest["complete"]
+        assert [(chunk["offset"], chunk["size"]) for chunk in manifest["chunks"]] == [
+            (0, 4),
+            (4, 4),
+            (8, 2),
+            (10, 3),
+        ]
+
+        for cursor, max_bytes in [(0, 100), (2, 7), (4, 4), (9, 2), (13, 5)]:
+            data = other_manager.read_logs_file(
+                "run_id", "easy.compute", ComputeIOType.STDOUT, cursor=cursor, max_bytes=max_bytes
+            )
+            assert data.data == "0123456789abc"[cursor : cursor + max_bytes]
+            assert data.size == 13
+
+
+@mock_s3
+def test_compute_log_manager_read_chunks_multibyte(s3_bucket, monkeypatch):
+    monkeypatch.setattr(s3_compute_log_manager, "MAX_CHUNK_SIZE", 4)
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket=s3_bucket)
+
+    with seven.TemporaryDirectory() as temp_dir, seven.TemporaryDirectory() as other_temp_dir:
+        manager = S3ComputeLogManager(bucket=s3_bucket, local_dir=temp_dir, upload_interval=10)
+        other_manager = S3ComputeLogManager(bucket=s3_bucket, local_dir=other_temp_dir)
+
+        # multibyte characters that straddle both the chunks and the reads
+        text = u"a\u00e9b\u20acc\U0001f600d"
+        path = manager.get_local_path("run_id", "easy.compute", ComputeIOType.STDOUT)
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as f:
+            f.write(text.encode("utf-8"))
+        manager._upload_chunks_from_local(  # pylint: disable=protected-access
+            "run_id", "easy.compute", ComputeIOType.STDOUT, complete=True
+        )
+        _wait_for_manifest(
+            s3, s3_bucket, "dagster/storage/run_id/compute_logs/easy.compute.out.manifest.json"
+        )
+
+        for max_bytes in range(4, 8):
+            cursor = 0
+            read = u""
+            while True:
+                data = other_manager.read_logs_file(
+                    "run_id",
+                    "easy.compute",
+                    ComputeIOType.STDOUT,
+                    cursor=cursor,
+                    max_bytes=max_bytes,
+                )
+                if data.cursor == cursor:
+                    break
+                read += data.data
+                cursor = data.cursor
+            assert read == text
+
+
+@mock_s3
+def test_compute_log_manager_read_single_object_skips_manifest(s3_bucket):
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket=s3_bucket)
+    bucket_key = "dagster/storage/run_id/compute_logs/easy.compute.out"
+    s3.put_object(Bucket=s3_bucket, Key=bucket_key, Body=b"hello")
+
+    with seven.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(bucket=s3_bucket, local_dir=temp_dir)
+        session = manager._s3_session  # pylint: disable=protected-access
+        with mock.patch.object(session, "get_object", wraps=session.get_object) as get_object:
+            # logs that were never uploaded are not looked for in a manifest either
+            data = manager.read_logs_file("run_id", "missing.compute", ComputeIOType.STDOUT)
+            assert data.data is None
+
+            data = manager.read_logs_file("run_id", "easy.compute", ComputeIOType.STDOUT)
+            assert data.data == "hello"
+            assert not [
+                call
+                for call in get_object.call_args_list
+                if call[1]["Key"].endswith(".manifest.json")
+            ]
+
+
 @mock_s3
 def test_compute_log_manager_from_config(s3_bucket):
     s3_prefix = "foobar"
@@ -1,12 +1,51 @@
 import boto3
-from dagster_aws.s3 import S3ObjectStore
+import pytest
+from dagster_aws.s3 import S3ObjectChangedError, S3ObjectStore, create_s3_fake_resource
 from moto import mock_s3
 
 from dagster.core.storage.object_store import DEFAULT_SERIALIZATION_STRATEGY
+from dagster.core.types.marshal import SerializationStrategy
+
+MiB = 1024 * 1024
+
+
+class LinesSerializationStrategy(SerializationStrategy):
+    def __init__(self):
+        super(LinesSerializationStrategy, self).__init__("lines", write_mode="w", read_mode="r")
+
+    def serialize(self, value, write_file_obj):
+        for line in value:
+            write_file_obj.write(line + "\n")
+
+    def deserialize(self, read_file_obj):
+        return [line.rstrip("\n") for line in read_file_obj]
+
+
+class TextSerializationStrategy(SerializationStrategy):
+    def __init__(self):
+        super(TextSerializationStrategy, self).__init__("text", write_mode="w", read_mode="r")
+
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(value)
+
+    def deserialize(self, read_file_obj):
+        return read_file_obj.read()
+
+
+class FailingSerializationStrategy(SerializationStrategy):
+    def __init__(self):
+        super(FailingSerializationStrategy, self).__init__("failing")
+
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(b"x" * 50)
+        raise Exception("Failed to serialize")
+
+    def deserialize(self, read_file_obj):
+        raise NotImplementedError()
 
 
 @mock_s3
-def test_s3_object_store(s3_bucket, caplog):
+def test_s3_object_store(s3_bucket):
     # Uses mock S3
     s3 = boto3.client("s3")
     s3.create_bucket(Bucket=s3_bucket)
@@ -17,9 +56,11 @@ def test_s3_object_store(s3_bucket, caplog):
     res = s3_obj_store.set_object(key, True, DEFAULT_SERIALIZATION_STRATEGY)
     assert res.key == "s3://{s3_bucket}/{key}".format(s3_bucket=s3_bucket, key=key)
 
-    s3_obj_store.set_object(key, True, DEFAULT_SERIALIZATION_STRATEGY)
-    assert "Removing existing S3 key" in caplog.text
+    s3_obj_store.set_object(key, False, DEFAULT_SERIALIZATION_STRATEGY)
+    assert s3_obj_store.has_object(key)
+    assert s3_obj_store.get_object(key, DEFAULT_SERIALIZATION_STRATEGY).obj == False
 
+    s3_obj_store.set_object(key, True, DEFAULT_SERIALIZATION_STRATEGY)
     assert s3_obj_store.has_object(key)
     assert s3_obj_store.get_object(key, DEFAULT_SERIALIZATION_STRATEGY).obj == True
 
@@ -32,3 +73,123 @@ def test_s3_object_store(s3_bucket, caplog):
     assert s3_obj_store.uri_for_key(key) == "s3://{s3_bucket}/{key}".format(
         s3_bucket=s3_bucket, key=key
     )
+
+
+@mock_s3
+def test_s3_object_store_multipart(s3_bucket):
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket=s3_bucket)
+
+    # S3 requires parts of at least 5 MiB
+    s3_obj_store = S3ObjectStore(s3_bucket, multipart_chunksize=5 * MiB, max_concurrency=2)
+    value = [bytes(bytearray([index])) * MiB for index in range(12)]
+    s3_obj_store.set_object("foo", value, DEFAULT_SERIALIZATION_STRATEGY)
+
+    assert s3.head_object(Bucket=s3_bucket, Key="foo")["ETag"].endswith('-3"')
+    assert s3_obj_store.get_object("foo", DEFAULT_SERIALIZATION_STRATEGY).obj == value
+
+
+@pytest.mark.parametrize("value_size", [0, 1, 99, 100, 101, 1000])
+def test_s3_object_store_chunks(s3_bucket, value_size):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(
+        s3_bucket, s3_session=s3_session, multipart_chunksize=100, max_concurrency=3
+    )
+
+    value = bytes(bytearray(index % 256 for index in range(value_size)))
+    s3_obj_store.set_object("foo", value, DEFAULT_SERIALIZATION_STRATEGY)
+    assert s3_obj_store.get_object("foo", DEFAULT_SERIALIZATION_STRATEGY).obj == value
+
+    lines = ["line {index}".format(index=index) for index in range(value_size)]
+    s3_obj_store.set_object("bar", lines, LinesSerializationStrategy())
+    assert s3_session.buckets[s3_bucket]["bar"] == "".join(line + "\n" for line in lines).encode(
+        "utf-8"
+    )
+    assert s3_obj_store.get_object("bar", LinesSerializationStrategy()).obj == lines
+
+
+@pytest.mark.parametrize("multipart_chunksize", [4, 100])
+def test_s3_object_store_text_line_endings(s3_bucket, multipart_chunksize):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(
+        s3_bucket, s3_session=s3_session, multipart_chunksize=multipart_chunksize
+    )
+
+    # text is stored and read back byte for byte, whatever its line endings
+    value = u"crlf\r\ncr\rlf\n\r\n"
+    s3_obj_store.set_object("foo", value, TextSerializationStrategy())
+    assert s3_session.buckets[s3_bucket]["foo"] == value.encode("utf-8")
+    assert s3_obj_store.get_object("foo", TextSerializationStrategy()).obj == value
+
+
+def test_s3_object_store_single_part(s3_bucket):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(s3_bucket, s3_session=s3_session)
+
+    s3_obj_store.set_object("foo", True, DEFAULT_SERIALIZATION_STRATEGY)
+    assert s3_obj_store.get_object("foo", DEFAULT_SERIALIZATION_STRATEGY).obj == True
+
+    # small objects are written and read with a single request, without checking for or deleting
+    # an existing object first
+    assert s3_session.mock_extras.put_object.call_count == 1
+    assert s3_session.mock_extras.get_object.call_count == 1
+    assert s3_session.mock_extras.create_multipart_upload.call_count == 0
+    assert s3_session.mock_extras.list_objects_v2.call_count == 0
+
+
+class ReplacingSerializationStrategy(SerializationStrategy):
+    """Reads an object in two parts, replacing it in between."""
+
+    def __init__(self, s3_obj_store, key):
+        super(ReplacingSerializationStrategy, self).__init__("replacing")
+        self.s3_obj_store = s3_obj_store
+        self.key = key
+
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(value)
+
+    def deserialize(self, read_file_obj):
+        data = read_file_obj.read(10)
+        self.s3_obj_store.set_object(self.key, b"y" * 1000, self)
+        return data + read_file_obj.read()
+
+
+def test_s3_object_store_replaced_while_read(s3_bucket):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(
+        s3_bucket, s3_session=s3_session, multipart_chunksize=100, max_concurrency=1
+    )
+    strategy = ReplacingSerializationStrategy(s3_obj_store, "foo")
+    s3_obj_store.set_object("foo", b"x" * 1000, strategy)
+
+    # only the first ranges were downloaded before the object was replaced
+    with pytest.raises(S3ObjectChangedError, match="s3://{}/foo".format(s3_bucket)):
+        s3_obj_store.get_object("foo", strategy)
+
+
+@mock_s3
+def test_s3_object_store_replaced_while_read_mock_s3(s3_bucket):
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket=s3_bucket)
+
+    # S3 requires parts of at least 5 MiB, so objects are written with a single request
+    s3_obj_store = S3ObjectStore(s3_bucket)
+    strategy = ReplacingSerializationStrategy(s3_obj_store, "foo")
+    s3_obj_store.set_object("foo", b"x" * 1000, strategy)
+
+    reading_obj_store = S3ObjectStore(s3_bucket, multipart_chunksize=100, max_concurrency=1)
+    with pytest.raises(S3ObjectChangedError):
+        reading_obj_store.get_object("foo", strategy)
+
+
+def test_s3_object_store_aborts_failed_upload(s3_bucket):
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore(s3_bucket, s3_session=s3_session, multipart_chunksize=10)
+
+    with pytest.raises(Exception, match="Failed to serialize"):
+        s3_obj_store.set_object("foo", None, FailingSerializationStrategy())
+
+    assert s3_session.mock_extras.abort_multipart_upload.call_count == 1
+    assert s3_session.mock_extras.complete_multipart_upload.call_count == 0
+    assert not s3_session.multipart_uploads
+    assert not s3_obj_store.has_object("foo")
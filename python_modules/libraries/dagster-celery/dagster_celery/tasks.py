@@ -1,7 +1,7 @@
 from dagster import DagsterInstance, EventMetadataEntry, check
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
 from dagster.core.events import EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import create_execution_plan_for_steps, execute_plan_iterator
 from dagster.core.execution.retries import Retries
 from dagster.core.instance import InstanceRef
 from dagster.serdes import serialize_dagster_namedtuple
@@ -29,12 +29,9 @@ def create_task(celery_app, **task_kwargs):
 
         step_keys_str = ", ".join(step_keys)
 
-        execution_plan = create_execution_plan(
-            pipeline,
-            pipeline_run.run_config,
-            mode=pipeline_run.mode,
-            step_keys_to_execute=pipeline_run.step_keys_to_execute,
-        ).build_subset_plan(step_keys)
+        execution_plan = create_execution_plan_for_steps(
+            pipeline, pipeline_run, instance, step_keys, run_config=pipeline_run.run_config
+        )
 
         engine_event = instance.report_engine_event(
             "Executing steps {} in celery worker".format(step_keys_str),
@@ -1,6 +1,6 @@
 from dagster.core.utils import check_dagster_package_version
 
-from .data_frame import DataFrame
+from .data_frame import DataFrame, DataFrameFilesystemStoragePlugin
 from .executor import dask_executor
 from .version import __version__
 
@@ -8,5 +8,6 @@ check_dagster_package_version("dagster-dask", __version__)
 
 __all__ = [
     "DataFrame",
+    "DataFrameFilesystemStoragePlugin",
     "dask_executor",
 ]
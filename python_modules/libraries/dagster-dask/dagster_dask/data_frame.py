@@ -1,3 +1,4 @@
+import os
 import warnings
 
 import dask.dataframe as dd
@@ -21,6 +22,9 @@ from dagster import (
     dagster_type_loader,
     dagster_type_materializer,
 )
+from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.storage.system_storage import fs_intermediate_storage, fs_system_storage
+from dagster.core.storage.type_storage import TypeStoragePlugin
 
 WriteCompressionTextOptions = Enum(
     "WriteCompressionText", [EnumValue("gzip"), EnumValue("bz2"), EnumValue("xz"),],
@@ -480,6 +484,67 @@ def df_type_check(_, value):
     )
 
 
+class DataFrameFilesystemStoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    """Stores intermediate Dask DataFrames in the filesystem as Parquet datasets, with a file for
+    each partition, rather than pickling the task graphs that compute them. Requires pyarrow.
+
+    The ``DaskDataFrame`` type pickles its intermediates. To store them as Parquet instead:
+
+    .. code-block:: python
+
+        ParquetDataFrame = DagsterType(
+            name="ParquetDaskDataFrame",
+            type_check_fn=lambda _, value: isinstance(value, dd.DataFrame),
+            auto_plugins=[DataFrameFilesystemStoragePlugin],
+        )
+    """
+
+    @classmethod
+    def compatible_with_storage_def(cls, system_storage_def):
+        if not (
+            system_storage_def is fs_system_storage or system_storage_def is fs_intermediate_storage
+        ):
+            return False
+
+        try:
+            import pyarrow  # pylint: disable=unused-import
+
+            return True
+        except ImportError:
+            return False
+
+    @classmethod
+    def set_intermediate_object(
+        cls, intermediate_storage, _context, _dagster_type, step_output_handle, value
+    ):
+        paths = ["intermediates", step_output_handle.step_key, step_output_handle.output_name]
+        target_path = os.path.join(intermediate_storage.root, *paths)
+        # Writing the partitions of a replaced intermediate into its directory would add to them
+        intermediate_storage.object_store.rm_object(target_path)
+        value.to_parquet(target_path, engine="pyarrow")
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.SET_OBJECT,
+            key=target_path,
+            obj=value,
+            serialization_strategy_name="parquet",
+            object_store_name=intermediate_storage.object_store.name,
+        )
+
+    @classmethod
+    def get_intermediate_object(
+        cls, intermediate_storage, _context, _dagster_type, step_output_handle
+    ):
+        paths = ["intermediates", step_output_handle.step_key, step_output_handle.output_name]
+        target_path = os.path.join(intermediate_storage.root, *paths)
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.GET_OBJECT,
+            key=target_path,
+            obj=dd.read_parquet(target_path, engine="pyarrow"),
+            serialization_strategy_name="parquet",
+            object_store_name=intermediate_storage.object_store.name,
+        )
+
+
 DataFrame = DagsterType(
     name="DaskDataFrame",
     description="""A Dask DataFrame is a large parallel DataFrame composed of many smaller Pandas DataFrames, split along the index.
@@ -1,12 +1,22 @@
+import os
 import re
 import shutil
 
 import dask.dataframe as dd
 import pytest
-from dagster_dask import DataFrame
+from dagster_dask import DataFrame, DataFrameFilesystemStoragePlugin
 from dask.dataframe.utils import assert_eq
 
-from dagster import InputDefinition, OutputDefinition, execute_solid, file_relative_path, solid
+from dagster import (
+    DagsterType,
+    InputDefinition,
+    OutputDefinition,
+    execute_pipeline,
+    execute_solid,
+    file_relative_path,
+    pipeline,
+    solid,
+)
 from dagster.utils.test import get_temp_dir
 
 
@@ -94,3 +104,47 @@ def test_dataframe_outputs(file_type, read, kwargs):
             assert result.success
             actual = read(f"{temp_path}/*")
             assert assert_eq(actual, df)
+
+
+ParquetDataFrame = DagsterType(
+    name="ParquetDaskDataFrame",
+    type_check_fn=lambda _, value: isinstance(value, dd.DataFrame),
+    auto_plugins=[DataFrameFilesystemStoragePlugin],
+)
+
+
+@pytest.mark.parametrize(
+    "dagster_type,stored_as_parquet",
+    [
+        pytest.param(DataFrame, False, id="pickle"),
+        pytest.param(ParquetDataFrame, True, id="parquet"),
+    ],
+)
+def test_dataframe_filesystem_storage(dagster_type, stored_as_parquet):
+    df = create_dask_df()
+
+    @solid(output_defs=[OutputDefinition(dagster_type=dagster_type)])
+    def return_df(_):
+        return df
+
+    @solid(input_defs=[InputDefinition(dagster_type=dagster_type, name="input_df")])
+    def read_df(_, input_df):
+        assert assert_eq(input_df, df)
+        return input_df.sum().compute()
+
+    @pipeline
+    def dataframe_pipeline():
+        read_df(return_df())
+
+    with get_temp_dir() as temp_path:
+        result = execute_pipeline(
+            dataframe_pipeline,
+            run_config={"storage": {"filesystem": {"config": {"base_dir": temp_path}}}},
+        )
+        assert result.success
+
+        # Only types that opt in store their intermediates as Parquet datasets
+        path = os.path.join(temp_path, "intermediates", "return_df.compute", "result")
+        assert os.path.isdir(path) == stored_as_parquet
+        if stored_as_parquet:
+            assert assert_eq(dd.read_parquet(path), df)
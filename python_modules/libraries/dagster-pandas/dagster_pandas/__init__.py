@@ -1,5 +1,12 @@
 from dagster.core.utils import check_dagster_package_version
 
+from .check_strategy import (
+    ChunkedCheckStrategy,
+    DataFrameCheckStrategy,
+    FullCheckStrategy,
+    HeadCheckStrategy,
+    SampledCheckStrategy,
+)
 from .constraints import (
     ColumnWithMetadataException,
     ConstraintWithMetadata,
@@ -22,6 +29,14 @@ from .data_frame import (
     create_dagster_pandas_dataframe_type,
     create_structured_dataframe_type,
 )
+from .type_storage import (
+    ArrowSerializationStrategy,
+    ColumnarSerializationStrategy,
+    DataFrameFilesystemStoragePlugin,
+    NpyFilesystemStoragePlugin,
+    NpySerializationStrategy,
+    ParquetSerializationStrategy,
+)
 from .validation import PandasColumn
 from .version import __version__
 
@@ -32,6 +47,17 @@ __all__ = [
     "create_dagster_pandas_dataframe_type",
     "create_structured_dataframe_type",
     "PandasColumn",
+    "DataFrameCheckStrategy",
+    "FullCheckStrategy",
+    "SampledCheckStrategy",
+    "HeadCheckStrategy",
+    "ChunkedCheckStrategy",
+    "ColumnarSerializationStrategy",
+    "ParquetSerializationStrategy",
+    "ArrowSerializationStrategy",
+    "DataFrameFilesystemStoragePlugin",
+    "NpySerializationStrategy",
+    "NpyFilesystemStoragePlugin",
     "ColumnWithMetadataException",
     "ConstraintWithMetadataException",
     "MultiAggregateConstraintWithMetadata",
@@ -0,0 +1,148 @@
+import math
+
+import numpy as np
+
+from dagster import EventMetadataEntry, check
+
+
+class DataFrameCheckStrategy(object):
+    """
+    Base class for the strategies that determine which rows of a DataFrame the type check of a
+    dagster-pandas dataframe type validates. Row-level (column) constraints are validated against
+    the selected rows, column aggregate constraints and summary statistics are computed over them,
+    and dataframe-wide constraints are always validated against the whole DataFrame.
+
+    Args:
+        skip_checked_inputs (Optional[bool]): If True, a step input whose value is the output of an
+            upstream step of the same run and type is not checked again, as it already passed the
+            same type check as an output. Defaults to False.
+    """
+
+    name = None
+
+    def __init__(self, skip_checked_inputs=False):
+        self.skip_checked_inputs = check.bool_param(skip_checked_inputs, "skip_checked_inputs")
+
+    def select_rows(self, dataframe):
+        """The rows of the DataFrame to check."""
+        return dataframe
+
+    def chunks(self, rows):
+        """Splits the selected rows into the chunks validated in turn by row-level constraints."""
+        yield rows
+
+    @property
+    def params(self):
+        return {}
+
+    def metadata_entry(self, checked_rows, total_rows, input_already_checked=False):
+        data = dict(
+            self.params, strategy=self.name, checked_rows=checked_rows, total_rows=total_rows
+        )
+        if input_already_checked:
+            data["input_already_checked"] = True
+        return EventMetadataEntry.json(
+            data, "check_strategy", "The rows of the DataFrame that were type checked"
+        )
+
+
+class FullCheckStrategy(DataFrameCheckStrategy):
+    """
+    Checks every row of the DataFrame at once. This is the default.
+
+    Args:
+        skip_checked_inputs (Optional[bool]): Whether to skip checking inputs that already passed
+            the same type check as an output of this run. Defaults to False.
+    """
+
+    name = "full"
+
+
+class SampledCheckStrategy(DataFrameCheckStrategy):
+    """
+    Checks a random sample of the rows of the DataFrame, in their original order.
+
+    Args:
+        fraction (float): The fraction of rows to check, between 0 and 1.
+        seed (Optional[int]): The seed of the random sample, so that the same rows are checked on
+            every check of DataFrames of the same length.
+        skip_checked_inputs (Optional[bool]): Whether to skip checking inputs that already passed
+            the same type check as an output of this run. Defaults to False.
+    """
+
+    name = "sampled"
+
+    def __init__(self, fraction, seed=None, skip_checked_inputs=False):
+        self.fraction = check.numeric_param(fraction, "fraction")
+        check.param_invariant(0 < fraction <= 1, "fraction", "Must be between 0 and 1")
+        self.seed = check.opt_int_param(seed, "seed")
+        super(SampledCheckStrategy, self).__init__(skip_checked_inputs=skip_checked_inputs)
+
+    def select_rows(self, dataframe):
+        num_rows = int(math.ceil(len(dataframe) * self.fraction))
+        # unlike DataFrame.sample, doesn't shuffle the positions of every row to pick the sample
+        positions = np.random.default_rng(self.seed).choice(len(dataframe), num_rows, replace=False)
+        return dataframe.iloc[np.sort(positions)]
+
+    @property
+    def params(self):
+        return {"fraction": self.fraction, "seed": self.seed}
+
+
+class HeadCheckStrategy(DataFrameCheckStrategy):
+    """
+    Checks the first rows of the DataFrame.
+
+    Args:
+        num_rows (int): The number of rows to check.
+        skip_checked_inputs (Optional[bool]): Whether to skip checking inputs that already passed
+            the same type check as an output of this run. Defaults to False.
+    """
+
+    name = "head"
+
+    def __init__(self, num_rows, skip_checked_inputs=False):
+        self.num_rows = check.int_param(num_rows, "num_rows")
+        check.param_invariant(num_rows > 0, "num_rows", "Must be positive")
+        super(HeadCheckStrategy, self).__init__(skip_checked_inputs=skip_checked_inputs)
+
+    def select_rows(self, dataframe):
+        return dataframe.head(self.num_rows)
+
+    @property
+    def params(self):
+        return {"num_rows": self.num_rows}
+
+
+class ChunkedCheckStrategy(DataFrameCheckStrategy):
+    """
+    Checks every row of the DataFrame, a chunk of rows at a time, stopping at the first chunk that
+    fails. Row-level constraints comparing rows with each other, like uniqueness, only compare the
+    rows of each chunk.
+
+    When the type's default loader is used, DataFrames loaded from CSV and table files (and Parquet
+    files, with pyarrow) are read and checked a chunk at a time, so that loading stops at the first
+    chunk that fails, and they aren't checked again when the input is type checked.
+
+    Args:
+        chunk_size (int): The number of rows in each chunk.
+        skip_checked_inputs (Optional[bool]): Whether to skip checking inputs that already passed
+            the same type check as an output of this run. Defaults to False.
+    """
+
+    name = "chunked"
+
+    def __init__(self, chunk_size, skip_checked_inputs=False):
+        self.chunk_size = check.int_param(chunk_size, "chunk_size")
+        check.param_invariant(chunk_size > 0, "chunk_size", "Must be positive")
+        super(ChunkedCheckStrategy, self).__init__(skip_checked_inputs=skip_checked_inputs)
+
+    def chunks(self, rows):
+        if len(rows) == 0:
+            yield rows
+        for start in range(0, len(rows), self.chunk_size):
+            yield rows.iloc[start : start + self.chunk_size]
+
+    @property
+    def params(self):
+        return {"chunk_size": self.chunk_size}
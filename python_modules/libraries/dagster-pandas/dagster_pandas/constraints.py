@@ -1,8 +1,10 @@
+import numbers
 import sys
 from collections import defaultdict
 from datetime import datetime
 from functools import wraps
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -383,6 +385,28 @@ def apply_ignore_missing_data_to_mask(mask, column):
     return mask & ~column.isnull()
 
 
+# The most offending rows (and their values) reported per column by a ColumnConstraintWithMetadata
+DEFAULT_MAX_OFFENDING_ROWS = 1000
+
+# The python type of the values a column of each numpy dtype kind passes to a validation function
+_VALUE_TYPES_BY_DTYPE_KIND = {"b": bool, "i": int, "u": int, "f": float}
+
+
+def _value_type(column):
+    return _VALUE_TYPES_BY_DTYPE_KIND.get(column.dtype.kind)
+
+
+def _validity_mask(validation_fn, column):
+    """Evaluates a column validation function over a whole column at once, if it has a mask_fn
+    that supports the column's dtype. Returns a boolean numpy array marking the valid values, or
+    None if the validation function must be applied to each value instead."""
+    mask_fn = getattr(validation_fn, "mask_fn", None)
+    # extension dtypes (categoricals, nullable integers...) pass values to .apply in their own way
+    if mask_fn is None or not isinstance(column.dtype, np.dtype):
+        return None
+    return mask_fn(column)
+
+
 class ColumnAggregateConstraintWithMetadata(ConstraintWithMetadata):
     """
     Similar to the base class, but now your validation functions should take in columns (pd.Series) not Dataframes.
@@ -399,23 +423,36 @@ class ColumnAggregateConstraintWithMetadata(ConstraintWithMetadata):
         name (Optional[str]): what to call the constraint, defaults to the class name.
     """
 
+    def column_violations(self, column):
+        """
+        Validates a single column.
+
+        Args:
+            column (pd.Series): the column to validate
+
+        Returns:
+            Optional[list]: None if the column is valid, otherwise the offending values
+        """
+        # TODO: grab extra metadata
+        res = self.validation_fn(column)
+        if res[0]:
+            return None
+        if not res[1].get("actual") is None:
+            return [x.item() for x in res[1].get("actual").to_numpy()]
+        return [x.item() for x in column.to_numpy()]
+
     def validate(self, data, *columns, **kwargs):
         if len(columns) == 0:
             columns = data.columns
         columns = [column for column in columns if column in data.columns]
-        relevant_data = data[list(columns)]
 
         offending_columns = set()
         offending_values = {}
         for column in columns:
-            # TODO: grab extra metadata
-            res = self.validation_fn(relevant_data[column])
-            if not res[0]:
+            violations = self.column_violations(data[column])
+            if violations is not None:
                 offending_columns.add(column)
-                if not res[1].get("actual") is None:
-                    offending_values[column] = [x.item() for x in res[1].get("actual").to_numpy()]
-                else:
-                    offending_values[column] = [x.item() for x in relevant_data[column].to_numpy()]
+                offending_values[column] = violations
         if len(offending_columns) == 0 and not self.raise_or_typecheck:
             return TypeCheck(success=True)
         elif len(offending_columns) > 0:
@@ -451,23 +488,69 @@ class ColumnConstraintWithMetadata(ConstraintWithMetadata):
         raise_or_typecheck (Optional[bool]): whether to raise an exception (if set to True) or emit a failed typecheck event
                     (if set to False) when validation fails
         name (Optional[str]): what to call the constraint, defaults to the class name.
+        max_offending_rows (Optional[int]): the most offending rows (and values) to report for each
+                    column, defaults to 1000. Set to None to report every offending row.
+
+    A validation_fn may have a ``mask_fn`` attribute, a function taking a whole column (pd.Series)
+    and returning a boolean numpy array of which of its values are valid, or None if it can't
+    evaluate columns of that dtype. Columns are then validated with a single vectorized operation
+    rather than by calling validation_fn on each value. The validators built by this module's
+    factories all have one.
     """
 
+    def __init__(
+        self,
+        description,
+        validation_fn,
+        resulting_exception,
+        raise_or_typecheck=True,
+        name=None,
+        max_offending_rows=DEFAULT_MAX_OFFENDING_ROWS,
+    ):
+        self.max_offending_rows = check.opt_int_param(max_offending_rows, "max_offending_rows")
+        super(ColumnConstraintWithMetadata, self).__init__(
+            description,
+            validation_fn,
+            resulting_exception,
+            raise_or_typecheck=raise_or_typecheck,
+            name=name,
+        )
+
+    def column_violations(self, column):
+        """
+        Validates each value of a single column.
+
+        Args:
+            column (pd.Series): the column to validate
+
+        Returns:
+            Optional[Tuple[List[str], list]]: None if every value is valid, otherwise the offending
+                rows and their values, up to max_offending_rows of each
+        """
+        mask = _validity_mask(self.validation_fn, column)
+        if mask is None:
+            # TODO:  grab metadata from here
+            results = column[column.apply(lambda x: not self.validation_fn(x)[0])]
+        else:
+            # only the offending rows that are reported are looked up
+            positions = np.flatnonzero(~mask)
+            results = column.iloc[positions[: self.max_offending_rows]]
+        if len(results) == 0:
+            return None
+        results = results.iloc[: self.max_offending_rows]
+        return ["row " + str(i) for i in results.index.tolist()], results.tolist()
+
     def validate(self, data, *columns, **kwargs):
         if len(columns) == 0:
             columns = data.columns
 
         columns = [column for column in columns if column in data.columns]
-        relevant_data = data[list(columns)]
         offending = {}
         offending_values = {}
-        # TODO:  grab metadata from here
-        inverse_validation = lambda x: not self.validation_fn(x)[0]
         for column in columns:
-            results = relevant_data[relevant_data[column].apply(inverse_validation)]
-            if len(results.index.tolist()) > 0:
-                offending[column] = ["row " + str(i) for i in (results.index.tolist())]
-                offending_values[column] = results[column].tolist()
+            violations = self.column_violations(data[column])
+            if violations is not None:
+                offending[column], offending_values[column] = violations
         if len(offending) == 0:
             if not self.raise_or_typecheck:
                 return TypeCheck(success=True)
@@ -506,6 +589,8 @@ class MultiColumnConstraintWithMetadata(ColumnConstraintWithMetadata):
             type_for_internal (Optional[type]): what type to use for internal validators.  Subclass of
                                                 ConstraintWithMetadata
             name (Optional[str]): what to call the constraint, defaults to the class name.
+            max_offending_rows (Optional[int]): the most offending rows to report for each column and
+                                                function, defaults to 1000. None reports every row.
     """
 
     def __init__(
@@ -516,31 +601,50 @@ class MultiColumnConstraintWithMetadata(ColumnConstraintWithMetadata):
         raise_or_typecheck=True,
         type_for_internal=ColumnConstraintWithMetadata,
         name=None,
+        max_offending_rows=DEFAULT_MAX_OFFENDING_ROWS,
     ):
         # TODO:  support multiple descriptions
         self.column_to_fn_dict = check.dict_param(
             fn_and_columns_dict, "fn_and_columns_dict", key_type=str
         )
+        internal_kwargs = (
+            {"max_offending_rows": max_offending_rows}
+            if issubclass(type_for_internal, ColumnConstraintWithMetadata)
+            else {}
+        )
+        # the internal validators are built once, rather than on every validation
+        self.column_to_validators = {
+            column: [
+                (
+                    fn,
+                    type_for_internal(
+                        fn.__doc__,
+                        fn,
+                        ColumnWithMetadataException,
+                        raise_or_typecheck=False,
+                        **internal_kwargs
+                    ),
+                )
+                for fn in fn_arr
+            ]
+            for column, fn_arr in self.column_to_fn_dict.items()
+        }
 
         def validation_fn(data, *args, **kwargs):
             metadict = defaultdict(dict)
             truthparam = True
-            for column, fn_arr in self.column_to_fn_dict.items():
+            for column, validators in self.column_to_validators.items():
                 if column not in data.columns:
                     continue
-                for fn in fn_arr:
-                    # TODO:  do this more effectively
-                    new_validator = type_for_internal(
-                        fn.__doc__, fn, ColumnWithMetadataException, raise_or_typecheck=False
-                    )
-                    result = new_validator.validate(
-                        DataFrame(data[column]), column, *args, **kwargs
+                # each column is looked up once and passed to all of its validators
+                column_data = data[column]
+                for fn, validator in validators:
+                    result_dict = self._violation_metadata(
+                        validator, column, column_data, *args, **kwargs
                     )
-                    result_val = result.success
-                    if result_val:
+                    if result_dict is None:
                         continue
-                    result_dict = result.metadata_entries[0].entry_data.data
-                    truthparam = truthparam and result_val
+                    truthparam = False
                     for key in result_dict.keys():
                         if "constraint" not in key:
                             if key == "expected":
@@ -564,8 +668,40 @@ class MultiColumnConstraintWithMetadata(ColumnConstraintWithMetadata):
             resulting_exception,
             raise_or_typecheck=raise_or_typecheck,
             name=name,
+            max_offending_rows=max_offending_rows,
         )
 
+    @staticmethod
+    def _violation_metadata(validator, column, column_data, *args, **kwargs):
+        """Returns the metadata of a failed internal validation of a column, or None if it passed.
+
+        The internal validators provided by this module check the column directly; others are run
+        against a single column dataframe and their metadata is read from the failed typecheck."""
+        validate_fn = type(validator).validate
+        if validate_fn is ColumnConstraintWithMetadata.validate:
+            violations = validator.column_violations(column_data)
+            if violations is None:
+                return None
+            return {
+                "expected": validator.validation_fn.__doc__,
+                "offending": {column: violations[0]},
+                "actual": {column: violations[1]},
+            }
+        elif validate_fn is ColumnAggregateConstraintWithMetadata.validate:
+            violations = validator.column_violations(column_data)
+            if violations is None:
+                return None
+            return {
+                "expected": validator.description.replace("Confirms", ""),
+                "offending": {column},
+                "actual": {column: violations},
+            }
+
+        result = validator.validate(DataFrame(column_data), column, *args, **kwargs)
+        if result.success:
+            return None
+        return result.metadata_entries[0].entry_data.data
+
     def validate(self, data, *args, **kwargs):
         return ConstraintWithMetadata.validate(self, data, *args, **kwargs)
 
@@ -621,6 +757,9 @@ def non_null_validation(x):
     return not pd.isnull(x), {}
 
 
+non_null_validation.mask_fn = lambda column: column.notnull().to_numpy()
+
+
 def all_unique_validator(column, ignore_missing_vals=False):
     """
     validates that all values in an iterable are unique
@@ -678,6 +817,17 @@ def nonnull(func):
 
     nvalidator.__doc__ += " and ensures no values are null"
 
+    # wraps copies any mask_fn of func, which must be replaced by one that also checks for nulls
+    func_mask_fn = getattr(func, "mask_fn", None)
+
+    def nonnull_mask_fn(column):
+        mask = func_mask_fn(column) if func_mask_fn is not None else None
+        if mask is None:
+            return None
+        return mask & column.notnull().to_numpy()
+
+    nvalidator.mask_fn = nonnull_mask_fn
+
     return nvalidator
 
 
@@ -733,11 +883,31 @@ def column_range_validation_factory(minim=None, maxim=None, ignore_missing_vals=
             return True, {}
         return (isinstance(x, (type(minim), type(maxim)))) and (x <= maxim) and (x >= minim), {}
 
+    def in_range_mask_fn(column):
+        value_type = _value_type(column)
+        if value_type is None or not all(
+            isinstance(bound, numbers.Real) for bound in (minim, maxim)
+        ):
+            return None
+        if issubclass(value_type, (type(minim), type(maxim))):
+            values = column.to_numpy()
+            try:
+                with np.errstate(invalid="ignore"):
+                    mask = (values <= maxim) & (values >= minim)
+            except (OverflowError, TypeError):
+                return None
+        else:
+            mask = np.zeros(len(column), dtype=bool)
+        if ignore_missing_vals:
+            mask |= column.isnull().to_numpy()
+        return mask
+
     in_range_validation_fn.__doc__ = "checks whether values are between {} and {}".format(
         minim, maxim
     )
     if ignore_missing_vals:
         in_range_validation_fn.__doc__ += ", ignoring nulls"
+    in_range_validation_fn.mask_fn = in_range_mask_fn
 
     return in_range_validation_fn
 
@@ -790,8 +960,19 @@ def categorical_column_validator_factory(categories, ignore_missing_vals=False):
     categorical_validation_fn.__doc__ = "checks whether values are within this set of values: {}".format(
         categories
     )
+
+    def categorical_mask_fn(column):
+        if column.dtype.kind not in "biufO":
+            return None
+        nulls = column.isnull().to_numpy()
+        if nulls.any() and not ignore_missing_vals:
+            # whether a null is in the categories depends on which null object it is
+            return None
+        return column.isin(list(categories)).to_numpy() | nulls
+
     if ignore_missing_vals:
         categorical_validation_fn.__doc__ += ", ignoring nulls"
+    categorical_validation_fn.mask_fn = categorical_mask_fn
 
     return categorical_validation_fn
 
@@ -842,8 +1023,22 @@ def dtype_in_set_validation_factory(datatypes, ignore_missing_vals=False):
     dtype_in_set_validation_fn.__doc__ = "checks whether values are this type/types: {}".format(
         datatypes
     )
+
+    def dtype_in_set_mask_fn(column):
+        value_type = _value_type(column)
+        if value_type is None:
+            return None
+        try:
+            mask = np.full(len(column), issubclass(value_type, datatypes), dtype=bool)
+        except TypeError:
+            return None
+        if ignore_missing_vals:
+            mask |= column.isnull().to_numpy()
+        return mask
+
     if ignore_missing_vals:
         dtype_in_set_validation_fn.__doc__ += ", ignoring nulls"
+    dtype_in_set_validation_fn.mask_fn = dtype_in_set_mask_fn
 
     return dtype_in_set_validation_fn
 
@@ -1,9 +1,20 @@
+import weakref
+
 import pandas as pd
+from dagster_pandas.check_strategy import (
+    ChunkedCheckStrategy,
+    DataFrameCheckStrategy,
+    FullCheckStrategy,
+)
 from dagster_pandas.constraints import (
     ColumnDTypeFnConstraint,
     ColumnDTypeInSetConstraint,
     ConstraintViolationException,
 )
+from dagster_pandas.type_storage import (
+    DataFrameFilesystemStoragePlugin,
+    ParquetSerializationStrategy,
+)
 from dagster_pandas.validation import PandasColumn, validate_constraints
 
 from dagster import (
@@ -54,8 +65,8 @@ def dataframe_materializer(_context, config, pandas_df):
     return AssetMaterialization.file(file_options["path"])
 
 
-@dagster_type_loader(
-    Selector(
+def _dataframe_loader_config():
+    return Selector(
         {
             "csv": {
                 "path": StringSource,
@@ -65,10 +76,9 @@ def dataframe_materializer(_context, config, pandas_df):
             "table": {"path": StringSource},
         },
     )
-)
-def dataframe_loader(_context, config):
-    file_type, file_options = list(config.items())[0]
 
+
+def _read_dataframe(file_type, file_options):
     if file_type == "csv":
         path = file_options["path"]
         return pd.read_csv(path, **dict_without_keys(file_options, "path"))
@@ -82,6 +92,120 @@ def dataframe_loader(_context, config):
         )
 
 
+def _read_dataframe_chunks(file_type, file_options, chunk_size):
+    if file_type == "csv":
+        path = file_options["path"]
+        return pd.read_csv(path, chunksize=chunk_size, **dict_without_keys(file_options, "path"))
+    elif file_type == "parquet":
+        return _read_parquet_chunks(file_options["path"], chunk_size)
+    elif file_type == "table":
+        return pd.read_csv(file_options["path"], sep="\t", chunksize=chunk_size)
+    else:
+        raise DagsterInvariantViolationError(
+            "Unsupported file_type {file_type}".format(file_type=file_type)
+        )
+
+
+def _read_parquet_chunks(path, chunk_size):
+    import pyarrow.parquet as pq
+
+    num_rows = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        chunk = batch.to_pandas()
+        # a default index isn't stored in the file, so each batch would otherwise start at 0
+        if isinstance(chunk.index, pd.RangeIndex):
+            chunk.index = pd.RangeIndex(num_rows, num_rows + len(chunk))
+        num_rows += len(chunk)
+        yield chunk
+
+
+@dagster_type_loader(_dataframe_loader_config())
+def dataframe_loader(_context, config):
+    file_type, file_options = list(config.items())[0]
+    return _read_dataframe(file_type, file_options)
+
+
+# The results of checking the rows of DataFrames as they were loaded by chunked loaders, by the id
+# of the DataFrame, until they are type checked as inputs
+_LOADED_ROWS_CHECKS = {}
+
+
+def _chunked_dataframe_loader(chunk_size, check_chunk):
+    @dagster_type_loader(_dataframe_loader_config())
+    def _loader(_context, config):
+        file_type, file_options = list(config.items())[0]
+
+        chunks = []
+        failed_type_check = None
+        for chunk in _read_dataframe_chunks(file_type, file_options, chunk_size):
+            chunks.append(chunk)
+            failed_type_check = check_chunk(chunk)
+            if failed_type_check is not None:
+                # the input fails its type check without reading the rest of the file
+                break
+
+        if not chunks:
+            return _read_dataframe(file_type, file_options)
+
+        value = pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+        key = id(value)
+        _LOADED_ROWS_CHECKS[key] = (
+            weakref.ref(value, lambda _: _LOADED_ROWS_CHECKS.pop(key, None)),
+            failed_type_check,
+        )
+        return value
+
+    return _loader
+
+
+def _pop_loaded_rows_check(value):
+    """Returns whether the rows of a DataFrame were checked as it was loaded by a chunked loader,
+    and the resulting failed type check, if any."""
+    ref, failed_type_check = _LOADED_ROWS_CHECKS.pop(id(value), (None, None))
+    if ref is None or ref() is not value:
+        return False, None
+    return True, failed_type_check
+
+
+def _check_rows(check_strategy, value, check_chunk):
+    """Checks the chunks of the rows of a DataFrame selected by the check strategy in turn, unless
+    they were checked as the DataFrame was loaded, until one fails.
+
+    Returns the selected rows and the failed type check of the chunk that failed, if any."""
+    rows_checked, failed_type_check = _pop_loaded_rows_check(value)
+    if rows_checked:
+        return value, failed_type_check
+
+    rows = check_strategy.select_rows(value)
+    for chunk in check_strategy.chunks(rows):
+        failed_type_check = check_chunk(chunk)
+        if failed_type_check is not None:
+            return rows, failed_type_check
+    return rows, None
+
+
+def _is_input_already_checked(context):
+    # type checks may be called without a context outside of pipeline execution
+    return context is not None and context.input_already_checked
+
+
+def _loader_for_check_strategy(loader, check_strategy, check_chunk):
+    if loader:
+        return loader
+    if isinstance(check_strategy, ChunkedCheckStrategy):
+        return _chunked_dataframe_loader(check_strategy.chunk_size, check_chunk)
+    return dataframe_loader
+
+
+def _columnar_storage_args(columnar_storage, columns=None):
+    if not check.bool_param(columnar_storage, "columnar_storage"):
+        return {}
+    return {
+        "serialization_strategy": ParquetSerializationStrategy(columns=columns),
+        "auto_plugins": [DataFrameFilesystemStoragePlugin],
+    }
+
+
 def df_type_check(_, value):
     if not isinstance(value, pd.DataFrame):
         return TypeCheck(success=False)
@@ -155,6 +279,8 @@ def create_dagster_pandas_dataframe_type(
     materializer=None,
     input_hydration_config=None,
     output_materialization_config=None,
+    check_strategy=None,
+    columnar_storage=False,
 ):
     """
     Constructs a custom pandas dataframe dagster type.
@@ -174,6 +300,15 @@ def create_dagster_pandas_dataframe_type(
         materializer (Optional[DagsterTypeMaterializer]): An instance of a class
             that inherits from :py:class:`~dagster.DagsterTypeMaterializer`. If None, we will
             default to using `dataframe_materializer`.
+        check_strategy (Optional[DataFrameCheckStrategy]): An instance of a class that inherits
+            from :py:class:`~dagster_pandas.DataFrameCheckStrategy`, which determines which rows
+            the column constraints are checked against and event_metadata_fn is called with, and
+            which is reported in the metadata of the type check. If None, every row is checked.
+        columnar_storage (Optional[bool]): If True, intermediates of this type are stored with
+            pyarrow, as memory-mapped Arrow IPC files in the filesystem and as Parquet files in
+            other object stores, and inputs of this type only read the declared columns. Outputs of
+            this type must be read by inputs of a dagster pandas type with columnar storage.
+            Defaults to False.
     """
     # We allow for the plugging in of dagster_type_loaders/materializers so that
     # Users can load and matrerialize their custom dataframes via configuration their own way if the default
@@ -184,8 +319,17 @@ def create_dagster_pandas_dataframe_type(
         check.opt_str_param(description, "description", default=""),
         check.opt_list_param(columns, "columns", of_type=PandasColumn),
     )
+    check.opt_inst_param(check_strategy, "check_strategy", DataFrameCheckStrategy)
+    strategy = check_strategy if check_strategy else FullCheckStrategy()
+
+    def _check_chunk(chunk):
+        try:
+            validate_constraints(chunk, pandas_columns=columns)
+        except ConstraintViolationException as e:
+            return TypeCheck(success=False, description=str(e))
+        return None
 
-    def _dagster_type_check(_, value):
+    def _dagster_type_check(context, value):
         if not isinstance(value, pd.DataFrame):
             return TypeCheck(
                 success=False,
@@ -194,17 +338,35 @@ def create_dagster_pandas_dataframe_type(
                 ),
             )
 
-        try:
-            validate_constraints(
-                value, pandas_columns=columns, dataframe_constraints=dataframe_constraints
+        if strategy.skip_checked_inputs and _is_input_already_checked(context):
+            return TypeCheck(
+                success=True,
+                metadata_entries=[
+                    strategy.metadata_entry(0, len(value), input_already_checked=True)
+                ],
+            )
+
+        rows, failed_type_check = _check_rows(strategy, value, _check_chunk)
+        strategy_entries = (
+            [strategy.metadata_entry(len(rows), len(value))] if check_strategy else []
+        )
+        if failed_type_check is None:
+            try:
+                validate_constraints(value, dataframe_constraints=dataframe_constraints)
+            except ConstraintViolationException as e:
+                failed_type_check = TypeCheck(success=False, description=str(e))
+        if failed_type_check is not None:
+            return TypeCheck(
+                success=False,
+                description=failed_type_check.description,
+                metadata_entries=strategy_entries,
             )
-        except ConstraintViolationException as e:
-            return TypeCheck(success=False, description=str(e))
 
         return TypeCheck(
             success=True,
-            metadata_entries=_execute_summary_stats(name, value, event_metadata_fn)
-            if event_metadata_fn
+            metadata_entries=_execute_summary_stats(name, rows, event_metadata_fn)
+            + strategy_entries
+            if event_metadata_fn or check_strategy
             else None,
         )
 
@@ -222,9 +384,12 @@ def create_dagster_pandas_dataframe_type(
     return DagsterType(
         name=name,
         type_check_fn=_dagster_type_check,
-        loader=loader_ if loader_ else dataframe_loader,
+        loader=_loader_for_check_strategy(loader_, strategy, _check_chunk),
         materializer=materializer_ if materializer_ else dataframe_materializer,
         description=description,
+        **_columnar_storage_args(
+            columnar_storage, [column.name for column in columns] if columns else None
+        )
     )
 
 
@@ -239,6 +404,8 @@ def create_structured_dataframe_type(
     materializer=None,
     input_hydration_config=None,
     output_materialization_config=None,
+    check_strategy=None,
+    columnar_storage=False,
 ):
     """
 
@@ -261,13 +428,29 @@ def create_structured_dataframe_type(
         materializer (Optional[DagsterTypeMaterializer]): An instance of a class
             that inherits from :py:class:`~dagster.DagsterTypeMaterializer`. If None, we will
             default to using `dataframe_materializer`.
+        check_strategy (Optional[DataFrameCheckStrategy]): An instance of a class that inherits
+            from :py:class:`~dagster_pandas.DataFrameCheckStrategy`, which determines which rows
+            the column-level validation is applied to, and which is reported in the metadata of
+            the type check. If None, every row is validated.
+        columnar_storage (Optional[bool]): If True, intermediates of this type are stored with
+            pyarrow, as memory-mapped Arrow IPC files in the filesystem and as Parquet files in
+            other object stores. Outputs of this type must be read by inputs of a dagster pandas
+            type with columnar storage. Defaults to False.
 
     Returns:
         a DagsterType with the corresponding name and packaged validation.
 
     """
+    check.opt_inst_param(check_strategy, "check_strategy", DataFrameCheckStrategy)
+    strategy = check_strategy if check_strategy else FullCheckStrategy()
 
-    def _dagster_type_check(_, value):
+    def _check_chunk(chunk):
+        if columns_validator is None:
+            return None
+        result = columns_validator.validate(chunk)
+        return None if result.success else result
+
+    def _dagster_type_check(context, value):
         if not isinstance(value, pd.DataFrame):
             return TypeCheck(
                 success=False,
@@ -275,17 +458,28 @@ def create_structured_dataframe_type(
                     type_name=type(value).__name__
                 ),
             )
+
+        if strategy.skip_checked_inputs and _is_input_already_checked(context):
+            return TypeCheck(
+                success=True,
+                metadata_entries=[
+                    strategy.metadata_entry(0, len(value), input_already_checked=True)
+                ],
+            )
+
         individual_result_dict = {}
 
         if dataframe_validator is not None:
             individual_result_dict["dataframe"] = dataframe_validator.validate(value)
+
+        rows, failed_type_check = _check_rows(strategy, value, _check_chunk)
         if columns_validator is not None:
-            individual_result_dict["columns"] = columns_validator.validate(value)
+            individual_result_dict["columns"] = (
+                failed_type_check if failed_type_check else TypeCheck(success=True)
+            )
 
         if columns_aggregate_validator is not None:
-            individual_result_dict["column-aggregates"] = columns_aggregate_validator.validate(
-                value
-            )
+            individual_result_dict["column-aggregates"] = columns_aggregate_validator.validate(rows)
 
         typechecks_succeeded = True
         metadata = []
@@ -301,6 +495,8 @@ def create_structured_dataframe_type(
                 EventMetadataEntry.json(result_dict, "{}-constraint-metadata".format(key),)
             )
             constraint_clauses.append("{} failing constraints, {}".format(key, result.description))
+        if check_strategy:
+            metadata.append(strategy.metadata_entry(len(rows), len(value)))
         # returns aggregates, then column, then dataframe
         return TypeCheck(
             success=typechecks_succeeded,
@@ -322,9 +518,10 @@ def create_structured_dataframe_type(
     return DagsterType(
         name=name,
         type_check_fn=_dagster_type_check,
-        loader=loader_ if loader_ else dataframe_loader,
+        loader=_loader_for_check_strategy(loader_, strategy, _check_chunk),
         materializer=materializer_ if materializer_ else dataframe_materializer,
         description=description,
+        **_columnar_storage_args(columnar_storage)
     )
 
 
@@ -0,0 +1,328 @@
+import io
+import mmap
+import os
+import pickle
+from abc import ABCMeta, abstractmethod
+
+import six
+
+from dagster import SerializationStrategy, check
+from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.storage.system_storage import fs_intermediate_storage, fs_system_storage
+from dagster.core.storage.type_storage import TypeStoragePlugin
+
+PARQUET_MAGIC = b"PAR1"
+ARROW_MAGIC = b"ARROW1"
+
+
+def _index_columns(schema):
+    # A RangeIndex is stored as metadata rather than as a column
+    pandas_metadata = schema.pandas_metadata or {}
+    return [
+        column
+        for column in pandas_metadata.get("index_columns", [])
+        if isinstance(column, six.string_types)
+    ]
+
+
+class ColumnarSerializationStrategy(six.with_metaclass(ABCMeta, SerializationStrategy)):
+    """
+    Base class for the serialization strategies that store pandas DataFrames in columnar formats
+    with pyarrow, so that only some of their columns may be read back.
+
+    DataFrames pickled by other dagster-pandas types, as intermediates of a step whose output type
+    differs from the input type, are read back as well.
+
+    Args:
+        name (str): The name of the serialization strategy.
+        magic (bytes): The bytes at the start of files in the columnar format.
+        columns (Optional[List[str]]): The columns to read, along with the index. Declared columns
+            which the stored DataFrame lacks are skipped, for its type check to report. If None,
+            every column is read.
+    """
+
+    def __init__(self, name, magic, columns=None):
+        self.magic = check.inst_param(magic, "magic", bytes)
+        self.columns = check.opt_nullable_list_param(columns, "columns", of_type=str)
+        super(ColumnarSerializationStrategy, self).__init__(name)
+
+    def columns_to_read(self, schema):
+        if self.columns is None:
+            return None
+        return [name for name in self.columns if name in schema.names] + _index_columns(schema)
+
+    def serialize(self, value, write_file_obj):
+        import pyarrow as pa
+
+        # Object stores may upload from file objects that can't seek, which columnar files need
+        sink = pa.BufferOutputStream()
+        self.write_table(pa.Table.from_pandas(value), sink)
+        write_file_obj.write(sink.getvalue())
+
+    def serialize_to_file(self, value, write_path):
+        import pyarrow as pa
+
+        check.str_param(write_path, "write_path")
+        with pa.OSFile(write_path, "wb") as sink:
+            self.write_table(pa.Table.from_pandas(value), sink)
+
+    def deserialize(self, read_file_obj):
+        import pyarrow as pa
+
+        # Columnar files are read from their end, so a file object that can't seek is read whole
+        data = read_file_obj.read()
+        if not data.startswith(self.magic):
+            return pickle.loads(data)
+        return self.read_table(pa.BufferReader(data))
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, "read_path")
+        with open(read_path, "rb") as read_obj:
+            if not read_obj.read(len(self.magic)) == self.magic:
+                read_obj.seek(0)
+                return pickle.load(read_obj)
+        return self.read_table(read_path)
+
+    @abstractmethod
+    def write_table(self, table, sink):
+        """Writes a pyarrow Table to a pyarrow output stream."""
+
+    @abstractmethod
+    def read_table(self, source):
+        """Reads a DataFrame from a pyarrow file or a local path."""
+
+
+class ParquetSerializationStrategy(ColumnarSerializationStrategy):
+    """
+    Stores pandas DataFrames as Parquet files, reading only the columns given. Local files are
+    memory-mapped. Requires pyarrow.
+
+    Args:
+        columns (Optional[List[str]]): The columns to read, along with the index. If None, every
+            column is read.
+    """
+
+    def __init__(self, columns=None, name="parquet"):
+        super(ParquetSerializationStrategy, self).__init__(
+            name, magic=PARQUET_MAGIC, columns=columns
+        )
+
+    def write_table(self, table, sink):
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink)
+
+    def read_table(self, source):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(source, memory_map=isinstance(source, six.string_types))
+        return parquet_file.read(
+            columns=self.columns_to_read(parquet_file.schema_arrow)
+        ).to_pandas()
+
+
+class ArrowSerializationStrategy(ColumnarSerializationStrategy):
+    """
+    Stores pandas DataFrames as uncompressed Arrow IPC files, reading only the columns given.
+    Local files are memory-mapped, so that the columns which aren't read are never paged in.
+    Requires pyarrow.
+
+    Args:
+        columns (Optional[List[str]]): The columns to read, along with the index. If None, every
+            column is read.
+    """
+
+    def __init__(self, columns=None, name="arrow"):
+        super(ArrowSerializationStrategy, self).__init__(name, magic=ARROW_MAGIC, columns=columns)
+
+    def write_table(self, table, sink):
+        import pyarrow as pa
+
+        writer = pa.ipc.new_file(sink, table.schema)
+        writer.write_table(table)
+        writer.close()
+
+    def read_table(self, source):
+        import pyarrow as pa
+
+        if isinstance(source, six.string_types):
+            with pa.memory_map(source) as memory_map:
+                return self.read_table(memory_map)
+
+        # Reading an Arrow IPC file doesn't copy its buffers, so only the selected columns are read
+        reader = pa.ipc.open_file(source)
+        table = reader.read_all()
+        columns = self.columns_to_read(reader.schema)
+        if columns is not None:
+            table = table.select(columns)
+        return table.to_pandas()
+
+
+def declared_columns(dagster_type):
+    """The columns that inputs of a dagster type read from columnar storage."""
+    strategy = dagster_type.serialization_strategy
+    if isinstance(strategy, ColumnarSerializationStrategy):
+        return strategy.columns
+    return None
+
+
+class DataFrameFilesystemStoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    """
+    Stores intermediate pandas DataFrames in the filesystem as Arrow IPC files, which are
+    memory-mapped when read, and reads only the columns of the input's type.
+    """
+
+    @classmethod
+    def compatible_with_storage_def(cls, system_storage_def):
+        return (
+            system_storage_def is fs_system_storage or system_storage_def is fs_intermediate_storage
+        )
+
+    @classmethod
+    def set_intermediate_object(
+        cls, intermediate_storage, _context, _dagster_type, step_output_handle, value
+    ):
+        paths = ["intermediates", step_output_handle.step_key, step_output_handle.output_name]
+        return intermediate_storage.object_store.set_object(
+            intermediate_storage.key_for_paths(paths),
+            value,
+            serialization_strategy=ArrowSerializationStrategy(),
+        )
+
+    @classmethod
+    def get_intermediate_object(
+        cls, intermediate_storage, _context, dagster_type, step_output_handle
+    ):
+        paths = ["intermediates", step_output_handle.step_key, step_output_handle.output_name]
+        return intermediate_storage.object_store.get_object(
+            intermediate_storage.key_for_paths(paths),
+            serialization_strategy=ArrowSerializationStrategy(
+                columns=declared_columns(dagster_type)
+            ),
+        )
+
+
+class NpySerializationStrategy(SerializationStrategy):
+    """
+    Stores NumPy arrays as .npy files. Local files are memory-mapped when read, so that the steps
+    reading an array on the same host share its pages rather than each reading a copy of it.
+
+    Args:
+        mmap_mode (Optional[str]): The mode in which local files are memory-mapped, as for
+            ``numpy.load``. Defaults to ``'r'``, which maps them read-only. If None, local files
+            are read into memory.
+    """
+
+    def __init__(self, mmap_mode="r", name="npy"):
+        self.mmap_mode = check.opt_str_param(mmap_mode, "mmap_mode")
+        super(NpySerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        import numpy as np
+
+        np.save(write_file_obj, value, allow_pickle=False)
+
+    def deserialize(self, read_file_obj):
+        import numpy as np
+
+        # numpy seeks back over the bytes it reads ahead, which object stores that stream their
+        # objects can't do, so a file object that can't seek is read whole
+        if not read_file_obj.seekable():
+            read_file_obj = io.BytesIO(read_file_obj.read())
+        return np.load(read_file_obj, allow_pickle=False)
+
+    def deserialize_from_file(self, read_path):
+        import numpy as np
+
+        check.str_param(read_path, "read_path")
+        return np.load(read_path, mmap_mode=self.mmap_mode, allow_pickle=False)
+
+
+def _mapped_npy_path(value):
+    """The path of the .npy file that an array maps whole and read-only, if there is one."""
+    import numpy as np
+
+    # The base of a view of a memory-mapped array is the array rather than the map itself, and
+    # the pages of a copy-on-write array may differ from the file
+    if not (
+        isinstance(value, np.memmap)
+        and isinstance(value.base, mmap.mmap)
+        and value.mode == "r"
+        and value.filename
+    ):
+        return None
+
+    try:
+        mapped = np.load(value.filename, mmap_mode="r", allow_pickle=False)
+    except (IOError, ValueError):
+        return None
+
+    if (mapped.shape, mapped.dtype, mapped.strides, mapped.offset) != (
+        value.shape,
+        value.dtype,
+        value.strides,
+        value.offset,
+    ):
+        return None
+    return value.filename
+
+
+class NpyFilesystemStoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    """
+    Stores intermediate NumPy arrays in the filesystem as .npy files, which are memory-mapped
+    read-only when read. An output that is an input array passed through unchanged is stored as a
+    hard link to the input's file, rather than written again.
+
+    For example, to pass NumPy arrays between steps through memory-mapped files:
+
+    .. code-block:: python
+
+        NumpyArray = PythonObjectDagsterType(
+            np.ndarray,
+            name="NumpyArray",
+            serialization_strategy=NpySerializationStrategy(),
+            auto_plugins=[NpyFilesystemStoragePlugin],
+        )
+    """
+
+    @classmethod
+    def compatible_with_storage_def(cls, system_storage_def):
+        return (
+            system_storage_def is fs_system_storage or system_storage_def is fs_intermediate_storage
+        )
+
+    @classmethod
+    def set_intermediate_object(
+        cls, intermediate_storage, _context, _dagster_type, step_output_handle, value
+    ):
+        paths = ["intermediates", step_output_handle.step_key, step_output_handle.output_name]
+        key = intermediate_storage.key_for_paths(paths)
+        object_store = intermediate_storage.object_store
+        serialization_strategy = NpySerializationStrategy()
+
+        mapped_path = _mapped_npy_path(value)
+        if mapped_path is None:
+            return object_store.set_object(
+                key, value, serialization_strategy=serialization_strategy
+            )
+
+        if mapped_path != os.path.abspath(key):
+            object_store.rm_object(key)
+            object_store.cp_object(mapped_path, key)
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.SET_OBJECT,
+            key=key,
+            obj=value,
+            serialization_strategy_name=serialization_strategy.name,
+            object_store_name=object_store.name,
+        )
+
+    @classmethod
+    def get_intermediate_object(
+        cls, intermediate_storage, _context, _dagster_type, step_output_handle
+    ):
+        paths = ["intermediates", step_output_handle.step_key, step_output_handle.output_name]
+        return intermediate_storage.object_store.get_object(
+            intermediate_storage.key_for_paths(paths),
+            serialization_strategy=NpySerializationStrategy(),
+        )
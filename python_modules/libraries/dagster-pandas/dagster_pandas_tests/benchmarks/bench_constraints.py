@@ -0,0 +1,108 @@
+"""Measure the time taken to type check a synthetic DataFrame against a structured dataframe type
+with column and column aggregate constraints, with the validators evaluated over whole columns
+and, for comparison, called on each value.
+
+Run with:
+
+    python -m dagster_pandas_tests.benchmarks.bench_constraints [--num-rows 1000000] \
+        [--failure-rate 0.001]
+"""
+import argparse
+import warnings
+from functools import wraps
+
+import numpy as np
+from dagster_pandas import (
+    ColumnWithMetadataException,
+    ConstraintWithMetadataException,
+    MultiAggregateConstraintWithMetadata,
+    MultiColumnConstraintWithMetadata,
+    all_unique_validator,
+    categorical_column_validator_factory,
+    column_range_validation_factory,
+    create_structured_dataframe_type,
+    dtype_in_set_validation_factory,
+    nonnull,
+)
+from pandas import DataFrame
+
+from dagster.utils.backcompat import ExperimentalWarning
+from dagster.utils.timing import format_duration, time_execution_scope
+
+
+def per_value(validation_fn):
+    # a copy of the validator without its mask_fn, as a user-defined validator would be
+    @wraps(validation_fn)
+    def validator(x):
+        return validation_fn(x)
+
+    del validator.mask_fn
+    return validator
+
+
+def synthetic_frame(num_rows, failure_rate):
+    random = np.random.RandomState(0)
+    failures = random.random_sample(num_rows) < failure_rate
+    return DataFrame(
+        {
+            "id": np.arange(num_rows),
+            "amount": np.where(failures, -1.0, random.random_sample(num_rows) * 100),
+            "quantity": random.randint(0, 10, num_rows),
+            "category": np.where(failures, "z", random.choice(["a", "b", "c"], num_rows)),
+        }
+    )
+
+
+def structured_dataframe_type(wrap_validator):
+    columns_validator = MultiColumnConstraintWithMetadata(
+        "Confirms column values",
+        {
+            "amount": [
+                wrap_validator(nonnull(column_range_validation_factory(0.0, 100.0))),
+                wrap_validator(dtype_in_set_validation_factory(float)),
+            ],
+            "quantity": [wrap_validator(column_range_validation_factory(0, 9))],
+            "category": [wrap_validator(categorical_column_validator_factory(["a", "b", "c"]))],
+        },
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    columns_aggregate_validator = MultiAggregateConstraintWithMetadata(
+        "Confirms ids are unique",
+        {"id": [all_unique_validator]},
+        ConstraintWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    return create_structured_dataframe_type(
+        "SyntheticDataFrame",
+        columns_validator=columns_validator,
+        columns_aggregate_validator=columns_aggregate_validator,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-rows", type=int, default=1000000)
+    parser.add_argument("--failure-rate", type=float, default=0.001)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", ExperimentalWarning)
+    df = synthetic_frame(args.num_rows, args.failure_rate)
+
+    for label, wrap_validator in [("vectorized", lambda fn: fn), ("per value", per_value)]:
+        dagster_type = structured_dataframe_type(wrap_validator)
+        with time_execution_scope() as timer_result:
+            type_check = dagster_type.type_check(None, df)
+
+        print(  # pylint: disable=print-call
+            "{label:>10}: type checked {num_rows} rows in {time}, success: {success}".format(
+                label=label,
+                num_rows=args.num_rows,
+                time=format_duration(timer_result.millis),
+                success=type_check.success,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Measure the time taken to pass a large NumPy array through a chain of steps run by the
+multiprocess executor, with the array stored in the filesystem as a pickle and, for comparison,
+as a .npy file that each step memory-maps.
+
+Every step after the first sums the array, which reads all of it, and passes it on unchanged.
+
+Run with:
+
+    python -m dagster_pandas_tests.benchmarks.bench_npy_intermediates [--size-mb 2048]
+"""
+import argparse
+import os
+
+import numpy as np
+from dagster_pandas import NpyFilesystemStoragePlugin, NpySerializationStrategy
+
+from dagster import (
+    InputDefinition,
+    OutputDefinition,
+    PythonObjectDagsterType,
+    execute_pipeline,
+    pipeline,
+    reconstructable,
+    seven,
+    solid,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.utils.timing import format_duration, time_execution_scope
+
+MiB = 1024 * 1024
+
+NUM_STEPS = 10
+
+PickledArray = PythonObjectDagsterType(np.ndarray, name="PickledArray")
+
+MappedArray = PythonObjectDagsterType(
+    np.ndarray,
+    name="MappedArray",
+    serialization_strategy=NpySerializationStrategy(),
+    auto_plugins=[NpyFilesystemStoragePlugin],
+)
+
+
+def chain(dagster_type):
+    @solid(config_schema={"size_mb": int}, output_defs=[OutputDefinition(dagster_type)])
+    def create(context):
+        return np.ones(context.solid_config["size_mb"] * MiB // 8, dtype=np.float64)
+
+    @solid(
+        input_defs=[InputDefinition("array", dagster_type)],
+        output_defs=[OutputDefinition(dagster_type)],
+    )
+    def read(_, array):
+        array.sum()
+        return array
+
+    def _chain():
+        array = create()
+        for step in range(NUM_STEPS - 1):
+            array = read.alias("read_{step}".format(step=step))(array)
+
+    return _chain
+
+
+@pipeline
+def pickled_chain():
+    chain(PickledArray)()
+
+
+@pipeline
+def mapped_chain():
+    chain(MappedArray)()
+
+
+def disk_usage(path):
+    # hard links to the same file are only counted once
+    inodes = {}
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            stat = os.stat(os.path.join(dirpath, filename))
+            inodes[stat.st_ino] = stat.st_size
+    return sum(inodes.values())
+
+
+def time_chain(pipeline_def, size_mb):
+    with seven.TemporaryDirectory() as tempdir:
+        storage_dir = os.path.join(tempdir, "storage")
+        run_config = {
+            "solids": {"create": {"config": {"size_mb": size_mb}}},
+            "storage": {"filesystem": {"config": {"base_dir": storage_dir}}},
+            "execution": {"multiprocess": {}},
+            "loggers": {"console": {"config": {"log_level": "ERROR"}}},
+        }
+        with time_execution_scope() as timer_result:
+            result = execute_pipeline(
+                reconstructable(pipeline_def),
+                run_config=run_config,
+                instance=DagsterInstance.local_temp(tempdir),
+            )
+        assert result.success
+        return timer_result.millis, disk_usage(storage_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=2048)
+    args = parser.parse_args()
+
+    for name, pipeline_def in [("pickle", pickled_chain), ("npy, memory-mapped", mapped_chain)]:
+        millis, stored_bytes = time_chain(pipeline_def, args.size_mb)
+        print(  # pylint: disable=print-call
+            "{name:>18}: {total} for {num_steps} steps, {per_step} per step, "
+            "{stored:.0f} MiB of intermediates".format(
+                name=name,
+                total=format_duration(millis),
+                num_steps=NUM_STEPS,
+                per_step=format_duration(millis / NUM_STEPS),
+                stored=stored_bytes / float(MiB),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,20 @@
 import pytest
+from dagster_pandas.check_strategy import (
+    ChunkedCheckStrategy,
+    FullCheckStrategy,
+    HeadCheckStrategy,
+    SampledCheckStrategy,
+)
 from dagster_pandas.constraints import (
     ColumnDTypeInSetConstraint,
     InRangeColumnConstraint,
     NonNullableColumnConstraint,
+    RowCountConstraint,
 )
 from dagster_pandas.data_frame import _execute_summary_stats, create_dagster_pandas_dataframe_type
 from dagster_pandas.validation import PandasColumn
 from pandas import DataFrame, read_csv
+from pandas.testing import assert_frame_equal
 
 from dagster import (
     AssetMaterialization,
@@ -248,3 +256,147 @@ def test_custom_dagster_dataframe_parametrizable_input():
     materialization_events = solid_result.materialization_events_during_compute
     assert len(materialization_events) == 1
     assert materialization_events[0].event_specific_data.materialization.label == "nothing"
+
+
+def _check_strategy_metadata(metadata_entries):
+    (entry,) = [entry for entry in metadata_entries if entry.label == "check_strategy"]
+    return entry.entry_data.data
+
+
+@pytest.mark.parametrize(
+    "check_strategy,success,checked_rows",
+    [
+        (None, False, None),
+        (FullCheckStrategy(), False, 100),
+        (HeadCheckStrategy(50), True, 50),
+        (SampledCheckStrategy(0.1, seed=0), True, 10),
+        (ChunkedCheckStrategy(30), False, 100),
+    ],
+)
+def test_dataframe_type_check_strategies(check_strategy, success, checked_rows):
+    summarized_rows = []
+
+    def compute_event_metadata(dataframe):
+        summarized_rows.append(len(dataframe))
+        return [EventMetadataEntry.text(str(len(dataframe)), "rows", "number of rows")]
+
+    TestDataFrame = create_dagster_pandas_dataframe_type(
+        name="TestDataFrame",
+        columns=[PandasColumn.integer_column("pid", min_value=0)],
+        event_metadata_fn=compute_event_metadata,
+        check_strategy=check_strategy,
+    )
+    # the only negative pid is in neither the first 50 rows nor the sample
+    df = DataFrame({"pid": [-1 if i == 75 else i for i in range(100)]})
+
+    type_check = TestDataFrame.type_check(None, df)
+    assert type_check.success == success
+    if check_strategy is None:
+        assert type_check.metadata_entries == []
+    else:
+        metadata = _check_strategy_metadata(type_check.metadata_entries)
+        assert metadata["strategy"] == check_strategy.name
+        assert metadata["checked_rows"] == checked_rows
+        assert metadata["total_rows"] == 100
+    if success:
+        assert summarized_rows == [checked_rows]
+
+
+def test_sampled_check_strategy_selects_rows_in_order():
+    df = DataFrame({"foo": range(1000)})
+    rows = SampledCheckStrategy(0.05, seed=1).select_rows(df)
+    assert len(rows) == 50
+    assert rows.index.is_monotonic_increasing
+    assert_frame_equal(rows, SampledCheckStrategy(0.05, seed=1).select_rows(df))
+    assert len(SampledCheckStrategy(1).select_rows(df)) == 1000
+    assert len(SampledCheckStrategy(0.5).select_rows(DataFrame({"foo": []}))) == 0
+
+
+def test_chunked_check_strategy_dataframe_constraints():
+    TestDataFrame = create_dagster_pandas_dataframe_type(
+        name="TestDataFrame",
+        columns=[PandasColumn.integer_column("pid", unique=True)],
+        dataframe_constraints=[RowCountConstraint(10)],
+        check_strategy=ChunkedCheckStrategy(3),
+    )
+    # dataframe constraints are checked against the whole dataframe, not each chunk
+    assert TestDataFrame.type_check(None, DataFrame({"pid": range(10)})).success
+    assert not TestDataFrame.type_check(None, DataFrame({"pid": range(9)})).success
+    assert not TestDataFrame.type_check(None, DataFrame({"pid": []}, dtype="int64")).success
+
+
+@pytest.mark.parametrize("file_type,sep", [("csv", ","), ("table", "\t")])
+def test_chunked_check_strategy_loader(file_type, sep):
+    TestDataFrame = create_dagster_pandas_dataframe_type(
+        name="TestDataFrame",
+        columns=[PandasColumn.integer_column("pid", min_value=0)],
+        check_strategy=ChunkedCheckStrategy(3),
+    )
+
+    @solid(input_defs=[InputDefinition("df", TestDataFrame)])
+    def count_rows(_, df):
+        return len(df)
+
+    for pids, success in [(list(range(10)), True), ([0, 1, 2, 3, -1] + list(range(5)), False)]:
+        with safe_tempfile_path() as input_fp:
+            DataFrame({"pid": pids}).to_csv(input_fp, sep=sep, index=False)
+            result = execute_solid(
+                count_rows,
+                run_config={
+                    "solids": {"count_rows": {"inputs": {"df": {file_type: {"path": input_fp}}}}}
+                },
+                raise_on_error=False,
+            )
+
+        assert result.success == success
+        type_check_data = result.input_events_during_compute[0].event_specific_data.type_check_data
+        assert type_check_data.success == success
+        metadata = _check_strategy_metadata(type_check_data.metadata_entries)
+        if success:
+            assert result.output_value() == 10
+            assert metadata["checked_rows"] == 10
+        else:
+            # loading stopped at the failing chunk
+            assert metadata["total_rows"] == 6
+
+
+@pytest.mark.parametrize("skip_checked_inputs", [True, False])
+def test_skip_checked_inputs(skip_checked_inputs):
+    summarized = []
+
+    def compute_event_metadata(dataframe):
+        summarized.append(len(dataframe))
+        return []
+
+    TestDataFrame = create_dagster_pandas_dataframe_type(
+        name="TestDataFrame",
+        columns=[PandasColumn.integer_column("pid")],
+        event_metadata_fn=compute_event_metadata,
+        check_strategy=FullCheckStrategy(skip_checked_inputs=skip_checked_inputs),
+    )
+
+    @solid(output_defs=[OutputDefinition(TestDataFrame)])
+    def create_dataframe(_):
+        return DataFrame({"pid": [1, 2, 3]})
+
+    @solid(input_defs=[InputDefinition("df", TestDataFrame)])
+    def count_rows(_, df):
+        return len(df)
+
+    @pipeline
+    def skip_pipeline():
+        count_rows(create_dataframe())
+
+    result = execute_pipeline(skip_pipeline)
+    assert result.success
+    input_event = result.result_for_solid("count_rows").input_events_during_compute[0]
+    metadata = _check_strategy_metadata(
+        input_event.event_specific_data.type_check_data.metadata_entries
+    )
+    if skip_checked_inputs:
+        assert summarized == [3]
+        assert metadata["input_already_checked"]
+        assert metadata["checked_rows"] == 0
+    else:
+        assert summarized == [3, 3]
+        assert "input_already_checked" not in metadata
@@ -10,6 +10,8 @@ from dagster_pandas.constraints import (
     MultiColumnConstraintWithMetadata,
     MultiConstraintWithMetadata,
     StrictColumnsWithMetadata,
+    column_range_validation_factory,
+    nonnull,
 )
 from pandas import DataFrame
 
@@ -191,3 +193,68 @@ def test_range_constraint():
     assert {"bar": [3], "baz": [4]} == val["actual"]
     range_val = ColumnRangeConstraintWithMetadata(raise_or_typecheck=False)
     assert range_val.validate(df).success
+
+
+def test_column_constraint_max_offending_rows():
+    df = DataFrame({"foo": range(5000), "bar": [float(x) for x in range(5000)]})
+
+    def column_num_validation_function(value):
+        return (value < 2, {})
+
+    for validation_fn in [column_range_validation_factory(0, 1), column_num_validation_function]:
+        column_val = ColumnConstraintWithMetadata(
+            "Confirms values less than 2",
+            validation_fn,
+            ColumnWithMetadataException,
+            raise_or_typecheck=False,
+            max_offending_rows=3,
+        )
+        val = column_val.validate(df, "foo").metadata_entries[0].entry_data.data
+        assert {"foo": ["row 2", "row 3", "row 4"]} == val["offending"]
+        assert {"foo": [2, 3, 4]} == val["actual"]
+
+    def any_value(_value):
+        """returns any value"""
+        return (True, {})
+
+    column_val = MultiColumnConstraintWithMetadata(
+        "Confirms values in range",
+        {"foo": [column_range_validation_factory(0, 10)], "bar": [nonnull(any_value)]},
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    val = column_val.validate(df).metadata_entries[0].entry_data.data
+    assert len(val["offending"]["foo"]["in_range_validation_fn"]) == 1000
+    assert val["offending"]["foo"]["in_range_validation_fn"][0] == "row 11"
+    assert val["actual"]["foo"]["in_range_validation_fn"][-1] == 1010
+    assert "bar" not in val["offending"]
+
+
+def test_multi_column_constraint_custom_internal_type():
+    class CountingColumnConstraint(ColumnConstraintWithMetadata):
+        validations = 0
+
+        def validate(self, data, *columns, **kwargs):
+            CountingColumnConstraint.validations += 1
+            return super(CountingColumnConstraint, self).validate(data, *columns, **kwargs)
+
+    def col_val_two(value):
+        """
+        returns values less than 2
+        """
+        return (value < 2, {})
+
+    df = DataFrame({"foo": [1, 2, 3], "bar": [3, 2, 1]})
+    column_val = MultiColumnConstraintWithMetadata(
+        "Complex number confirmation",
+        {"foo": [col_val_two], "bar": [col_val_two]},
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+        type_for_internal=CountingColumnConstraint,
+    )
+    val = column_val.validate(df).metadata_entries[0].entry_data.data
+    assert CountingColumnConstraint.validations == 2
+    assert {
+        "foo": {"col_val_two": ["row 1", "row 2"]},
+        "bar": {"col_val_two": ["row 0", "row 1"]},
+    } == val["offending"]
@@ -1,3 +1,4 @@
+from dagster_pandas.check_strategy import ChunkedCheckStrategy, HeadCheckStrategy
 from dagster_pandas.constraints import (
     ColumnWithMetadataException,
     ConstraintWithMetadataException,
@@ -232,3 +233,44 @@ def test_failing_type_eval_multi_error():
     df_metadata = df_data.entry_data.data
     assert df_metadata["expected"] == ["foo", "bar"]
     assert df_metadata["actual"] == {"extra_columns": ["baz"], "missing_columns": []}
+
+
+def test_type_eval_check_strategies():
+    df = DataFrame({"foo": [1, 2, 3, 2, 1, 7], "bar": [9, 10, 11, 12, 13, 11]})
+
+    head_type = create_structured_dataframe_type(
+        "NumericType",
+        columns_validator=column_validator,
+        columns_aggregate_validator=aggregate_validator,
+        dataframe_validator=dataframe_validator,
+        check_strategy=HeadCheckStrategy(3),
+    )
+    type_check = head_type.type_check(None, df)
+    assert type_check.success
+    assert [entry.label for entry in type_check.metadata_entries] == ["check_strategy"]
+    assert type_check.metadata_entries[0].entry_data.data == {
+        "strategy": "head",
+        "num_rows": 3,
+        "checked_rows": 3,
+        "total_rows": 6,
+    }
+
+    chunked_type = create_structured_dataframe_type(
+        "NumericType",
+        columns_validator=column_validator,
+        columns_aggregate_validator=aggregate_validator,
+        dataframe_validator=dataframe_validator,
+        check_strategy=ChunkedCheckStrategy(4),
+    )
+    type_check = chunked_type.type_check(None, df)
+    assert not type_check.success
+    metadata = {entry.label: entry.entry_data.data for entry in type_check.metadata_entries}
+    # the values of the second chunk are out of range, and the aggregates are computed over the
+    # whole dataframe
+    assert metadata["columns-constraint-metadata"]["offending"] == {
+        "foo": {"in_range_validation_fn": ["row 5"]}
+    }
+    assert metadata["column-aggregates-constraint-metadata"]["offending"] == {
+        "bar": {"all_unique_validator": "a violation"}
+    }
+    assert metadata["check_strategy"]["checked_rows"] == 6
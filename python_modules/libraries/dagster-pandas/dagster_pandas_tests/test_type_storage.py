@@ -0,0 +1,255 @@
+import io
+import os
+import pickle
+
+import numpy as np
+import pytest
+from dagster_pandas import (
+    ArrowSerializationStrategy,
+    NpyFilesystemStoragePlugin,
+    NpySerializationStrategy,
+    ParquetSerializationStrategy,
+    create_dagster_pandas_dataframe_type,
+    create_structured_dataframe_type,
+)
+from dagster_pandas.type_storage import ARROW_MAGIC
+from dagster_pandas.validation import PandasColumn
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from dagster import (
+    DagsterEventType,
+    InputDefinition,
+    Output,
+    OutputDefinition,
+    PythonObjectDagsterType,
+    execute_pipeline,
+    pipeline,
+    seven,
+    solid,
+)
+
+STRATEGIES = [ParquetSerializationStrategy, ArrowSerializationStrategy]
+
+requires_pyarrow = pytest.mark.skipif(
+    not seven.is_module_available("pyarrow"), reason="requires pyarrow"
+)
+
+
+class _UnseekableReader(io.RawIOBase):
+    def __init__(self, data):
+        super(_UnseekableReader, self).__init__()
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._data.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+class _UnseekableWriter(io.RawIOBase):
+    def __init__(self):
+        super(_UnseekableWriter, self).__init__()
+        self.data = b""
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += bytes(b)
+        return len(b)
+
+
+def _frame():
+    return DataFrame(
+        {"foo": [1, 2, 3], "bar": ["a", "b", "c"], "baz": [0.5, 1.5, 2.5]}, index=["x", "y", "z"],
+    )
+
+
+@requires_pyarrow
+@pytest.mark.parametrize("strategy_cls", STRATEGIES)
+def test_columnar_serialization_round_trip(strategy_cls):
+    writer = _UnseekableWriter()
+    strategy_cls().serialize(_frame(), writer)
+    assert_frame_equal(strategy_cls().deserialize(io.BytesIO(writer.data)), _frame())
+
+    with seven.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "frame")
+        strategy_cls().serialize_to_file(_frame(), path)
+        assert_frame_equal(strategy_cls().deserialize_from_file(path), _frame())
+
+
+@requires_pyarrow
+@pytest.mark.parametrize("strategy_cls", STRATEGIES)
+def test_columnar_serialization_reads_columns(strategy_cls):
+    # The declared column missing from the stored frame is left for the type check to report
+    strategy = strategy_cls(columns=["baz", "foo", "missing"])
+    expected = _frame()[["baz", "foo"]]
+
+    writer = _UnseekableWriter()
+    strategy.serialize(_frame(), writer)
+    assert_frame_equal(strategy.deserialize(io.BytesIO(writer.data)), expected)
+
+    with seven.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "frame")
+        strategy.serialize_to_file(_frame(), path)
+        assert_frame_equal(strategy.deserialize_from_file(path), expected)
+
+
+@requires_pyarrow
+@pytest.mark.parametrize("strategy_cls", STRATEGIES)
+def test_columnar_serialization_reads_pickled_frames(strategy_cls):
+    assert_frame_equal(
+        strategy_cls(columns=["foo"]).deserialize(io.BytesIO(pickle.dumps(_frame()))), _frame()
+    )
+
+    with seven.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "frame")
+        with open(path, "wb") as f:
+            pickle.dump(_frame(), f)
+        assert_frame_equal(strategy_cls().deserialize_from_file(path), _frame())
+
+
+@requires_pyarrow
+def test_columnar_storage_filesystem():
+    WideDataFrame = create_dagster_pandas_dataframe_type(
+        "WideDataFrame",
+        columns=[PandasColumn(name) for name in ["foo", "bar", "baz"]],
+        columnar_storage=True,
+    )
+    NarrowDataFrame = create_dagster_pandas_dataframe_type(
+        "NarrowDataFrame", columns=[PandasColumn.integer_column("foo")], columnar_storage=True,
+    )
+    StructuredDataFrame = create_structured_dataframe_type(
+        "StructuredDataFrame", columnar_storage=True
+    )
+
+    @solid(output_defs=[OutputDefinition(WideDataFrame)])
+    def wide(_):
+        return _frame()
+
+    @solid(
+        input_defs=[InputDefinition("df", NarrowDataFrame)],
+        output_defs=[OutputDefinition(StructuredDataFrame)],
+    )
+    def narrow(_, df):
+        assert list(df.columns) == ["foo"]
+        assert_frame_equal(df, _frame()[["foo"]])
+        return df
+
+    @solid(input_defs=[InputDefinition("df", StructuredDataFrame)], output_defs=[])
+    def structured(_, df):
+        assert_frame_equal(df, _frame()[["foo"]])
+
+    @pipeline
+    def columnar_pipeline():
+        structured(narrow(wide()))
+
+    with seven.TemporaryDirectory() as tempdir:
+        result = execute_pipeline(
+            columnar_pipeline,
+            run_config={"storage": {"filesystem": {"config": {"base_dir": tempdir}}}},
+        )
+        assert result.success
+
+        path = os.path.join(tempdir, "intermediates", "wide.compute", "result")
+        with open(path, "rb") as f:
+            assert f.read(len(ARROW_MAGIC)) == ARROW_MAGIC
+
+    messages = [
+        event.message
+        for event in result.event_list
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+    ]
+    assert len(messages) == 4
+    assert all(message.endswith("in filesystem object store using arrow.") for message in messages)
+
+
+def test_npy_serialization():
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    writer = _UnseekableWriter()
+    NpySerializationStrategy().serialize(array, writer)
+    np.testing.assert_array_equal(
+        NpySerializationStrategy().deserialize(io.BytesIO(writer.data)), array
+    )
+    # streamed as object stores that read their objects in ranges do
+    np.testing.assert_array_equal(
+        NpySerializationStrategy().deserialize(io.BufferedReader(_UnseekableReader(writer.data))),
+        array,
+    )
+
+    with seven.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "array")
+        NpySerializationStrategy().serialize_to_file(array, path)
+
+        mapped = NpySerializationStrategy().deserialize_from_file(path)
+        assert isinstance(mapped, np.memmap)
+        assert not mapped.flags.writeable
+        np.testing.assert_array_equal(mapped, array)
+
+        loaded = NpySerializationStrategy(mmap_mode=None).deserialize_from_file(path)
+        assert not isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, array)
+
+
+def test_npy_filesystem_storage():
+    NumpyArray = PythonObjectDagsterType(
+        np.ndarray,
+        name="NumpyArray",
+        serialization_strategy=NpySerializationStrategy(),
+        auto_plugins=[NpyFilesystemStoragePlugin],
+    )
+
+    @solid(output_defs=[OutputDefinition(NumpyArray)])
+    def create(_):
+        return np.arange(100, dtype=np.int64)
+
+    @solid(
+        input_defs=[InputDefinition("array", NumpyArray)],
+        output_defs=[
+            OutputDefinition(NumpyArray, "same"),
+            OutputDefinition(NumpyArray, "view"),
+            OutputDefinition(NumpyArray, "derived"),
+        ],
+    )
+    def passthrough(_, array):
+        assert isinstance(array, np.memmap)
+        yield Output(array, "same")
+        yield Output(array[50:], "view")
+        yield Output(array + 1, "derived")
+
+    @solid(
+        input_defs=[
+            InputDefinition("same", NumpyArray),
+            InputDefinition("view", NumpyArray),
+            InputDefinition("derived", NumpyArray),
+        ],
+        output_defs=[],
+    )
+    def consume(_, same, view, derived):
+        np.testing.assert_array_equal(same, np.arange(100))
+        np.testing.assert_array_equal(view, np.arange(50, 100))
+        np.testing.assert_array_equal(derived, np.arange(1, 101))
+
+    @pipeline
+    def npy_pipeline():
+        consume(*passthrough(create()))
+
+    with seven.TemporaryDirectory() as tempdir:
+        result = execute_pipeline(
+            npy_pipeline, run_config={"storage": {"filesystem": {"config": {"base_dir": tempdir}}}},
+        )
+        assert result.success
+
+        def _inode(step_key, output_name):
+            return os.stat(os.path.join(tempdir, "intermediates", step_key, output_name)).st_ino
+
+        # Only the array passed through unchanged is stored as a link to the input's file
+        created = _inode("create.compute", "result")
+        assert _inode("passthrough.compute", "same") == created
+        assert _inode("passthrough.compute", "view") != created
+        assert _inode("passthrough.compute", "derived") != created
@@ -1,3 +1,4 @@
+import pytest
 from dagster_pandas.constraints import (
     all_unique_validator,
     categorical_column_validator_factory,
@@ -6,7 +7,9 @@ from dagster_pandas.constraints import (
     non_null_validation,
     nonnull,
 )
+from dagster_pandas.constraints import _validity_mask
 from numpy import nan as NaN
+from pandas import Categorical, Series, Timestamp
 
 
 def test_unique():
@@ -52,3 +55,44 @@ def test_categorical():
     assert testfunc("b")[0]
     assert testfunc(NaN)[0]
     assert not testfunc("c")[0]
+
+
+@pytest.mark.parametrize(
+    "validation_fn",
+    [
+        non_null_validation,
+        column_range_validation_factory(minim=0, maxim=10),
+        column_range_validation_factory(minim=0.5, maxim=2.5, ignore_missing_vals=True),
+        column_range_validation_factory(minim=Timestamp("2020-01-01")),
+        nonnull(column_range_validation_factory(minim=0.0, maxim=10.0, ignore_missing_vals=True)),
+        categorical_column_validator_factory([1, 2, "a"]),
+        categorical_column_validator_factory([1, 2, "a"], ignore_missing_vals=True),
+        dtype_in_set_validation_factory((int,)),
+        dtype_in_set_validation_factory(float, ignore_missing_vals=True),
+        nonnull(dtype_in_set_validation_factory((int, float), ignore_missing_vals=True)),
+    ],
+)
+@pytest.mark.parametrize(
+    "column",
+    [
+        Series([0, 1, 2, 10, 11, -1]),
+        Series([0.0, 1.5, NaN, 2.0, 12.0]),
+        Series([True, False, True]),
+        Series([1, "a", None, 2.5, "b"], dtype=object),
+        Series([Timestamp("2019-01-01"), Timestamp("2021-01-01"), None]),
+        Series(Categorical(["a", "b", "a"])),
+        Series([], dtype="float64"),
+    ],
+)
+def test_validity_masks_match_validation_fns(validation_fn, column):
+    expected = [validation_fn(x)[0] for x in column.astype(object)]
+    mask = _validity_mask(validation_fn, column)
+    if mask is not None:
+        assert mask.tolist() == expected
+
+
+def test_validity_masks_are_vectorized():
+    column = Series(range(100))
+    assert _validity_mask(column_range_validation_factory(minim=0, maxim=10), column) is not None
+    assert _validity_mask(nonnull(categorical_column_validator_factory([1])), column) is not None
+    assert _validity_mask(lambda x: (x > 1, {}), column) is None
@@ -12,10 +12,16 @@ from dagster.core.storage.event_log import (
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
-from dagster.core.storage.sql import create_engine, get_alembic_config, run_alembic_upgrade
+from dagster.core.storage.sql import (
+    create_engine,
+    get_alembic_config,
+    run_alembic_upgrade,
+    serialization_format_config_field,
+)
 from dagster.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
+    SerializationFormat,
     deserialize_json_to_dagster_namedtuple,
 )
 
@@ -46,12 +52,20 @@ class PostgresEventLogStorage(AssetAwareSqlEventLogStorage, ConfigurableClass):
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
 
+    The optional ``serialization_format`` param (``JSON``, ``COMPACT`` or ``COMPACT_ZLIB``) selects
+    the format in which new records are written. Records written in any format can be read.
     """
 
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(self, postgres_url, inst_data=None, serialization_format=None):
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self._event_watcher = PostgresEventWatcher(self.postgres_url)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._serialization_format = check.opt_inst_param(
+            serialization_format,
+            "serialization_format",
+            SerializationFormat,
+            default=SerializationFormat.JSON,
+        )
         self._engine = create_engine(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db.pool.NullPool
         )
@@ -66,14 +80,20 @@ class PostgresEventLogStorage(AssetAwareSqlEventLogStorage, ConfigurableClass):
     def inst_data(self):
         return self._inst_data
 
+    @property
+    def serialization_format(self):
+        return self._serialization_format
+
     @classmethod
     def config_type(cls):
-        return pg_config()
+        return dict(pg_config(), serialization_format=serialization_format_config_field())
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresEventLogStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            serialization_format=config_value.get("serialization_format"),
         )
 
     @staticmethod
@@ -2,7 +2,7 @@ import time
 
 import psycopg2
 
-from dagster import Field, IntSource, Selector, StringSource
+from dagster import Field, IntSource, StringSource, check
 from dagster.seven import quote_plus as urlquote
 
 
@@ -13,22 +13,27 @@ def get_conn(conn_string):
 
 
 def pg_config():
-    return Selector(
-        {
-            "postgres_url": str,
-            "postgres_db": {
+    return {
+        "postgres_url": Field(str, is_required=False),
+        "postgres_db": Field(
+            {
                 "username": StringSource,
                 "password": StringSource,
                 "hostname": StringSource,
                 "db_name": StringSource,
                 "port": Field(IntSource, is_required=False, default_value=5432),
             },
-        }
-    )
+            is_required=False,
+        ),
+    }
 
 
 def pg_url_from_config(config_value):
-    if config_value.get("postgres_url"):
+    check.invariant(
+        ("postgres_url" in config_value) != ("postgres_db" in config_value),
+        "Postgres storage config must have exactly one of postgres_url or postgres_db",
+    )
+    if "postgres_url" in config_value:
         return config_value["postgres_url"]
 
     return get_conn_string(**config_value["postgres_db"])
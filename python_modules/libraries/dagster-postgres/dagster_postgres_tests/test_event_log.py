@@ -24,7 +24,7 @@ from dagster.core.execution.api import execute_run
 from dagster.core.instance import DagsterInstance
 from dagster.core.utils import make_new_run_id
 from dagster.loggers import colored_console_logger
-from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.serdes import SerializationFormat, deserialize_json_to_dagster_namedtuple
 
 TEST_TIMEOUT = 5
 
@@ -503,6 +503,39 @@ def test_load_from_config(hostname):
     assert from_url.postgres_url == from_explicit.postgres_url
 
 
+def test_load_serialization_format_from_config(conn_string):
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events, _result = synthesize_events(_solids)
+
+    PostgresEventLogStorage.create_clean_storage(conn_string)
+    cfg = """
+      event_log_storage:
+        module: dagster_postgres.event_log
+        class: PostgresEventLogStorage
+        config:
+            postgres_url: {conn_string}
+            serialization_format: COMPACT_ZLIB
+    """.format(
+        conn_string=conn_string
+    )
+
+    # pylint: disable=protected-access
+    event_log_storage = DagsterInstance.local_temp(overrides=yaml.safe_load(cfg))._event_storage
+    assert event_log_storage.serialization_format == SerializationFormat.COMPACT_ZLIB
+
+    for event in events:
+        event_log_storage.store_event(event)
+
+    assert all(not row[0].startswith("{") for row in fetch_all_events(conn_string))
+    assert event_log_storage.get_logs_for_run(events[0].run_id) == events
+
+
 def test_asset_materialization(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
 
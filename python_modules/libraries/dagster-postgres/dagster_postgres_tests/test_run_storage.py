@@ -6,6 +6,7 @@ from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from dagster.core.test_utils import environ
 from dagster.core.utils import make_new_run_id
+from dagster.serdes import SerializationFormat
 from dagster.utils.test.run_storage import TestRunStorage
 
 TestRunStorage.__test__ = False
@@ -157,3 +158,26 @@ def test_load_from_config(hostname):
 
         assert from_url.postgres_url == from_explicit.postgres_url
         assert from_url.postgres_url == from_env.postgres_url
+
+
+def test_load_serialization_format_from_config(clean_storage, conn_string):
+    cfg = """
+      run_storage:
+        module: dagster_postgres.run_storage
+        class: PostgresRunStorage
+        config:
+          postgres_url: {conn_string}
+          serialization_format: COMPACT_ZLIB
+    """.format(
+        conn_string=conn_string
+    )
+
+    # pylint: disable=protected-access
+    run_storage = DagsterInstance.local_temp(overrides=yaml.safe_load(cfg))._run_storage
+    assert run_storage.serialization_format == SerializationFormat.COMPACT_ZLIB
+
+    run_id = make_new_run_id()
+    run_storage.add_run(build_run(pipeline_name="pipeline_name", run_id=run_id))
+
+    # rows written in the compact format are read by storages configured for any format
+    assert clean_storage.get_run_by_id(run_id).run_id == run_id